@@ -0,0 +1,26 @@
+import os
+from contextlib import contextmanager
+
+
+@contextmanager
+def atomic_write(path, mode="w", *args, opener=open, **kwargs):
+    """Write ``path`` through a temporary file that replaces it when the block ends.
+
+    A reader never sees half a file: the data goes to ``path + ".tmp"``
+    and is moved over ``path`` only once the block finished without an
+    error; on an error the temporary file is removed and ``path`` is left
+    as it was. ``opener`` is called as ``opener(tmp_path, mode, *args,
+    **kwargs)``, so ``lzma.open`` or ``zipfile.ZipFile`` work as well as
+    ``open``.
+    """
+    tmp_path = path + ".tmp"
+    try:
+        with opener(tmp_path, mode, *args, **kwargs) as f:
+            yield f
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    os.replace(tmp_path, path)
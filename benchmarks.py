@@ -0,0 +1,267 @@
+"""Micro-benchmarks of the engine's hot paths on fixed synthetic inputs.
+
+Run ``python benchmarks.py`` to print timings and compare them with the
+stored baseline; ``--save-baseline`` records the current numbers as the
+new baseline and ``--output`` writes the results as JSON.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+
+BASELINE_PATH = "benchmarks_baseline.json"
+# A result slower than the baseline by more than this share is flagged
+REGRESSION_THRESHOLD = 0.2
+LISTINGS = 12000
+
+
+def measure(run, repeat=5):
+    """Best wall time of ``repeat`` calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        begin = perf_counter()
+        run()
+        best = min(best, perf_counter() - begin)
+    return best
+
+
+def synthetic_fetch(names, listings=LISTINGS, seed=0):
+    """A fetch response body with ``listings`` Watcher's Eye items in mixed currencies."""
+    from mod_matcher import synthetic_lines
+
+    rng = random.Random(seed)
+    lines = synthetic_lines(names, listings, seed)
+    per_item = len(lines) // listings
+    result = []
+    for i in range(listings):
+        result.append({
+            "id": f"{i:064x}",
+            "listing": {
+                "price": {"type": "~price", "amount": round(rng.lognormvariate(1, 1.2), 1),
+                          "currency": rng.choice(("divine", "divine", "chaos", "exalted"))},
+                "account": {"name": f"seller{i % 500}", "online": {"league": "Mercenaries"} if rng.random() < 0.7 else None},
+                "indexed": "2024-01-01T00:00:00Z",
+            },
+            # The fields the engine ignores are kept at their real size
+            "item": {
+                "verified": True, "w": 1, "h": 1, "league": "Mercenaries", "id": f"{i:064x}",
+                "icon": "https://web.poecdn.com/gen/image/WzI1LDE0LHsiZiI6IjJESXRlbXMvSmV3ZWxzL0VsZGVyQ29tYmF0SmV3ZWwiLCJ3IjoxLCJoIjoxLCJzY2FsZSI6MX1d/1b6c5bb1c9/ElderCombatJewel.png",
+                "typeLine": "Prismatic Jewel", "baseType": "Prismatic Jewel", "name": "Watcher's Eye",
+                "identified": True, "ilvl": rng.choice((84, 85, 86)), "corrupted": rng.random() < 0.1,
+                "properties": [{"name": "Limited to", "values": [["1", 0]], "displayMode": 0}],
+                "explicitMods": lines[i * per_item:(i + 1) * per_item],
+                "flavourText": ["One by one, they stood their ground against a creature", "they had no hope of understanding,",
+                                "let alone defeating, and one by one, they became a part of it."],
+                "frameType": 3,
+                "extended": {"mods": {"explicit": [{"name": "", "tier": "", "level": 1,
+                                                     "magnitudes": [{"hash": f"explicit.stat_{rng.randrange(10 ** 9)}", "min": 4, "max": 6}]}
+                                                    for _ in range(per_item)]},
+                             "hashes": {"explicit": [[f"explicit.stat_{rng.randrange(10 ** 9)}", [k]] for k in range(per_item)]}},
+            },
+        })
+    return {"result": result}
+
+
+def synthetic_rows(catalog, seed=0):
+    """One result row per pair, as the engine stores them."""
+    rng = random.Random(seed)
+    rows = []
+    for i, j in catalog.pairs():
+        price = round(rng.lognormvariate(0, 1.5), 2)
+        rows.append({
+            "mod1": catalog.names[i], "mod2": catalog.names[j], "avg_price": price,
+            "updated": 1700000000 + rng.randrange(10 ** 6), "listings": rng.randrange(1, 10),
+            "median": price, "min": round(price * 0.8, 2),
+        })
+    return rows
+
+
+def bench_payloads(catalog):
+    from trade_api import search_payload
+
+    combos = [catalog.combo_ids(combo) for combo in catalog.pairs()]
+    return measure(lambda: [json.dumps(search_payload(mods)) for mods in combos]), len(combos)
+
+
+def bench_price_extraction(catalog):
+    from currency_rates import ExchangeRates
+    from fetch_decoder import extract_listings
+    from price_aggregation import listing_prices
+
+    listings = extract_listings(synthetic_fetch(catalog.names))
+    rates = ExchangeRates({"chaos": 0.005, "exalted": 0.1})
+    return measure(lambda: listing_prices(listings, rates)), len(listings)
+
+
+def fetch_bodies(names):
+    """The synthetic listings as fetch response bodies of one batch each."""
+    from trade_api import FETCH_BATCH
+
+    result = synthetic_fetch(names)["result"]
+    return [
+        json.dumps({"result": result[start:start + FETCH_BATCH]}).encode()
+        for start in range(0, len(result), FETCH_BATCH)
+    ]
+
+
+def bench_json_decode(catalog):
+    """Decoding alone with the standard library, the cost before compact listings.
+
+    Each body is dropped once decoded, as the old fetch loop did; keeping
+    them all would time the garbage collector walking the live dicts.
+    """
+    bodies = fetch_bodies(catalog.names)
+
+    def run():
+        for body in bodies:
+            json.loads(body)
+
+    return measure(run), LISTINGS
+
+
+def bench_listing_decode(catalog):
+    """Decoding plus extraction of compact listings with the default decoder (orjson if installed)."""
+    from fetch_decoder import decode_listings
+
+    bodies = fetch_bodies(catalog.names)
+    return measure(lambda: [decode_listings(body) for body in bodies]), LISTINGS
+
+
+def bench_listing_decode_stdlib(catalog):
+    from fetch_decoder import decode_listings
+
+    bodies = fetch_bodies(catalog.names)
+    return measure(lambda: [decode_listings(body, json.loads) for body in bodies]), LISTINGS
+
+
+def bench_roll_parsing(catalog):
+    from fetch_decoder import extract_listings
+    from mod_matcher import ModMatcher
+    from roll_pricing import listing_rolls
+
+    listings = extract_listings(synthetic_fetch(catalog.names))
+    matcher = ModMatcher(catalog.names)
+    return measure(lambda: listing_rolls(listings, matcher)), len(listings)
+
+
+def bench_persistence(catalog):
+    from snapshot_store import ResultSnapshot
+
+    snapshot = ResultSnapshot(synthetic_rows(catalog), catalog)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "watcher_prices.json")
+        return measure(lambda: snapshot.save(path)), len(snapshot)
+
+
+def bench_table(catalog):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    from watchers_eye_gui import PriceFetcher
+
+    window = PriceFetcher()
+    rows = synthetic_rows(catalog)
+
+    def fill():
+        window.table.setRowCount(0)
+        window.row_index.clear()
+        window.row_updated.clear()
+        for row in rows:
+            window.update_table(row["avg_price"], row["mod1"], row["mod2"], "", row["updated"])
+        app.processEvents()
+
+    return measure(fill, repeat=3), len(rows)
+
+
+def bench_catalog_import(catalog):
+    # A fresh interpreter each time, so module and catalog caches start cold
+    code = (
+        "from time import perf_counter; begin = perf_counter(); "
+        "from mod_catalog import load_catalog; load_catalog(); print(perf_counter() - begin)"
+    )
+    here = os.path.dirname(os.path.abspath(__file__))
+    timings = [
+        float(subprocess.run([sys.executable, "-c", code], cwd=here, capture_output=True, text=True, check=True).stdout)
+        for _ in range(5)
+    ]
+    return min(timings), len(catalog)
+
+
+BENCHMARKS = {
+    "payload_construction": bench_payloads,
+    "price_extraction": bench_price_extraction,
+    "json_decode": bench_json_decode,
+    "listing_decode": bench_listing_decode,
+    "listing_decode_stdlib": bench_listing_decode_stdlib,
+    "roll_parsing": bench_roll_parsing,
+    "result_persistence": bench_persistence,
+    "table_insertion": bench_table,
+    "catalog_import": bench_catalog_import,
+}
+
+
+def run(names=None):
+    from mod_catalog import load_catalog
+
+    catalog = load_catalog()
+    results = {}
+    for name in names or BENCHMARKS:
+        seconds, size = BENCHMARKS[name](catalog)
+        results[name] = {"seconds": seconds, "size": size}
+    from fetch_decoder import DECODER
+
+    return {
+        "python": platform.python_version(), "machine": platform.machine(), "decoder": DECODER,
+        "benchmarks": results,
+    }
+
+
+def compare(results, baseline):
+    """Lines comparing each benchmark with the baseline; regressions are marked."""
+    lines = [f"{'benchmark':<22} {'size':>8} {'ms':>10} {'us/item':>9} {'baseline':>10} {'change':>8}"]
+    for name, result in results["benchmarks"].items():
+        previous = baseline.get("benchmarks", {}).get(name) if baseline else None
+        per_item = result["seconds"] / result["size"] * 1e6 if result["size"] else 0.0
+        line = f"{name:<22} {result['size']:>8} {result['seconds'] * 1000:>10.2f} {per_item:>9.2f}"
+        if previous:
+            change = result["seconds"] / previous["seconds"] - 1
+            flag = "  REGRESSION" if change > REGRESSION_THRESHOLD else ""
+            line += f" {previous['seconds'] * 1000:>10.2f} {change:>+8.1%}{flag}"
+        lines.append(line)
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("names", nargs="*", help=f"benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args()
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+
+    results = run(args.names)
+    try:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        baseline = None
+    print("\n".join(compare(results, baseline)))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import json
+import time
+
+from atomic_file import atomic_write
+
+RATES_PATH = "exchange_rates.json"
+RATES_URL = "https://poe.ninja/api/data/currencyoverview?league={league}&type=Currency"
+DEFAULT_LEAGUE = "Mercenaries"
+# Exchange rates drift slowly compared to Watcher's Eye prices
+REFRESH_SECONDS = 6 * 3600
+CHECK_SECONDS = 600
+
+
+class ExchangeRates:
+    """Value of one unit of each trade currency id, in divine orbs.
+
+    Rates come from poe.ninja and are cached on disk so a run can convert
+    listings immediately; a listing in a currency without a rate is dropped.
+    """
+
+    def __init__(self, rates=None, fetched=0.0):
+        self.rates = {"divine": 1.0}
+        self.rates.update(rates or {})
+        self.fetched = fetched
+
+    @classmethod
+    def load(cls, path=RATES_PATH):
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            return cls(data.get("rates"), data.get("fetched", 0.0))
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError) as e:
+            print("Exchange rate read error:", str(e))
+            return cls()
+
+    def save(self, path=RATES_PATH):
+        with atomic_write(path, encoding="utf-8") as f:
+            json.dump({"fetched": self.fetched, "rates": self.rates}, f, indent=2)
+
+    def is_stale(self, now=None):
+        return (now or time.time()) - self.fetched > REFRESH_SECONDS
+
+    def to_divine(self, amount, currency):
+        rate = self.rates.get(currency)
+        return amount * rate if rate is not None else None
+
+    def from_divine(self, amount, currency):
+        rate = self.rates.get(currency)
+        return amount / rate if rate else None
+
+    def update_from_ninja(self, data):
+        """Rebuild the table from a poe.ninja currency overview response."""
+        trade_ids = {d["name"]: d["tradeId"] for d in data.get("currencyDetails", []) if d.get("tradeId")}
+        chaos_values = {"chaos": 1.0}
+        for line in data.get("lines", []):
+            trade_id = trade_ids.get(line.get("currencyTypeName"))
+            if trade_id and line.get("chaosEquivalent"):
+                chaos_values[trade_id] = float(line["chaosEquivalent"])
+        divine = chaos_values.get("divine")
+        if not divine:
+            raise ValueError("No divine orb rate in exchange data")
+        self.rates = {trade_id: value / divine for trade_id, value in chaos_values.items()}
+        self.rates["divine"] = 1.0
+        self.fetched = time.time()
+
+    async def refresh(self, session, league=DEFAULT_LEAGUE, path=RATES_PATH):
+        async with session.get(RATES_URL.format(league=league)) as r:
+            if r.status != 200:
+                raise ValueError(f"Exchange rate error: {r.status}")
+            self.update_from_ninja(await r.json(content_type=None))
+        self.save(path)
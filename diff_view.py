@@ -0,0 +1,118 @@
+from datetime import datetime
+
+import numpy as np
+from PyQt5.QtWidgets import (
+    QComboBox, QHBoxLayout, QLabel, QPushButton, QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget
+)
+
+from snapshot_diff import DEFAULT_MOVERS, RANKINGS, SnapshotStack
+from snapshot_history import SnapshotHistory
+
+COLUMNS = ["Mod 1", "Mod 2", "Before", "After", "Change", "Change %", "Listings", "Status"]
+# Ranks by how far a price ranged over every snapshot in the span, not
+# just between its ends
+RANGE = "range"
+
+
+def _price(value):
+    return "-" if np.isnan(value) else f"{value:.2f}"
+
+
+def _count(value):
+    return "?" if value < 0 else str(value)
+
+
+class DiffView(QWidget):
+    """Top movers between two stored snapshots, plus new and vanished pairs."""
+
+    def __init__(self, catalog, stack, history=None, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.history = history or SnapshotHistory()
+        self.stack = stack
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("From"))
+        self.first_box = QComboBox()
+        controls.addWidget(self.first_box)
+        controls.addWidget(QLabel("To"))
+        self.second_box = QComboBox()
+        controls.addWidget(self.second_box)
+        controls.addWidget(QLabel("Rank by"))
+        self.rank_box = QComboBox()
+        self.rank_box.addItems(RANKINGS + (RANGE,))
+        controls.addWidget(self.rank_box)
+        self.reload_button = QPushButton("Reload")
+        controls.addWidget(self.reload_button)
+        controls.addStretch()
+        layout.addLayout(controls)
+
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        layout.addWidget(self.table)
+
+        self.first_box.currentIndexChanged.connect(self.show_diff)
+        self.second_box.currentIndexChanged.connect(self.show_diff)
+        self.rank_box.currentIndexChanged.connect(self.show_diff)
+        self.reload_button.clicked.connect(self.reload)
+        self.show_latest()
+
+    def reload(self):
+        """Re-read the whole snapshot history."""
+        self.stack = SnapshotStack.from_history(self.history, self.catalog)
+        self.show_latest()
+
+    def add_snapshot(self, stamp, records):
+        """Append a snapshot the worker just stored, without re-reading the history."""
+        self.stack.append(stamp, records)
+        self.show_latest()
+
+    def show_latest(self):
+        """Compare the last two snapshots."""
+        labels = [f"{datetime.fromtimestamp(stamp):%Y-%m-%d %H:%M}" for stamp in self.stack.times]
+        for box, index in ((self.first_box, len(labels) - 2), (self.second_box, len(labels) - 1)):
+            box.blockSignals(True)
+            box.clear()
+            box.addItems(labels)
+            box.setCurrentIndex(max(index, 0))
+            box.blockSignals(False)
+        self.show_diff()
+
+    def show_diff(self):
+        self.table.setRowCount(0)
+        if len(self.stack) < 2:
+            self.summary_label.setText("Two stored snapshots are needed for a comparison.")
+            return
+        first, second = self.first_box.currentIndex(), self.second_box.currentIndex()
+        diff = self.stack.diff(first, second)
+        summary = diff.summary()
+        self.summary_label.setText(
+            f"{summary['changed']} price change(s), {summary['new']} new, {summary['vanished']} vanished, "
+            f"{summary['listings_changed']} listing count change(s)"
+        )
+        ranking = self.rank_box.currentText()
+        if ranking == RANGE:
+            span = sorted((first, second))
+            rows = [(pair, "ranged") for pair in self.stack.top_swings(DEFAULT_MOVERS, *span)]
+        else:
+            rows = [(pair, "changed") for pair in diff.top_movers(DEFAULT_MOVERS, ranking)]
+        rows += [(pair, "new") for pair in diff.top_new()]
+        rows += [(pair, "vanished") for pair in diff.top_vanished()]
+
+        self.table.setUpdatesEnabled(False)
+        self.table.setRowCount(len(rows))
+        names = self.catalog.names
+        for row, ((i, j), status) in enumerate(rows):
+            change = diff.relative[i, j]
+            values = [
+                names[i], names[j], _price(diff.before[i, j]), _price(diff.after[i, j]),
+                _price(diff.absolute[i, j]), "-" if np.isnan(change) else f"{change:+.1%}",
+                f"{_count(diff.before_counts[i, j])} → {_count(diff.after_counts[i, j])}", status,
+            ]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(value))
+        self.table.setUpdatesEnabled(True)
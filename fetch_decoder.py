@@ -0,0 +1,40 @@
+import json
+
+from records import Listing
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DECODER = "orjson" if orjson else "json"
+
+
+def loads(content):
+    """Decode a JSON response body with orjson when it is installed."""
+    return orjson.loads(content) if orjson else json.loads(content)
+
+
+def extract_listings(data):
+    """Compact listings from a decoded fetch response; unpriced entries are skipped."""
+    listings = []
+    for entry in data.get("result") or []:
+        try:
+            listing = entry["listing"]
+            price = listing["price"]
+            amount = float(price["amount"])
+            currency = price["currency"]
+        except (KeyError, TypeError, ValueError):
+            continue
+        item = entry.get("item") or {}
+        listings.append(Listing(
+            entry["id"], amount, currency,
+            bool(item.get("corrupted")), item.get("ilvl", 0),
+            tuple(item.get("explicitMods") or ()),
+        ))
+    return listings
+
+
+def decode_listings(content, decode=loads):
+    """Compact listings straight from a fetch response body."""
+    return extract_listings(decode(content))
@@ -0,0 +1,60 @@
+from trade_api import CLEAN_FILTERS, search_payload
+
+# Batches fetched per broad query, so the narrower variants still see a
+# sample comparable to a filtered search of one batch
+VARIANT_BATCHES = 2
+
+
+class FilterVariant:
+    """A listing filter that is applied locally instead of by the trade search."""
+
+    __slots__ = ("name", "currency", "clean")
+
+    def __init__(self, name, currency=None, clean=False):
+        self.name = name
+        self.currency = currency
+        self.clean = clean
+
+    def matches(self, listing):
+        if self.currency is not None and listing.currency != self.currency:
+            return False
+        if self.clean and (listing.corrupted or listing.ilvl < CLEAN_FILTERS["ilvl"]["min"]):
+            return False
+        return True
+
+
+# The filters the tools have historically priced with
+VARIANTS = (
+    FilterVariant("online"),
+    FilterVariant("divine", currency="divine"),
+    FilterVariant("clean", clean=True),
+)
+VARIANT_NAMES = tuple(variant.name for variant in VARIANTS)
+# Variant whose price stands for the combo in each search mode
+PAIR_VARIANT = "online"
+SINGLE_VARIANT = "clean"
+
+
+def broad_payload(mods):
+    """Search body shared by every filter variant.
+
+    Currency and item-state filters are left out so each variant can be
+    carved out of the same fetched listings; like every other search it
+    only covers online sellers.
+    """
+    return search_payload(mods)
+
+
+def partition(listings, rates, variants=VARIANTS):
+    """``{variant name: [(listing id, divine amount), ...]}`` for one result set.
+
+    Listings in a currency without an exchange rate are left out of every variant.
+    """
+    divine = {listing.id: rates.to_divine(listing.amount, listing.currency) for listing in listings}
+    return {
+        variant.name: [
+            (listing.id, divine[listing.id]) for listing in listings
+            if divine[listing.id] is not None and variant.matches(listing)
+        ]
+        for variant in variants
+    }
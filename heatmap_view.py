@@ -0,0 +1,197 @@
+import numpy as np
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QColor, QImage, QPainter
+from PyQt5.QtWidgets import QCheckBox, QHBoxLayout, QLabel, QScrollArea, QToolTip, QVBoxLayout, QWidget
+
+from mod_catalog import AURAS
+
+MISSING_COLOR = 0xFF202020
+# Estimated cells are drawn at half intensity over the missing colour
+_HALF_MASK = 0x00FEFEFE
+MIN_CELL, MAX_CELL = 2, 32
+
+# Anchor colours of the price scale, cheap to expensive
+_ANCHORS = np.array([
+    (68, 1, 84), (59, 82, 139), (33, 145, 140), (94, 201, 98), (253, 231, 37)
+], dtype=float)
+
+
+def build_palette(size=256):
+    """ARGB32 lookup table interpolated between the anchor colours."""
+    steps = np.linspace(0, len(_ANCHORS) - 1, size)
+    low = np.floor(steps).astype(int)
+    high = np.minimum(low + 1, len(_ANCHORS) - 1)
+    frac = (steps - low)[:, None]
+    rgb = (_ANCHORS[low] * (1 - frac) + _ANCHORS[high] * frac).round().astype(np.uint32)
+    return 0xFF000000 | (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+
+
+class HeatmapCanvas(QWidget):
+    """Pair-price matrix painted from a NumPy ARGB buffer shared with a QImage.
+
+    Colours use a log scale up to the most expensive pair; incremental
+    updates only rewrite the two mirrored pixels of the changed pair.
+    """
+
+    def __init__(self, catalog, matrix, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.matrix = matrix
+        self.palette_lut = build_palette()
+        self.cell = 8
+        self.grouped = False
+        self.order = np.arange(matrix.size)
+        self.position = np.arange(matrix.size)
+        self.scale_max = 0.0
+        self.estimate = None
+        self.show_estimates = False
+
+        size = matrix.size
+        self.pixels = np.full((size, size), MISSING_COLOR, dtype=np.uint32)
+        # The QImage reads straight from self.pixels, which is only ever written in place
+        self.image = QImage(self.pixels.data, size, size, size * 4, QImage.Format_ARGB32)
+
+        self.setMouseTracking(True)
+        self.rebuild()
+
+    def _colors(self, prices):
+        scale = np.log1p(self.scale_max) or 1.0
+        with np.errstate(invalid="ignore"):
+            levels = np.clip(np.log1p(prices) / scale * 255, 0, 255)
+        levels = np.nan_to_num(levels).astype(np.intp)
+        return np.where(np.isnan(prices), MISSING_COLOR, self.palette_lut[levels])
+
+    def rebuild(self):
+        view = np.ix_(self.order, self.order)
+        prices = self.matrix.prices[view]
+        self.scale_max = float(np.nanmax(prices)) if np.isfinite(prices).any() else 0.0
+        colors = self._colors(prices)
+        if self.show_estimates and self.estimate is not None:
+            estimated = self._colors(self.estimate.mean[view])
+            dimmed = ((estimated & _HALF_MASK) >> 1) + ((MISSING_COLOR & _HALF_MASK) >> 1) | 0xFF000000
+            fill = np.isnan(prices) & ~np.isnan(self.estimate.mean[view])
+            colors = np.where(fill, dimmed, colors)
+        self.pixels[...] = colors
+        self._resize()
+        self.update()
+
+    def set_estimate(self, estimate):
+        self.estimate = estimate
+        if self.show_estimates:
+            self.rebuild()
+
+    def set_show_estimates(self, show):
+        self.show_estimates = show
+        self.rebuild()
+
+    def update_pair(self, i, j):
+        price = self.matrix.prices[i, j]
+        if price > self.scale_max or (np.isnan(price) and self.show_estimates):
+            self.rebuild()
+            return
+        color = self._colors(np.array([price]))[0]
+        row, col = self.position[i], self.position[j]
+        self.pixels[row, col] = self.pixels[col, row] = color
+        self.update(QRect(col * self.cell, row * self.cell, self.cell, self.cell))
+        self.update(QRect(row * self.cell, col * self.cell, self.cell, self.cell))
+
+    def set_grouped(self, grouped):
+        self.grouped = grouped
+        aura_ids = np.asarray(self.catalog.aura_ids)
+        self.order = np.argsort(aura_ids, kind="stable") if grouped else np.arange(self.matrix.size)
+        self.position = np.argsort(self.order)
+        self.rebuild()
+
+    def set_cell(self, cell):
+        self.cell = max(MIN_CELL, min(MAX_CELL, cell))
+        self._resize()
+        self.update()
+
+    def _resize(self):
+        side = self.matrix.size * self.cell
+        self.setFixedSize(side, side)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        side = self.matrix.size * self.cell
+        painter.drawImage(QRect(0, 0, side, side), self.image)
+        if self.grouped:
+            painter.setPen(QColor(255, 255, 255, 160))
+            sorted_auras = np.asarray(self.catalog.aura_ids)[self.order]
+            for start in np.flatnonzero(sorted_auras[1:] != sorted_auras[:-1]) + 1:
+                offset = int(start) * self.cell
+                painter.drawLine(offset, 0, offset, side)
+                painter.drawLine(0, offset, side, offset)
+        painter.end()
+
+    def wheelEvent(self, event):
+        if event.modifiers() & Qt.ControlModifier:
+            self.set_cell(self.cell + (1 if event.angleDelta().y() > 0 else -1))
+            event.accept()
+        else:
+            super().wheelEvent(event)
+
+    def mouseMoveEvent(self, event):
+        row, col = event.y() // self.cell, event.x() // self.cell
+        if not (0 <= row < self.matrix.size and 0 <= col < self.matrix.size) or row == col:
+            QToolTip.hideText()
+            return
+        i, j = int(self.order[row]), int(self.order[col])
+        price = self.matrix.prices[i, j]
+        if not np.isnan(price):
+            price_text = f"{price:.2f} divine ({self.matrix.counts[i, j]} listings)"
+        elif self.estimate is not None and not np.isnan(self.estimate.mean[i, j]):
+            price_text = (
+                f"est. {self.estimate.mean[i, j]:.2f} divine "
+                f"(90%: {self.estimate.low[i, j]:.2f} – {self.estimate.high[i, j]:.2f})"
+            )
+        else:
+            price_text = "no price"
+        names = self.catalog.names
+        auras = self.catalog.aura_ids
+        QToolTip.showText(
+            event.globalPos(),
+            f"{names[i]} [{AURAS[auras[i]]}]\n{names[j]} [{AURAS[auras[j]]}]\n{price_text}",
+            self
+        )
+
+
+class HeatmapView(QWidget):
+    def __init__(self, catalog, matrix, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+
+        controls = QHBoxLayout()
+        self.group_checkbox = QCheckBox("Group by aura")
+        controls.addWidget(self.group_checkbox)
+        self.estimate_checkbox = QCheckBox("Show estimates")
+        controls.addWidget(self.estimate_checkbox)
+        self.scale_label = QLabel()
+        controls.addWidget(self.scale_label)
+        controls.addStretch()
+        controls.addWidget(QLabel("Ctrl+wheel to zoom"))
+        layout.addLayout(controls)
+
+        self.canvas = HeatmapCanvas(catalog, matrix)
+        scroll = QScrollArea()
+        scroll.setWidget(self.canvas)
+        layout.addWidget(scroll)
+
+        self.group_checkbox.toggled.connect(self.set_grouped)
+        self.estimate_checkbox.toggled.connect(self.canvas.set_show_estimates)
+        self._update_scale_label()
+
+    def set_grouped(self, grouped):
+        self.canvas.set_grouped(grouped)
+        self._update_scale_label()
+
+    def update_pair(self, i, j):
+        self.canvas.update_pair(i, j)
+        self._update_scale_label()
+
+    def set_estimate(self, estimate):
+        self.canvas.set_estimate(estimate)
+
+    def _update_scale_label(self):
+        self.scale_label.setText(f"Scale: 0 – {self.canvas.scale_max:.1f} divine (log)")
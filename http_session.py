@@ -0,0 +1,139 @@
+import asyncio
+import importlib.util
+import time
+
+import aiohttp
+
+from metrics import rate_limit_states
+
+USER_AGENT = "poe-watchers-eye-analyzer/1.0"
+# The trade API is reached one request at a time; a few pooled connections
+# cover the search/fetch pair, the rate refresher and proxy loading
+CONNECTION_LIMIT = 8
+CONNECTIONS_PER_HOST = 4
+DNS_CACHE_SECONDS = 600
+KEEPALIVE_SECONDS = 60
+WARMUP_URL = "https://www.pathofexile.com/api/trade/data/leagues"
+
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=60, connect=10, sock_read=30)
+SEARCH_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10, sock_read=20)
+FETCH_TIMEOUT = aiohttp.ClientTimeout(total=20, connect=10, sock_read=15)
+WARMUP_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=5)
+# Spacing of requests to an endpoint until its rate-limit rules are known
+DEFAULT_REQUEST_INTERVAL = 5.0
+
+# aiohttp decodes brotli only when a brotli module is installed
+ACCEPT_ENCODING = "gzip, deflate, br" if (
+    importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi")
+) else "gzip, deflate"
+
+
+class ConnectionStats:
+    """Counts new versus reused connections and DNS cache hits of a session.
+
+    Counters go to ``metrics`` when given, so reuse shows up next to the
+    request latencies.
+    """
+
+    def __init__(self, metrics=None):
+        self.metrics = metrics
+        self.counts = {"connections_opened": 0, "connections_reused": 0, "dns_hits": 0, "dns_misses": 0, "requests": 0}
+
+    def trace_config(self):
+        config = aiohttp.TraceConfig()
+        config.on_connection_create_end.append(self._counter("connections_opened"))
+        config.on_connection_reuseconn.append(self._counter("connections_reused"))
+        config.on_dns_cache_hit.append(self._counter("dns_hits"))
+        config.on_dns_cache_miss.append(self._counter("dns_misses"))
+        config.on_request_end.append(self._counter("requests"))
+        return config
+
+    def _counter(self, name):
+        async def count(session, context, params):
+            self.counts[name] += 1
+            if self.metrics is not None:
+                self.metrics.inc(f"http_{name}")
+        return count
+
+    def reuse_ratio(self):
+        connections = self.counts["connections_opened"] + self.counts["connections_reused"]
+        return self.counts["connections_reused"] / connections if connections else None
+
+    def report(self):
+        ratio = self.reuse_ratio()
+        return (
+            f"Connections: {self.counts['connections_opened']} opened, {self.counts['connections_reused']} reused"
+            f"{f' ({ratio:.0%} reuse)' if ratio is not None else ''} over {self.counts['requests']} request(s); "
+            f"DNS cache {self.counts['dns_hits']} hit(s), {self.counts['dns_misses']} miss(es)"
+        )
+
+
+class RequestPacer:
+    """Spaces the requests to each trade API endpoint by its rate-limit rules.
+
+    The rules and states come from the ``X-Rate-Limit-*`` headers of the
+    endpoint's last response. Requests are spaced at the sustained rate of
+    the strictest rule; when a rule is one hit from its limit the rest of
+    its window is waited out, and an active restriction is waited out in
+    full, so a burst of paged searches never runs into a 429 and the
+    timeout that comes with it.
+    """
+
+    def __init__(self, default_interval=DEFAULT_REQUEST_INTERVAL):
+        self.default_interval = default_interval
+        self.intervals = {}
+        self.last = {}
+
+    def observe(self, endpoint, headers):
+        states = rate_limit_states(headers)
+        if not states:
+            return
+        interval = max(window / allowed for _, _, allowed, window, _ in states)
+        for _, hits, allowed, window, restricted in states:
+            if restricted:
+                interval = max(interval, restricted)
+            elif hits >= allowed - 1:
+                interval = max(interval, window)
+        self.intervals[endpoint] = interval
+
+    async def wait(self, endpoint):
+        """Sleep until the next request to ``endpoint`` is allowed; returns the seconds waited."""
+        interval = self.intervals.get(endpoint, self.default_interval)
+        delay = self.last.get(endpoint, float("-inf")) + interval - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self.last[endpoint] = time.monotonic()
+        return max(delay, 0.0)
+
+
+def create_session(stats=None, headers=None):
+    """The engine's HTTP session: pooled keep-alive connections, cached DNS and bounded timeouts."""
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT,
+        limit_per_host=CONNECTIONS_PER_HOST,
+        use_dns_cache=True,
+        ttl_dns_cache=DNS_CACHE_SECONDS,
+        keepalive_timeout=KEEPALIVE_SECONDS,
+    )
+    session_headers = {
+        "User-Agent": USER_AGENT,
+        "Content-Type": "application/json",
+        "Accept-Encoding": ACCEPT_ENCODING,
+    }
+    session_headers.update(headers or {})
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers=session_headers,
+        timeout=DEFAULT_TIMEOUT,
+        trace_configs=[stats.trace_config()] if stats else None,
+    )
+
+
+async def warm_up(session, url=WARMUP_URL):
+    """Open (and keep alive) a connection before the first timed request; returns success."""
+    try:
+        async with session.get(url, timeout=WARMUP_TIMEOUT) as r:
+            await r.read()
+            return r.status < 500
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return False
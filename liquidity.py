@@ -0,0 +1,74 @@
+import json
+import time
+
+from atomic_file import atomic_write
+from records import ScanRecord
+
+LIQUIDITY_PATH = "liquidity.json"
+# A scan that found no listings keeps a pair out of price searches this long
+LIQUIDITY_TTL = 24 * 3600
+# A scan is one request instead of a search and a fetch, so it can wait half as long
+SCAN_COUNTDOWN = 5
+# The store is written every this many scans and when the run ends; a crash
+# loses at most this many scans
+SCAN_SAVE_EVERY = 50
+
+
+def load_liquidity(path=LIQUIDITY_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError) as e:
+        print("Liquidity read error:", str(e))
+        return []
+
+
+def scanned_empty(matrix, now=None):
+    """Pairs a recent liquidity scan found no listings for."""
+    now = time.time() if now is None else now
+    return (matrix.totals == 0) & (now - matrix.totals_updated < LIQUIDITY_TTL)
+
+
+class LiquidityStore:
+    """Listing count and result ids per combo from search-only scans.
+
+    Result ids are kept packed in each record; rows naming mods that are no
+    longer in the catalog are written back unchanged.
+    """
+
+    def __init__(self, rows, catalog):
+        self.catalog = catalog
+        self.records = {}
+        self.unmatched = []
+        # Scans recorded since the last save
+        self.unsaved = 0
+        for row in rows:
+            record = ScanRecord.from_row(catalog, row)
+            if record is None:
+                self.unmatched.append(row)
+            else:
+                self.records[tuple(sorted(record.combo))] = record
+
+    def __len__(self):
+        return len(self.records) + len(self.unmatched)
+
+    def update(self, combo, total, ids, updated=None):
+        record = ScanRecord(tuple(combo), total, ids, round(updated if updated is not None else time.time()))
+        self.records[tuple(sorted(record.combo))] = record
+        self.unsaved += 1
+        return record
+
+    def apply_to(self, matrix):
+        for record in self.records.values():
+            if len(record.combo) == 2:
+                matrix.set_total(*record.combo, record.total, record.updated)
+
+    def to_list(self):
+        return [record.to_row(self.catalog) for record in self.records.values()] + self.unmatched
+
+    def save(self, path=LIQUIDITY_PATH):
+        with atomic_write(path, encoding="utf-8") as f:
+            json.dump(self.to_list(), f, ensure_ascii=False, separators=(",", ":"))
+        self.unsaved = 0
@@ -1,13 +1,10 @@
 import sys
-import asyncio
-import aiohttp
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton,
     QTableWidget, QTableWidgetItem, QLabel
 )
 from PyQt5.QtCore import QTimer, pyqtSlot
-from mod_data import MOD_COMBOS, MOD_NAMES
-import json
+from mod_catalog import load_catalog
 
 class PriceFetcher(QWidget):
     def __init__(self):
@@ -33,11 +30,12 @@ class PriceFetcher(QWidget):
         layout.addWidget(self.table)
 
         self.setLayout(layout)
-        self.loop = asyncio.new_event_loop()
+        self.loop = None
         self.debug_info = ""
         self.task = None
         self.request_count = 0
         self.minute_start = None
+        self.rates = None
 
     def refresh_data(self):
         self.status_label.setText("Querying trade site...")
@@ -61,6 +59,9 @@ class PriceFetcher(QWidget):
         msg.exec_()
 
     def run_async_task(self):
+        import asyncio
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
         self.task = self.loop.create_task(self.run_price_checks())
         self.loop.run_until_complete(self.task)
@@ -76,34 +77,48 @@ class PriceFetcher(QWidget):
 
     async def run_price_checks(self):
         from time import time
+        from currency_rates import ExchangeRates
+        from http_session import create_session
         headers = {
             "User-Agent": "poe-watchers-eye-analyzer/1.0 (contact: weakness.of.power@gmail.com)",
-            "Content-Type": "application/json"
         }
         
         self.request_count = 0
         self.minute_start = time()
-        
-        async with aiohttp.ClientSession(headers=headers) as session:
-            for i, (mod1, mod2) in enumerate(MOD_COMBOS):
-                self.debug_info += f"\n\nProcessing mods: {MOD_NAMES[mod1]} + {MOD_NAMES[mod2]}\n"
-                self.status_label.setText(f"Processing ({i+1}/{len(MOD_COMBOS)}): {MOD_NAMES[mod1]}")
+
+        catalog = load_catalog()
+        total = catalog.combo_count(2)
+        self.rates = ExchangeRates.load()
+
+        async with create_session(headers=headers) as session:
+            # Listings in currencies without a rate are dropped, so refresh first
+            if self.rates.is_stale():
+                try:
+                    await self.rates.refresh(session)
+                except Exception as e:
+                    self.debug_info += f"\nExchange rate refresh failed: {str(e)}"
+            for i, combo in enumerate(catalog.pairs()):
+                mod1, mod2 = catalog.combo_ids(combo)
+                name1, name2 = catalog.combo_names(combo)
+                self.debug_info += f"\n\nProcessing mods: {name1} + {name2}\n"
+                self.status_label.setText(f"Processing ({i+1}/{total}): {name1}")
                 
                 avg_price = await self.query_price(session, mod1, mod2)
                 # Use QTimer to update UI from async context
-                QTimer.singleShot(0, lambda p=avg_price, m1=MOD_NAMES[mod1], m2=MOD_NAMES[mod2]: 
+                QTimer.singleShot(0, lambda p=avg_price, m1=name1, m2=name2: 
                                 self.update_table_slot(p, m1, m2))
                 
                 # Rate limiting - ensure 15 requests per minute
                 await self.rate_limit()
                 
-                if i < len(MOD_COMBOS) - 1:
-                    self.status_label.setText(f"Waiting for rate limit... ({i+1}/{len(MOD_COMBOS)})")
+                if i < total - 1:
+                    self.status_label.setText(f"Waiting for rate limit... ({i+1}/{total})")
         
         self.status_label.setText("Done.")
 
     async def rate_limit(self):
         from time import time
+        import asyncio
         self.request_count += 2  # Each mod pair = 2 requests (search + fetch)
         
         if self.request_count >= 14:  # Slightly less than 15 to be safe
@@ -117,6 +132,10 @@ class PriceFetcher(QWidget):
             await asyncio.sleep(60 / 7.5 - (time() - self.minute_start) % (60 / 7.5) if self.request_count < 14 else 0)
 
     async def query_price(self, session, mod1, mod2):
+        import json
+        from fetch_decoder import extract_listings
+        from price_aggregation import listing_prices, summarize
+        from trade_api import FETCH_BATCH
         try:
             # Step 1: Search request
             search_payload = {
@@ -151,7 +170,7 @@ class PriceFetcher(QWidget):
                 return None
                 
             # Step 2: Fetch listings
-            result_ids = search_data["result"][:5]
+            result_ids = search_data["result"][:FETCH_BATCH]
             fetch_url = f"https://www.pathofexile.com/api/trade/fetch/{','.join(result_ids)}?query={search_data['id']}"
             self.debug_info += f"\n[FETCH REQUEST] URL: {fetch_url}"
             
@@ -169,21 +188,16 @@ class PriceFetcher(QWidget):
                 listings = await r.json()
                 self.debug_info += f"\nListings Received: {len(listings.get('result', []))}"
                 
-            # Process prices
-            prices = []
-            for item in listings.get("result", []):
-                try:
-                    price = item["listing"]["price"]
-                    if price["currency"] == "divine":
-                        prices.append(price["amount"])
-                        self.debug_info += f"\n- Found price: {price['amount']} divine"
-                except KeyError:
-                    continue
-                    
-            if prices:
-                avg = sum(prices) / len(prices)
-                self.debug_info += f"\nAverage price: {avg:.2f} divine"
-                return avg
+            # Process prices: every currency is converted to divine and
+            # likely price-fixing listings are rejected
+            prices = listing_prices(extract_listings(listings), self.rates)
+            for listing_id, amount in prices:
+                self.debug_info += f"\n- Found price: {amount:.2f} divine"
+
+            summary = summarize([amount for _, amount in prices])
+            if summary["count"]:
+                self.debug_info += f"\nTrimmed mean price: {summary['trimmed_mean']:.2f} divine"
+                return summary["trimmed_mean"]
             return None
             
         except Exception as e:
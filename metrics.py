@@ -0,0 +1,192 @@
+import asyncio
+import threading
+import time
+from collections import deque
+
+from atomic_file import atomic_write
+
+METRICS_PATH = "metrics.prom"
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+LAG_INTERVAL = 0.5
+# Combos per minute is measured over this many trailing seconds
+RATE_WINDOW = 300
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q):
+        """Upper bucket bound below which a ``q`` share of observations fall."""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return float("inf")
+
+
+def _label_text(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in labels) + "}"
+
+
+def rate_limit_states(headers):
+    """``[(rule, hits, allowed, window seconds, restricted seconds)]`` from trade API headers."""
+    states = []
+    for rule in filter(None, (headers.get("X-Rate-Limit-Rules") or "").split(",")):
+        limits = headers.get(f"X-Rate-Limit-{rule}") or ""
+        current = headers.get(f"X-Rate-Limit-{rule}-State") or ""
+        for limit, state in zip(limits.split(","), current.split(",")):
+            try:
+                allowed, window = int(limit.split(":")[0]), int(limit.split(":")[1])
+                hits = int(state.split(":")[0])
+                restricted = int(state.split(":")[2]) if state.count(":") >= 2 else 0
+            except (ValueError, IndexError):
+                continue
+            if allowed:
+                states.append((rule.lower(), hits, allowed, window, restricted))
+    return states
+
+
+def parse_rate_limits(headers):
+    """``{(rule, window seconds): share of the window's requests used}`` from trade API headers."""
+    return {(rule, window): hits / allowed for rule, hits, allowed, window, _ in rate_limit_states(headers)}
+
+
+class Metrics:
+    """Counters, gauges and histograms of one engine run.
+
+    Samples are keyed by metric name and a sorted tuple of label pairs. The
+    worker thread records and the GUI thread reads, so every access holds
+    the lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+        self.started = time.time()
+        self.completions = deque()
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def set(self, name, value, **labels):
+        with self._lock:
+            self.gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def observe(self, name, value, buckets=LATENCY_BUCKETS, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def record_response(self, endpoint, status, seconds, sent, received, headers):
+        self.observe("request_seconds", seconds, endpoint=endpoint)
+        self.inc("request_bytes_out", sent, endpoint=endpoint)
+        self.inc("request_bytes_in", received, endpoint=endpoint)
+        self.inc("responses", endpoint=endpoint, status=f"{status // 100}xx" if status != 429 else "429")
+        for (rule, window), fill in parse_rate_limits(headers).items():
+            self.set("rate_limit_fill", fill, endpoint=endpoint, rule=rule, window=window)
+
+    def combo_done(self, now=None):
+        now = time.time() if now is None else now
+        self.inc("combos")
+        with self._lock:
+            self.completions.append(now)
+            while self.completions and self.completions[0] < now - RATE_WINDOW:
+                self.completions.popleft()
+
+    def combos_per_minute(self, now=None):
+        now = time.time() if now is None else now
+        with self._lock:
+            recent = sum(1 for done in self.completions if done >= now - RATE_WINDOW)
+        return recent * 60 / min(RATE_WINDOW, max(now - self.started, 1.0))
+
+    def to_openmetrics(self):
+        self.set("combos_per_minute", self.combos_per_minute())
+        lines = []
+        with self._lock:
+            for kind, samples in (("counter", self.counters), ("gauge", self.gauges)):
+                typed = set()
+                for (name, labels), value in sorted(samples.items()):
+                    if name not in typed:
+                        lines.append(f"# TYPE {name} {kind}")
+                        typed.add(name)
+                    suffix = "_total" if kind == "counter" else ""
+                    lines.append(f"{name}{suffix}{_label_text(labels)} {value}")
+            typed = set()
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                if name not in typed:
+                    lines.append(f"# TYPE {name} histogram")
+                    typed.add(name)
+                cumulative = 0
+                for bound, count in zip(histogram.buckets + ("+Inf",), histogram.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_label_text(labels + (('le', bound),))} {cumulative}")
+                lines.append(f"{name}_count{_label_text(labels)} {histogram.count}")
+                lines.append(f"{name}_sum{_label_text(labels)} {histogram.sum}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def save(self, path=METRICS_PATH):
+        with atomic_write(path, encoding="utf-8") as f:
+            f.write(self.to_openmetrics())
+
+    def summary(self):
+        """Human-readable lines for the stats panel."""
+        lines = [f"Combos per minute: {self.combos_per_minute():.2f}"]
+        with self._lock:
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                if not histogram.count:
+                    continue
+                label = ", ".join(f"{k}={v}" for k, v in labels)
+                p50, p95 = histogram.quantile(0.5), histogram.quantile(0.95)
+                lines.append(
+                    f"{name} [{label}]: n={histogram.count} mean={histogram.sum / histogram.count:.3f}s "
+                    f"p50≤{p50}s p95≤{p95}s"
+                )
+            for (name, labels), value in sorted(self.counters.items()):
+                label = ", ".join(f"{k}={v}" for k, v in labels)
+                lines.append(f"{name} [{label}]: {value}")
+            for (name, labels), value in sorted(self.gauges.items()):
+                label = ", ".join(f"{k}={v}" for k, v in labels)
+                lines.append(f"{name} [{label}]: {value:.3g}" if isinstance(value, float) else f"{name} [{label}]: {value}")
+        return lines
+
+
+async def watch_loop_lag(metrics, interval=LAG_INTERVAL):
+    """Record how late the event loop wakes up from a fixed sleep."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        lag = max(loop.time() - start - interval, 0.0)
+        metrics.observe("event_loop_lag_seconds", lag, buckets=LAG_BUCKETS)
+        metrics.set("event_loop_lag_last_seconds", lag)
@@ -0,0 +1,167 @@
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+from itertools import combinations
+from math import comb
+from time import perf_counter
+
+from atomic_file import atomic_write
+
+STAT_PREFIX = "explicit.stat_"
+
+AURAS = (
+    "Anger", "Clarity", "Determination", "Discipline", "Grace", "Haste", "Hatred",
+    "Malevolence", "Precision", "Pride", "Purity of Elements", "Purity of Fire",
+    "Purity of Ice", "Purity of Lightning", "Vitality", "Wrath", "Zealotry",
+)
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATH = os.path.join(_HERE, "mod_data.py")
+CACHE_PATH = os.path.join(_HERE, "mod_catalog.bin")
+
+CACHE_MAGIC = b"WECAT"
+CACHE_VERSION = 1
+# magic, pad, version, mod count, sha1 of mod_data.py; 32 bytes so the arrays stay aligned
+_HEADER = struct.Struct("=5sxHI20s")
+
+
+def aura_index(name):
+    for i, aura in enumerate(AURAS):
+        if aura in name:
+            return i
+    raise ValueError(f"No aura found in mod name: {name}")
+
+
+class ModCatalog:
+    """Watcher's Eye mods interned to small integer indexes.
+
+    Combos are tuples of indexes generated on demand instead of being kept
+    as thousands of stat id string tuples.
+    """
+
+    __slots__ = ("stat_numbers", "stat_ids", "names", "aura_ids", "_index", "_name_index", "load_source", "load_seconds")
+
+    def __init__(self, stat_numbers, names):
+        # Either an array("I") or a memoryview over the mapped cache file
+        self.stat_numbers = stat_numbers if isinstance(stat_numbers, memoryview) else array("I", stat_numbers)
+        self.stat_ids = tuple(f"{STAT_PREFIX}{n}" for n in self.stat_numbers)
+        self.names = tuple(names)
+        self.aura_ids = array("B", (aura_index(name) for name in self.names))
+        self._index = {stat_id: i for i, stat_id in enumerate(self.stat_ids)}
+        self._name_index = {name: i for i, name in enumerate(self.names)}
+        self.load_source = None
+        self.load_seconds = 0.0
+
+    @classmethod
+    def from_mod_names(cls, mod_names):
+        numbers = [int(stat_id[len(STAT_PREFIX):]) for stat_id in mod_names]
+        return cls(numbers, mod_names.values())
+
+    def __len__(self):
+        return len(self.stat_ids)
+
+    def index(self, stat_id):
+        return self._index[stat_id]
+
+    def name_of(self, stat_id):
+        return self.names[self._index[stat_id]]
+
+    def index_of_name(self, name):
+        return self._name_index[name]
+
+    def combos(self, size):
+        return combinations(range(len(self.stat_ids)), size)
+
+    def combo_count(self, size):
+        return comb(len(self.stat_ids), size)
+
+    def singles(self):
+        return self.combos(1)
+
+    def pairs(self):
+        return self.combos(2)
+
+    def triples(self):
+        return self.combos(3)
+
+    def combo_ids(self, combo):
+        return tuple(self.stat_ids[i] for i in combo)
+
+    def combo_names(self, combo):
+        return tuple(self.names[i] for i in combo)
+
+
+def _source_digest(path=SOURCE_PATH):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).digest()
+
+
+def write_cache(catalog, digest, path=CACHE_PATH):
+    blobs = [name.encode("utf-8") for name in catalog.names]
+    offsets = array("I", [0])
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+
+    with atomic_write(path, "wb") as f:
+        f.write(_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, len(catalog), digest))
+        f.write(array("I", catalog.stat_numbers).tobytes())
+        f.write(offsets.tobytes())
+        f.write(b"".join(blobs))
+
+
+def read_cache(digest, path=CACHE_PATH):
+    """Return the cached catalog, or None if it is missing or stale."""
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(mapped) < _HEADER.size:
+        return None
+    magic, version, count, cached_digest = _HEADER.unpack_from(mapped)
+    if magic != CACHE_MAGIC or version != CACHE_VERSION or cached_digest != digest:
+        return None
+
+    view = memoryview(mapped)
+    numbers_end = _HEADER.size + 4 * count
+    offsets_end = numbers_end + 4 * (count + 1)
+    if len(mapped) < offsets_end:
+        return None
+    stat_numbers = view[_HEADER.size:numbers_end].cast("I")
+    offsets = view[numbers_end:offsets_end].cast("I")
+    blob = view[offsets_end:]
+    if len(blob) != offsets[count]:
+        return None
+    names = [str(blob[offsets[i]:offsets[i + 1]], "utf-8") for i in range(count)]
+    return ModCatalog(stat_numbers, names)
+
+
+_catalog = None
+
+
+def load_catalog():
+    """Load the catalog from the binary cache, rebuilding it when mod_data.py changed."""
+    global _catalog
+    if _catalog is not None:
+        return _catalog
+
+    started = perf_counter()
+    digest = _source_digest()
+    catalog = read_cache(digest)
+    if catalog is not None:
+        catalog.load_source = "cache"
+    else:
+        from mod_data import MOD_NAMES
+
+        catalog = ModCatalog.from_mod_names(MOD_NAMES)
+        catalog.load_source = "rebuilt"
+        try:
+            write_cache(catalog, digest)
+        except OSError as e:
+            print("Catalog cache write error:", str(e))
+    catalog.load_seconds = perf_counter() - started
+    _catalog = catalog
+    return _catalog
@@ -1,3748 +1,3 @@
-# Mapping of mod IDs to readable names
-MOD_COMBOS = [
-    ("explicit.stat_1817023621", "explicit.stat_3375743050"),
-    ("explicit.stat_1817023621", "explicit.stat_2048747572"),
-    ("explicit.stat_1817023621", "explicit.stat_418293304"),
-    ("explicit.stat_1817023621", "explicit.stat_2106756686"),
-    ("explicit.stat_1817023621", "explicit.stat_3357049845"),
-    ("explicit.stat_1817023621", "explicit.stat_1077131949"),
-    ("explicit.stat_1817023621", "explicit.stat_2255914633"),
-    ("explicit.stat_1817023621", "explicit.stat_2753985507"),
-    ("explicit.stat_1817023621", "explicit.stat_2643562209"),
-    ("explicit.stat_1817023621", "explicit.stat_1413864591"),
-    ("explicit.stat_1817023621", "explicit.stat_1222888897"),
-    ("explicit.stat_1817023621", "explicit.stat_664849247"),
-    ("explicit.stat_1817023621", "explicit.stat_68410701"),
-    ("explicit.stat_1817023621", "explicit.stat_3742808908"),
-    ("explicit.stat_1817023621", "explicit.stat_1873457881"),
-    ("explicit.stat_1817023621", "explicit.stat_3692646597"),
-    ("explicit.stat_1817023621", "explicit.stat_1011863394"),
-    ("explicit.stat_1817023621", "explicit.stat_3371719014"),
-    ("explicit.stat_1817023621", "explicit.stat_4173751044"),
-    ("explicit.stat_1817023621", "explicit.stat_576528026"),
-    ("explicit.stat_1817023621", "explicit.stat_3772848194"),
-    ("explicit.stat_1817023621", "explicit.stat_969576725"),
-    ("explicit.stat_1817023621", "explicit.stat_4071658793"),
-    ("explicit.stat_1817023621", "explicit.stat_3329402420"),
-    ("explicit.stat_1817023621", "explicit.stat_4259701244"),
-    ("explicit.stat_1817023621", "explicit.stat_3765507527"),
-    ("explicit.stat_1817023621", "explicit.stat_1313498929"),
-    ("explicit.stat_1817023621", "explicit.stat_991194404"),
-    ("explicit.stat_1817023621", "explicit.stat_1424006185"),
-    ("explicit.stat_1817023621", "explicit.stat_1346311588"),
-    ("explicit.stat_1817023621", "explicit.stat_207635700"),
-    ("explicit.stat_1817023621", "explicit.stat_1853636813"),
-    ("explicit.stat_1817023621", "explicit.stat_2831391506"),
-    ("explicit.stat_1817023621", "explicit.stat_1138813382"),
-    ("explicit.stat_1817023621", "explicit.stat_2736708072"),
-    ("explicit.stat_1817023621", "explicit.stat_3308185931"),
-    ("explicit.stat_1817023621", "explicit.stat_4104891138"),
-    ("explicit.stat_1817023621", "explicit.stat_34059570"),
-    ("explicit.stat_1817023621", "explicit.stat_3643449791"),
-    ("explicit.stat_1817023621", "explicit.stat_3468843137"),
-    ("explicit.stat_1817023621", "explicit.stat_3207781478"),
-    ("explicit.stat_1817023621", "explicit.stat_2806391472"),
-    ("explicit.stat_1817023621", "explicit.stat_2567659895"),
-    ("explicit.stat_1817023621", "explicit.stat_4012281889"),
-    ("explicit.stat_1817023621", "explicit.stat_1173690938"),
-    ("explicit.stat_1817023621", "explicit.stat_2365917222"),
-    ("explicit.stat_1817023621", "explicit.stat_3223142064"),
-    ("explicit.stat_1817023621", "explicit.stat_1567542124"),
-    ("explicit.stat_1817023621", "explicit.stat_2647344903"),
-    ("explicit.stat_1817023621", "explicit.stat_1165583295"),
-    ("explicit.stat_1817023621", "explicit.stat_371612541"),
-    ("explicit.stat_1817023621", "explicit.stat_2720072724"),
-    ("explicit.stat_1817023621", "explicit.stat_1919069577"),
-    ("explicit.stat_1817023621", "explicit.stat_3772841281"),
-    ("explicit.stat_1817023621", "explicit.stat_4245204226"),
-    ("explicit.stat_1817023621", "explicit.stat_2163419452"),
-    ("explicit.stat_1817023621", "explicit.stat_3111519953"),
-    ("explicit.stat_1817023621", "explicit.stat_2434030180"),
-    ("explicit.stat_1817023621", "explicit.stat_1653848515"),
-    ("explicit.stat_1817023621", "explicit.stat_2731416566"),
-    ("explicit.stat_1817023621", "explicit.stat_3234824465"),
-    ("explicit.stat_1817023621", "explicit.stat_3627458291"),
-    ("explicit.stat_1817023621", "explicit.stat_2091518682"),
-    ("explicit.stat_1817023621", "explicit.stat_214835567"),
-    ("explicit.stat_1817023621", "explicit.stat_362838683"),
-    ("explicit.stat_1817023621", "explicit.stat_2457540491"),
-    ("explicit.stat_1817023621", "explicit.stat_65331133"),
-    ("explicit.stat_1817023621", "explicit.stat_3337107517"),
-    ("explicit.stat_1817023621", "explicit.stat_3332055899"),
-    ("explicit.stat_1817023621", "explicit.stat_2548097895"),
-    ("explicit.stat_1817023621", "explicit.stat_1016185292"),
-    ("explicit.stat_1817023621", "explicit.stat_3624529132"),
-    ("explicit.stat_1817023621", "explicit.stat_380220671"),
-    ("explicit.stat_1817023621", "explicit.stat_2189467271"),
-    ("explicit.stat_1817023621", "explicit.stat_3953667743"),
-    ("explicit.stat_1817023621", "explicit.stat_1723738042"),
-    ("explicit.stat_1817023621", "explicit.stat_556659145"),
-    ("explicit.stat_1817023621", "explicit.stat_2690790844"),
-    ("explicit.stat_1817023621", "explicit.stat_80470845"),
-    ("explicit.stat_1817023621", "explicit.stat_2444534954"),
-    ("explicit.stat_1817023621", "explicit.stat_1699077932"),
-    ("explicit.stat_1817023621", "explicit.stat_2383304564"),
-    ("explicit.stat_1817023621", "explicit.stat_121436064"),
-    ("explicit.stat_1817023621", "explicit.stat_2312747856"),
-    ("explicit.stat_1817023621", "explicit.stat_3656959867"),
-    ("explicit.stat_1817023621", "explicit.stat_281949611"),
-    ("explicit.stat_3375743050", "explicit.stat_2048747572"),
-    ("explicit.stat_3375743050", "explicit.stat_418293304"),
-    ("explicit.stat_3375743050", "explicit.stat_2106756686"),
-    ("explicit.stat_3375743050", "explicit.stat_3357049845"),
-    ("explicit.stat_3375743050", "explicit.stat_1077131949"),
-    ("explicit.stat_3375743050", "explicit.stat_2255914633"),
-    ("explicit.stat_3375743050", "explicit.stat_2753985507"),
-    ("explicit.stat_3375743050", "explicit.stat_2643562209"),
-    ("explicit.stat_3375743050", "explicit.stat_1413864591"),
-    ("explicit.stat_3375743050", "explicit.stat_1222888897"),
-    ("explicit.stat_3375743050", "explicit.stat_664849247"),
-    ("explicit.stat_3375743050", "explicit.stat_68410701"),
-    ("explicit.stat_3375743050", "explicit.stat_3742808908"),
-    ("explicit.stat_3375743050", "explicit.stat_1873457881"),
-    ("explicit.stat_3375743050", "explicit.stat_3692646597"),
-    ("explicit.stat_3375743050", "explicit.stat_1011863394"),
-    ("explicit.stat_3375743050", "explicit.stat_3371719014"),
-    ("explicit.stat_3375743050", "explicit.stat_4173751044"),
-    ("explicit.stat_3375743050", "explicit.stat_576528026"),
-    ("explicit.stat_3375743050", "explicit.stat_3772848194"),
-    ("explicit.stat_3375743050", "explicit.stat_969576725"),
-    ("explicit.stat_3375743050", "explicit.stat_4071658793"),
-    ("explicit.stat_3375743050", "explicit.stat_3329402420"),
-    ("explicit.stat_3375743050", "explicit.stat_4259701244"),
-    ("explicit.stat_3375743050", "explicit.stat_3765507527"),
-    ("explicit.stat_3375743050", "explicit.stat_1313498929"),
-    ("explicit.stat_3375743050", "explicit.stat_991194404"),
-    ("explicit.stat_3375743050", "explicit.stat_1424006185"),
-    ("explicit.stat_3375743050", "explicit.stat_1346311588"),
-    ("explicit.stat_3375743050", "explicit.stat_207635700"),
-    ("explicit.stat_3375743050", "explicit.stat_1853636813"),
-    ("explicit.stat_3375743050", "explicit.stat_2831391506"),
-    ("explicit.stat_3375743050", "explicit.stat_1138813382"),
-    ("explicit.stat_3375743050", "explicit.stat_2736708072"),
-    ("explicit.stat_3375743050", "explicit.stat_3308185931"),
-    ("explicit.stat_3375743050", "explicit.stat_4104891138"),
-    ("explicit.stat_3375743050", "explicit.stat_34059570"),
-    ("explicit.stat_3375743050", "explicit.stat_3643449791"),
-    ("explicit.stat_3375743050", "explicit.stat_3468843137"),
-    ("explicit.stat_3375743050", "explicit.stat_3207781478"),
-    ("explicit.stat_3375743050", "explicit.stat_2806391472"),
-    ("explicit.stat_3375743050", "explicit.stat_2567659895"),
-    ("explicit.stat_3375743050", "explicit.stat_4012281889"),
-    ("explicit.stat_3375743050", "explicit.stat_1173690938"),
-    ("explicit.stat_3375743050", "explicit.stat_2365917222"),
-    ("explicit.stat_3375743050", "explicit.stat_3223142064"),
-    ("explicit.stat_3375743050", "explicit.stat_1567542124"),
-    ("explicit.stat_3375743050", "explicit.stat_2647344903"),
-    ("explicit.stat_3375743050", "explicit.stat_1165583295"),
-    ("explicit.stat_3375743050", "explicit.stat_371612541"),
-    ("explicit.stat_3375743050", "explicit.stat_2720072724"),
-    ("explicit.stat_3375743050", "explicit.stat_1919069577"),
-    ("explicit.stat_3375743050", "explicit.stat_3772841281"),
-    ("explicit.stat_3375743050", "explicit.stat_4245204226"),
-    ("explicit.stat_3375743050", "explicit.stat_2163419452"),
-    ("explicit.stat_3375743050", "explicit.stat_3111519953"),
-    ("explicit.stat_3375743050", "explicit.stat_2434030180"),
-    ("explicit.stat_3375743050", "explicit.stat_1653848515"),
-    ("explicit.stat_3375743050", "explicit.stat_2731416566"),
-    ("explicit.stat_3375743050", "explicit.stat_3234824465"),
-    ("explicit.stat_3375743050", "explicit.stat_3627458291"),
-    ("explicit.stat_3375743050", "explicit.stat_2091518682"),
-    ("explicit.stat_3375743050", "explicit.stat_214835567"),
-    ("explicit.stat_3375743050", "explicit.stat_362838683"),
-    ("explicit.stat_3375743050", "explicit.stat_2457540491"),
-    ("explicit.stat_3375743050", "explicit.stat_65331133"),
-    ("explicit.stat_3375743050", "explicit.stat_3337107517"),
-    ("explicit.stat_3375743050", "explicit.stat_3332055899"),
-    ("explicit.stat_3375743050", "explicit.stat_2548097895"),
-    ("explicit.stat_3375743050", "explicit.stat_1016185292"),
-    ("explicit.stat_3375743050", "explicit.stat_3624529132"),
-    ("explicit.stat_3375743050", "explicit.stat_380220671"),
-    ("explicit.stat_3375743050", "explicit.stat_2189467271"),
-    ("explicit.stat_3375743050", "explicit.stat_3953667743"),
-    ("explicit.stat_3375743050", "explicit.stat_1723738042"),
-    ("explicit.stat_3375743050", "explicit.stat_556659145"),
-    ("explicit.stat_3375743050", "explicit.stat_2690790844"),
-    ("explicit.stat_3375743050", "explicit.stat_80470845"),
-    ("explicit.stat_3375743050", "explicit.stat_2444534954"),
-    ("explicit.stat_3375743050", "explicit.stat_1699077932"),
-    ("explicit.stat_3375743050", "explicit.stat_2383304564"),
-    ("explicit.stat_3375743050", "explicit.stat_121436064"),
-    ("explicit.stat_3375743050", "explicit.stat_2312747856"),
-    ("explicit.stat_3375743050", "explicit.stat_3656959867"),
-    ("explicit.stat_3375743050", "explicit.stat_281949611"),
-    ("explicit.stat_2048747572", "explicit.stat_418293304"),
-    ("explicit.stat_2048747572", "explicit.stat_2106756686"),
-    ("explicit.stat_2048747572", "explicit.stat_3357049845"),
-    ("explicit.stat_2048747572", "explicit.stat_1077131949"),
-    ("explicit.stat_2048747572", "explicit.stat_2255914633"),
-    ("explicit.stat_2048747572", "explicit.stat_2753985507"),
-    ("explicit.stat_2048747572", "explicit.stat_2643562209"),
-    ("explicit.stat_2048747572", "explicit.stat_1413864591"),
-    ("explicit.stat_2048747572", "explicit.stat_1222888897"),
-    ("explicit.stat_2048747572", "explicit.stat_664849247"),
-    ("explicit.stat_2048747572", "explicit.stat_68410701"),
-    ("explicit.stat_2048747572", "explicit.stat_3742808908"),
-    ("explicit.stat_2048747572", "explicit.stat_1873457881"),
-    ("explicit.stat_2048747572", "explicit.stat_3692646597"),
-    ("explicit.stat_2048747572", "explicit.stat_1011863394"),
-    ("explicit.stat_2048747572", "explicit.stat_3371719014"),
-    ("explicit.stat_2048747572", "explicit.stat_4173751044"),
-    ("explicit.stat_2048747572", "explicit.stat_576528026"),
-    ("explicit.stat_2048747572", "explicit.stat_3772848194"),
-    ("explicit.stat_2048747572", "explicit.stat_969576725"),
-    ("explicit.stat_2048747572", "explicit.stat_4071658793"),
-    ("explicit.stat_2048747572", "explicit.stat_3329402420"),
-    ("explicit.stat_2048747572", "explicit.stat_4259701244"),
-    ("explicit.stat_2048747572", "explicit.stat_3765507527"),
-    ("explicit.stat_2048747572", "explicit.stat_1313498929"),
-    ("explicit.stat_2048747572", "explicit.stat_991194404"),
-    ("explicit.stat_2048747572", "explicit.stat_1424006185"),
-    ("explicit.stat_2048747572", "explicit.stat_1346311588"),
-    ("explicit.stat_2048747572", "explicit.stat_207635700"),
-    ("explicit.stat_2048747572", "explicit.stat_1853636813"),
-    ("explicit.stat_2048747572", "explicit.stat_2831391506"),
-    ("explicit.stat_2048747572", "explicit.stat_1138813382"),
-    ("explicit.stat_2048747572", "explicit.stat_2736708072"),
-    ("explicit.stat_2048747572", "explicit.stat_3308185931"),
-    ("explicit.stat_2048747572", "explicit.stat_4104891138"),
-    ("explicit.stat_2048747572", "explicit.stat_34059570"),
-    ("explicit.stat_2048747572", "explicit.stat_3643449791"),
-    ("explicit.stat_2048747572", "explicit.stat_3468843137"),
-    ("explicit.stat_2048747572", "explicit.stat_3207781478"),
-    ("explicit.stat_2048747572", "explicit.stat_2806391472"),
-    ("explicit.stat_2048747572", "explicit.stat_2567659895"),
-    ("explicit.stat_2048747572", "explicit.stat_4012281889"),
-    ("explicit.stat_2048747572", "explicit.stat_1173690938"),
-    ("explicit.stat_2048747572", "explicit.stat_2365917222"),
-    ("explicit.stat_2048747572", "explicit.stat_3223142064"),
-    ("explicit.stat_2048747572", "explicit.stat_1567542124"),
-    ("explicit.stat_2048747572", "explicit.stat_2647344903"),
-    ("explicit.stat_2048747572", "explicit.stat_1165583295"),
-    ("explicit.stat_2048747572", "explicit.stat_371612541"),
-    ("explicit.stat_2048747572", "explicit.stat_2720072724"),
-    ("explicit.stat_2048747572", "explicit.stat_1919069577"),
-    ("explicit.stat_2048747572", "explicit.stat_3772841281"),
-    ("explicit.stat_2048747572", "explicit.stat_4245204226"),
-    ("explicit.stat_2048747572", "explicit.stat_2163419452"),
-    ("explicit.stat_2048747572", "explicit.stat_3111519953"),
-    ("explicit.stat_2048747572", "explicit.stat_2434030180"),
-    ("explicit.stat_2048747572", "explicit.stat_1653848515"),
-    ("explicit.stat_2048747572", "explicit.stat_2731416566"),
-    ("explicit.stat_2048747572", "explicit.stat_3234824465"),
-    ("explicit.stat_2048747572", "explicit.stat_3627458291"),
-    ("explicit.stat_2048747572", "explicit.stat_2091518682"),
-    ("explicit.stat_2048747572", "explicit.stat_214835567"),
-    ("explicit.stat_2048747572", "explicit.stat_362838683"),
-    ("explicit.stat_2048747572", "explicit.stat_2457540491"),
-    ("explicit.stat_2048747572", "explicit.stat_65331133"),
-    ("explicit.stat_2048747572", "explicit.stat_3337107517"),
-    ("explicit.stat_2048747572", "explicit.stat_3332055899"),
-    ("explicit.stat_2048747572", "explicit.stat_2548097895"),
-    ("explicit.stat_2048747572", "explicit.stat_1016185292"),
-    ("explicit.stat_2048747572", "explicit.stat_3624529132"),
-    ("explicit.stat_2048747572", "explicit.stat_380220671"),
-    ("explicit.stat_2048747572", "explicit.stat_2189467271"),
-    ("explicit.stat_2048747572", "explicit.stat_3953667743"),
-    ("explicit.stat_2048747572", "explicit.stat_1723738042"),
-    ("explicit.stat_2048747572", "explicit.stat_556659145"),
-    ("explicit.stat_2048747572", "explicit.stat_2690790844"),
-    ("explicit.stat_2048747572", "explicit.stat_80470845"),
-    ("explicit.stat_2048747572", "explicit.stat_2444534954"),
-    ("explicit.stat_2048747572", "explicit.stat_1699077932"),
-    ("explicit.stat_2048747572", "explicit.stat_2383304564"),
-    ("explicit.stat_2048747572", "explicit.stat_121436064"),
-    ("explicit.stat_2048747572", "explicit.stat_2312747856"),
-    ("explicit.stat_2048747572", "explicit.stat_3656959867"),
-    ("explicit.stat_2048747572", "explicit.stat_281949611"),
-    ("explicit.stat_418293304", "explicit.stat_2106756686"),
-    ("explicit.stat_418293304", "explicit.stat_3357049845"),
-    ("explicit.stat_418293304", "explicit.stat_1077131949"),
-    ("explicit.stat_418293304", "explicit.stat_2255914633"),
-    ("explicit.stat_418293304", "explicit.stat_2753985507"),
-    ("explicit.stat_418293304", "explicit.stat_2643562209"),
-    ("explicit.stat_418293304", "explicit.stat_1413864591"),
-    ("explicit.stat_418293304", "explicit.stat_1222888897"),
-    ("explicit.stat_418293304", "explicit.stat_664849247"),
-    ("explicit.stat_418293304", "explicit.stat_68410701"),
-    ("explicit.stat_418293304", "explicit.stat_3742808908"),
-    ("explicit.stat_418293304", "explicit.stat_1873457881"),
-    ("explicit.stat_418293304", "explicit.stat_3692646597"),
-    ("explicit.stat_418293304", "explicit.stat_1011863394"),
-    ("explicit.stat_418293304", "explicit.stat_3371719014"),
-    ("explicit.stat_418293304", "explicit.stat_4173751044"),
-    ("explicit.stat_418293304", "explicit.stat_576528026"),
-    ("explicit.stat_418293304", "explicit.stat_3772848194"),
-    ("explicit.stat_418293304", "explicit.stat_969576725"),
-    ("explicit.stat_418293304", "explicit.stat_4071658793"),
-    ("explicit.stat_418293304", "explicit.stat_3329402420"),
-    ("explicit.stat_418293304", "explicit.stat_4259701244"),
-    ("explicit.stat_418293304", "explicit.stat_3765507527"),
-    ("explicit.stat_418293304", "explicit.stat_1313498929"),
-    ("explicit.stat_418293304", "explicit.stat_991194404"),
-    ("explicit.stat_418293304", "explicit.stat_1424006185"),
-    ("explicit.stat_418293304", "explicit.stat_1346311588"),
-    ("explicit.stat_418293304", "explicit.stat_207635700"),
-    ("explicit.stat_418293304", "explicit.stat_1853636813"),
-    ("explicit.stat_418293304", "explicit.stat_2831391506"),
-    ("explicit.stat_418293304", "explicit.stat_1138813382"),
-    ("explicit.stat_418293304", "explicit.stat_2736708072"),
-    ("explicit.stat_418293304", "explicit.stat_3308185931"),
-    ("explicit.stat_418293304", "explicit.stat_4104891138"),
-    ("explicit.stat_418293304", "explicit.stat_34059570"),
-    ("explicit.stat_418293304", "explicit.stat_3643449791"),
-    ("explicit.stat_418293304", "explicit.stat_3468843137"),
-    ("explicit.stat_418293304", "explicit.stat_3207781478"),
-    ("explicit.stat_418293304", "explicit.stat_2806391472"),
-    ("explicit.stat_418293304", "explicit.stat_2567659895"),
-    ("explicit.stat_418293304", "explicit.stat_4012281889"),
-    ("explicit.stat_418293304", "explicit.stat_1173690938"),
-    ("explicit.stat_418293304", "explicit.stat_2365917222"),
-    ("explicit.stat_418293304", "explicit.stat_3223142064"),
-    ("explicit.stat_418293304", "explicit.stat_1567542124"),
-    ("explicit.stat_418293304", "explicit.stat_2647344903"),
-    ("explicit.stat_418293304", "explicit.stat_1165583295"),
-    ("explicit.stat_418293304", "explicit.stat_371612541"),
-    ("explicit.stat_418293304", "explicit.stat_2720072724"),
-    ("explicit.stat_418293304", "explicit.stat_1919069577"),
-    ("explicit.stat_418293304", "explicit.stat_3772841281"),
-    ("explicit.stat_418293304", "explicit.stat_4245204226"),
-    ("explicit.stat_418293304", "explicit.stat_2163419452"),
-    ("explicit.stat_418293304", "explicit.stat_3111519953"),
-    ("explicit.stat_418293304", "explicit.stat_2434030180"),
-    ("explicit.stat_418293304", "explicit.stat_1653848515"),
-    ("explicit.stat_418293304", "explicit.stat_2731416566"),
-    ("explicit.stat_418293304", "explicit.stat_3234824465"),
-    ("explicit.stat_418293304", "explicit.stat_3627458291"),
-    ("explicit.stat_418293304", "explicit.stat_2091518682"),
-    ("explicit.stat_418293304", "explicit.stat_214835567"),
-    ("explicit.stat_418293304", "explicit.stat_362838683"),
-    ("explicit.stat_418293304", "explicit.stat_2457540491"),
-    ("explicit.stat_418293304", "explicit.stat_65331133"),
-    ("explicit.stat_418293304", "explicit.stat_3337107517"),
-    ("explicit.stat_418293304", "explicit.stat_3332055899"),
-    ("explicit.stat_418293304", "explicit.stat_2548097895"),
-    ("explicit.stat_418293304", "explicit.stat_1016185292"),
-    ("explicit.stat_418293304", "explicit.stat_3624529132"),
-    ("explicit.stat_418293304", "explicit.stat_380220671"),
-    ("explicit.stat_418293304", "explicit.stat_2189467271"),
-    ("explicit.stat_418293304", "explicit.stat_3953667743"),
-    ("explicit.stat_418293304", "explicit.stat_1723738042"),
-    ("explicit.stat_418293304", "explicit.stat_556659145"),
-    ("explicit.stat_418293304", "explicit.stat_2690790844"),
-    ("explicit.stat_418293304", "explicit.stat_80470845"),
-    ("explicit.stat_418293304", "explicit.stat_2444534954"),
-    ("explicit.stat_418293304", "explicit.stat_1699077932"),
-    ("explicit.stat_418293304", "explicit.stat_2383304564"),
-    ("explicit.stat_418293304", "explicit.stat_121436064"),
-    ("explicit.stat_418293304", "explicit.stat_2312747856"),
-    ("explicit.stat_418293304", "explicit.stat_3656959867"),
-    ("explicit.stat_418293304", "explicit.stat_281949611"),
-    ("explicit.stat_2106756686", "explicit.stat_3357049845"),
-    ("explicit.stat_2106756686", "explicit.stat_1077131949"),
-    ("explicit.stat_2106756686", "explicit.stat_2255914633"),
-    ("explicit.stat_2106756686", "explicit.stat_2753985507"),
-    ("explicit.stat_2106756686", "explicit.stat_2643562209"),
-    ("explicit.stat_2106756686", "explicit.stat_1413864591"),
-    ("explicit.stat_2106756686", "explicit.stat_1222888897"),
-    ("explicit.stat_2106756686", "explicit.stat_664849247"),
-    ("explicit.stat_2106756686", "explicit.stat_68410701"),
-    ("explicit.stat_2106756686", "explicit.stat_3742808908"),
-    ("explicit.stat_2106756686", "explicit.stat_1873457881"),
-    ("explicit.stat_2106756686", "explicit.stat_3692646597"),
-    ("explicit.stat_2106756686", "explicit.stat_1011863394"),
-    ("explicit.stat_2106756686", "explicit.stat_3371719014"),
-    ("explicit.stat_2106756686", "explicit.stat_4173751044"),
-    ("explicit.stat_2106756686", "explicit.stat_576528026"),
-    ("explicit.stat_2106756686", "explicit.stat_3772848194"),
-    ("explicit.stat_2106756686", "explicit.stat_969576725"),
-    ("explicit.stat_2106756686", "explicit.stat_4071658793"),
-    ("explicit.stat_2106756686", "explicit.stat_3329402420"),
-    ("explicit.stat_2106756686", "explicit.stat_4259701244"),
-    ("explicit.stat_2106756686", "explicit.stat_3765507527"),
-    ("explicit.stat_2106756686", "explicit.stat_1313498929"),
-    ("explicit.stat_2106756686", "explicit.stat_991194404"),
-    ("explicit.stat_2106756686", "explicit.stat_1424006185"),
-    ("explicit.stat_2106756686", "explicit.stat_1346311588"),
-    ("explicit.stat_2106756686", "explicit.stat_207635700"),
-    ("explicit.stat_2106756686", "explicit.stat_1853636813"),
-    ("explicit.stat_2106756686", "explicit.stat_2831391506"),
-    ("explicit.stat_2106756686", "explicit.stat_1138813382"),
-    ("explicit.stat_2106756686", "explicit.stat_2736708072"),
-    ("explicit.stat_2106756686", "explicit.stat_3308185931"),
-    ("explicit.stat_2106756686", "explicit.stat_4104891138"),
-    ("explicit.stat_2106756686", "explicit.stat_34059570"),
-    ("explicit.stat_2106756686", "explicit.stat_3643449791"),
-    ("explicit.stat_2106756686", "explicit.stat_3468843137"),
-    ("explicit.stat_2106756686", "explicit.stat_3207781478"),
-    ("explicit.stat_2106756686", "explicit.stat_2806391472"),
-    ("explicit.stat_2106756686", "explicit.stat_2567659895"),
-    ("explicit.stat_2106756686", "explicit.stat_4012281889"),
-    ("explicit.stat_2106756686", "explicit.stat_1173690938"),
-    ("explicit.stat_2106756686", "explicit.stat_2365917222"),
-    ("explicit.stat_2106756686", "explicit.stat_3223142064"),
-    ("explicit.stat_2106756686", "explicit.stat_1567542124"),
-    ("explicit.stat_2106756686", "explicit.stat_2647344903"),
-    ("explicit.stat_2106756686", "explicit.stat_1165583295"),
-    ("explicit.stat_2106756686", "explicit.stat_371612541"),
-    ("explicit.stat_2106756686", "explicit.stat_2720072724"),
-    ("explicit.stat_2106756686", "explicit.stat_1919069577"),
-    ("explicit.stat_2106756686", "explicit.stat_3772841281"),
-    ("explicit.stat_2106756686", "explicit.stat_4245204226"),
-    ("explicit.stat_2106756686", "explicit.stat_2163419452"),
-    ("explicit.stat_2106756686", "explicit.stat_3111519953"),
-    ("explicit.stat_2106756686", "explicit.stat_2434030180"),
-    ("explicit.stat_2106756686", "explicit.stat_1653848515"),
-    ("explicit.stat_2106756686", "explicit.stat_2731416566"),
-    ("explicit.stat_2106756686", "explicit.stat_3234824465"),
-    ("explicit.stat_2106756686", "explicit.stat_3627458291"),
-    ("explicit.stat_2106756686", "explicit.stat_2091518682"),
-    ("explicit.stat_2106756686", "explicit.stat_214835567"),
-    ("explicit.stat_2106756686", "explicit.stat_362838683"),
-    ("explicit.stat_2106756686", "explicit.stat_2457540491"),
-    ("explicit.stat_2106756686", "explicit.stat_65331133"),
-    ("explicit.stat_2106756686", "explicit.stat_3337107517"),
-    ("explicit.stat_2106756686", "explicit.stat_3332055899"),
-    ("explicit.stat_2106756686", "explicit.stat_2548097895"),
-    ("explicit.stat_2106756686", "explicit.stat_1016185292"),
-    ("explicit.stat_2106756686", "explicit.stat_3624529132"),
-    ("explicit.stat_2106756686", "explicit.stat_380220671"),
-    ("explicit.stat_2106756686", "explicit.stat_2189467271"),
-    ("explicit.stat_2106756686", "explicit.stat_3953667743"),
-    ("explicit.stat_2106756686", "explicit.stat_1723738042"),
-    ("explicit.stat_2106756686", "explicit.stat_556659145"),
-    ("explicit.stat_2106756686", "explicit.stat_2690790844"),
-    ("explicit.stat_2106756686", "explicit.stat_80470845"),
-    ("explicit.stat_2106756686", "explicit.stat_2444534954"),
-    ("explicit.stat_2106756686", "explicit.stat_1699077932"),
-    ("explicit.stat_2106756686", "explicit.stat_2383304564"),
-    ("explicit.stat_2106756686", "explicit.stat_121436064"),
-    ("explicit.stat_2106756686", "explicit.stat_2312747856"),
-    ("explicit.stat_2106756686", "explicit.stat_3656959867"),
-    ("explicit.stat_2106756686", "explicit.stat_281949611"),
-    ("explicit.stat_3357049845", "explicit.stat_1077131949"),
-    ("explicit.stat_3357049845", "explicit.stat_2255914633"),
-    ("explicit.stat_3357049845", "explicit.stat_2753985507"),
-    ("explicit.stat_3357049845", "explicit.stat_2643562209"),
-    ("explicit.stat_3357049845", "explicit.stat_1413864591"),
-    ("explicit.stat_3357049845", "explicit.stat_1222888897"),
-    ("explicit.stat_3357049845", "explicit.stat_664849247"),
-    ("explicit.stat_3357049845", "explicit.stat_68410701"),
-    ("explicit.stat_3357049845", "explicit.stat_3742808908"),
-    ("explicit.stat_3357049845", "explicit.stat_1873457881"),
-    ("explicit.stat_3357049845", "explicit.stat_3692646597"),
-    ("explicit.stat_3357049845", "explicit.stat_1011863394"),
-    ("explicit.stat_3357049845", "explicit.stat_3371719014"),
-    ("explicit.stat_3357049845", "explicit.stat_4173751044"),
-    ("explicit.stat_3357049845", "explicit.stat_576528026"),
-    ("explicit.stat_3357049845", "explicit.stat_3772848194"),
-    ("explicit.stat_3357049845", "explicit.stat_969576725"),
-    ("explicit.stat_3357049845", "explicit.stat_4071658793"),
-    ("explicit.stat_3357049845", "explicit.stat_3329402420"),
-    ("explicit.stat_3357049845", "explicit.stat_4259701244"),
-    ("explicit.stat_3357049845", "explicit.stat_3765507527"),
-    ("explicit.stat_3357049845", "explicit.stat_1313498929"),
-    ("explicit.stat_3357049845", "explicit.stat_991194404"),
-    ("explicit.stat_3357049845", "explicit.stat_1424006185"),
-    ("explicit.stat_3357049845", "explicit.stat_1346311588"),
-    ("explicit.stat_3357049845", "explicit.stat_207635700"),
-    ("explicit.stat_3357049845", "explicit.stat_1853636813"),
-    ("explicit.stat_3357049845", "explicit.stat_2831391506"),
-    ("explicit.stat_3357049845", "explicit.stat_1138813382"),
-    ("explicit.stat_3357049845", "explicit.stat_2736708072"),
-    ("explicit.stat_3357049845", "explicit.stat_3308185931"),
-    ("explicit.stat_3357049845", "explicit.stat_4104891138"),
-    ("explicit.stat_3357049845", "explicit.stat_34059570"),
-    ("explicit.stat_3357049845", "explicit.stat_3643449791"),
-    ("explicit.stat_3357049845", "explicit.stat_3468843137"),
-    ("explicit.stat_3357049845", "explicit.stat_3207781478"),
-    ("explicit.stat_3357049845", "explicit.stat_2806391472"),
-    ("explicit.stat_3357049845", "explicit.stat_2567659895"),
-    ("explicit.stat_3357049845", "explicit.stat_4012281889"),
-    ("explicit.stat_3357049845", "explicit.stat_1173690938"),
-    ("explicit.stat_3357049845", "explicit.stat_2365917222"),
-    ("explicit.stat_3357049845", "explicit.stat_3223142064"),
-    ("explicit.stat_3357049845", "explicit.stat_1567542124"),
-    ("explicit.stat_3357049845", "explicit.stat_2647344903"),
-    ("explicit.stat_3357049845", "explicit.stat_1165583295"),
-    ("explicit.stat_3357049845", "explicit.stat_371612541"),
-    ("explicit.stat_3357049845", "explicit.stat_2720072724"),
-    ("explicit.stat_3357049845", "explicit.stat_1919069577"),
-    ("explicit.stat_3357049845", "explicit.stat_3772841281"),
-    ("explicit.stat_3357049845", "explicit.stat_4245204226"),
-    ("explicit.stat_3357049845", "explicit.stat_2163419452"),
-    ("explicit.stat_3357049845", "explicit.stat_3111519953"),
-    ("explicit.stat_3357049845", "explicit.stat_2434030180"),
-    ("explicit.stat_3357049845", "explicit.stat_1653848515"),
-    ("explicit.stat_3357049845", "explicit.stat_2731416566"),
-    ("explicit.stat_3357049845", "explicit.stat_3234824465"),
-    ("explicit.stat_3357049845", "explicit.stat_3627458291"),
-    ("explicit.stat_3357049845", "explicit.stat_2091518682"),
-    ("explicit.stat_3357049845", "explicit.stat_214835567"),
-    ("explicit.stat_3357049845", "explicit.stat_362838683"),
-    ("explicit.stat_3357049845", "explicit.stat_2457540491"),
-    ("explicit.stat_3357049845", "explicit.stat_65331133"),
-    ("explicit.stat_3357049845", "explicit.stat_3337107517"),
-    ("explicit.stat_3357049845", "explicit.stat_3332055899"),
-    ("explicit.stat_3357049845", "explicit.stat_2548097895"),
-    ("explicit.stat_3357049845", "explicit.stat_1016185292"),
-    ("explicit.stat_3357049845", "explicit.stat_3624529132"),
-    ("explicit.stat_3357049845", "explicit.stat_380220671"),
-    ("explicit.stat_3357049845", "explicit.stat_2189467271"),
-    ("explicit.stat_3357049845", "explicit.stat_3953667743"),
-    ("explicit.stat_3357049845", "explicit.stat_1723738042"),
-    ("explicit.stat_3357049845", "explicit.stat_556659145"),
-    ("explicit.stat_3357049845", "explicit.stat_2690790844"),
-    ("explicit.stat_3357049845", "explicit.stat_80470845"),
-    ("explicit.stat_3357049845", "explicit.stat_2444534954"),
-    ("explicit.stat_3357049845", "explicit.stat_1699077932"),
-    ("explicit.stat_3357049845", "explicit.stat_2383304564"),
-    ("explicit.stat_3357049845", "explicit.stat_121436064"),
-    ("explicit.stat_3357049845", "explicit.stat_2312747856"),
-    ("explicit.stat_3357049845", "explicit.stat_3656959867"),
-    ("explicit.stat_3357049845", "explicit.stat_281949611"),
-    ("explicit.stat_1077131949", "explicit.stat_2255914633"),
-    ("explicit.stat_1077131949", "explicit.stat_2753985507"),
-    ("explicit.stat_1077131949", "explicit.stat_2643562209"),
-    ("explicit.stat_1077131949", "explicit.stat_1413864591"),
-    ("explicit.stat_1077131949", "explicit.stat_1222888897"),
-    ("explicit.stat_1077131949", "explicit.stat_664849247"),
-    ("explicit.stat_1077131949", "explicit.stat_68410701"),
-    ("explicit.stat_1077131949", "explicit.stat_3742808908"),
-    ("explicit.stat_1077131949", "explicit.stat_1873457881"),
-    ("explicit.stat_1077131949", "explicit.stat_3692646597"),
-    ("explicit.stat_1077131949", "explicit.stat_1011863394"),
-    ("explicit.stat_1077131949", "explicit.stat_3371719014"),
-    ("explicit.stat_1077131949", "explicit.stat_4173751044"),
-    ("explicit.stat_1077131949", "explicit.stat_576528026"),
-    ("explicit.stat_1077131949", "explicit.stat_3772848194"),
-    ("explicit.stat_1077131949", "explicit.stat_969576725"),
-    ("explicit.stat_1077131949", "explicit.stat_4071658793"),
-    ("explicit.stat_1077131949", "explicit.stat_3329402420"),
-    ("explicit.stat_1077131949", "explicit.stat_4259701244"),
-    ("explicit.stat_1077131949", "explicit.stat_3765507527"),
-    ("explicit.stat_1077131949", "explicit.stat_1313498929"),
-    ("explicit.stat_1077131949", "explicit.stat_991194404"),
-    ("explicit.stat_1077131949", "explicit.stat_1424006185"),
-    ("explicit.stat_1077131949", "explicit.stat_1346311588"),
-    ("explicit.stat_1077131949", "explicit.stat_207635700"),
-    ("explicit.stat_1077131949", "explicit.stat_1853636813"),
-    ("explicit.stat_1077131949", "explicit.stat_2831391506"),
-    ("explicit.stat_1077131949", "explicit.stat_1138813382"),
-    ("explicit.stat_1077131949", "explicit.stat_2736708072"),
-    ("explicit.stat_1077131949", "explicit.stat_3308185931"),
-    ("explicit.stat_1077131949", "explicit.stat_4104891138"),
-    ("explicit.stat_1077131949", "explicit.stat_34059570"),
-    ("explicit.stat_1077131949", "explicit.stat_3643449791"),
-    ("explicit.stat_1077131949", "explicit.stat_3468843137"),
-    ("explicit.stat_1077131949", "explicit.stat_3207781478"),
-    ("explicit.stat_1077131949", "explicit.stat_2806391472"),
-    ("explicit.stat_1077131949", "explicit.stat_2567659895"),
-    ("explicit.stat_1077131949", "explicit.stat_4012281889"),
-    ("explicit.stat_1077131949", "explicit.stat_1173690938"),
-    ("explicit.stat_1077131949", "explicit.stat_2365917222"),
-    ("explicit.stat_1077131949", "explicit.stat_3223142064"),
-    ("explicit.stat_1077131949", "explicit.stat_1567542124"),
-    ("explicit.stat_1077131949", "explicit.stat_2647344903"),
-    ("explicit.stat_1077131949", "explicit.stat_1165583295"),
-    ("explicit.stat_1077131949", "explicit.stat_371612541"),
-    ("explicit.stat_1077131949", "explicit.stat_2720072724"),
-    ("explicit.stat_1077131949", "explicit.stat_1919069577"),
-    ("explicit.stat_1077131949", "explicit.stat_3772841281"),
-    ("explicit.stat_1077131949", "explicit.stat_4245204226"),
-    ("explicit.stat_1077131949", "explicit.stat_2163419452"),
-    ("explicit.stat_1077131949", "explicit.stat_3111519953"),
-    ("explicit.stat_1077131949", "explicit.stat_2434030180"),
-    ("explicit.stat_1077131949", "explicit.stat_1653848515"),
-    ("explicit.stat_1077131949", "explicit.stat_2731416566"),
-    ("explicit.stat_1077131949", "explicit.stat_3234824465"),
-    ("explicit.stat_1077131949", "explicit.stat_3627458291"),
-    ("explicit.stat_1077131949", "explicit.stat_2091518682"),
-    ("explicit.stat_1077131949", "explicit.stat_214835567"),
-    ("explicit.stat_1077131949", "explicit.stat_362838683"),
-    ("explicit.stat_1077131949", "explicit.stat_2457540491"),
-    ("explicit.stat_1077131949", "explicit.stat_65331133"),
-    ("explicit.stat_1077131949", "explicit.stat_3337107517"),
-    ("explicit.stat_1077131949", "explicit.stat_3332055899"),
-    ("explicit.stat_1077131949", "explicit.stat_2548097895"),
-    ("explicit.stat_1077131949", "explicit.stat_1016185292"),
-    ("explicit.stat_1077131949", "explicit.stat_3624529132"),
-    ("explicit.stat_1077131949", "explicit.stat_380220671"),
-    ("explicit.stat_1077131949", "explicit.stat_2189467271"),
-    ("explicit.stat_1077131949", "explicit.stat_3953667743"),
-    ("explicit.stat_1077131949", "explicit.stat_1723738042"),
-    ("explicit.stat_1077131949", "explicit.stat_556659145"),
-    ("explicit.stat_1077131949", "explicit.stat_2690790844"),
-    ("explicit.stat_1077131949", "explicit.stat_80470845"),
-    ("explicit.stat_1077131949", "explicit.stat_2444534954"),
-    ("explicit.stat_1077131949", "explicit.stat_1699077932"),
-    ("explicit.stat_1077131949", "explicit.stat_2383304564"),
-    ("explicit.stat_1077131949", "explicit.stat_121436064"),
-    ("explicit.stat_1077131949", "explicit.stat_2312747856"),
-    ("explicit.stat_1077131949", "explicit.stat_3656959867"),
-    ("explicit.stat_1077131949", "explicit.stat_281949611"),
-    ("explicit.stat_2255914633", "explicit.stat_2753985507"),
-    ("explicit.stat_2255914633", "explicit.stat_2643562209"),
-    ("explicit.stat_2255914633", "explicit.stat_1413864591"),
-    ("explicit.stat_2255914633", "explicit.stat_1222888897"),
-    ("explicit.stat_2255914633", "explicit.stat_664849247"),
-    ("explicit.stat_2255914633", "explicit.stat_68410701"),
-    ("explicit.stat_2255914633", "explicit.stat_3742808908"),
-    ("explicit.stat_2255914633", "explicit.stat_1873457881"),
-    ("explicit.stat_2255914633", "explicit.stat_3692646597"),
-    ("explicit.stat_2255914633", "explicit.stat_1011863394"),
-    ("explicit.stat_2255914633", "explicit.stat_3371719014"),
-    ("explicit.stat_2255914633", "explicit.stat_4173751044"),
-    ("explicit.stat_2255914633", "explicit.stat_576528026"),
-    ("explicit.stat_2255914633", "explicit.stat_3772848194"),
-    ("explicit.stat_2255914633", "explicit.stat_969576725"),
-    ("explicit.stat_2255914633", "explicit.stat_4071658793"),
-    ("explicit.stat_2255914633", "explicit.stat_3329402420"),
-    ("explicit.stat_2255914633", "explicit.stat_4259701244"),
-    ("explicit.stat_2255914633", "explicit.stat_3765507527"),
-    ("explicit.stat_2255914633", "explicit.stat_1313498929"),
-    ("explicit.stat_2255914633", "explicit.stat_991194404"),
-    ("explicit.stat_2255914633", "explicit.stat_1424006185"),
-    ("explicit.stat_2255914633", "explicit.stat_1346311588"),
-    ("explicit.stat_2255914633", "explicit.stat_207635700"),
-    ("explicit.stat_2255914633", "explicit.stat_1853636813"),
-    ("explicit.stat_2255914633", "explicit.stat_2831391506"),
-    ("explicit.stat_2255914633", "explicit.stat_1138813382"),
-    ("explicit.stat_2255914633", "explicit.stat_2736708072"),
-    ("explicit.stat_2255914633", "explicit.stat_3308185931"),
-    ("explicit.stat_2255914633", "explicit.stat_4104891138"),
-    ("explicit.stat_2255914633", "explicit.stat_34059570"),
-    ("explicit.stat_2255914633", "explicit.stat_3643449791"),
-    ("explicit.stat_2255914633", "explicit.stat_3468843137"),
-    ("explicit.stat_2255914633", "explicit.stat_3207781478"),
-    ("explicit.stat_2255914633", "explicit.stat_2806391472"),
-    ("explicit.stat_2255914633", "explicit.stat_2567659895"),
-    ("explicit.stat_2255914633", "explicit.stat_4012281889"),
-    ("explicit.stat_2255914633", "explicit.stat_1173690938"),
-    ("explicit.stat_2255914633", "explicit.stat_2365917222"),
-    ("explicit.stat_2255914633", "explicit.stat_3223142064"),
-    ("explicit.stat_2255914633", "explicit.stat_1567542124"),
-    ("explicit.stat_2255914633", "explicit.stat_2647344903"),
-    ("explicit.stat_2255914633", "explicit.stat_1165583295"),
-    ("explicit.stat_2255914633", "explicit.stat_371612541"),
-    ("explicit.stat_2255914633", "explicit.stat_2720072724"),
-    ("explicit.stat_2255914633", "explicit.stat_1919069577"),
-    ("explicit.stat_2255914633", "explicit.stat_3772841281"),
-    ("explicit.stat_2255914633", "explicit.stat_4245204226"),
-    ("explicit.stat_2255914633", "explicit.stat_2163419452"),
-    ("explicit.stat_2255914633", "explicit.stat_3111519953"),
-    ("explicit.stat_2255914633", "explicit.stat_2434030180"),
-    ("explicit.stat_2255914633", "explicit.stat_1653848515"),
-    ("explicit.stat_2255914633", "explicit.stat_2731416566"),
-    ("explicit.stat_2255914633", "explicit.stat_3234824465"),
-    ("explicit.stat_2255914633", "explicit.stat_3627458291"),
-    ("explicit.stat_2255914633", "explicit.stat_2091518682"),
-    ("explicit.stat_2255914633", "explicit.stat_214835567"),
-    ("explicit.stat_2255914633", "explicit.stat_362838683"),
-    ("explicit.stat_2255914633", "explicit.stat_2457540491"),
-    ("explicit.stat_2255914633", "explicit.stat_65331133"),
-    ("explicit.stat_2255914633", "explicit.stat_3337107517"),
-    ("explicit.stat_2255914633", "explicit.stat_3332055899"),
-    ("explicit.stat_2255914633", "explicit.stat_2548097895"),
-    ("explicit.stat_2255914633", "explicit.stat_1016185292"),
-    ("explicit.stat_2255914633", "explicit.stat_3624529132"),
-    ("explicit.stat_2255914633", "explicit.stat_380220671"),
-    ("explicit.stat_2255914633", "explicit.stat_2189467271"),
-    ("explicit.stat_2255914633", "explicit.stat_3953667743"),
-    ("explicit.stat_2255914633", "explicit.stat_1723738042"),
-    ("explicit.stat_2255914633", "explicit.stat_556659145"),
-    ("explicit.stat_2255914633", "explicit.stat_2690790844"),
-    ("explicit.stat_2255914633", "explicit.stat_80470845"),
-    ("explicit.stat_2255914633", "explicit.stat_2444534954"),
-    ("explicit.stat_2255914633", "explicit.stat_1699077932"),
-    ("explicit.stat_2255914633", "explicit.stat_2383304564"),
-    ("explicit.stat_2255914633", "explicit.stat_121436064"),
-    ("explicit.stat_2255914633", "explicit.stat_2312747856"),
-    ("explicit.stat_2255914633", "explicit.stat_3656959867"),
-    ("explicit.stat_2255914633", "explicit.stat_281949611"),
-    ("explicit.stat_2753985507", "explicit.stat_2643562209"),
-    ("explicit.stat_2753985507", "explicit.stat_1413864591"),
-    ("explicit.stat_2753985507", "explicit.stat_1222888897"),
-    ("explicit.stat_2753985507", "explicit.stat_664849247"),
-    ("explicit.stat_2753985507", "explicit.stat_68410701"),
-    ("explicit.stat_2753985507", "explicit.stat_3742808908"),
-    ("explicit.stat_2753985507", "explicit.stat_1873457881"),
-    ("explicit.stat_2753985507", "explicit.stat_3692646597"),
-    ("explicit.stat_2753985507", "explicit.stat_1011863394"),
-    ("explicit.stat_2753985507", "explicit.stat_3371719014"),
-    ("explicit.stat_2753985507", "explicit.stat_4173751044"),
-    ("explicit.stat_2753985507", "explicit.stat_576528026"),
-    ("explicit.stat_2753985507", "explicit.stat_3772848194"),
-    ("explicit.stat_2753985507", "explicit.stat_969576725"),
-    ("explicit.stat_2753985507", "explicit.stat_4071658793"),
-    ("explicit.stat_2753985507", "explicit.stat_3329402420"),
-    ("explicit.stat_2753985507", "explicit.stat_4259701244"),
-    ("explicit.stat_2753985507", "explicit.stat_3765507527"),
-    ("explicit.stat_2753985507", "explicit.stat_1313498929"),
-    ("explicit.stat_2753985507", "explicit.stat_991194404"),
-    ("explicit.stat_2753985507", "explicit.stat_1424006185"),
-    ("explicit.stat_2753985507", "explicit.stat_1346311588"),
-    ("explicit.stat_2753985507", "explicit.stat_207635700"),
-    ("explicit.stat_2753985507", "explicit.stat_1853636813"),
-    ("explicit.stat_2753985507", "explicit.stat_2831391506"),
-    ("explicit.stat_2753985507", "explicit.stat_1138813382"),
-    ("explicit.stat_2753985507", "explicit.stat_2736708072"),
-    ("explicit.stat_2753985507", "explicit.stat_3308185931"),
-    ("explicit.stat_2753985507", "explicit.stat_4104891138"),
-    ("explicit.stat_2753985507", "explicit.stat_34059570"),
-    ("explicit.stat_2753985507", "explicit.stat_3643449791"),
-    ("explicit.stat_2753985507", "explicit.stat_3468843137"),
-    ("explicit.stat_2753985507", "explicit.stat_3207781478"),
-    ("explicit.stat_2753985507", "explicit.stat_2806391472"),
-    ("explicit.stat_2753985507", "explicit.stat_2567659895"),
-    ("explicit.stat_2753985507", "explicit.stat_4012281889"),
-    ("explicit.stat_2753985507", "explicit.stat_1173690938"),
-    ("explicit.stat_2753985507", "explicit.stat_2365917222"),
-    ("explicit.stat_2753985507", "explicit.stat_3223142064"),
-    ("explicit.stat_2753985507", "explicit.stat_1567542124"),
-    ("explicit.stat_2753985507", "explicit.stat_2647344903"),
-    ("explicit.stat_2753985507", "explicit.stat_1165583295"),
-    ("explicit.stat_2753985507", "explicit.stat_371612541"),
-    ("explicit.stat_2753985507", "explicit.stat_2720072724"),
-    ("explicit.stat_2753985507", "explicit.stat_1919069577"),
-    ("explicit.stat_2753985507", "explicit.stat_3772841281"),
-    ("explicit.stat_2753985507", "explicit.stat_4245204226"),
-    ("explicit.stat_2753985507", "explicit.stat_2163419452"),
-    ("explicit.stat_2753985507", "explicit.stat_3111519953"),
-    ("explicit.stat_2753985507", "explicit.stat_2434030180"),
-    ("explicit.stat_2753985507", "explicit.stat_1653848515"),
-    ("explicit.stat_2753985507", "explicit.stat_2731416566"),
-    ("explicit.stat_2753985507", "explicit.stat_3234824465"),
-    ("explicit.stat_2753985507", "explicit.stat_3627458291"),
-    ("explicit.stat_2753985507", "explicit.stat_2091518682"),
-    ("explicit.stat_2753985507", "explicit.stat_214835567"),
-    ("explicit.stat_2753985507", "explicit.stat_362838683"),
-    ("explicit.stat_2753985507", "explicit.stat_2457540491"),
-    ("explicit.stat_2753985507", "explicit.stat_65331133"),
-    ("explicit.stat_2753985507", "explicit.stat_3337107517"),
-    ("explicit.stat_2753985507", "explicit.stat_3332055899"),
-    ("explicit.stat_2753985507", "explicit.stat_2548097895"),
-    ("explicit.stat_2753985507", "explicit.stat_1016185292"),
-    ("explicit.stat_2753985507", "explicit.stat_3624529132"),
-    ("explicit.stat_2753985507", "explicit.stat_380220671"),
-    ("explicit.stat_2753985507", "explicit.stat_2189467271"),
-    ("explicit.stat_2753985507", "explicit.stat_3953667743"),
-    ("explicit.stat_2753985507", "explicit.stat_1723738042"),
-    ("explicit.stat_2753985507", "explicit.stat_556659145"),
-    ("explicit.stat_2753985507", "explicit.stat_2690790844"),
-    ("explicit.stat_2753985507", "explicit.stat_80470845"),
-    ("explicit.stat_2753985507", "explicit.stat_2444534954"),
-    ("explicit.stat_2753985507", "explicit.stat_1699077932"),
-    ("explicit.stat_2753985507", "explicit.stat_2383304564"),
-    ("explicit.stat_2753985507", "explicit.stat_121436064"),
-    ("explicit.stat_2753985507", "explicit.stat_2312747856"),
-    ("explicit.stat_2753985507", "explicit.stat_3656959867"),
-    ("explicit.stat_2753985507", "explicit.stat_281949611"),
-    ("explicit.stat_2643562209", "explicit.stat_1413864591"),
-    ("explicit.stat_2643562209", "explicit.stat_1222888897"),
-    ("explicit.stat_2643562209", "explicit.stat_664849247"),
-    ("explicit.stat_2643562209", "explicit.stat_68410701"),
-    ("explicit.stat_2643562209", "explicit.stat_3742808908"),
-    ("explicit.stat_2643562209", "explicit.stat_1873457881"),
-    ("explicit.stat_2643562209", "explicit.stat_3692646597"),
-    ("explicit.stat_2643562209", "explicit.stat_1011863394"),
-    ("explicit.stat_2643562209", "explicit.stat_3371719014"),
-    ("explicit.stat_2643562209", "explicit.stat_4173751044"),
-    ("explicit.stat_2643562209", "explicit.stat_576528026"),
-    ("explicit.stat_2643562209", "explicit.stat_3772848194"),
-    ("explicit.stat_2643562209", "explicit.stat_969576725"),
-    ("explicit.stat_2643562209", "explicit.stat_4071658793"),
-    ("explicit.stat_2643562209", "explicit.stat_3329402420"),
-    ("explicit.stat_2643562209", "explicit.stat_4259701244"),
-    ("explicit.stat_2643562209", "explicit.stat_3765507527"),
-    ("explicit.stat_2643562209", "explicit.stat_1313498929"),
-    ("explicit.stat_2643562209", "explicit.stat_991194404"),
-    ("explicit.stat_2643562209", "explicit.stat_1424006185"),
-    ("explicit.stat_2643562209", "explicit.stat_1346311588"),
-    ("explicit.stat_2643562209", "explicit.stat_207635700"),
-    ("explicit.stat_2643562209", "explicit.stat_1853636813"),
-    ("explicit.stat_2643562209", "explicit.stat_2831391506"),
-    ("explicit.stat_2643562209", "explicit.stat_1138813382"),
-    ("explicit.stat_2643562209", "explicit.stat_2736708072"),
-    ("explicit.stat_2643562209", "explicit.stat_3308185931"),
-    ("explicit.stat_2643562209", "explicit.stat_4104891138"),
-    ("explicit.stat_2643562209", "explicit.stat_34059570"),
-    ("explicit.stat_2643562209", "explicit.stat_3643449791"),
-    ("explicit.stat_2643562209", "explicit.stat_3468843137"),
-    ("explicit.stat_2643562209", "explicit.stat_3207781478"),
-    ("explicit.stat_2643562209", "explicit.stat_2806391472"),
-    ("explicit.stat_2643562209", "explicit.stat_2567659895"),
-    ("explicit.stat_2643562209", "explicit.stat_4012281889"),
-    ("explicit.stat_2643562209", "explicit.stat_1173690938"),
-    ("explicit.stat_2643562209", "explicit.stat_2365917222"),
-    ("explicit.stat_2643562209", "explicit.stat_3223142064"),
-    ("explicit.stat_2643562209", "explicit.stat_1567542124"),
-    ("explicit.stat_2643562209", "explicit.stat_2647344903"),
-    ("explicit.stat_2643562209", "explicit.stat_1165583295"),
-    ("explicit.stat_2643562209", "explicit.stat_371612541"),
-    ("explicit.stat_2643562209", "explicit.stat_2720072724"),
-    ("explicit.stat_2643562209", "explicit.stat_1919069577"),
-    ("explicit.stat_2643562209", "explicit.stat_3772841281"),
-    ("explicit.stat_2643562209", "explicit.stat_4245204226"),
-    ("explicit.stat_2643562209", "explicit.stat_2163419452"),
-    ("explicit.stat_2643562209", "explicit.stat_3111519953"),
-    ("explicit.stat_2643562209", "explicit.stat_2434030180"),
-    ("explicit.stat_2643562209", "explicit.stat_1653848515"),
-    ("explicit.stat_2643562209", "explicit.stat_2731416566"),
-    ("explicit.stat_2643562209", "explicit.stat_3234824465"),
-    ("explicit.stat_2643562209", "explicit.stat_3627458291"),
-    ("explicit.stat_2643562209", "explicit.stat_2091518682"),
-    ("explicit.stat_2643562209", "explicit.stat_214835567"),
-    ("explicit.stat_2643562209", "explicit.stat_362838683"),
-    ("explicit.stat_2643562209", "explicit.stat_2457540491"),
-    ("explicit.stat_2643562209", "explicit.stat_65331133"),
-    ("explicit.stat_2643562209", "explicit.stat_3337107517"),
-    ("explicit.stat_2643562209", "explicit.stat_3332055899"),
-    ("explicit.stat_2643562209", "explicit.stat_2548097895"),
-    ("explicit.stat_2643562209", "explicit.stat_1016185292"),
-    ("explicit.stat_2643562209", "explicit.stat_3624529132"),
-    ("explicit.stat_2643562209", "explicit.stat_380220671"),
-    ("explicit.stat_2643562209", "explicit.stat_2189467271"),
-    ("explicit.stat_2643562209", "explicit.stat_3953667743"),
-    ("explicit.stat_2643562209", "explicit.stat_1723738042"),
-    ("explicit.stat_2643562209", "explicit.stat_556659145"),
-    ("explicit.stat_2643562209", "explicit.stat_2690790844"),
-    ("explicit.stat_2643562209", "explicit.stat_80470845"),
-    ("explicit.stat_2643562209", "explicit.stat_2444534954"),
-    ("explicit.stat_2643562209", "explicit.stat_1699077932"),
-    ("explicit.stat_2643562209", "explicit.stat_2383304564"),
-    ("explicit.stat_2643562209", "explicit.stat_121436064"),
-    ("explicit.stat_2643562209", "explicit.stat_2312747856"),
-    ("explicit.stat_2643562209", "explicit.stat_3656959867"),
-    ("explicit.stat_2643562209", "explicit.stat_281949611"),
-    ("explicit.stat_1413864591", "explicit.stat_1222888897"),
-    ("explicit.stat_1413864591", "explicit.stat_664849247"),
-    ("explicit.stat_1413864591", "explicit.stat_68410701"),
-    ("explicit.stat_1413864591", "explicit.stat_3742808908"),
-    ("explicit.stat_1413864591", "explicit.stat_1873457881"),
-    ("explicit.stat_1413864591", "explicit.stat_3692646597"),
-    ("explicit.stat_1413864591", "explicit.stat_1011863394"),
-    ("explicit.stat_1413864591", "explicit.stat_3371719014"),
-    ("explicit.stat_1413864591", "explicit.stat_4173751044"),
-    ("explicit.stat_1413864591", "explicit.stat_576528026"),
-    ("explicit.stat_1413864591", "explicit.stat_3772848194"),
-    ("explicit.stat_1413864591", "explicit.stat_969576725"),
-    ("explicit.stat_1413864591", "explicit.stat_4071658793"),
-    ("explicit.stat_1413864591", "explicit.stat_3329402420"),
-    ("explicit.stat_1413864591", "explicit.stat_4259701244"),
-    ("explicit.stat_1413864591", "explicit.stat_3765507527"),
-    ("explicit.stat_1413864591", "explicit.stat_1313498929"),
-    ("explicit.stat_1413864591", "explicit.stat_991194404"),
-    ("explicit.stat_1413864591", "explicit.stat_1424006185"),
-    ("explicit.stat_1413864591", "explicit.stat_1346311588"),
-    ("explicit.stat_1413864591", "explicit.stat_207635700"),
-    ("explicit.stat_1413864591", "explicit.stat_1853636813"),
-    ("explicit.stat_1413864591", "explicit.stat_2831391506"),
-    ("explicit.stat_1413864591", "explicit.stat_1138813382"),
-    ("explicit.stat_1413864591", "explicit.stat_2736708072"),
-    ("explicit.stat_1413864591", "explicit.stat_3308185931"),
-    ("explicit.stat_1413864591", "explicit.stat_4104891138"),
-    ("explicit.stat_1413864591", "explicit.stat_34059570"),
-    ("explicit.stat_1413864591", "explicit.stat_3643449791"),
-    ("explicit.stat_1413864591", "explicit.stat_3468843137"),
-    ("explicit.stat_1413864591", "explicit.stat_3207781478"),
-    ("explicit.stat_1413864591", "explicit.stat_2806391472"),
-    ("explicit.stat_1413864591", "explicit.stat_2567659895"),
-    ("explicit.stat_1413864591", "explicit.stat_4012281889"),
-    ("explicit.stat_1413864591", "explicit.stat_1173690938"),
-    ("explicit.stat_1413864591", "explicit.stat_2365917222"),
-    ("explicit.stat_1413864591", "explicit.stat_3223142064"),
-    ("explicit.stat_1413864591", "explicit.stat_1567542124"),
-    ("explicit.stat_1413864591", "explicit.stat_2647344903"),
-    ("explicit.stat_1413864591", "explicit.stat_1165583295"),
-    ("explicit.stat_1413864591", "explicit.stat_371612541"),
-    ("explicit.stat_1413864591", "explicit.stat_2720072724"),
-    ("explicit.stat_1413864591", "explicit.stat_1919069577"),
-    ("explicit.stat_1413864591", "explicit.stat_3772841281"),
-    ("explicit.stat_1413864591", "explicit.stat_4245204226"),
-    ("explicit.stat_1413864591", "explicit.stat_2163419452"),
-    ("explicit.stat_1413864591", "explicit.stat_3111519953"),
-    ("explicit.stat_1413864591", "explicit.stat_2434030180"),
-    ("explicit.stat_1413864591", "explicit.stat_1653848515"),
-    ("explicit.stat_1413864591", "explicit.stat_2731416566"),
-    ("explicit.stat_1413864591", "explicit.stat_3234824465"),
-    ("explicit.stat_1413864591", "explicit.stat_3627458291"),
-    ("explicit.stat_1413864591", "explicit.stat_2091518682"),
-    ("explicit.stat_1413864591", "explicit.stat_214835567"),
-    ("explicit.stat_1413864591", "explicit.stat_362838683"),
-    ("explicit.stat_1413864591", "explicit.stat_2457540491"),
-    ("explicit.stat_1413864591", "explicit.stat_65331133"),
-    ("explicit.stat_1413864591", "explicit.stat_3337107517"),
-    ("explicit.stat_1413864591", "explicit.stat_3332055899"),
-    ("explicit.stat_1413864591", "explicit.stat_2548097895"),
-    ("explicit.stat_1413864591", "explicit.stat_1016185292"),
-    ("explicit.stat_1413864591", "explicit.stat_3624529132"),
-    ("explicit.stat_1413864591", "explicit.stat_380220671"),
-    ("explicit.stat_1413864591", "explicit.stat_2189467271"),
-    ("explicit.stat_1413864591", "explicit.stat_3953667743"),
-    ("explicit.stat_1413864591", "explicit.stat_1723738042"),
-    ("explicit.stat_1413864591", "explicit.stat_556659145"),
-    ("explicit.stat_1413864591", "explicit.stat_2690790844"),
-    ("explicit.stat_1413864591", "explicit.stat_80470845"),
-    ("explicit.stat_1413864591", "explicit.stat_2444534954"),
-    ("explicit.stat_1413864591", "explicit.stat_1699077932"),
-    ("explicit.stat_1413864591", "explicit.stat_2383304564"),
-    ("explicit.stat_1413864591", "explicit.stat_121436064"),
-    ("explicit.stat_1413864591", "explicit.stat_2312747856"),
-    ("explicit.stat_1413864591", "explicit.stat_3656959867"),
-    ("explicit.stat_1413864591", "explicit.stat_281949611"),
-    ("explicit.stat_1222888897", "explicit.stat_664849247"),
-    ("explicit.stat_1222888897", "explicit.stat_68410701"),
-    ("explicit.stat_1222888897", "explicit.stat_3742808908"),
-    ("explicit.stat_1222888897", "explicit.stat_1873457881"),
-    ("explicit.stat_1222888897", "explicit.stat_3692646597"),
-    ("explicit.stat_1222888897", "explicit.stat_1011863394"),
-    ("explicit.stat_1222888897", "explicit.stat_3371719014"),
-    ("explicit.stat_1222888897", "explicit.stat_4173751044"),
-    ("explicit.stat_1222888897", "explicit.stat_576528026"),
-    ("explicit.stat_1222888897", "explicit.stat_3772848194"),
-    ("explicit.stat_1222888897", "explicit.stat_969576725"),
-    ("explicit.stat_1222888897", "explicit.stat_4071658793"),
-    ("explicit.stat_1222888897", "explicit.stat_3329402420"),
-    ("explicit.stat_1222888897", "explicit.stat_4259701244"),
-    ("explicit.stat_1222888897", "explicit.stat_3765507527"),
-    ("explicit.stat_1222888897", "explicit.stat_1313498929"),
-    ("explicit.stat_1222888897", "explicit.stat_991194404"),
-    ("explicit.stat_1222888897", "explicit.stat_1424006185"),
-    ("explicit.stat_1222888897", "explicit.stat_1346311588"),
-    ("explicit.stat_1222888897", "explicit.stat_207635700"),
-    ("explicit.stat_1222888897", "explicit.stat_1853636813"),
-    ("explicit.stat_1222888897", "explicit.stat_2831391506"),
-    ("explicit.stat_1222888897", "explicit.stat_1138813382"),
-    ("explicit.stat_1222888897", "explicit.stat_2736708072"),
-    ("explicit.stat_1222888897", "explicit.stat_3308185931"),
-    ("explicit.stat_1222888897", "explicit.stat_4104891138"),
-    ("explicit.stat_1222888897", "explicit.stat_34059570"),
-    ("explicit.stat_1222888897", "explicit.stat_3643449791"),
-    ("explicit.stat_1222888897", "explicit.stat_3468843137"),
-    ("explicit.stat_1222888897", "explicit.stat_3207781478"),
-    ("explicit.stat_1222888897", "explicit.stat_2806391472"),
-    ("explicit.stat_1222888897", "explicit.stat_2567659895"),
-    ("explicit.stat_1222888897", "explicit.stat_4012281889"),
-    ("explicit.stat_1222888897", "explicit.stat_1173690938"),
-    ("explicit.stat_1222888897", "explicit.stat_2365917222"),
-    ("explicit.stat_1222888897", "explicit.stat_3223142064"),
-    ("explicit.stat_1222888897", "explicit.stat_1567542124"),
-    ("explicit.stat_1222888897", "explicit.stat_2647344903"),
-    ("explicit.stat_1222888897", "explicit.stat_1165583295"),
-    ("explicit.stat_1222888897", "explicit.stat_371612541"),
-    ("explicit.stat_1222888897", "explicit.stat_2720072724"),
-    ("explicit.stat_1222888897", "explicit.stat_1919069577"),
-    ("explicit.stat_1222888897", "explicit.stat_3772841281"),
-    ("explicit.stat_1222888897", "explicit.stat_4245204226"),
-    ("explicit.stat_1222888897", "explicit.stat_2163419452"),
-    ("explicit.stat_1222888897", "explicit.stat_3111519953"),
-    ("explicit.stat_1222888897", "explicit.stat_2434030180"),
-    ("explicit.stat_1222888897", "explicit.stat_1653848515"),
-    ("explicit.stat_1222888897", "explicit.stat_2731416566"),
-    ("explicit.stat_1222888897", "explicit.stat_3234824465"),
-    ("explicit.stat_1222888897", "explicit.stat_3627458291"),
-    ("explicit.stat_1222888897", "explicit.stat_2091518682"),
-    ("explicit.stat_1222888897", "explicit.stat_214835567"),
-    ("explicit.stat_1222888897", "explicit.stat_362838683"),
-    ("explicit.stat_1222888897", "explicit.stat_2457540491"),
-    ("explicit.stat_1222888897", "explicit.stat_65331133"),
-    ("explicit.stat_1222888897", "explicit.stat_3337107517"),
-    ("explicit.stat_1222888897", "explicit.stat_3332055899"),
-    ("explicit.stat_1222888897", "explicit.stat_2548097895"),
-    ("explicit.stat_1222888897", "explicit.stat_1016185292"),
-    ("explicit.stat_1222888897", "explicit.stat_3624529132"),
-    ("explicit.stat_1222888897", "explicit.stat_380220671"),
-    ("explicit.stat_1222888897", "explicit.stat_2189467271"),
-    ("explicit.stat_1222888897", "explicit.stat_3953667743"),
-    ("explicit.stat_1222888897", "explicit.stat_1723738042"),
-    ("explicit.stat_1222888897", "explicit.stat_556659145"),
-    ("explicit.stat_1222888897", "explicit.stat_2690790844"),
-    ("explicit.stat_1222888897", "explicit.stat_80470845"),
-    ("explicit.stat_1222888897", "explicit.stat_2444534954"),
-    ("explicit.stat_1222888897", "explicit.stat_1699077932"),
-    ("explicit.stat_1222888897", "explicit.stat_2383304564"),
-    ("explicit.stat_1222888897", "explicit.stat_121436064"),
-    ("explicit.stat_1222888897", "explicit.stat_2312747856"),
-    ("explicit.stat_1222888897", "explicit.stat_3656959867"),
-    ("explicit.stat_1222888897", "explicit.stat_281949611"),
-    ("explicit.stat_664849247", "explicit.stat_68410701"),
-    ("explicit.stat_664849247", "explicit.stat_3742808908"),
-    ("explicit.stat_664849247", "explicit.stat_1873457881"),
-    ("explicit.stat_664849247", "explicit.stat_3692646597"),
-    ("explicit.stat_664849247", "explicit.stat_1011863394"),
-    ("explicit.stat_664849247", "explicit.stat_3371719014"),
-    ("explicit.stat_664849247", "explicit.stat_4173751044"),
-    ("explicit.stat_664849247", "explicit.stat_576528026"),
-    ("explicit.stat_664849247", "explicit.stat_3772848194"),
-    ("explicit.stat_664849247", "explicit.stat_969576725"),
-    ("explicit.stat_664849247", "explicit.stat_4071658793"),
-    ("explicit.stat_664849247", "explicit.stat_3329402420"),
-    ("explicit.stat_664849247", "explicit.stat_4259701244"),
-    ("explicit.stat_664849247", "explicit.stat_3765507527"),
-    ("explicit.stat_664849247", "explicit.stat_1313498929"),
-    ("explicit.stat_664849247", "explicit.stat_991194404"),
-    ("explicit.stat_664849247", "explicit.stat_1424006185"),
-    ("explicit.stat_664849247", "explicit.stat_1346311588"),
-    ("explicit.stat_664849247", "explicit.stat_207635700"),
-    ("explicit.stat_664849247", "explicit.stat_1853636813"),
-    ("explicit.stat_664849247", "explicit.stat_2831391506"),
-    ("explicit.stat_664849247", "explicit.stat_1138813382"),
-    ("explicit.stat_664849247", "explicit.stat_2736708072"),
-    ("explicit.stat_664849247", "explicit.stat_3308185931"),
-    ("explicit.stat_664849247", "explicit.stat_4104891138"),
-    ("explicit.stat_664849247", "explicit.stat_34059570"),
-    ("explicit.stat_664849247", "explicit.stat_3643449791"),
-    ("explicit.stat_664849247", "explicit.stat_3468843137"),
-    ("explicit.stat_664849247", "explicit.stat_3207781478"),
-    ("explicit.stat_664849247", "explicit.stat_2806391472"),
-    ("explicit.stat_664849247", "explicit.stat_2567659895"),
-    ("explicit.stat_664849247", "explicit.stat_4012281889"),
-    ("explicit.stat_664849247", "explicit.stat_1173690938"),
-    ("explicit.stat_664849247", "explicit.stat_2365917222"),
-    ("explicit.stat_664849247", "explicit.stat_3223142064"),
-    ("explicit.stat_664849247", "explicit.stat_1567542124"),
-    ("explicit.stat_664849247", "explicit.stat_2647344903"),
-    ("explicit.stat_664849247", "explicit.stat_1165583295"),
-    ("explicit.stat_664849247", "explicit.stat_371612541"),
-    ("explicit.stat_664849247", "explicit.stat_2720072724"),
-    ("explicit.stat_664849247", "explicit.stat_1919069577"),
-    ("explicit.stat_664849247", "explicit.stat_3772841281"),
-    ("explicit.stat_664849247", "explicit.stat_4245204226"),
-    ("explicit.stat_664849247", "explicit.stat_2163419452"),
-    ("explicit.stat_664849247", "explicit.stat_3111519953"),
-    ("explicit.stat_664849247", "explicit.stat_2434030180"),
-    ("explicit.stat_664849247", "explicit.stat_1653848515"),
-    ("explicit.stat_664849247", "explicit.stat_2731416566"),
-    ("explicit.stat_664849247", "explicit.stat_3234824465"),
-    ("explicit.stat_664849247", "explicit.stat_3627458291"),
-    ("explicit.stat_664849247", "explicit.stat_2091518682"),
-    ("explicit.stat_664849247", "explicit.stat_214835567"),
-    ("explicit.stat_664849247", "explicit.stat_362838683"),
-    ("explicit.stat_664849247", "explicit.stat_2457540491"),
-    ("explicit.stat_664849247", "explicit.stat_65331133"),
-    ("explicit.stat_664849247", "explicit.stat_3337107517"),
-    ("explicit.stat_664849247", "explicit.stat_3332055899"),
-    ("explicit.stat_664849247", "explicit.stat_2548097895"),
-    ("explicit.stat_664849247", "explicit.stat_1016185292"),
-    ("explicit.stat_664849247", "explicit.stat_3624529132"),
-    ("explicit.stat_664849247", "explicit.stat_380220671"),
-    ("explicit.stat_664849247", "explicit.stat_2189467271"),
-    ("explicit.stat_664849247", "explicit.stat_3953667743"),
-    ("explicit.stat_664849247", "explicit.stat_1723738042"),
-    ("explicit.stat_664849247", "explicit.stat_556659145"),
-    ("explicit.stat_664849247", "explicit.stat_2690790844"),
-    ("explicit.stat_664849247", "explicit.stat_80470845"),
-    ("explicit.stat_664849247", "explicit.stat_2444534954"),
-    ("explicit.stat_664849247", "explicit.stat_1699077932"),
-    ("explicit.stat_664849247", "explicit.stat_2383304564"),
-    ("explicit.stat_664849247", "explicit.stat_121436064"),
-    ("explicit.stat_664849247", "explicit.stat_2312747856"),
-    ("explicit.stat_664849247", "explicit.stat_3656959867"),
-    ("explicit.stat_664849247", "explicit.stat_281949611"),
-    ("explicit.stat_68410701", "explicit.stat_3742808908"),
-    ("explicit.stat_68410701", "explicit.stat_1873457881"),
-    ("explicit.stat_68410701", "explicit.stat_3692646597"),
-    ("explicit.stat_68410701", "explicit.stat_1011863394"),
-    ("explicit.stat_68410701", "explicit.stat_3371719014"),
-    ("explicit.stat_68410701", "explicit.stat_4173751044"),
-    ("explicit.stat_68410701", "explicit.stat_576528026"),
-    ("explicit.stat_68410701", "explicit.stat_3772848194"),
-    ("explicit.stat_68410701", "explicit.stat_969576725"),
-    ("explicit.stat_68410701", "explicit.stat_4071658793"),
-    ("explicit.stat_68410701", "explicit.stat_3329402420"),
-    ("explicit.stat_68410701", "explicit.stat_4259701244"),
-    ("explicit.stat_68410701", "explicit.stat_3765507527"),
-    ("explicit.stat_68410701", "explicit.stat_1313498929"),
-    ("explicit.stat_68410701", "explicit.stat_991194404"),
-    ("explicit.stat_68410701", "explicit.stat_1424006185"),
-    ("explicit.stat_68410701", "explicit.stat_1346311588"),
-    ("explicit.stat_68410701", "explicit.stat_207635700"),
-    ("explicit.stat_68410701", "explicit.stat_1853636813"),
-    ("explicit.stat_68410701", "explicit.stat_2831391506"),
-    ("explicit.stat_68410701", "explicit.stat_1138813382"),
-    ("explicit.stat_68410701", "explicit.stat_2736708072"),
-    ("explicit.stat_68410701", "explicit.stat_3308185931"),
-    ("explicit.stat_68410701", "explicit.stat_4104891138"),
-    ("explicit.stat_68410701", "explicit.stat_34059570"),
-    ("explicit.stat_68410701", "explicit.stat_3643449791"),
-    ("explicit.stat_68410701", "explicit.stat_3468843137"),
-    ("explicit.stat_68410701", "explicit.stat_3207781478"),
-    ("explicit.stat_68410701", "explicit.stat_2806391472"),
-    ("explicit.stat_68410701", "explicit.stat_2567659895"),
-    ("explicit.stat_68410701", "explicit.stat_4012281889"),
-    ("explicit.stat_68410701", "explicit.stat_1173690938"),
-    ("explicit.stat_68410701", "explicit.stat_2365917222"),
-    ("explicit.stat_68410701", "explicit.stat_3223142064"),
-    ("explicit.stat_68410701", "explicit.stat_1567542124"),
-    ("explicit.stat_68410701", "explicit.stat_2647344903"),
-    ("explicit.stat_68410701", "explicit.stat_1165583295"),
-    ("explicit.stat_68410701", "explicit.stat_371612541"),
-    ("explicit.stat_68410701", "explicit.stat_2720072724"),
-    ("explicit.stat_68410701", "explicit.stat_1919069577"),
-    ("explicit.stat_68410701", "explicit.stat_3772841281"),
-    ("explicit.stat_68410701", "explicit.stat_4245204226"),
-    ("explicit.stat_68410701", "explicit.stat_2163419452"),
-    ("explicit.stat_68410701", "explicit.stat_3111519953"),
-    ("explicit.stat_68410701", "explicit.stat_2434030180"),
-    ("explicit.stat_68410701", "explicit.stat_1653848515"),
-    ("explicit.stat_68410701", "explicit.stat_2731416566"),
-    ("explicit.stat_68410701", "explicit.stat_3234824465"),
-    ("explicit.stat_68410701", "explicit.stat_3627458291"),
-    ("explicit.stat_68410701", "explicit.stat_2091518682"),
-    ("explicit.stat_68410701", "explicit.stat_214835567"),
-    ("explicit.stat_68410701", "explicit.stat_362838683"),
-    ("explicit.stat_68410701", "explicit.stat_2457540491"),
-    ("explicit.stat_68410701", "explicit.stat_65331133"),
-    ("explicit.stat_68410701", "explicit.stat_3337107517"),
-    ("explicit.stat_68410701", "explicit.stat_3332055899"),
-    ("explicit.stat_68410701", "explicit.stat_2548097895"),
-    ("explicit.stat_68410701", "explicit.stat_1016185292"),
-    ("explicit.stat_68410701", "explicit.stat_3624529132"),
-    ("explicit.stat_68410701", "explicit.stat_380220671"),
-    ("explicit.stat_68410701", "explicit.stat_2189467271"),
-    ("explicit.stat_68410701", "explicit.stat_3953667743"),
-    ("explicit.stat_68410701", "explicit.stat_1723738042"),
-    ("explicit.stat_68410701", "explicit.stat_556659145"),
-    ("explicit.stat_68410701", "explicit.stat_2690790844"),
-    ("explicit.stat_68410701", "explicit.stat_80470845"),
-    ("explicit.stat_68410701", "explicit.stat_2444534954"),
-    ("explicit.stat_68410701", "explicit.stat_1699077932"),
-    ("explicit.stat_68410701", "explicit.stat_2383304564"),
-    ("explicit.stat_68410701", "explicit.stat_121436064"),
-    ("explicit.stat_68410701", "explicit.stat_2312747856"),
-    ("explicit.stat_68410701", "explicit.stat_3656959867"),
-    ("explicit.stat_68410701", "explicit.stat_281949611"),
-    ("explicit.stat_3742808908", "explicit.stat_1873457881"),
-    ("explicit.stat_3742808908", "explicit.stat_3692646597"),
-    ("explicit.stat_3742808908", "explicit.stat_1011863394"),
-    ("explicit.stat_3742808908", "explicit.stat_3371719014"),
-    ("explicit.stat_3742808908", "explicit.stat_4173751044"),
-    ("explicit.stat_3742808908", "explicit.stat_576528026"),
-    ("explicit.stat_3742808908", "explicit.stat_3772848194"),
-    ("explicit.stat_3742808908", "explicit.stat_969576725"),
-    ("explicit.stat_3742808908", "explicit.stat_4071658793"),
-    ("explicit.stat_3742808908", "explicit.stat_3329402420"),
-    ("explicit.stat_3742808908", "explicit.stat_4259701244"),
-    ("explicit.stat_3742808908", "explicit.stat_3765507527"),
-    ("explicit.stat_3742808908", "explicit.stat_1313498929"),
-    ("explicit.stat_3742808908", "explicit.stat_991194404"),
-    ("explicit.stat_3742808908", "explicit.stat_1424006185"),
-    ("explicit.stat_3742808908", "explicit.stat_1346311588"),
-    ("explicit.stat_3742808908", "explicit.stat_207635700"),
-    ("explicit.stat_3742808908", "explicit.stat_1853636813"),
-    ("explicit.stat_3742808908", "explicit.stat_2831391506"),
-    ("explicit.stat_3742808908", "explicit.stat_1138813382"),
-    ("explicit.stat_3742808908", "explicit.stat_2736708072"),
-    ("explicit.stat_3742808908", "explicit.stat_3308185931"),
-    ("explicit.stat_3742808908", "explicit.stat_4104891138"),
-    ("explicit.stat_3742808908", "explicit.stat_34059570"),
-    ("explicit.stat_3742808908", "explicit.stat_3643449791"),
-    ("explicit.stat_3742808908", "explicit.stat_3468843137"),
-    ("explicit.stat_3742808908", "explicit.stat_3207781478"),
-    ("explicit.stat_3742808908", "explicit.stat_2806391472"),
-    ("explicit.stat_3742808908", "explicit.stat_2567659895"),
-    ("explicit.stat_3742808908", "explicit.stat_4012281889"),
-    ("explicit.stat_3742808908", "explicit.stat_1173690938"),
-    ("explicit.stat_3742808908", "explicit.stat_2365917222"),
-    ("explicit.stat_3742808908", "explicit.stat_3223142064"),
-    ("explicit.stat_3742808908", "explicit.stat_1567542124"),
-    ("explicit.stat_3742808908", "explicit.stat_2647344903"),
-    ("explicit.stat_3742808908", "explicit.stat_1165583295"),
-    ("explicit.stat_3742808908", "explicit.stat_371612541"),
-    ("explicit.stat_3742808908", "explicit.stat_2720072724"),
-    ("explicit.stat_3742808908", "explicit.stat_1919069577"),
-    ("explicit.stat_3742808908", "explicit.stat_3772841281"),
-    ("explicit.stat_3742808908", "explicit.stat_4245204226"),
-    ("explicit.stat_3742808908", "explicit.stat_2163419452"),
-    ("explicit.stat_3742808908", "explicit.stat_3111519953"),
-    ("explicit.stat_3742808908", "explicit.stat_2434030180"),
-    ("explicit.stat_3742808908", "explicit.stat_1653848515"),
-    ("explicit.stat_3742808908", "explicit.stat_2731416566"),
-    ("explicit.stat_3742808908", "explicit.stat_3234824465"),
-    ("explicit.stat_3742808908", "explicit.stat_3627458291"),
-    ("explicit.stat_3742808908", "explicit.stat_2091518682"),
-    ("explicit.stat_3742808908", "explicit.stat_214835567"),
-    ("explicit.stat_3742808908", "explicit.stat_362838683"),
-    ("explicit.stat_3742808908", "explicit.stat_2457540491"),
-    ("explicit.stat_3742808908", "explicit.stat_65331133"),
-    ("explicit.stat_3742808908", "explicit.stat_3337107517"),
-    ("explicit.stat_3742808908", "explicit.stat_3332055899"),
-    ("explicit.stat_3742808908", "explicit.stat_2548097895"),
-    ("explicit.stat_3742808908", "explicit.stat_1016185292"),
-    ("explicit.stat_3742808908", "explicit.stat_3624529132"),
-    ("explicit.stat_3742808908", "explicit.stat_380220671"),
-    ("explicit.stat_3742808908", "explicit.stat_2189467271"),
-    ("explicit.stat_3742808908", "explicit.stat_3953667743"),
-    ("explicit.stat_3742808908", "explicit.stat_1723738042"),
-    ("explicit.stat_3742808908", "explicit.stat_556659145"),
-    ("explicit.stat_3742808908", "explicit.stat_2690790844"),
-    ("explicit.stat_3742808908", "explicit.stat_80470845"),
-    ("explicit.stat_3742808908", "explicit.stat_2444534954"),
-    ("explicit.stat_3742808908", "explicit.stat_1699077932"),
-    ("explicit.stat_3742808908", "explicit.stat_2383304564"),
-    ("explicit.stat_3742808908", "explicit.stat_121436064"),
-    ("explicit.stat_3742808908", "explicit.stat_2312747856"),
-    ("explicit.stat_3742808908", "explicit.stat_3656959867"),
-    ("explicit.stat_3742808908", "explicit.stat_281949611"),
-    ("explicit.stat_1873457881", "explicit.stat_3692646597"),
-    ("explicit.stat_1873457881", "explicit.stat_1011863394"),
-    ("explicit.stat_1873457881", "explicit.stat_3371719014"),
-    ("explicit.stat_1873457881", "explicit.stat_4173751044"),
-    ("explicit.stat_1873457881", "explicit.stat_576528026"),
-    ("explicit.stat_1873457881", "explicit.stat_3772848194"),
-    ("explicit.stat_1873457881", "explicit.stat_969576725"),
-    ("explicit.stat_1873457881", "explicit.stat_4071658793"),
-    ("explicit.stat_1873457881", "explicit.stat_3329402420"),
-    ("explicit.stat_1873457881", "explicit.stat_4259701244"),
-    ("explicit.stat_1873457881", "explicit.stat_3765507527"),
-    ("explicit.stat_1873457881", "explicit.stat_1313498929"),
-    ("explicit.stat_1873457881", "explicit.stat_991194404"),
-    ("explicit.stat_1873457881", "explicit.stat_1424006185"),
-    ("explicit.stat_1873457881", "explicit.stat_1346311588"),
-    ("explicit.stat_1873457881", "explicit.stat_207635700"),
-    ("explicit.stat_1873457881", "explicit.stat_1853636813"),
-    ("explicit.stat_1873457881", "explicit.stat_2831391506"),
-    ("explicit.stat_1873457881", "explicit.stat_1138813382"),
-    ("explicit.stat_1873457881", "explicit.stat_2736708072"),
-    ("explicit.stat_1873457881", "explicit.stat_3308185931"),
-    ("explicit.stat_1873457881", "explicit.stat_4104891138"),
-    ("explicit.stat_1873457881", "explicit.stat_34059570"),
-    ("explicit.stat_1873457881", "explicit.stat_3643449791"),
-    ("explicit.stat_1873457881", "explicit.stat_3468843137"),
-    ("explicit.stat_1873457881", "explicit.stat_3207781478"),
-    ("explicit.stat_1873457881", "explicit.stat_2806391472"),
-    ("explicit.stat_1873457881", "explicit.stat_2567659895"),
-    ("explicit.stat_1873457881", "explicit.stat_4012281889"),
-    ("explicit.stat_1873457881", "explicit.stat_1173690938"),
-    ("explicit.stat_1873457881", "explicit.stat_2365917222"),
-    ("explicit.stat_1873457881", "explicit.stat_3223142064"),
-    ("explicit.stat_1873457881", "explicit.stat_1567542124"),
-    ("explicit.stat_1873457881", "explicit.stat_2647344903"),
-    ("explicit.stat_1873457881", "explicit.stat_1165583295"),
-    ("explicit.stat_1873457881", "explicit.stat_371612541"),
-    ("explicit.stat_1873457881", "explicit.stat_2720072724"),
-    ("explicit.stat_1873457881", "explicit.stat_1919069577"),
-    ("explicit.stat_1873457881", "explicit.stat_3772841281"),
-    ("explicit.stat_1873457881", "explicit.stat_4245204226"),
-    ("explicit.stat_1873457881", "explicit.stat_2163419452"),
-    ("explicit.stat_1873457881", "explicit.stat_3111519953"),
-    ("explicit.stat_1873457881", "explicit.stat_2434030180"),
-    ("explicit.stat_1873457881", "explicit.stat_1653848515"),
-    ("explicit.stat_1873457881", "explicit.stat_2731416566"),
-    ("explicit.stat_1873457881", "explicit.stat_3234824465"),
-    ("explicit.stat_1873457881", "explicit.stat_3627458291"),
-    ("explicit.stat_1873457881", "explicit.stat_2091518682"),
-    ("explicit.stat_1873457881", "explicit.stat_214835567"),
-    ("explicit.stat_1873457881", "explicit.stat_362838683"),
-    ("explicit.stat_1873457881", "explicit.stat_2457540491"),
-    ("explicit.stat_1873457881", "explicit.stat_65331133"),
-    ("explicit.stat_1873457881", "explicit.stat_3337107517"),
-    ("explicit.stat_1873457881", "explicit.stat_3332055899"),
-    ("explicit.stat_1873457881", "explicit.stat_2548097895"),
-    ("explicit.stat_1873457881", "explicit.stat_1016185292"),
-    ("explicit.stat_1873457881", "explicit.stat_3624529132"),
-    ("explicit.stat_1873457881", "explicit.stat_380220671"),
-    ("explicit.stat_1873457881", "explicit.stat_2189467271"),
-    ("explicit.stat_1873457881", "explicit.stat_3953667743"),
-    ("explicit.stat_1873457881", "explicit.stat_1723738042"),
-    ("explicit.stat_1873457881", "explicit.stat_556659145"),
-    ("explicit.stat_1873457881", "explicit.stat_2690790844"),
-    ("explicit.stat_1873457881", "explicit.stat_80470845"),
-    ("explicit.stat_1873457881", "explicit.stat_2444534954"),
-    ("explicit.stat_1873457881", "explicit.stat_1699077932"),
-    ("explicit.stat_1873457881", "explicit.stat_2383304564"),
-    ("explicit.stat_1873457881", "explicit.stat_121436064"),
-    ("explicit.stat_1873457881", "explicit.stat_2312747856"),
-    ("explicit.stat_1873457881", "explicit.stat_3656959867"),
-    ("explicit.stat_1873457881", "explicit.stat_281949611"),
-    ("explicit.stat_3692646597", "explicit.stat_1011863394"),
-    ("explicit.stat_3692646597", "explicit.stat_3371719014"),
-    ("explicit.stat_3692646597", "explicit.stat_4173751044"),
-    ("explicit.stat_3692646597", "explicit.stat_576528026"),
-    ("explicit.stat_3692646597", "explicit.stat_3772848194"),
-    ("explicit.stat_3692646597", "explicit.stat_969576725"),
-    ("explicit.stat_3692646597", "explicit.stat_4071658793"),
-    ("explicit.stat_3692646597", "explicit.stat_3329402420"),
-    ("explicit.stat_3692646597", "explicit.stat_4259701244"),
-    ("explicit.stat_3692646597", "explicit.stat_3765507527"),
-    ("explicit.stat_3692646597", "explicit.stat_1313498929"),
-    ("explicit.stat_3692646597", "explicit.stat_991194404"),
-    ("explicit.stat_3692646597", "explicit.stat_1424006185"),
-    ("explicit.stat_3692646597", "explicit.stat_1346311588"),
-    ("explicit.stat_3692646597", "explicit.stat_207635700"),
-    ("explicit.stat_3692646597", "explicit.stat_1853636813"),
-    ("explicit.stat_3692646597", "explicit.stat_2831391506"),
-    ("explicit.stat_3692646597", "explicit.stat_1138813382"),
-    ("explicit.stat_3692646597", "explicit.stat_2736708072"),
-    ("explicit.stat_3692646597", "explicit.stat_3308185931"),
-    ("explicit.stat_3692646597", "explicit.stat_4104891138"),
-    ("explicit.stat_3692646597", "explicit.stat_34059570"),
-    ("explicit.stat_3692646597", "explicit.stat_3643449791"),
-    ("explicit.stat_3692646597", "explicit.stat_3468843137"),
-    ("explicit.stat_3692646597", "explicit.stat_3207781478"),
-    ("explicit.stat_3692646597", "explicit.stat_2806391472"),
-    ("explicit.stat_3692646597", "explicit.stat_2567659895"),
-    ("explicit.stat_3692646597", "explicit.stat_4012281889"),
-    ("explicit.stat_3692646597", "explicit.stat_1173690938"),
-    ("explicit.stat_3692646597", "explicit.stat_2365917222"),
-    ("explicit.stat_3692646597", "explicit.stat_3223142064"),
-    ("explicit.stat_3692646597", "explicit.stat_1567542124"),
-    ("explicit.stat_3692646597", "explicit.stat_2647344903"),
-    ("explicit.stat_3692646597", "explicit.stat_1165583295"),
-    ("explicit.stat_3692646597", "explicit.stat_371612541"),
-    ("explicit.stat_3692646597", "explicit.stat_2720072724"),
-    ("explicit.stat_3692646597", "explicit.stat_1919069577"),
-    ("explicit.stat_3692646597", "explicit.stat_3772841281"),
-    ("explicit.stat_3692646597", "explicit.stat_4245204226"),
-    ("explicit.stat_3692646597", "explicit.stat_2163419452"),
-    ("explicit.stat_3692646597", "explicit.stat_3111519953"),
-    ("explicit.stat_3692646597", "explicit.stat_2434030180"),
-    ("explicit.stat_3692646597", "explicit.stat_1653848515"),
-    ("explicit.stat_3692646597", "explicit.stat_2731416566"),
-    ("explicit.stat_3692646597", "explicit.stat_3234824465"),
-    ("explicit.stat_3692646597", "explicit.stat_3627458291"),
-    ("explicit.stat_3692646597", "explicit.stat_2091518682"),
-    ("explicit.stat_3692646597", "explicit.stat_214835567"),
-    ("explicit.stat_3692646597", "explicit.stat_362838683"),
-    ("explicit.stat_3692646597", "explicit.stat_2457540491"),
-    ("explicit.stat_3692646597", "explicit.stat_65331133"),
-    ("explicit.stat_3692646597", "explicit.stat_3337107517"),
-    ("explicit.stat_3692646597", "explicit.stat_3332055899"),
-    ("explicit.stat_3692646597", "explicit.stat_2548097895"),
-    ("explicit.stat_3692646597", "explicit.stat_1016185292"),
-    ("explicit.stat_3692646597", "explicit.stat_3624529132"),
-    ("explicit.stat_3692646597", "explicit.stat_380220671"),
-    ("explicit.stat_3692646597", "explicit.stat_2189467271"),
-    ("explicit.stat_3692646597", "explicit.stat_3953667743"),
-    ("explicit.stat_3692646597", "explicit.stat_1723738042"),
-    ("explicit.stat_3692646597", "explicit.stat_556659145"),
-    ("explicit.stat_3692646597", "explicit.stat_2690790844"),
-    ("explicit.stat_3692646597", "explicit.stat_80470845"),
-    ("explicit.stat_3692646597", "explicit.stat_2444534954"),
-    ("explicit.stat_3692646597", "explicit.stat_1699077932"),
-    ("explicit.stat_3692646597", "explicit.stat_2383304564"),
-    ("explicit.stat_3692646597", "explicit.stat_121436064"),
-    ("explicit.stat_3692646597", "explicit.stat_2312747856"),
-    ("explicit.stat_3692646597", "explicit.stat_3656959867"),
-    ("explicit.stat_3692646597", "explicit.stat_281949611"),
-    ("explicit.stat_1011863394", "explicit.stat_3371719014"),
-    ("explicit.stat_1011863394", "explicit.stat_4173751044"),
-    ("explicit.stat_1011863394", "explicit.stat_576528026"),
-    ("explicit.stat_1011863394", "explicit.stat_3772848194"),
-    ("explicit.stat_1011863394", "explicit.stat_969576725"),
-    ("explicit.stat_1011863394", "explicit.stat_4071658793"),
-    ("explicit.stat_1011863394", "explicit.stat_3329402420"),
-    ("explicit.stat_1011863394", "explicit.stat_4259701244"),
-    ("explicit.stat_1011863394", "explicit.stat_3765507527"),
-    ("explicit.stat_1011863394", "explicit.stat_1313498929"),
-    ("explicit.stat_1011863394", "explicit.stat_991194404"),
-    ("explicit.stat_1011863394", "explicit.stat_1424006185"),
-    ("explicit.stat_1011863394", "explicit.stat_1346311588"),
-    ("explicit.stat_1011863394", "explicit.stat_207635700"),
-    ("explicit.stat_1011863394", "explicit.stat_1853636813"),
-    ("explicit.stat_1011863394", "explicit.stat_2831391506"),
-    ("explicit.stat_1011863394", "explicit.stat_1138813382"),
-    ("explicit.stat_1011863394", "explicit.stat_2736708072"),
-    ("explicit.stat_1011863394", "explicit.stat_3308185931"),
-    ("explicit.stat_1011863394", "explicit.stat_4104891138"),
-    ("explicit.stat_1011863394", "explicit.stat_34059570"),
-    ("explicit.stat_1011863394", "explicit.stat_3643449791"),
-    ("explicit.stat_1011863394", "explicit.stat_3468843137"),
-    ("explicit.stat_1011863394", "explicit.stat_3207781478"),
-    ("explicit.stat_1011863394", "explicit.stat_2806391472"),
-    ("explicit.stat_1011863394", "explicit.stat_2567659895"),
-    ("explicit.stat_1011863394", "explicit.stat_4012281889"),
-    ("explicit.stat_1011863394", "explicit.stat_1173690938"),
-    ("explicit.stat_1011863394", "explicit.stat_2365917222"),
-    ("explicit.stat_1011863394", "explicit.stat_3223142064"),
-    ("explicit.stat_1011863394", "explicit.stat_1567542124"),
-    ("explicit.stat_1011863394", "explicit.stat_2647344903"),
-    ("explicit.stat_1011863394", "explicit.stat_1165583295"),
-    ("explicit.stat_1011863394", "explicit.stat_371612541"),
-    ("explicit.stat_1011863394", "explicit.stat_2720072724"),
-    ("explicit.stat_1011863394", "explicit.stat_1919069577"),
-    ("explicit.stat_1011863394", "explicit.stat_3772841281"),
-    ("explicit.stat_1011863394", "explicit.stat_4245204226"),
-    ("explicit.stat_1011863394", "explicit.stat_2163419452"),
-    ("explicit.stat_1011863394", "explicit.stat_3111519953"),
-    ("explicit.stat_1011863394", "explicit.stat_2434030180"),
-    ("explicit.stat_1011863394", "explicit.stat_1653848515"),
-    ("explicit.stat_1011863394", "explicit.stat_2731416566"),
-    ("explicit.stat_1011863394", "explicit.stat_3234824465"),
-    ("explicit.stat_1011863394", "explicit.stat_3627458291"),
-    ("explicit.stat_1011863394", "explicit.stat_2091518682"),
-    ("explicit.stat_1011863394", "explicit.stat_214835567"),
-    ("explicit.stat_1011863394", "explicit.stat_362838683"),
-    ("explicit.stat_1011863394", "explicit.stat_2457540491"),
-    ("explicit.stat_1011863394", "explicit.stat_65331133"),
-    ("explicit.stat_1011863394", "explicit.stat_3337107517"),
-    ("explicit.stat_1011863394", "explicit.stat_3332055899"),
-    ("explicit.stat_1011863394", "explicit.stat_2548097895"),
-    ("explicit.stat_1011863394", "explicit.stat_1016185292"),
-    ("explicit.stat_1011863394", "explicit.stat_3624529132"),
-    ("explicit.stat_1011863394", "explicit.stat_380220671"),
-    ("explicit.stat_1011863394", "explicit.stat_2189467271"),
-    ("explicit.stat_1011863394", "explicit.stat_3953667743"),
-    ("explicit.stat_1011863394", "explicit.stat_1723738042"),
-    ("explicit.stat_1011863394", "explicit.stat_556659145"),
-    ("explicit.stat_1011863394", "explicit.stat_2690790844"),
-    ("explicit.stat_1011863394", "explicit.stat_80470845"),
-    ("explicit.stat_1011863394", "explicit.stat_2444534954"),
-    ("explicit.stat_1011863394", "explicit.stat_1699077932"),
-    ("explicit.stat_1011863394", "explicit.stat_2383304564"),
-    ("explicit.stat_1011863394", "explicit.stat_121436064"),
-    ("explicit.stat_1011863394", "explicit.stat_2312747856"),
-    ("explicit.stat_1011863394", "explicit.stat_3656959867"),
-    ("explicit.stat_1011863394", "explicit.stat_281949611"),
-    ("explicit.stat_3371719014", "explicit.stat_4173751044"),
-    ("explicit.stat_3371719014", "explicit.stat_576528026"),
-    ("explicit.stat_3371719014", "explicit.stat_3772848194"),
-    ("explicit.stat_3371719014", "explicit.stat_969576725"),
-    ("explicit.stat_3371719014", "explicit.stat_4071658793"),
-    ("explicit.stat_3371719014", "explicit.stat_3329402420"),
-    ("explicit.stat_3371719014", "explicit.stat_4259701244"),
-    ("explicit.stat_3371719014", "explicit.stat_3765507527"),
-    ("explicit.stat_3371719014", "explicit.stat_1313498929"),
-    ("explicit.stat_3371719014", "explicit.stat_991194404"),
-    ("explicit.stat_3371719014", "explicit.stat_1424006185"),
-    ("explicit.stat_3371719014", "explicit.stat_1346311588"),
-    ("explicit.stat_3371719014", "explicit.stat_207635700"),
-    ("explicit.stat_3371719014", "explicit.stat_1853636813"),
-    ("explicit.stat_3371719014", "explicit.stat_2831391506"),
-    ("explicit.stat_3371719014", "explicit.stat_1138813382"),
-    ("explicit.stat_3371719014", "explicit.stat_2736708072"),
-    ("explicit.stat_3371719014", "explicit.stat_3308185931"),
-    ("explicit.stat_3371719014", "explicit.stat_4104891138"),
-    ("explicit.stat_3371719014", "explicit.stat_34059570"),
-    ("explicit.stat_3371719014", "explicit.stat_3643449791"),
-    ("explicit.stat_3371719014", "explicit.stat_3468843137"),
-    ("explicit.stat_3371719014", "explicit.stat_3207781478"),
-    ("explicit.stat_3371719014", "explicit.stat_2806391472"),
-    ("explicit.stat_3371719014", "explicit.stat_2567659895"),
-    ("explicit.stat_3371719014", "explicit.stat_4012281889"),
-    ("explicit.stat_3371719014", "explicit.stat_1173690938"),
-    ("explicit.stat_3371719014", "explicit.stat_2365917222"),
-    ("explicit.stat_3371719014", "explicit.stat_3223142064"),
-    ("explicit.stat_3371719014", "explicit.stat_1567542124"),
-    ("explicit.stat_3371719014", "explicit.stat_2647344903"),
-    ("explicit.stat_3371719014", "explicit.stat_1165583295"),
-    ("explicit.stat_3371719014", "explicit.stat_371612541"),
-    ("explicit.stat_3371719014", "explicit.stat_2720072724"),
-    ("explicit.stat_3371719014", "explicit.stat_1919069577"),
-    ("explicit.stat_3371719014", "explicit.stat_3772841281"),
-    ("explicit.stat_3371719014", "explicit.stat_4245204226"),
-    ("explicit.stat_3371719014", "explicit.stat_2163419452"),
-    ("explicit.stat_3371719014", "explicit.stat_3111519953"),
-    ("explicit.stat_3371719014", "explicit.stat_2434030180"),
-    ("explicit.stat_3371719014", "explicit.stat_1653848515"),
-    ("explicit.stat_3371719014", "explicit.stat_2731416566"),
-    ("explicit.stat_3371719014", "explicit.stat_3234824465"),
-    ("explicit.stat_3371719014", "explicit.stat_3627458291"),
-    ("explicit.stat_3371719014", "explicit.stat_2091518682"),
-    ("explicit.stat_3371719014", "explicit.stat_214835567"),
-    ("explicit.stat_3371719014", "explicit.stat_362838683"),
-    ("explicit.stat_3371719014", "explicit.stat_2457540491"),
-    ("explicit.stat_3371719014", "explicit.stat_65331133"),
-    ("explicit.stat_3371719014", "explicit.stat_3337107517"),
-    ("explicit.stat_3371719014", "explicit.stat_3332055899"),
-    ("explicit.stat_3371719014", "explicit.stat_2548097895"),
-    ("explicit.stat_3371719014", "explicit.stat_1016185292"),
-    ("explicit.stat_3371719014", "explicit.stat_3624529132"),
-    ("explicit.stat_3371719014", "explicit.stat_380220671"),
-    ("explicit.stat_3371719014", "explicit.stat_2189467271"),
-    ("explicit.stat_3371719014", "explicit.stat_3953667743"),
-    ("explicit.stat_3371719014", "explicit.stat_1723738042"),
-    ("explicit.stat_3371719014", "explicit.stat_556659145"),
-    ("explicit.stat_3371719014", "explicit.stat_2690790844"),
-    ("explicit.stat_3371719014", "explicit.stat_80470845"),
-    ("explicit.stat_3371719014", "explicit.stat_2444534954"),
-    ("explicit.stat_3371719014", "explicit.stat_1699077932"),
-    ("explicit.stat_3371719014", "explicit.stat_2383304564"),
-    ("explicit.stat_3371719014", "explicit.stat_121436064"),
-    ("explicit.stat_3371719014", "explicit.stat_2312747856"),
-    ("explicit.stat_3371719014", "explicit.stat_3656959867"),
-    ("explicit.stat_3371719014", "explicit.stat_281949611"),
-    ("explicit.stat_4173751044", "explicit.stat_576528026"),
-    ("explicit.stat_4173751044", "explicit.stat_3772848194"),
-    ("explicit.stat_4173751044", "explicit.stat_969576725"),
-    ("explicit.stat_4173751044", "explicit.stat_4071658793"),
-    ("explicit.stat_4173751044", "explicit.stat_3329402420"),
-    ("explicit.stat_4173751044", "explicit.stat_4259701244"),
-    ("explicit.stat_4173751044", "explicit.stat_3765507527"),
-    ("explicit.stat_4173751044", "explicit.stat_1313498929"),
-    ("explicit.stat_4173751044", "explicit.stat_991194404"),
-    ("explicit.stat_4173751044", "explicit.stat_1424006185"),
-    ("explicit.stat_4173751044", "explicit.stat_1346311588"),
-    ("explicit.stat_4173751044", "explicit.stat_207635700"),
-    ("explicit.stat_4173751044", "explicit.stat_1853636813"),
-    ("explicit.stat_4173751044", "explicit.stat_2831391506"),
-    ("explicit.stat_4173751044", "explicit.stat_1138813382"),
-    ("explicit.stat_4173751044", "explicit.stat_2736708072"),
-    ("explicit.stat_4173751044", "explicit.stat_3308185931"),
-    ("explicit.stat_4173751044", "explicit.stat_4104891138"),
-    ("explicit.stat_4173751044", "explicit.stat_34059570"),
-    ("explicit.stat_4173751044", "explicit.stat_3643449791"),
-    ("explicit.stat_4173751044", "explicit.stat_3468843137"),
-    ("explicit.stat_4173751044", "explicit.stat_3207781478"),
-    ("explicit.stat_4173751044", "explicit.stat_2806391472"),
-    ("explicit.stat_4173751044", "explicit.stat_2567659895"),
-    ("explicit.stat_4173751044", "explicit.stat_4012281889"),
-    ("explicit.stat_4173751044", "explicit.stat_1173690938"),
-    ("explicit.stat_4173751044", "explicit.stat_2365917222"),
-    ("explicit.stat_4173751044", "explicit.stat_3223142064"),
-    ("explicit.stat_4173751044", "explicit.stat_1567542124"),
-    ("explicit.stat_4173751044", "explicit.stat_2647344903"),
-    ("explicit.stat_4173751044", "explicit.stat_1165583295"),
-    ("explicit.stat_4173751044", "explicit.stat_371612541"),
-    ("explicit.stat_4173751044", "explicit.stat_2720072724"),
-    ("explicit.stat_4173751044", "explicit.stat_1919069577"),
-    ("explicit.stat_4173751044", "explicit.stat_3772841281"),
-    ("explicit.stat_4173751044", "explicit.stat_4245204226"),
-    ("explicit.stat_4173751044", "explicit.stat_2163419452"),
-    ("explicit.stat_4173751044", "explicit.stat_3111519953"),
-    ("explicit.stat_4173751044", "explicit.stat_2434030180"),
-    ("explicit.stat_4173751044", "explicit.stat_1653848515"),
-    ("explicit.stat_4173751044", "explicit.stat_2731416566"),
-    ("explicit.stat_4173751044", "explicit.stat_3234824465"),
-    ("explicit.stat_4173751044", "explicit.stat_3627458291"),
-    ("explicit.stat_4173751044", "explicit.stat_2091518682"),
-    ("explicit.stat_4173751044", "explicit.stat_214835567"),
-    ("explicit.stat_4173751044", "explicit.stat_362838683"),
-    ("explicit.stat_4173751044", "explicit.stat_2457540491"),
-    ("explicit.stat_4173751044", "explicit.stat_65331133"),
-    ("explicit.stat_4173751044", "explicit.stat_3337107517"),
-    ("explicit.stat_4173751044", "explicit.stat_3332055899"),
-    ("explicit.stat_4173751044", "explicit.stat_2548097895"),
-    ("explicit.stat_4173751044", "explicit.stat_1016185292"),
-    ("explicit.stat_4173751044", "explicit.stat_3624529132"),
-    ("explicit.stat_4173751044", "explicit.stat_380220671"),
-    ("explicit.stat_4173751044", "explicit.stat_2189467271"),
-    ("explicit.stat_4173751044", "explicit.stat_3953667743"),
-    ("explicit.stat_4173751044", "explicit.stat_1723738042"),
-    ("explicit.stat_4173751044", "explicit.stat_556659145"),
-    ("explicit.stat_4173751044", "explicit.stat_2690790844"),
-    ("explicit.stat_4173751044", "explicit.stat_80470845"),
-    ("explicit.stat_4173751044", "explicit.stat_2444534954"),
-    ("explicit.stat_4173751044", "explicit.stat_1699077932"),
-    ("explicit.stat_4173751044", "explicit.stat_2383304564"),
-    ("explicit.stat_4173751044", "explicit.stat_121436064"),
-    ("explicit.stat_4173751044", "explicit.stat_2312747856"),
-    ("explicit.stat_4173751044", "explicit.stat_3656959867"),
-    ("explicit.stat_4173751044", "explicit.stat_281949611"),
-    ("explicit.stat_576528026", "explicit.stat_3772848194"),
-    ("explicit.stat_576528026", "explicit.stat_969576725"),
-    ("explicit.stat_576528026", "explicit.stat_4071658793"),
-    ("explicit.stat_576528026", "explicit.stat_3329402420"),
-    ("explicit.stat_576528026", "explicit.stat_4259701244"),
-    ("explicit.stat_576528026", "explicit.stat_3765507527"),
-    ("explicit.stat_576528026", "explicit.stat_1313498929"),
-    ("explicit.stat_576528026", "explicit.stat_991194404"),
-    ("explicit.stat_576528026", "explicit.stat_1424006185"),
-    ("explicit.stat_576528026", "explicit.stat_1346311588"),
-    ("explicit.stat_576528026", "explicit.stat_207635700"),
-    ("explicit.stat_576528026", "explicit.stat_1853636813"),
-    ("explicit.stat_576528026", "explicit.stat_2831391506"),
-    ("explicit.stat_576528026", "explicit.stat_1138813382"),
-    ("explicit.stat_576528026", "explicit.stat_2736708072"),
-    ("explicit.stat_576528026", "explicit.stat_3308185931"),
-    ("explicit.stat_576528026", "explicit.stat_4104891138"),
-    ("explicit.stat_576528026", "explicit.stat_34059570"),
-    ("explicit.stat_576528026", "explicit.stat_3643449791"),
-    ("explicit.stat_576528026", "explicit.stat_3468843137"),
-    ("explicit.stat_576528026", "explicit.stat_3207781478"),
-    ("explicit.stat_576528026", "explicit.stat_2806391472"),
-    ("explicit.stat_576528026", "explicit.stat_2567659895"),
-    ("explicit.stat_576528026", "explicit.stat_4012281889"),
-    ("explicit.stat_576528026", "explicit.stat_1173690938"),
-    ("explicit.stat_576528026", "explicit.stat_2365917222"),
-    ("explicit.stat_576528026", "explicit.stat_3223142064"),
-    ("explicit.stat_576528026", "explicit.stat_1567542124"),
-    ("explicit.stat_576528026", "explicit.stat_2647344903"),
-    ("explicit.stat_576528026", "explicit.stat_1165583295"),
-    ("explicit.stat_576528026", "explicit.stat_371612541"),
-    ("explicit.stat_576528026", "explicit.stat_2720072724"),
-    ("explicit.stat_576528026", "explicit.stat_1919069577"),
-    ("explicit.stat_576528026", "explicit.stat_3772841281"),
-    ("explicit.stat_576528026", "explicit.stat_4245204226"),
-    ("explicit.stat_576528026", "explicit.stat_2163419452"),
-    ("explicit.stat_576528026", "explicit.stat_3111519953"),
-    ("explicit.stat_576528026", "explicit.stat_2434030180"),
-    ("explicit.stat_576528026", "explicit.stat_1653848515"),
-    ("explicit.stat_576528026", "explicit.stat_2731416566"),
-    ("explicit.stat_576528026", "explicit.stat_3234824465"),
-    ("explicit.stat_576528026", "explicit.stat_3627458291"),
-    ("explicit.stat_576528026", "explicit.stat_2091518682"),
-    ("explicit.stat_576528026", "explicit.stat_214835567"),
-    ("explicit.stat_576528026", "explicit.stat_362838683"),
-    ("explicit.stat_576528026", "explicit.stat_2457540491"),
-    ("explicit.stat_576528026", "explicit.stat_65331133"),
-    ("explicit.stat_576528026", "explicit.stat_3337107517"),
-    ("explicit.stat_576528026", "explicit.stat_3332055899"),
-    ("explicit.stat_576528026", "explicit.stat_2548097895"),
-    ("explicit.stat_576528026", "explicit.stat_1016185292"),
-    ("explicit.stat_576528026", "explicit.stat_3624529132"),
-    ("explicit.stat_576528026", "explicit.stat_380220671"),
-    ("explicit.stat_576528026", "explicit.stat_2189467271"),
-    ("explicit.stat_576528026", "explicit.stat_3953667743"),
-    ("explicit.stat_576528026", "explicit.stat_1723738042"),
-    ("explicit.stat_576528026", "explicit.stat_556659145"),
-    ("explicit.stat_576528026", "explicit.stat_2690790844"),
-    ("explicit.stat_576528026", "explicit.stat_80470845"),
-    ("explicit.stat_576528026", "explicit.stat_2444534954"),
-    ("explicit.stat_576528026", "explicit.stat_1699077932"),
-    ("explicit.stat_576528026", "explicit.stat_2383304564"),
-    ("explicit.stat_576528026", "explicit.stat_121436064"),
-    ("explicit.stat_576528026", "explicit.stat_2312747856"),
-    ("explicit.stat_576528026", "explicit.stat_3656959867"),
-    ("explicit.stat_576528026", "explicit.stat_281949611"),
-    ("explicit.stat_3772848194", "explicit.stat_969576725"),
-    ("explicit.stat_3772848194", "explicit.stat_4071658793"),
-    ("explicit.stat_3772848194", "explicit.stat_3329402420"),
-    ("explicit.stat_3772848194", "explicit.stat_4259701244"),
-    ("explicit.stat_3772848194", "explicit.stat_3765507527"),
-    ("explicit.stat_3772848194", "explicit.stat_1313498929"),
-    ("explicit.stat_3772848194", "explicit.stat_991194404"),
-    ("explicit.stat_3772848194", "explicit.stat_1424006185"),
-    ("explicit.stat_3772848194", "explicit.stat_1346311588"),
-    ("explicit.stat_3772848194", "explicit.stat_207635700"),
-    ("explicit.stat_3772848194", "explicit.stat_1853636813"),
-    ("explicit.stat_3772848194", "explicit.stat_2831391506"),
-    ("explicit.stat_3772848194", "explicit.stat_1138813382"),
-    ("explicit.stat_3772848194", "explicit.stat_2736708072"),
-    ("explicit.stat_3772848194", "explicit.stat_3308185931"),
-    ("explicit.stat_3772848194", "explicit.stat_4104891138"),
-    ("explicit.stat_3772848194", "explicit.stat_34059570"),
-    ("explicit.stat_3772848194", "explicit.stat_3643449791"),
-    ("explicit.stat_3772848194", "explicit.stat_3468843137"),
-    ("explicit.stat_3772848194", "explicit.stat_3207781478"),
-    ("explicit.stat_3772848194", "explicit.stat_2806391472"),
-    ("explicit.stat_3772848194", "explicit.stat_2567659895"),
-    ("explicit.stat_3772848194", "explicit.stat_4012281889"),
-    ("explicit.stat_3772848194", "explicit.stat_1173690938"),
-    ("explicit.stat_3772848194", "explicit.stat_2365917222"),
-    ("explicit.stat_3772848194", "explicit.stat_3223142064"),
-    ("explicit.stat_3772848194", "explicit.stat_1567542124"),
-    ("explicit.stat_3772848194", "explicit.stat_2647344903"),
-    ("explicit.stat_3772848194", "explicit.stat_1165583295"),
-    ("explicit.stat_3772848194", "explicit.stat_371612541"),
-    ("explicit.stat_3772848194", "explicit.stat_2720072724"),
-    ("explicit.stat_3772848194", "explicit.stat_1919069577"),
-    ("explicit.stat_3772848194", "explicit.stat_3772841281"),
-    ("explicit.stat_3772848194", "explicit.stat_4245204226"),
-    ("explicit.stat_3772848194", "explicit.stat_2163419452"),
-    ("explicit.stat_3772848194", "explicit.stat_3111519953"),
-    ("explicit.stat_3772848194", "explicit.stat_2434030180"),
-    ("explicit.stat_3772848194", "explicit.stat_1653848515"),
-    ("explicit.stat_3772848194", "explicit.stat_2731416566"),
-    ("explicit.stat_3772848194", "explicit.stat_3234824465"),
-    ("explicit.stat_3772848194", "explicit.stat_3627458291"),
-    ("explicit.stat_3772848194", "explicit.stat_2091518682"),
-    ("explicit.stat_3772848194", "explicit.stat_214835567"),
-    ("explicit.stat_3772848194", "explicit.stat_362838683"),
-    ("explicit.stat_3772848194", "explicit.stat_2457540491"),
-    ("explicit.stat_3772848194", "explicit.stat_65331133"),
-    ("explicit.stat_3772848194", "explicit.stat_3337107517"),
-    ("explicit.stat_3772848194", "explicit.stat_3332055899"),
-    ("explicit.stat_3772848194", "explicit.stat_2548097895"),
-    ("explicit.stat_3772848194", "explicit.stat_1016185292"),
-    ("explicit.stat_3772848194", "explicit.stat_3624529132"),
-    ("explicit.stat_3772848194", "explicit.stat_380220671"),
-    ("explicit.stat_3772848194", "explicit.stat_2189467271"),
-    ("explicit.stat_3772848194", "explicit.stat_3953667743"),
-    ("explicit.stat_3772848194", "explicit.stat_1723738042"),
-    ("explicit.stat_3772848194", "explicit.stat_556659145"),
-    ("explicit.stat_3772848194", "explicit.stat_2690790844"),
-    ("explicit.stat_3772848194", "explicit.stat_80470845"),
-    ("explicit.stat_3772848194", "explicit.stat_2444534954"),
-    ("explicit.stat_3772848194", "explicit.stat_1699077932"),
-    ("explicit.stat_3772848194", "explicit.stat_2383304564"),
-    ("explicit.stat_3772848194", "explicit.stat_121436064"),
-    ("explicit.stat_3772848194", "explicit.stat_2312747856"),
-    ("explicit.stat_3772848194", "explicit.stat_3656959867"),
-    ("explicit.stat_3772848194", "explicit.stat_281949611"),
-    ("explicit.stat_969576725", "explicit.stat_4071658793"),
-    ("explicit.stat_969576725", "explicit.stat_3329402420"),
-    ("explicit.stat_969576725", "explicit.stat_4259701244"),
-    ("explicit.stat_969576725", "explicit.stat_3765507527"),
-    ("explicit.stat_969576725", "explicit.stat_1313498929"),
-    ("explicit.stat_969576725", "explicit.stat_991194404"),
-    ("explicit.stat_969576725", "explicit.stat_1424006185"),
-    ("explicit.stat_969576725", "explicit.stat_1346311588"),
-    ("explicit.stat_969576725", "explicit.stat_207635700"),
-    ("explicit.stat_969576725", "explicit.stat_1853636813"),
-    ("explicit.stat_969576725", "explicit.stat_2831391506"),
-    ("explicit.stat_969576725", "explicit.stat_1138813382"),
-    ("explicit.stat_969576725", "explicit.stat_2736708072"),
-    ("explicit.stat_969576725", "explicit.stat_3308185931"),
-    ("explicit.stat_969576725", "explicit.stat_4104891138"),
-    ("explicit.stat_969576725", "explicit.stat_34059570"),
-    ("explicit.stat_969576725", "explicit.stat_3643449791"),
-    ("explicit.stat_969576725", "explicit.stat_3468843137"),
-    ("explicit.stat_969576725", "explicit.stat_3207781478"),
-    ("explicit.stat_969576725", "explicit.stat_2806391472"),
-    ("explicit.stat_969576725", "explicit.stat_2567659895"),
-    ("explicit.stat_969576725", "explicit.stat_4012281889"),
-    ("explicit.stat_969576725", "explicit.stat_1173690938"),
-    ("explicit.stat_969576725", "explicit.stat_2365917222"),
-    ("explicit.stat_969576725", "explicit.stat_3223142064"),
-    ("explicit.stat_969576725", "explicit.stat_1567542124"),
-    ("explicit.stat_969576725", "explicit.stat_2647344903"),
-    ("explicit.stat_969576725", "explicit.stat_1165583295"),
-    ("explicit.stat_969576725", "explicit.stat_371612541"),
-    ("explicit.stat_969576725", "explicit.stat_2720072724"),
-    ("explicit.stat_969576725", "explicit.stat_1919069577"),
-    ("explicit.stat_969576725", "explicit.stat_3772841281"),
-    ("explicit.stat_969576725", "explicit.stat_4245204226"),
-    ("explicit.stat_969576725", "explicit.stat_2163419452"),
-    ("explicit.stat_969576725", "explicit.stat_3111519953"),
-    ("explicit.stat_969576725", "explicit.stat_2434030180"),
-    ("explicit.stat_969576725", "explicit.stat_1653848515"),
-    ("explicit.stat_969576725", "explicit.stat_2731416566"),
-    ("explicit.stat_969576725", "explicit.stat_3234824465"),
-    ("explicit.stat_969576725", "explicit.stat_3627458291"),
-    ("explicit.stat_969576725", "explicit.stat_2091518682"),
-    ("explicit.stat_969576725", "explicit.stat_214835567"),
-    ("explicit.stat_969576725", "explicit.stat_362838683"),
-    ("explicit.stat_969576725", "explicit.stat_2457540491"),
-    ("explicit.stat_969576725", "explicit.stat_65331133"),
-    ("explicit.stat_969576725", "explicit.stat_3337107517"),
-    ("explicit.stat_969576725", "explicit.stat_3332055899"),
-    ("explicit.stat_969576725", "explicit.stat_2548097895"),
-    ("explicit.stat_969576725", "explicit.stat_1016185292"),
-    ("explicit.stat_969576725", "explicit.stat_3624529132"),
-    ("explicit.stat_969576725", "explicit.stat_380220671"),
-    ("explicit.stat_969576725", "explicit.stat_2189467271"),
-    ("explicit.stat_969576725", "explicit.stat_3953667743"),
-    ("explicit.stat_969576725", "explicit.stat_1723738042"),
-    ("explicit.stat_969576725", "explicit.stat_556659145"),
-    ("explicit.stat_969576725", "explicit.stat_2690790844"),
-    ("explicit.stat_969576725", "explicit.stat_80470845"),
-    ("explicit.stat_969576725", "explicit.stat_2444534954"),
-    ("explicit.stat_969576725", "explicit.stat_1699077932"),
-    ("explicit.stat_969576725", "explicit.stat_2383304564"),
-    ("explicit.stat_969576725", "explicit.stat_121436064"),
-    ("explicit.stat_969576725", "explicit.stat_2312747856"),
-    ("explicit.stat_969576725", "explicit.stat_3656959867"),
-    ("explicit.stat_969576725", "explicit.stat_281949611"),
-    ("explicit.stat_4071658793", "explicit.stat_3329402420"),
-    ("explicit.stat_4071658793", "explicit.stat_4259701244"),
-    ("explicit.stat_4071658793", "explicit.stat_3765507527"),
-    ("explicit.stat_4071658793", "explicit.stat_1313498929"),
-    ("explicit.stat_4071658793", "explicit.stat_991194404"),
-    ("explicit.stat_4071658793", "explicit.stat_1424006185"),
-    ("explicit.stat_4071658793", "explicit.stat_1346311588"),
-    ("explicit.stat_4071658793", "explicit.stat_207635700"),
-    ("explicit.stat_4071658793", "explicit.stat_1853636813"),
-    ("explicit.stat_4071658793", "explicit.stat_2831391506"),
-    ("explicit.stat_4071658793", "explicit.stat_1138813382"),
-    ("explicit.stat_4071658793", "explicit.stat_2736708072"),
-    ("explicit.stat_4071658793", "explicit.stat_3308185931"),
-    ("explicit.stat_4071658793", "explicit.stat_4104891138"),
-    ("explicit.stat_4071658793", "explicit.stat_34059570"),
-    ("explicit.stat_4071658793", "explicit.stat_3643449791"),
-    ("explicit.stat_4071658793", "explicit.stat_3468843137"),
-    ("explicit.stat_4071658793", "explicit.stat_3207781478"),
-    ("explicit.stat_4071658793", "explicit.stat_2806391472"),
-    ("explicit.stat_4071658793", "explicit.stat_2567659895"),
-    ("explicit.stat_4071658793", "explicit.stat_4012281889"),
-    ("explicit.stat_4071658793", "explicit.stat_1173690938"),
-    ("explicit.stat_4071658793", "explicit.stat_2365917222"),
-    ("explicit.stat_4071658793", "explicit.stat_3223142064"),
-    ("explicit.stat_4071658793", "explicit.stat_1567542124"),
-    ("explicit.stat_4071658793", "explicit.stat_2647344903"),
-    ("explicit.stat_4071658793", "explicit.stat_1165583295"),
-    ("explicit.stat_4071658793", "explicit.stat_371612541"),
-    ("explicit.stat_4071658793", "explicit.stat_2720072724"),
-    ("explicit.stat_4071658793", "explicit.stat_1919069577"),
-    ("explicit.stat_4071658793", "explicit.stat_3772841281"),
-    ("explicit.stat_4071658793", "explicit.stat_4245204226"),
-    ("explicit.stat_4071658793", "explicit.stat_2163419452"),
-    ("explicit.stat_4071658793", "explicit.stat_3111519953"),
-    ("explicit.stat_4071658793", "explicit.stat_2434030180"),
-    ("explicit.stat_4071658793", "explicit.stat_1653848515"),
-    ("explicit.stat_4071658793", "explicit.stat_2731416566"),
-    ("explicit.stat_4071658793", "explicit.stat_3234824465"),
-    ("explicit.stat_4071658793", "explicit.stat_3627458291"),
-    ("explicit.stat_4071658793", "explicit.stat_2091518682"),
-    ("explicit.stat_4071658793", "explicit.stat_214835567"),
-    ("explicit.stat_4071658793", "explicit.stat_362838683"),
-    ("explicit.stat_4071658793", "explicit.stat_2457540491"),
-    ("explicit.stat_4071658793", "explicit.stat_65331133"),
-    ("explicit.stat_4071658793", "explicit.stat_3337107517"),
-    ("explicit.stat_4071658793", "explicit.stat_3332055899"),
-    ("explicit.stat_4071658793", "explicit.stat_2548097895"),
-    ("explicit.stat_4071658793", "explicit.stat_1016185292"),
-    ("explicit.stat_4071658793", "explicit.stat_3624529132"),
-    ("explicit.stat_4071658793", "explicit.stat_380220671"),
-    ("explicit.stat_4071658793", "explicit.stat_2189467271"),
-    ("explicit.stat_4071658793", "explicit.stat_3953667743"),
-    ("explicit.stat_4071658793", "explicit.stat_1723738042"),
-    ("explicit.stat_4071658793", "explicit.stat_556659145"),
-    ("explicit.stat_4071658793", "explicit.stat_2690790844"),
-    ("explicit.stat_4071658793", "explicit.stat_80470845"),
-    ("explicit.stat_4071658793", "explicit.stat_2444534954"),
-    ("explicit.stat_4071658793", "explicit.stat_1699077932"),
-    ("explicit.stat_4071658793", "explicit.stat_2383304564"),
-    ("explicit.stat_4071658793", "explicit.stat_121436064"),
-    ("explicit.stat_4071658793", "explicit.stat_2312747856"),
-    ("explicit.stat_4071658793", "explicit.stat_3656959867"),
-    ("explicit.stat_4071658793", "explicit.stat_281949611"),
-    ("explicit.stat_3329402420", "explicit.stat_4259701244"),
-    ("explicit.stat_3329402420", "explicit.stat_3765507527"),
-    ("explicit.stat_3329402420", "explicit.stat_1313498929"),
-    ("explicit.stat_3329402420", "explicit.stat_991194404"),
-    ("explicit.stat_3329402420", "explicit.stat_1424006185"),
-    ("explicit.stat_3329402420", "explicit.stat_1346311588"),
-    ("explicit.stat_3329402420", "explicit.stat_207635700"),
-    ("explicit.stat_3329402420", "explicit.stat_1853636813"),
-    ("explicit.stat_3329402420", "explicit.stat_2831391506"),
-    ("explicit.stat_3329402420", "explicit.stat_1138813382"),
-    ("explicit.stat_3329402420", "explicit.stat_2736708072"),
-    ("explicit.stat_3329402420", "explicit.stat_3308185931"),
-    ("explicit.stat_3329402420", "explicit.stat_4104891138"),
-    ("explicit.stat_3329402420", "explicit.stat_34059570"),
-    ("explicit.stat_3329402420", "explicit.stat_3643449791"),
-    ("explicit.stat_3329402420", "explicit.stat_3468843137"),
-    ("explicit.stat_3329402420", "explicit.stat_3207781478"),
-    ("explicit.stat_3329402420", "explicit.stat_2806391472"),
-    ("explicit.stat_3329402420", "explicit.stat_2567659895"),
-    ("explicit.stat_3329402420", "explicit.stat_4012281889"),
-    ("explicit.stat_3329402420", "explicit.stat_1173690938"),
-    ("explicit.stat_3329402420", "explicit.stat_2365917222"),
-    ("explicit.stat_3329402420", "explicit.stat_3223142064"),
-    ("explicit.stat_3329402420", "explicit.stat_1567542124"),
-    ("explicit.stat_3329402420", "explicit.stat_2647344903"),
-    ("explicit.stat_3329402420", "explicit.stat_1165583295"),
-    ("explicit.stat_3329402420", "explicit.stat_371612541"),
-    ("explicit.stat_3329402420", "explicit.stat_2720072724"),
-    ("explicit.stat_3329402420", "explicit.stat_1919069577"),
-    ("explicit.stat_3329402420", "explicit.stat_3772841281"),
-    ("explicit.stat_3329402420", "explicit.stat_4245204226"),
-    ("explicit.stat_3329402420", "explicit.stat_2163419452"),
-    ("explicit.stat_3329402420", "explicit.stat_3111519953"),
-    ("explicit.stat_3329402420", "explicit.stat_2434030180"),
-    ("explicit.stat_3329402420", "explicit.stat_1653848515"),
-    ("explicit.stat_3329402420", "explicit.stat_2731416566"),
-    ("explicit.stat_3329402420", "explicit.stat_3234824465"),
-    ("explicit.stat_3329402420", "explicit.stat_3627458291"),
-    ("explicit.stat_3329402420", "explicit.stat_2091518682"),
-    ("explicit.stat_3329402420", "explicit.stat_214835567"),
-    ("explicit.stat_3329402420", "explicit.stat_362838683"),
-    ("explicit.stat_3329402420", "explicit.stat_2457540491"),
-    ("explicit.stat_3329402420", "explicit.stat_65331133"),
-    ("explicit.stat_3329402420", "explicit.stat_3337107517"),
-    ("explicit.stat_3329402420", "explicit.stat_3332055899"),
-    ("explicit.stat_3329402420", "explicit.stat_2548097895"),
-    ("explicit.stat_3329402420", "explicit.stat_1016185292"),
-    ("explicit.stat_3329402420", "explicit.stat_3624529132"),
-    ("explicit.stat_3329402420", "explicit.stat_380220671"),
-    ("explicit.stat_3329402420", "explicit.stat_2189467271"),
-    ("explicit.stat_3329402420", "explicit.stat_3953667743"),
-    ("explicit.stat_3329402420", "explicit.stat_1723738042"),
-    ("explicit.stat_3329402420", "explicit.stat_556659145"),
-    ("explicit.stat_3329402420", "explicit.stat_2690790844"),
-    ("explicit.stat_3329402420", "explicit.stat_80470845"),
-    ("explicit.stat_3329402420", "explicit.stat_2444534954"),
-    ("explicit.stat_3329402420", "explicit.stat_1699077932"),
-    ("explicit.stat_3329402420", "explicit.stat_2383304564"),
-    ("explicit.stat_3329402420", "explicit.stat_121436064"),
-    ("explicit.stat_3329402420", "explicit.stat_2312747856"),
-    ("explicit.stat_3329402420", "explicit.stat_3656959867"),
-    ("explicit.stat_3329402420", "explicit.stat_281949611"),
-    ("explicit.stat_4259701244", "explicit.stat_3765507527"),
-    ("explicit.stat_4259701244", "explicit.stat_1313498929"),
-    ("explicit.stat_4259701244", "explicit.stat_991194404"),
-    ("explicit.stat_4259701244", "explicit.stat_1424006185"),
-    ("explicit.stat_4259701244", "explicit.stat_1346311588"),
-    ("explicit.stat_4259701244", "explicit.stat_207635700"),
-    ("explicit.stat_4259701244", "explicit.stat_1853636813"),
-    ("explicit.stat_4259701244", "explicit.stat_2831391506"),
-    ("explicit.stat_4259701244", "explicit.stat_1138813382"),
-    ("explicit.stat_4259701244", "explicit.stat_2736708072"),
-    ("explicit.stat_4259701244", "explicit.stat_3308185931"),
-    ("explicit.stat_4259701244", "explicit.stat_4104891138"),
-    ("explicit.stat_4259701244", "explicit.stat_34059570"),
-    ("explicit.stat_4259701244", "explicit.stat_3643449791"),
-    ("explicit.stat_4259701244", "explicit.stat_3468843137"),
-    ("explicit.stat_4259701244", "explicit.stat_3207781478"),
-    ("explicit.stat_4259701244", "explicit.stat_2806391472"),
-    ("explicit.stat_4259701244", "explicit.stat_2567659895"),
-    ("explicit.stat_4259701244", "explicit.stat_4012281889"),
-    ("explicit.stat_4259701244", "explicit.stat_1173690938"),
-    ("explicit.stat_4259701244", "explicit.stat_2365917222"),
-    ("explicit.stat_4259701244", "explicit.stat_3223142064"),
-    ("explicit.stat_4259701244", "explicit.stat_1567542124"),
-    ("explicit.stat_4259701244", "explicit.stat_2647344903"),
-    ("explicit.stat_4259701244", "explicit.stat_1165583295"),
-    ("explicit.stat_4259701244", "explicit.stat_371612541"),
-    ("explicit.stat_4259701244", "explicit.stat_2720072724"),
-    ("explicit.stat_4259701244", "explicit.stat_1919069577"),
-    ("explicit.stat_4259701244", "explicit.stat_3772841281"),
-    ("explicit.stat_4259701244", "explicit.stat_4245204226"),
-    ("explicit.stat_4259701244", "explicit.stat_2163419452"),
-    ("explicit.stat_4259701244", "explicit.stat_3111519953"),
-    ("explicit.stat_4259701244", "explicit.stat_2434030180"),
-    ("explicit.stat_4259701244", "explicit.stat_1653848515"),
-    ("explicit.stat_4259701244", "explicit.stat_2731416566"),
-    ("explicit.stat_4259701244", "explicit.stat_3234824465"),
-    ("explicit.stat_4259701244", "explicit.stat_3627458291"),
-    ("explicit.stat_4259701244", "explicit.stat_2091518682"),
-    ("explicit.stat_4259701244", "explicit.stat_214835567"),
-    ("explicit.stat_4259701244", "explicit.stat_362838683"),
-    ("explicit.stat_4259701244", "explicit.stat_2457540491"),
-    ("explicit.stat_4259701244", "explicit.stat_65331133"),
-    ("explicit.stat_4259701244", "explicit.stat_3337107517"),
-    ("explicit.stat_4259701244", "explicit.stat_3332055899"),
-    ("explicit.stat_4259701244", "explicit.stat_2548097895"),
-    ("explicit.stat_4259701244", "explicit.stat_1016185292"),
-    ("explicit.stat_4259701244", "explicit.stat_3624529132"),
-    ("explicit.stat_4259701244", "explicit.stat_380220671"),
-    ("explicit.stat_4259701244", "explicit.stat_2189467271"),
-    ("explicit.stat_4259701244", "explicit.stat_3953667743"),
-    ("explicit.stat_4259701244", "explicit.stat_1723738042"),
-    ("explicit.stat_4259701244", "explicit.stat_556659145"),
-    ("explicit.stat_4259701244", "explicit.stat_2690790844"),
-    ("explicit.stat_4259701244", "explicit.stat_80470845"),
-    ("explicit.stat_4259701244", "explicit.stat_2444534954"),
-    ("explicit.stat_4259701244", "explicit.stat_1699077932"),
-    ("explicit.stat_4259701244", "explicit.stat_2383304564"),
-    ("explicit.stat_4259701244", "explicit.stat_121436064"),
-    ("explicit.stat_4259701244", "explicit.stat_2312747856"),
-    ("explicit.stat_4259701244", "explicit.stat_3656959867"),
-    ("explicit.stat_4259701244", "explicit.stat_281949611"),
-    ("explicit.stat_3765507527", "explicit.stat_1313498929"),
-    ("explicit.stat_3765507527", "explicit.stat_991194404"),
-    ("explicit.stat_3765507527", "explicit.stat_1424006185"),
-    ("explicit.stat_3765507527", "explicit.stat_1346311588"),
-    ("explicit.stat_3765507527", "explicit.stat_207635700"),
-    ("explicit.stat_3765507527", "explicit.stat_1853636813"),
-    ("explicit.stat_3765507527", "explicit.stat_2831391506"),
-    ("explicit.stat_3765507527", "explicit.stat_1138813382"),
-    ("explicit.stat_3765507527", "explicit.stat_2736708072"),
-    ("explicit.stat_3765507527", "explicit.stat_3308185931"),
-    ("explicit.stat_3765507527", "explicit.stat_4104891138"),
-    ("explicit.stat_3765507527", "explicit.stat_34059570"),
-    ("explicit.stat_3765507527", "explicit.stat_3643449791"),
-    ("explicit.stat_3765507527", "explicit.stat_3468843137"),
-    ("explicit.stat_3765507527", "explicit.stat_3207781478"),
-    ("explicit.stat_3765507527", "explicit.stat_2806391472"),
-    ("explicit.stat_3765507527", "explicit.stat_2567659895"),
-    ("explicit.stat_3765507527", "explicit.stat_4012281889"),
-    ("explicit.stat_3765507527", "explicit.stat_1173690938"),
-    ("explicit.stat_3765507527", "explicit.stat_2365917222"),
-    ("explicit.stat_3765507527", "explicit.stat_3223142064"),
-    ("explicit.stat_3765507527", "explicit.stat_1567542124"),
-    ("explicit.stat_3765507527", "explicit.stat_2647344903"),
-    ("explicit.stat_3765507527", "explicit.stat_1165583295"),
-    ("explicit.stat_3765507527", "explicit.stat_371612541"),
-    ("explicit.stat_3765507527", "explicit.stat_2720072724"),
-    ("explicit.stat_3765507527", "explicit.stat_1919069577"),
-    ("explicit.stat_3765507527", "explicit.stat_3772841281"),
-    ("explicit.stat_3765507527", "explicit.stat_4245204226"),
-    ("explicit.stat_3765507527", "explicit.stat_2163419452"),
-    ("explicit.stat_3765507527", "explicit.stat_3111519953"),
-    ("explicit.stat_3765507527", "explicit.stat_2434030180"),
-    ("explicit.stat_3765507527", "explicit.stat_1653848515"),
-    ("explicit.stat_3765507527", "explicit.stat_2731416566"),
-    ("explicit.stat_3765507527", "explicit.stat_3234824465"),
-    ("explicit.stat_3765507527", "explicit.stat_3627458291"),
-    ("explicit.stat_3765507527", "explicit.stat_2091518682"),
-    ("explicit.stat_3765507527", "explicit.stat_214835567"),
-    ("explicit.stat_3765507527", "explicit.stat_362838683"),
-    ("explicit.stat_3765507527", "explicit.stat_2457540491"),
-    ("explicit.stat_3765507527", "explicit.stat_65331133"),
-    ("explicit.stat_3765507527", "explicit.stat_3337107517"),
-    ("explicit.stat_3765507527", "explicit.stat_3332055899"),
-    ("explicit.stat_3765507527", "explicit.stat_2548097895"),
-    ("explicit.stat_3765507527", "explicit.stat_1016185292"),
-    ("explicit.stat_3765507527", "explicit.stat_3624529132"),
-    ("explicit.stat_3765507527", "explicit.stat_380220671"),
-    ("explicit.stat_3765507527", "explicit.stat_2189467271"),
-    ("explicit.stat_3765507527", "explicit.stat_3953667743"),
-    ("explicit.stat_3765507527", "explicit.stat_1723738042"),
-    ("explicit.stat_3765507527", "explicit.stat_556659145"),
-    ("explicit.stat_3765507527", "explicit.stat_2690790844"),
-    ("explicit.stat_3765507527", "explicit.stat_80470845"),
-    ("explicit.stat_3765507527", "explicit.stat_2444534954"),
-    ("explicit.stat_3765507527", "explicit.stat_1699077932"),
-    ("explicit.stat_3765507527", "explicit.stat_2383304564"),
-    ("explicit.stat_3765507527", "explicit.stat_121436064"),
-    ("explicit.stat_3765507527", "explicit.stat_2312747856"),
-    ("explicit.stat_3765507527", "explicit.stat_3656959867"),
-    ("explicit.stat_3765507527", "explicit.stat_281949611"),
-    ("explicit.stat_1313498929", "explicit.stat_991194404"),
-    ("explicit.stat_1313498929", "explicit.stat_1424006185"),
-    ("explicit.stat_1313498929", "explicit.stat_1346311588"),
-    ("explicit.stat_1313498929", "explicit.stat_207635700"),
-    ("explicit.stat_1313498929", "explicit.stat_1853636813"),
-    ("explicit.stat_1313498929", "explicit.stat_2831391506"),
-    ("explicit.stat_1313498929", "explicit.stat_1138813382"),
-    ("explicit.stat_1313498929", "explicit.stat_2736708072"),
-    ("explicit.stat_1313498929", "explicit.stat_3308185931"),
-    ("explicit.stat_1313498929", "explicit.stat_4104891138"),
-    ("explicit.stat_1313498929", "explicit.stat_34059570"),
-    ("explicit.stat_1313498929", "explicit.stat_3643449791"),
-    ("explicit.stat_1313498929", "explicit.stat_3468843137"),
-    ("explicit.stat_1313498929", "explicit.stat_3207781478"),
-    ("explicit.stat_1313498929", "explicit.stat_2806391472"),
-    ("explicit.stat_1313498929", "explicit.stat_2567659895"),
-    ("explicit.stat_1313498929", "explicit.stat_4012281889"),
-    ("explicit.stat_1313498929", "explicit.stat_1173690938"),
-    ("explicit.stat_1313498929", "explicit.stat_2365917222"),
-    ("explicit.stat_1313498929", "explicit.stat_3223142064"),
-    ("explicit.stat_1313498929", "explicit.stat_1567542124"),
-    ("explicit.stat_1313498929", "explicit.stat_2647344903"),
-    ("explicit.stat_1313498929", "explicit.stat_1165583295"),
-    ("explicit.stat_1313498929", "explicit.stat_371612541"),
-    ("explicit.stat_1313498929", "explicit.stat_2720072724"),
-    ("explicit.stat_1313498929", "explicit.stat_1919069577"),
-    ("explicit.stat_1313498929", "explicit.stat_3772841281"),
-    ("explicit.stat_1313498929", "explicit.stat_4245204226"),
-    ("explicit.stat_1313498929", "explicit.stat_2163419452"),
-    ("explicit.stat_1313498929", "explicit.stat_3111519953"),
-    ("explicit.stat_1313498929", "explicit.stat_2434030180"),
-    ("explicit.stat_1313498929", "explicit.stat_1653848515"),
-    ("explicit.stat_1313498929", "explicit.stat_2731416566"),
-    ("explicit.stat_1313498929", "explicit.stat_3234824465"),
-    ("explicit.stat_1313498929", "explicit.stat_3627458291"),
-    ("explicit.stat_1313498929", "explicit.stat_2091518682"),
-    ("explicit.stat_1313498929", "explicit.stat_214835567"),
-    ("explicit.stat_1313498929", "explicit.stat_362838683"),
-    ("explicit.stat_1313498929", "explicit.stat_2457540491"),
-    ("explicit.stat_1313498929", "explicit.stat_65331133"),
-    ("explicit.stat_1313498929", "explicit.stat_3337107517"),
-    ("explicit.stat_1313498929", "explicit.stat_3332055899"),
-    ("explicit.stat_1313498929", "explicit.stat_2548097895"),
-    ("explicit.stat_1313498929", "explicit.stat_1016185292"),
-    ("explicit.stat_1313498929", "explicit.stat_3624529132"),
-    ("explicit.stat_1313498929", "explicit.stat_380220671"),
-    ("explicit.stat_1313498929", "explicit.stat_2189467271"),
-    ("explicit.stat_1313498929", "explicit.stat_3953667743"),
-    ("explicit.stat_1313498929", "explicit.stat_1723738042"),
-    ("explicit.stat_1313498929", "explicit.stat_556659145"),
-    ("explicit.stat_1313498929", "explicit.stat_2690790844"),
-    ("explicit.stat_1313498929", "explicit.stat_80470845"),
-    ("explicit.stat_1313498929", "explicit.stat_2444534954"),
-    ("explicit.stat_1313498929", "explicit.stat_1699077932"),
-    ("explicit.stat_1313498929", "explicit.stat_2383304564"),
-    ("explicit.stat_1313498929", "explicit.stat_121436064"),
-    ("explicit.stat_1313498929", "explicit.stat_2312747856"),
-    ("explicit.stat_1313498929", "explicit.stat_3656959867"),
-    ("explicit.stat_1313498929", "explicit.stat_281949611"),
-    ("explicit.stat_991194404", "explicit.stat_1424006185"),
-    ("explicit.stat_991194404", "explicit.stat_1346311588"),
-    ("explicit.stat_991194404", "explicit.stat_207635700"),
-    ("explicit.stat_991194404", "explicit.stat_1853636813"),
-    ("explicit.stat_991194404", "explicit.stat_2831391506"),
-    ("explicit.stat_991194404", "explicit.stat_1138813382"),
-    ("explicit.stat_991194404", "explicit.stat_2736708072"),
-    ("explicit.stat_991194404", "explicit.stat_3308185931"),
-    ("explicit.stat_991194404", "explicit.stat_4104891138"),
-    ("explicit.stat_991194404", "explicit.stat_34059570"),
-    ("explicit.stat_991194404", "explicit.stat_3643449791"),
-    ("explicit.stat_991194404", "explicit.stat_3468843137"),
-    ("explicit.stat_991194404", "explicit.stat_3207781478"),
-    ("explicit.stat_991194404", "explicit.stat_2806391472"),
-    ("explicit.stat_991194404", "explicit.stat_2567659895"),
-    ("explicit.stat_991194404", "explicit.stat_4012281889"),
-    ("explicit.stat_991194404", "explicit.stat_1173690938"),
-    ("explicit.stat_991194404", "explicit.stat_2365917222"),
-    ("explicit.stat_991194404", "explicit.stat_3223142064"),
-    ("explicit.stat_991194404", "explicit.stat_1567542124"),
-    ("explicit.stat_991194404", "explicit.stat_2647344903"),
-    ("explicit.stat_991194404", "explicit.stat_1165583295"),
-    ("explicit.stat_991194404", "explicit.stat_371612541"),
-    ("explicit.stat_991194404", "explicit.stat_2720072724"),
-    ("explicit.stat_991194404", "explicit.stat_1919069577"),
-    ("explicit.stat_991194404", "explicit.stat_3772841281"),
-    ("explicit.stat_991194404", "explicit.stat_4245204226"),
-    ("explicit.stat_991194404", "explicit.stat_2163419452"),
-    ("explicit.stat_991194404", "explicit.stat_3111519953"),
-    ("explicit.stat_991194404", "explicit.stat_2434030180"),
-    ("explicit.stat_991194404", "explicit.stat_1653848515"),
-    ("explicit.stat_991194404", "explicit.stat_2731416566"),
-    ("explicit.stat_991194404", "explicit.stat_3234824465"),
-    ("explicit.stat_991194404", "explicit.stat_3627458291"),
-    ("explicit.stat_991194404", "explicit.stat_2091518682"),
-    ("explicit.stat_991194404", "explicit.stat_214835567"),
-    ("explicit.stat_991194404", "explicit.stat_362838683"),
-    ("explicit.stat_991194404", "explicit.stat_2457540491"),
-    ("explicit.stat_991194404", "explicit.stat_65331133"),
-    ("explicit.stat_991194404", "explicit.stat_3337107517"),
-    ("explicit.stat_991194404", "explicit.stat_3332055899"),
-    ("explicit.stat_991194404", "explicit.stat_2548097895"),
-    ("explicit.stat_991194404", "explicit.stat_1016185292"),
-    ("explicit.stat_991194404", "explicit.stat_3624529132"),
-    ("explicit.stat_991194404", "explicit.stat_380220671"),
-    ("explicit.stat_991194404", "explicit.stat_2189467271"),
-    ("explicit.stat_991194404", "explicit.stat_3953667743"),
-    ("explicit.stat_991194404", "explicit.stat_1723738042"),
-    ("explicit.stat_991194404", "explicit.stat_556659145"),
-    ("explicit.stat_991194404", "explicit.stat_2690790844"),
-    ("explicit.stat_991194404", "explicit.stat_80470845"),
-    ("explicit.stat_991194404", "explicit.stat_2444534954"),
-    ("explicit.stat_991194404", "explicit.stat_1699077932"),
-    ("explicit.stat_991194404", "explicit.stat_2383304564"),
-    ("explicit.stat_991194404", "explicit.stat_121436064"),
-    ("explicit.stat_991194404", "explicit.stat_2312747856"),
-    ("explicit.stat_991194404", "explicit.stat_3656959867"),
-    ("explicit.stat_991194404", "explicit.stat_281949611"),
-    ("explicit.stat_1424006185", "explicit.stat_1346311588"),
-    ("explicit.stat_1424006185", "explicit.stat_207635700"),
-    ("explicit.stat_1424006185", "explicit.stat_1853636813"),
-    ("explicit.stat_1424006185", "explicit.stat_2831391506"),
-    ("explicit.stat_1424006185", "explicit.stat_1138813382"),
-    ("explicit.stat_1424006185", "explicit.stat_2736708072"),
-    ("explicit.stat_1424006185", "explicit.stat_3308185931"),
-    ("explicit.stat_1424006185", "explicit.stat_4104891138"),
-    ("explicit.stat_1424006185", "explicit.stat_34059570"),
-    ("explicit.stat_1424006185", "explicit.stat_3643449791"),
-    ("explicit.stat_1424006185", "explicit.stat_3468843137"),
-    ("explicit.stat_1424006185", "explicit.stat_3207781478"),
-    ("explicit.stat_1424006185", "explicit.stat_2806391472"),
-    ("explicit.stat_1424006185", "explicit.stat_2567659895"),
-    ("explicit.stat_1424006185", "explicit.stat_4012281889"),
-    ("explicit.stat_1424006185", "explicit.stat_1173690938"),
-    ("explicit.stat_1424006185", "explicit.stat_2365917222"),
-    ("explicit.stat_1424006185", "explicit.stat_3223142064"),
-    ("explicit.stat_1424006185", "explicit.stat_1567542124"),
-    ("explicit.stat_1424006185", "explicit.stat_2647344903"),
-    ("explicit.stat_1424006185", "explicit.stat_1165583295"),
-    ("explicit.stat_1424006185", "explicit.stat_371612541"),
-    ("explicit.stat_1424006185", "explicit.stat_2720072724"),
-    ("explicit.stat_1424006185", "explicit.stat_1919069577"),
-    ("explicit.stat_1424006185", "explicit.stat_3772841281"),
-    ("explicit.stat_1424006185", "explicit.stat_4245204226"),
-    ("explicit.stat_1424006185", "explicit.stat_2163419452"),
-    ("explicit.stat_1424006185", "explicit.stat_3111519953"),
-    ("explicit.stat_1424006185", "explicit.stat_2434030180"),
-    ("explicit.stat_1424006185", "explicit.stat_1653848515"),
-    ("explicit.stat_1424006185", "explicit.stat_2731416566"),
-    ("explicit.stat_1424006185", "explicit.stat_3234824465"),
-    ("explicit.stat_1424006185", "explicit.stat_3627458291"),
-    ("explicit.stat_1424006185", "explicit.stat_2091518682"),
-    ("explicit.stat_1424006185", "explicit.stat_214835567"),
-    ("explicit.stat_1424006185", "explicit.stat_362838683"),
-    ("explicit.stat_1424006185", "explicit.stat_2457540491"),
-    ("explicit.stat_1424006185", "explicit.stat_65331133"),
-    ("explicit.stat_1424006185", "explicit.stat_3337107517"),
-    ("explicit.stat_1424006185", "explicit.stat_3332055899"),
-    ("explicit.stat_1424006185", "explicit.stat_2548097895"),
-    ("explicit.stat_1424006185", "explicit.stat_1016185292"),
-    ("explicit.stat_1424006185", "explicit.stat_3624529132"),
-    ("explicit.stat_1424006185", "explicit.stat_380220671"),
-    ("explicit.stat_1424006185", "explicit.stat_2189467271"),
-    ("explicit.stat_1424006185", "explicit.stat_3953667743"),
-    ("explicit.stat_1424006185", "explicit.stat_1723738042"),
-    ("explicit.stat_1424006185", "explicit.stat_556659145"),
-    ("explicit.stat_1424006185", "explicit.stat_2690790844"),
-    ("explicit.stat_1424006185", "explicit.stat_80470845"),
-    ("explicit.stat_1424006185", "explicit.stat_2444534954"),
-    ("explicit.stat_1424006185", "explicit.stat_1699077932"),
-    ("explicit.stat_1424006185", "explicit.stat_2383304564"),
-    ("explicit.stat_1424006185", "explicit.stat_121436064"),
-    ("explicit.stat_1424006185", "explicit.stat_2312747856"),
-    ("explicit.stat_1424006185", "explicit.stat_3656959867"),
-    ("explicit.stat_1424006185", "explicit.stat_281949611"),
-    ("explicit.stat_1346311588", "explicit.stat_207635700"),
-    ("explicit.stat_1346311588", "explicit.stat_1853636813"),
-    ("explicit.stat_1346311588", "explicit.stat_2831391506"),
-    ("explicit.stat_1346311588", "explicit.stat_1138813382"),
-    ("explicit.stat_1346311588", "explicit.stat_2736708072"),
-    ("explicit.stat_1346311588", "explicit.stat_3308185931"),
-    ("explicit.stat_1346311588", "explicit.stat_4104891138"),
-    ("explicit.stat_1346311588", "explicit.stat_34059570"),
-    ("explicit.stat_1346311588", "explicit.stat_3643449791"),
-    ("explicit.stat_1346311588", "explicit.stat_3468843137"),
-    ("explicit.stat_1346311588", "explicit.stat_3207781478"),
-    ("explicit.stat_1346311588", "explicit.stat_2806391472"),
-    ("explicit.stat_1346311588", "explicit.stat_2567659895"),
-    ("explicit.stat_1346311588", "explicit.stat_4012281889"),
-    ("explicit.stat_1346311588", "explicit.stat_1173690938"),
-    ("explicit.stat_1346311588", "explicit.stat_2365917222"),
-    ("explicit.stat_1346311588", "explicit.stat_3223142064"),
-    ("explicit.stat_1346311588", "explicit.stat_1567542124"),
-    ("explicit.stat_1346311588", "explicit.stat_2647344903"),
-    ("explicit.stat_1346311588", "explicit.stat_1165583295"),
-    ("explicit.stat_1346311588", "explicit.stat_371612541"),
-    ("explicit.stat_1346311588", "explicit.stat_2720072724"),
-    ("explicit.stat_1346311588", "explicit.stat_1919069577"),
-    ("explicit.stat_1346311588", "explicit.stat_3772841281"),
-    ("explicit.stat_1346311588", "explicit.stat_4245204226"),
-    ("explicit.stat_1346311588", "explicit.stat_2163419452"),
-    ("explicit.stat_1346311588", "explicit.stat_3111519953"),
-    ("explicit.stat_1346311588", "explicit.stat_2434030180"),
-    ("explicit.stat_1346311588", "explicit.stat_1653848515"),
-    ("explicit.stat_1346311588", "explicit.stat_2731416566"),
-    ("explicit.stat_1346311588", "explicit.stat_3234824465"),
-    ("explicit.stat_1346311588", "explicit.stat_3627458291"),
-    ("explicit.stat_1346311588", "explicit.stat_2091518682"),
-    ("explicit.stat_1346311588", "explicit.stat_214835567"),
-    ("explicit.stat_1346311588", "explicit.stat_362838683"),
-    ("explicit.stat_1346311588", "explicit.stat_2457540491"),
-    ("explicit.stat_1346311588", "explicit.stat_65331133"),
-    ("explicit.stat_1346311588", "explicit.stat_3337107517"),
-    ("explicit.stat_1346311588", "explicit.stat_3332055899"),
-    ("explicit.stat_1346311588", "explicit.stat_2548097895"),
-    ("explicit.stat_1346311588", "explicit.stat_1016185292"),
-    ("explicit.stat_1346311588", "explicit.stat_3624529132"),
-    ("explicit.stat_1346311588", "explicit.stat_380220671"),
-    ("explicit.stat_1346311588", "explicit.stat_2189467271"),
-    ("explicit.stat_1346311588", "explicit.stat_3953667743"),
-    ("explicit.stat_1346311588", "explicit.stat_1723738042"),
-    ("explicit.stat_1346311588", "explicit.stat_556659145"),
-    ("explicit.stat_1346311588", "explicit.stat_2690790844"),
-    ("explicit.stat_1346311588", "explicit.stat_80470845"),
-    ("explicit.stat_1346311588", "explicit.stat_2444534954"),
-    ("explicit.stat_1346311588", "explicit.stat_1699077932"),
-    ("explicit.stat_1346311588", "explicit.stat_2383304564"),
-    ("explicit.stat_1346311588", "explicit.stat_121436064"),
-    ("explicit.stat_1346311588", "explicit.stat_2312747856"),
-    ("explicit.stat_1346311588", "explicit.stat_3656959867"),
-    ("explicit.stat_1346311588", "explicit.stat_281949611"),
-    ("explicit.stat_207635700", "explicit.stat_1853636813"),
-    ("explicit.stat_207635700", "explicit.stat_2831391506"),
-    ("explicit.stat_207635700", "explicit.stat_1138813382"),
-    ("explicit.stat_207635700", "explicit.stat_2736708072"),
-    ("explicit.stat_207635700", "explicit.stat_3308185931"),
-    ("explicit.stat_207635700", "explicit.stat_4104891138"),
-    ("explicit.stat_207635700", "explicit.stat_34059570"),
-    ("explicit.stat_207635700", "explicit.stat_3643449791"),
-    ("explicit.stat_207635700", "explicit.stat_3468843137"),
-    ("explicit.stat_207635700", "explicit.stat_3207781478"),
-    ("explicit.stat_207635700", "explicit.stat_2806391472"),
-    ("explicit.stat_207635700", "explicit.stat_2567659895"),
-    ("explicit.stat_207635700", "explicit.stat_4012281889"),
-    ("explicit.stat_207635700", "explicit.stat_1173690938"),
-    ("explicit.stat_207635700", "explicit.stat_2365917222"),
-    ("explicit.stat_207635700", "explicit.stat_3223142064"),
-    ("explicit.stat_207635700", "explicit.stat_1567542124"),
-    ("explicit.stat_207635700", "explicit.stat_2647344903"),
-    ("explicit.stat_207635700", "explicit.stat_1165583295"),
-    ("explicit.stat_207635700", "explicit.stat_371612541"),
-    ("explicit.stat_207635700", "explicit.stat_2720072724"),
-    ("explicit.stat_207635700", "explicit.stat_1919069577"),
-    ("explicit.stat_207635700", "explicit.stat_3772841281"),
-    ("explicit.stat_207635700", "explicit.stat_4245204226"),
-    ("explicit.stat_207635700", "explicit.stat_2163419452"),
-    ("explicit.stat_207635700", "explicit.stat_3111519953"),
-    ("explicit.stat_207635700", "explicit.stat_2434030180"),
-    ("explicit.stat_207635700", "explicit.stat_1653848515"),
-    ("explicit.stat_207635700", "explicit.stat_2731416566"),
-    ("explicit.stat_207635700", "explicit.stat_3234824465"),
-    ("explicit.stat_207635700", "explicit.stat_3627458291"),
-    ("explicit.stat_207635700", "explicit.stat_2091518682"),
-    ("explicit.stat_207635700", "explicit.stat_214835567"),
-    ("explicit.stat_207635700", "explicit.stat_362838683"),
-    ("explicit.stat_207635700", "explicit.stat_2457540491"),
-    ("explicit.stat_207635700", "explicit.stat_65331133"),
-    ("explicit.stat_207635700", "explicit.stat_3337107517"),
-    ("explicit.stat_207635700", "explicit.stat_3332055899"),
-    ("explicit.stat_207635700", "explicit.stat_2548097895"),
-    ("explicit.stat_207635700", "explicit.stat_1016185292"),
-    ("explicit.stat_207635700", "explicit.stat_3624529132"),
-    ("explicit.stat_207635700", "explicit.stat_380220671"),
-    ("explicit.stat_207635700", "explicit.stat_2189467271"),
-    ("explicit.stat_207635700", "explicit.stat_3953667743"),
-    ("explicit.stat_207635700", "explicit.stat_1723738042"),
-    ("explicit.stat_207635700", "explicit.stat_556659145"),
-    ("explicit.stat_207635700", "explicit.stat_2690790844"),
-    ("explicit.stat_207635700", "explicit.stat_80470845"),
-    ("explicit.stat_207635700", "explicit.stat_2444534954"),
-    ("explicit.stat_207635700", "explicit.stat_1699077932"),
-    ("explicit.stat_207635700", "explicit.stat_2383304564"),
-    ("explicit.stat_207635700", "explicit.stat_121436064"),
-    ("explicit.stat_207635700", "explicit.stat_2312747856"),
-    ("explicit.stat_207635700", "explicit.stat_3656959867"),
-    ("explicit.stat_207635700", "explicit.stat_281949611"),
-    ("explicit.stat_1853636813", "explicit.stat_2831391506"),
-    ("explicit.stat_1853636813", "explicit.stat_1138813382"),
-    ("explicit.stat_1853636813", "explicit.stat_2736708072"),
-    ("explicit.stat_1853636813", "explicit.stat_3308185931"),
-    ("explicit.stat_1853636813", "explicit.stat_4104891138"),
-    ("explicit.stat_1853636813", "explicit.stat_34059570"),
-    ("explicit.stat_1853636813", "explicit.stat_3643449791"),
-    ("explicit.stat_1853636813", "explicit.stat_3468843137"),
-    ("explicit.stat_1853636813", "explicit.stat_3207781478"),
-    ("explicit.stat_1853636813", "explicit.stat_2806391472"),
-    ("explicit.stat_1853636813", "explicit.stat_2567659895"),
-    ("explicit.stat_1853636813", "explicit.stat_4012281889"),
-    ("explicit.stat_1853636813", "explicit.stat_1173690938"),
-    ("explicit.stat_1853636813", "explicit.stat_2365917222"),
-    ("explicit.stat_1853636813", "explicit.stat_3223142064"),
-    ("explicit.stat_1853636813", "explicit.stat_1567542124"),
-    ("explicit.stat_1853636813", "explicit.stat_2647344903"),
-    ("explicit.stat_1853636813", "explicit.stat_1165583295"),
-    ("explicit.stat_1853636813", "explicit.stat_371612541"),
-    ("explicit.stat_1853636813", "explicit.stat_2720072724"),
-    ("explicit.stat_1853636813", "explicit.stat_1919069577"),
-    ("explicit.stat_1853636813", "explicit.stat_3772841281"),
-    ("explicit.stat_1853636813", "explicit.stat_4245204226"),
-    ("explicit.stat_1853636813", "explicit.stat_2163419452"),
-    ("explicit.stat_1853636813", "explicit.stat_3111519953"),
-    ("explicit.stat_1853636813", "explicit.stat_2434030180"),
-    ("explicit.stat_1853636813", "explicit.stat_1653848515"),
-    ("explicit.stat_1853636813", "explicit.stat_2731416566"),
-    ("explicit.stat_1853636813", "explicit.stat_3234824465"),
-    ("explicit.stat_1853636813", "explicit.stat_3627458291"),
-    ("explicit.stat_1853636813", "explicit.stat_2091518682"),
-    ("explicit.stat_1853636813", "explicit.stat_214835567"),
-    ("explicit.stat_1853636813", "explicit.stat_362838683"),
-    ("explicit.stat_1853636813", "explicit.stat_2457540491"),
-    ("explicit.stat_1853636813", "explicit.stat_65331133"),
-    ("explicit.stat_1853636813", "explicit.stat_3337107517"),
-    ("explicit.stat_1853636813", "explicit.stat_3332055899"),
-    ("explicit.stat_1853636813", "explicit.stat_2548097895"),
-    ("explicit.stat_1853636813", "explicit.stat_1016185292"),
-    ("explicit.stat_1853636813", "explicit.stat_3624529132"),
-    ("explicit.stat_1853636813", "explicit.stat_380220671"),
-    ("explicit.stat_1853636813", "explicit.stat_2189467271"),
-    ("explicit.stat_1853636813", "explicit.stat_3953667743"),
-    ("explicit.stat_1853636813", "explicit.stat_1723738042"),
-    ("explicit.stat_1853636813", "explicit.stat_556659145"),
-    ("explicit.stat_1853636813", "explicit.stat_2690790844"),
-    ("explicit.stat_1853636813", "explicit.stat_80470845"),
-    ("explicit.stat_1853636813", "explicit.stat_2444534954"),
-    ("explicit.stat_1853636813", "explicit.stat_1699077932"),
-    ("explicit.stat_1853636813", "explicit.stat_2383304564"),
-    ("explicit.stat_1853636813", "explicit.stat_121436064"),
-    ("explicit.stat_1853636813", "explicit.stat_2312747856"),
-    ("explicit.stat_1853636813", "explicit.stat_3656959867"),
-    ("explicit.stat_1853636813", "explicit.stat_281949611"),
-    ("explicit.stat_2831391506", "explicit.stat_1138813382"),
-    ("explicit.stat_2831391506", "explicit.stat_2736708072"),
-    ("explicit.stat_2831391506", "explicit.stat_3308185931"),
-    ("explicit.stat_2831391506", "explicit.stat_4104891138"),
-    ("explicit.stat_2831391506", "explicit.stat_34059570"),
-    ("explicit.stat_2831391506", "explicit.stat_3643449791"),
-    ("explicit.stat_2831391506", "explicit.stat_3468843137"),
-    ("explicit.stat_2831391506", "explicit.stat_3207781478"),
-    ("explicit.stat_2831391506", "explicit.stat_2806391472"),
-    ("explicit.stat_2831391506", "explicit.stat_2567659895"),
-    ("explicit.stat_2831391506", "explicit.stat_4012281889"),
-    ("explicit.stat_2831391506", "explicit.stat_1173690938"),
-    ("explicit.stat_2831391506", "explicit.stat_2365917222"),
-    ("explicit.stat_2831391506", "explicit.stat_3223142064"),
-    ("explicit.stat_2831391506", "explicit.stat_1567542124"),
-    ("explicit.stat_2831391506", "explicit.stat_2647344903"),
-    ("explicit.stat_2831391506", "explicit.stat_1165583295"),
-    ("explicit.stat_2831391506", "explicit.stat_371612541"),
-    ("explicit.stat_2831391506", "explicit.stat_2720072724"),
-    ("explicit.stat_2831391506", "explicit.stat_1919069577"),
-    ("explicit.stat_2831391506", "explicit.stat_3772841281"),
-    ("explicit.stat_2831391506", "explicit.stat_4245204226"),
-    ("explicit.stat_2831391506", "explicit.stat_2163419452"),
-    ("explicit.stat_2831391506", "explicit.stat_3111519953"),
-    ("explicit.stat_2831391506", "explicit.stat_2434030180"),
-    ("explicit.stat_2831391506", "explicit.stat_1653848515"),
-    ("explicit.stat_2831391506", "explicit.stat_2731416566"),
-    ("explicit.stat_2831391506", "explicit.stat_3234824465"),
-    ("explicit.stat_2831391506", "explicit.stat_3627458291"),
-    ("explicit.stat_2831391506", "explicit.stat_2091518682"),
-    ("explicit.stat_2831391506", "explicit.stat_214835567"),
-    ("explicit.stat_2831391506", "explicit.stat_362838683"),
-    ("explicit.stat_2831391506", "explicit.stat_2457540491"),
-    ("explicit.stat_2831391506", "explicit.stat_65331133"),
-    ("explicit.stat_2831391506", "explicit.stat_3337107517"),
-    ("explicit.stat_2831391506", "explicit.stat_3332055899"),
-    ("explicit.stat_2831391506", "explicit.stat_2548097895"),
-    ("explicit.stat_2831391506", "explicit.stat_1016185292"),
-    ("explicit.stat_2831391506", "explicit.stat_3624529132"),
-    ("explicit.stat_2831391506", "explicit.stat_380220671"),
-    ("explicit.stat_2831391506", "explicit.stat_2189467271"),
-    ("explicit.stat_2831391506", "explicit.stat_3953667743"),
-    ("explicit.stat_2831391506", "explicit.stat_1723738042"),
-    ("explicit.stat_2831391506", "explicit.stat_556659145"),
-    ("explicit.stat_2831391506", "explicit.stat_2690790844"),
-    ("explicit.stat_2831391506", "explicit.stat_80470845"),
-    ("explicit.stat_2831391506", "explicit.stat_2444534954"),
-    ("explicit.stat_2831391506", "explicit.stat_1699077932"),
-    ("explicit.stat_2831391506", "explicit.stat_2383304564"),
-    ("explicit.stat_2831391506", "explicit.stat_121436064"),
-    ("explicit.stat_2831391506", "explicit.stat_2312747856"),
-    ("explicit.stat_2831391506", "explicit.stat_3656959867"),
-    ("explicit.stat_2831391506", "explicit.stat_281949611"),
-    ("explicit.stat_1138813382", "explicit.stat_2736708072"),
-    ("explicit.stat_1138813382", "explicit.stat_3308185931"),
-    ("explicit.stat_1138813382", "explicit.stat_4104891138"),
-    ("explicit.stat_1138813382", "explicit.stat_34059570"),
-    ("explicit.stat_1138813382", "explicit.stat_3643449791"),
-    ("explicit.stat_1138813382", "explicit.stat_3468843137"),
-    ("explicit.stat_1138813382", "explicit.stat_3207781478"),
-    ("explicit.stat_1138813382", "explicit.stat_2806391472"),
-    ("explicit.stat_1138813382", "explicit.stat_2567659895"),
-    ("explicit.stat_1138813382", "explicit.stat_4012281889"),
-    ("explicit.stat_1138813382", "explicit.stat_1173690938"),
-    ("explicit.stat_1138813382", "explicit.stat_2365917222"),
-    ("explicit.stat_1138813382", "explicit.stat_3223142064"),
-    ("explicit.stat_1138813382", "explicit.stat_1567542124"),
-    ("explicit.stat_1138813382", "explicit.stat_2647344903"),
-    ("explicit.stat_1138813382", "explicit.stat_1165583295"),
-    ("explicit.stat_1138813382", "explicit.stat_371612541"),
-    ("explicit.stat_1138813382", "explicit.stat_2720072724"),
-    ("explicit.stat_1138813382", "explicit.stat_1919069577"),
-    ("explicit.stat_1138813382", "explicit.stat_3772841281"),
-    ("explicit.stat_1138813382", "explicit.stat_4245204226"),
-    ("explicit.stat_1138813382", "explicit.stat_2163419452"),
-    ("explicit.stat_1138813382", "explicit.stat_3111519953"),
-    ("explicit.stat_1138813382", "explicit.stat_2434030180"),
-    ("explicit.stat_1138813382", "explicit.stat_1653848515"),
-    ("explicit.stat_1138813382", "explicit.stat_2731416566"),
-    ("explicit.stat_1138813382", "explicit.stat_3234824465"),
-    ("explicit.stat_1138813382", "explicit.stat_3627458291"),
-    ("explicit.stat_1138813382", "explicit.stat_2091518682"),
-    ("explicit.stat_1138813382", "explicit.stat_214835567"),
-    ("explicit.stat_1138813382", "explicit.stat_362838683"),
-    ("explicit.stat_1138813382", "explicit.stat_2457540491"),
-    ("explicit.stat_1138813382", "explicit.stat_65331133"),
-    ("explicit.stat_1138813382", "explicit.stat_3337107517"),
-    ("explicit.stat_1138813382", "explicit.stat_3332055899"),
-    ("explicit.stat_1138813382", "explicit.stat_2548097895"),
-    ("explicit.stat_1138813382", "explicit.stat_1016185292"),
-    ("explicit.stat_1138813382", "explicit.stat_3624529132"),
-    ("explicit.stat_1138813382", "explicit.stat_380220671"),
-    ("explicit.stat_1138813382", "explicit.stat_2189467271"),
-    ("explicit.stat_1138813382", "explicit.stat_3953667743"),
-    ("explicit.stat_1138813382", "explicit.stat_1723738042"),
-    ("explicit.stat_1138813382", "explicit.stat_556659145"),
-    ("explicit.stat_1138813382", "explicit.stat_2690790844"),
-    ("explicit.stat_1138813382", "explicit.stat_80470845"),
-    ("explicit.stat_1138813382", "explicit.stat_2444534954"),
-    ("explicit.stat_1138813382", "explicit.stat_1699077932"),
-    ("explicit.stat_1138813382", "explicit.stat_2383304564"),
-    ("explicit.stat_1138813382", "explicit.stat_121436064"),
-    ("explicit.stat_1138813382", "explicit.stat_2312747856"),
-    ("explicit.stat_1138813382", "explicit.stat_3656959867"),
-    ("explicit.stat_1138813382", "explicit.stat_281949611"),
-    ("explicit.stat_2736708072", "explicit.stat_3308185931"),
-    ("explicit.stat_2736708072", "explicit.stat_4104891138"),
-    ("explicit.stat_2736708072", "explicit.stat_34059570"),
-    ("explicit.stat_2736708072", "explicit.stat_3643449791"),
-    ("explicit.stat_2736708072", "explicit.stat_3468843137"),
-    ("explicit.stat_2736708072", "explicit.stat_3207781478"),
-    ("explicit.stat_2736708072", "explicit.stat_2806391472"),
-    ("explicit.stat_2736708072", "explicit.stat_2567659895"),
-    ("explicit.stat_2736708072", "explicit.stat_4012281889"),
-    ("explicit.stat_2736708072", "explicit.stat_1173690938"),
-    ("explicit.stat_2736708072", "explicit.stat_2365917222"),
-    ("explicit.stat_2736708072", "explicit.stat_3223142064"),
-    ("explicit.stat_2736708072", "explicit.stat_1567542124"),
-    ("explicit.stat_2736708072", "explicit.stat_2647344903"),
-    ("explicit.stat_2736708072", "explicit.stat_1165583295"),
-    ("explicit.stat_2736708072", "explicit.stat_371612541"),
-    ("explicit.stat_2736708072", "explicit.stat_2720072724"),
-    ("explicit.stat_2736708072", "explicit.stat_1919069577"),
-    ("explicit.stat_2736708072", "explicit.stat_3772841281"),
-    ("explicit.stat_2736708072", "explicit.stat_4245204226"),
-    ("explicit.stat_2736708072", "explicit.stat_2163419452"),
-    ("explicit.stat_2736708072", "explicit.stat_3111519953"),
-    ("explicit.stat_2736708072", "explicit.stat_2434030180"),
-    ("explicit.stat_2736708072", "explicit.stat_1653848515"),
-    ("explicit.stat_2736708072", "explicit.stat_2731416566"),
-    ("explicit.stat_2736708072", "explicit.stat_3234824465"),
-    ("explicit.stat_2736708072", "explicit.stat_3627458291"),
-    ("explicit.stat_2736708072", "explicit.stat_2091518682"),
-    ("explicit.stat_2736708072", "explicit.stat_214835567"),
-    ("explicit.stat_2736708072", "explicit.stat_362838683"),
-    ("explicit.stat_2736708072", "explicit.stat_2457540491"),
-    ("explicit.stat_2736708072", "explicit.stat_65331133"),
-    ("explicit.stat_2736708072", "explicit.stat_3337107517"),
-    ("explicit.stat_2736708072", "explicit.stat_3332055899"),
-    ("explicit.stat_2736708072", "explicit.stat_2548097895"),
-    ("explicit.stat_2736708072", "explicit.stat_1016185292"),
-    ("explicit.stat_2736708072", "explicit.stat_3624529132"),
-    ("explicit.stat_2736708072", "explicit.stat_380220671"),
-    ("explicit.stat_2736708072", "explicit.stat_2189467271"),
-    ("explicit.stat_2736708072", "explicit.stat_3953667743"),
-    ("explicit.stat_2736708072", "explicit.stat_1723738042"),
-    ("explicit.stat_2736708072", "explicit.stat_556659145"),
-    ("explicit.stat_2736708072", "explicit.stat_2690790844"),
-    ("explicit.stat_2736708072", "explicit.stat_80470845"),
-    ("explicit.stat_2736708072", "explicit.stat_2444534954"),
-    ("explicit.stat_2736708072", "explicit.stat_1699077932"),
-    ("explicit.stat_2736708072", "explicit.stat_2383304564"),
-    ("explicit.stat_2736708072", "explicit.stat_121436064"),
-    ("explicit.stat_2736708072", "explicit.stat_2312747856"),
-    ("explicit.stat_2736708072", "explicit.stat_3656959867"),
-    ("explicit.stat_2736708072", "explicit.stat_281949611"),
-    ("explicit.stat_3308185931", "explicit.stat_4104891138"),
-    ("explicit.stat_3308185931", "explicit.stat_34059570"),
-    ("explicit.stat_3308185931", "explicit.stat_3643449791"),
-    ("explicit.stat_3308185931", "explicit.stat_3468843137"),
-    ("explicit.stat_3308185931", "explicit.stat_3207781478"),
-    ("explicit.stat_3308185931", "explicit.stat_2806391472"),
-    ("explicit.stat_3308185931", "explicit.stat_2567659895"),
-    ("explicit.stat_3308185931", "explicit.stat_4012281889"),
-    ("explicit.stat_3308185931", "explicit.stat_1173690938"),
-    ("explicit.stat_3308185931", "explicit.stat_2365917222"),
-    ("explicit.stat_3308185931", "explicit.stat_3223142064"),
-    ("explicit.stat_3308185931", "explicit.stat_1567542124"),
-    ("explicit.stat_3308185931", "explicit.stat_2647344903"),
-    ("explicit.stat_3308185931", "explicit.stat_1165583295"),
-    ("explicit.stat_3308185931", "explicit.stat_371612541"),
-    ("explicit.stat_3308185931", "explicit.stat_2720072724"),
-    ("explicit.stat_3308185931", "explicit.stat_1919069577"),
-    ("explicit.stat_3308185931", "explicit.stat_3772841281"),
-    ("explicit.stat_3308185931", "explicit.stat_4245204226"),
-    ("explicit.stat_3308185931", "explicit.stat_2163419452"),
-    ("explicit.stat_3308185931", "explicit.stat_3111519953"),
-    ("explicit.stat_3308185931", "explicit.stat_2434030180"),
-    ("explicit.stat_3308185931", "explicit.stat_1653848515"),
-    ("explicit.stat_3308185931", "explicit.stat_2731416566"),
-    ("explicit.stat_3308185931", "explicit.stat_3234824465"),
-    ("explicit.stat_3308185931", "explicit.stat_3627458291"),
-    ("explicit.stat_3308185931", "explicit.stat_2091518682"),
-    ("explicit.stat_3308185931", "explicit.stat_214835567"),
-    ("explicit.stat_3308185931", "explicit.stat_362838683"),
-    ("explicit.stat_3308185931", "explicit.stat_2457540491"),
-    ("explicit.stat_3308185931", "explicit.stat_65331133"),
-    ("explicit.stat_3308185931", "explicit.stat_3337107517"),
-    ("explicit.stat_3308185931", "explicit.stat_3332055899"),
-    ("explicit.stat_3308185931", "explicit.stat_2548097895"),
-    ("explicit.stat_3308185931", "explicit.stat_1016185292"),
-    ("explicit.stat_3308185931", "explicit.stat_3624529132"),
-    ("explicit.stat_3308185931", "explicit.stat_380220671"),
-    ("explicit.stat_3308185931", "explicit.stat_2189467271"),
-    ("explicit.stat_3308185931", "explicit.stat_3953667743"),
-    ("explicit.stat_3308185931", "explicit.stat_1723738042"),
-    ("explicit.stat_3308185931", "explicit.stat_556659145"),
-    ("explicit.stat_3308185931", "explicit.stat_2690790844"),
-    ("explicit.stat_3308185931", "explicit.stat_80470845"),
-    ("explicit.stat_3308185931", "explicit.stat_2444534954"),
-    ("explicit.stat_3308185931", "explicit.stat_1699077932"),
-    ("explicit.stat_3308185931", "explicit.stat_2383304564"),
-    ("explicit.stat_3308185931", "explicit.stat_121436064"),
-    ("explicit.stat_3308185931", "explicit.stat_2312747856"),
-    ("explicit.stat_3308185931", "explicit.stat_3656959867"),
-    ("explicit.stat_3308185931", "explicit.stat_281949611"),
-    ("explicit.stat_4104891138", "explicit.stat_34059570"),
-    ("explicit.stat_4104891138", "explicit.stat_3643449791"),
-    ("explicit.stat_4104891138", "explicit.stat_3468843137"),
-    ("explicit.stat_4104891138", "explicit.stat_3207781478"),
-    ("explicit.stat_4104891138", "explicit.stat_2806391472"),
-    ("explicit.stat_4104891138", "explicit.stat_2567659895"),
-    ("explicit.stat_4104891138", "explicit.stat_4012281889"),
-    ("explicit.stat_4104891138", "explicit.stat_1173690938"),
-    ("explicit.stat_4104891138", "explicit.stat_2365917222"),
-    ("explicit.stat_4104891138", "explicit.stat_3223142064"),
-    ("explicit.stat_4104891138", "explicit.stat_1567542124"),
-    ("explicit.stat_4104891138", "explicit.stat_2647344903"),
-    ("explicit.stat_4104891138", "explicit.stat_1165583295"),
-    ("explicit.stat_4104891138", "explicit.stat_371612541"),
-    ("explicit.stat_4104891138", "explicit.stat_2720072724"),
-    ("explicit.stat_4104891138", "explicit.stat_1919069577"),
-    ("explicit.stat_4104891138", "explicit.stat_3772841281"),
-    ("explicit.stat_4104891138", "explicit.stat_4245204226"),
-    ("explicit.stat_4104891138", "explicit.stat_2163419452"),
-    ("explicit.stat_4104891138", "explicit.stat_3111519953"),
-    ("explicit.stat_4104891138", "explicit.stat_2434030180"),
-    ("explicit.stat_4104891138", "explicit.stat_1653848515"),
-    ("explicit.stat_4104891138", "explicit.stat_2731416566"),
-    ("explicit.stat_4104891138", "explicit.stat_3234824465"),
-    ("explicit.stat_4104891138", "explicit.stat_3627458291"),
-    ("explicit.stat_4104891138", "explicit.stat_2091518682"),
-    ("explicit.stat_4104891138", "explicit.stat_214835567"),
-    ("explicit.stat_4104891138", "explicit.stat_362838683"),
-    ("explicit.stat_4104891138", "explicit.stat_2457540491"),
-    ("explicit.stat_4104891138", "explicit.stat_65331133"),
-    ("explicit.stat_4104891138", "explicit.stat_3337107517"),
-    ("explicit.stat_4104891138", "explicit.stat_3332055899"),
-    ("explicit.stat_4104891138", "explicit.stat_2548097895"),
-    ("explicit.stat_4104891138", "explicit.stat_1016185292"),
-    ("explicit.stat_4104891138", "explicit.stat_3624529132"),
-    ("explicit.stat_4104891138", "explicit.stat_380220671"),
-    ("explicit.stat_4104891138", "explicit.stat_2189467271"),
-    ("explicit.stat_4104891138", "explicit.stat_3953667743"),
-    ("explicit.stat_4104891138", "explicit.stat_1723738042"),
-    ("explicit.stat_4104891138", "explicit.stat_556659145"),
-    ("explicit.stat_4104891138", "explicit.stat_2690790844"),
-    ("explicit.stat_4104891138", "explicit.stat_80470845"),
-    ("explicit.stat_4104891138", "explicit.stat_2444534954"),
-    ("explicit.stat_4104891138", "explicit.stat_1699077932"),
-    ("explicit.stat_4104891138", "explicit.stat_2383304564"),
-    ("explicit.stat_4104891138", "explicit.stat_121436064"),
-    ("explicit.stat_4104891138", "explicit.stat_2312747856"),
-    ("explicit.stat_4104891138", "explicit.stat_3656959867"),
-    ("explicit.stat_4104891138", "explicit.stat_281949611"),
-    ("explicit.stat_34059570", "explicit.stat_3643449791"),
-    ("explicit.stat_34059570", "explicit.stat_3468843137"),
-    ("explicit.stat_34059570", "explicit.stat_3207781478"),
-    ("explicit.stat_34059570", "explicit.stat_2806391472"),
-    ("explicit.stat_34059570", "explicit.stat_2567659895"),
-    ("explicit.stat_34059570", "explicit.stat_4012281889"),
-    ("explicit.stat_34059570", "explicit.stat_1173690938"),
-    ("explicit.stat_34059570", "explicit.stat_2365917222"),
-    ("explicit.stat_34059570", "explicit.stat_3223142064"),
-    ("explicit.stat_34059570", "explicit.stat_1567542124"),
-    ("explicit.stat_34059570", "explicit.stat_2647344903"),
-    ("explicit.stat_34059570", "explicit.stat_1165583295"),
-    ("explicit.stat_34059570", "explicit.stat_371612541"),
-    ("explicit.stat_34059570", "explicit.stat_2720072724"),
-    ("explicit.stat_34059570", "explicit.stat_1919069577"),
-    ("explicit.stat_34059570", "explicit.stat_3772841281"),
-    ("explicit.stat_34059570", "explicit.stat_4245204226"),
-    ("explicit.stat_34059570", "explicit.stat_2163419452"),
-    ("explicit.stat_34059570", "explicit.stat_3111519953"),
-    ("explicit.stat_34059570", "explicit.stat_2434030180"),
-    ("explicit.stat_34059570", "explicit.stat_1653848515"),
-    ("explicit.stat_34059570", "explicit.stat_2731416566"),
-    ("explicit.stat_34059570", "explicit.stat_3234824465"),
-    ("explicit.stat_34059570", "explicit.stat_3627458291"),
-    ("explicit.stat_34059570", "explicit.stat_2091518682"),
-    ("explicit.stat_34059570", "explicit.stat_214835567"),
-    ("explicit.stat_34059570", "explicit.stat_362838683"),
-    ("explicit.stat_34059570", "explicit.stat_2457540491"),
-    ("explicit.stat_34059570", "explicit.stat_65331133"),
-    ("explicit.stat_34059570", "explicit.stat_3337107517"),
-    ("explicit.stat_34059570", "explicit.stat_3332055899"),
-    ("explicit.stat_34059570", "explicit.stat_2548097895"),
-    ("explicit.stat_34059570", "explicit.stat_1016185292"),
-    ("explicit.stat_34059570", "explicit.stat_3624529132"),
-    ("explicit.stat_34059570", "explicit.stat_380220671"),
-    ("explicit.stat_34059570", "explicit.stat_2189467271"),
-    ("explicit.stat_34059570", "explicit.stat_3953667743"),
-    ("explicit.stat_34059570", "explicit.stat_1723738042"),
-    ("explicit.stat_34059570", "explicit.stat_556659145"),
-    ("explicit.stat_34059570", "explicit.stat_2690790844"),
-    ("explicit.stat_34059570", "explicit.stat_80470845"),
-    ("explicit.stat_34059570", "explicit.stat_2444534954"),
-    ("explicit.stat_34059570", "explicit.stat_1699077932"),
-    ("explicit.stat_34059570", "explicit.stat_2383304564"),
-    ("explicit.stat_34059570", "explicit.stat_121436064"),
-    ("explicit.stat_34059570", "explicit.stat_2312747856"),
-    ("explicit.stat_34059570", "explicit.stat_3656959867"),
-    ("explicit.stat_34059570", "explicit.stat_281949611"),
-    ("explicit.stat_3643449791", "explicit.stat_3468843137"),
-    ("explicit.stat_3643449791", "explicit.stat_3207781478"),
-    ("explicit.stat_3643449791", "explicit.stat_2806391472"),
-    ("explicit.stat_3643449791", "explicit.stat_2567659895"),
-    ("explicit.stat_3643449791", "explicit.stat_4012281889"),
-    ("explicit.stat_3643449791", "explicit.stat_1173690938"),
-    ("explicit.stat_3643449791", "explicit.stat_2365917222"),
-    ("explicit.stat_3643449791", "explicit.stat_3223142064"),
-    ("explicit.stat_3643449791", "explicit.stat_1567542124"),
-    ("explicit.stat_3643449791", "explicit.stat_2647344903"),
-    ("explicit.stat_3643449791", "explicit.stat_1165583295"),
-    ("explicit.stat_3643449791", "explicit.stat_371612541"),
-    ("explicit.stat_3643449791", "explicit.stat_2720072724"),
-    ("explicit.stat_3643449791", "explicit.stat_1919069577"),
-    ("explicit.stat_3643449791", "explicit.stat_3772841281"),
-    ("explicit.stat_3643449791", "explicit.stat_4245204226"),
-    ("explicit.stat_3643449791", "explicit.stat_2163419452"),
-    ("explicit.stat_3643449791", "explicit.stat_3111519953"),
-    ("explicit.stat_3643449791", "explicit.stat_2434030180"),
-    ("explicit.stat_3643449791", "explicit.stat_1653848515"),
-    ("explicit.stat_3643449791", "explicit.stat_2731416566"),
-    ("explicit.stat_3643449791", "explicit.stat_3234824465"),
-    ("explicit.stat_3643449791", "explicit.stat_3627458291"),
-    ("explicit.stat_3643449791", "explicit.stat_2091518682"),
-    ("explicit.stat_3643449791", "explicit.stat_214835567"),
-    ("explicit.stat_3643449791", "explicit.stat_362838683"),
-    ("explicit.stat_3643449791", "explicit.stat_2457540491"),
-    ("explicit.stat_3643449791", "explicit.stat_65331133"),
-    ("explicit.stat_3643449791", "explicit.stat_3337107517"),
-    ("explicit.stat_3643449791", "explicit.stat_3332055899"),
-    ("explicit.stat_3643449791", "explicit.stat_2548097895"),
-    ("explicit.stat_3643449791", "explicit.stat_1016185292"),
-    ("explicit.stat_3643449791", "explicit.stat_3624529132"),
-    ("explicit.stat_3643449791", "explicit.stat_380220671"),
-    ("explicit.stat_3643449791", "explicit.stat_2189467271"),
-    ("explicit.stat_3643449791", "explicit.stat_3953667743"),
-    ("explicit.stat_3643449791", "explicit.stat_1723738042"),
-    ("explicit.stat_3643449791", "explicit.stat_556659145"),
-    ("explicit.stat_3643449791", "explicit.stat_2690790844"),
-    ("explicit.stat_3643449791", "explicit.stat_80470845"),
-    ("explicit.stat_3643449791", "explicit.stat_2444534954"),
-    ("explicit.stat_3643449791", "explicit.stat_1699077932"),
-    ("explicit.stat_3643449791", "explicit.stat_2383304564"),
-    ("explicit.stat_3643449791", "explicit.stat_121436064"),
-    ("explicit.stat_3643449791", "explicit.stat_2312747856"),
-    ("explicit.stat_3643449791", "explicit.stat_3656959867"),
-    ("explicit.stat_3643449791", "explicit.stat_281949611"),
-    ("explicit.stat_3468843137", "explicit.stat_3207781478"),
-    ("explicit.stat_3468843137", "explicit.stat_2806391472"),
-    ("explicit.stat_3468843137", "explicit.stat_2567659895"),
-    ("explicit.stat_3468843137", "explicit.stat_4012281889"),
-    ("explicit.stat_3468843137", "explicit.stat_1173690938"),
-    ("explicit.stat_3468843137", "explicit.stat_2365917222"),
-    ("explicit.stat_3468843137", "explicit.stat_3223142064"),
-    ("explicit.stat_3468843137", "explicit.stat_1567542124"),
-    ("explicit.stat_3468843137", "explicit.stat_2647344903"),
-    ("explicit.stat_3468843137", "explicit.stat_1165583295"),
-    ("explicit.stat_3468843137", "explicit.stat_371612541"),
-    ("explicit.stat_3468843137", "explicit.stat_2720072724"),
-    ("explicit.stat_3468843137", "explicit.stat_1919069577"),
-    ("explicit.stat_3468843137", "explicit.stat_3772841281"),
-    ("explicit.stat_3468843137", "explicit.stat_4245204226"),
-    ("explicit.stat_3468843137", "explicit.stat_2163419452"),
-    ("explicit.stat_3468843137", "explicit.stat_3111519953"),
-    ("explicit.stat_3468843137", "explicit.stat_2434030180"),
-    ("explicit.stat_3468843137", "explicit.stat_1653848515"),
-    ("explicit.stat_3468843137", "explicit.stat_2731416566"),
-    ("explicit.stat_3468843137", "explicit.stat_3234824465"),
-    ("explicit.stat_3468843137", "explicit.stat_3627458291"),
-    ("explicit.stat_3468843137", "explicit.stat_2091518682"),
-    ("explicit.stat_3468843137", "explicit.stat_214835567"),
-    ("explicit.stat_3468843137", "explicit.stat_362838683"),
-    ("explicit.stat_3468843137", "explicit.stat_2457540491"),
-    ("explicit.stat_3468843137", "explicit.stat_65331133"),
-    ("explicit.stat_3468843137", "explicit.stat_3337107517"),
-    ("explicit.stat_3468843137", "explicit.stat_3332055899"),
-    ("explicit.stat_3468843137", "explicit.stat_2548097895"),
-    ("explicit.stat_3468843137", "explicit.stat_1016185292"),
-    ("explicit.stat_3468843137", "explicit.stat_3624529132"),
-    ("explicit.stat_3468843137", "explicit.stat_380220671"),
-    ("explicit.stat_3468843137", "explicit.stat_2189467271"),
-    ("explicit.stat_3468843137", "explicit.stat_3953667743"),
-    ("explicit.stat_3468843137", "explicit.stat_1723738042"),
-    ("explicit.stat_3468843137", "explicit.stat_556659145"),
-    ("explicit.stat_3468843137", "explicit.stat_2690790844"),
-    ("explicit.stat_3468843137", "explicit.stat_80470845"),
-    ("explicit.stat_3468843137", "explicit.stat_2444534954"),
-    ("explicit.stat_3468843137", "explicit.stat_1699077932"),
-    ("explicit.stat_3468843137", "explicit.stat_2383304564"),
-    ("explicit.stat_3468843137", "explicit.stat_121436064"),
-    ("explicit.stat_3468843137", "explicit.stat_2312747856"),
-    ("explicit.stat_3468843137", "explicit.stat_3656959867"),
-    ("explicit.stat_3468843137", "explicit.stat_281949611"),
-    ("explicit.stat_3207781478", "explicit.stat_2806391472"),
-    ("explicit.stat_3207781478", "explicit.stat_2567659895"),
-    ("explicit.stat_3207781478", "explicit.stat_4012281889"),
-    ("explicit.stat_3207781478", "explicit.stat_1173690938"),
-    ("explicit.stat_3207781478", "explicit.stat_2365917222"),
-    ("explicit.stat_3207781478", "explicit.stat_3223142064"),
-    ("explicit.stat_3207781478", "explicit.stat_1567542124"),
-    ("explicit.stat_3207781478", "explicit.stat_2647344903"),
-    ("explicit.stat_3207781478", "explicit.stat_1165583295"),
-    ("explicit.stat_3207781478", "explicit.stat_371612541"),
-    ("explicit.stat_3207781478", "explicit.stat_2720072724"),
-    ("explicit.stat_3207781478", "explicit.stat_1919069577"),
-    ("explicit.stat_3207781478", "explicit.stat_3772841281"),
-    ("explicit.stat_3207781478", "explicit.stat_4245204226"),
-    ("explicit.stat_3207781478", "explicit.stat_2163419452"),
-    ("explicit.stat_3207781478", "explicit.stat_3111519953"),
-    ("explicit.stat_3207781478", "explicit.stat_2434030180"),
-    ("explicit.stat_3207781478", "explicit.stat_1653848515"),
-    ("explicit.stat_3207781478", "explicit.stat_2731416566"),
-    ("explicit.stat_3207781478", "explicit.stat_3234824465"),
-    ("explicit.stat_3207781478", "explicit.stat_3627458291"),
-    ("explicit.stat_3207781478", "explicit.stat_2091518682"),
-    ("explicit.stat_3207781478", "explicit.stat_214835567"),
-    ("explicit.stat_3207781478", "explicit.stat_362838683"),
-    ("explicit.stat_3207781478", "explicit.stat_2457540491"),
-    ("explicit.stat_3207781478", "explicit.stat_65331133"),
-    ("explicit.stat_3207781478", "explicit.stat_3337107517"),
-    ("explicit.stat_3207781478", "explicit.stat_3332055899"),
-    ("explicit.stat_3207781478", "explicit.stat_2548097895"),
-    ("explicit.stat_3207781478", "explicit.stat_1016185292"),
-    ("explicit.stat_3207781478", "explicit.stat_3624529132"),
-    ("explicit.stat_3207781478", "explicit.stat_380220671"),
-    ("explicit.stat_3207781478", "explicit.stat_2189467271"),
-    ("explicit.stat_3207781478", "explicit.stat_3953667743"),
-    ("explicit.stat_3207781478", "explicit.stat_1723738042"),
-    ("explicit.stat_3207781478", "explicit.stat_556659145"),
-    ("explicit.stat_3207781478", "explicit.stat_2690790844"),
-    ("explicit.stat_3207781478", "explicit.stat_80470845"),
-    ("explicit.stat_3207781478", "explicit.stat_2444534954"),
-    ("explicit.stat_3207781478", "explicit.stat_1699077932"),
-    ("explicit.stat_3207781478", "explicit.stat_2383304564"),
-    ("explicit.stat_3207781478", "explicit.stat_121436064"),
-    ("explicit.stat_3207781478", "explicit.stat_2312747856"),
-    ("explicit.stat_3207781478", "explicit.stat_3656959867"),
-    ("explicit.stat_3207781478", "explicit.stat_281949611"),
-    ("explicit.stat_2806391472", "explicit.stat_2567659895"),
-    ("explicit.stat_2806391472", "explicit.stat_4012281889"),
-    ("explicit.stat_2806391472", "explicit.stat_1173690938"),
-    ("explicit.stat_2806391472", "explicit.stat_2365917222"),
-    ("explicit.stat_2806391472", "explicit.stat_3223142064"),
-    ("explicit.stat_2806391472", "explicit.stat_1567542124"),
-    ("explicit.stat_2806391472", "explicit.stat_2647344903"),
-    ("explicit.stat_2806391472", "explicit.stat_1165583295"),
-    ("explicit.stat_2806391472", "explicit.stat_371612541"),
-    ("explicit.stat_2806391472", "explicit.stat_2720072724"),
-    ("explicit.stat_2806391472", "explicit.stat_1919069577"),
-    ("explicit.stat_2806391472", "explicit.stat_3772841281"),
-    ("explicit.stat_2806391472", "explicit.stat_4245204226"),
-    ("explicit.stat_2806391472", "explicit.stat_2163419452"),
-    ("explicit.stat_2806391472", "explicit.stat_3111519953"),
-    ("explicit.stat_2806391472", "explicit.stat_2434030180"),
-    ("explicit.stat_2806391472", "explicit.stat_1653848515"),
-    ("explicit.stat_2806391472", "explicit.stat_2731416566"),
-    ("explicit.stat_2806391472", "explicit.stat_3234824465"),
-    ("explicit.stat_2806391472", "explicit.stat_3627458291"),
-    ("explicit.stat_2806391472", "explicit.stat_2091518682"),
-    ("explicit.stat_2806391472", "explicit.stat_214835567"),
-    ("explicit.stat_2806391472", "explicit.stat_362838683"),
-    ("explicit.stat_2806391472", "explicit.stat_2457540491"),
-    ("explicit.stat_2806391472", "explicit.stat_65331133"),
-    ("explicit.stat_2806391472", "explicit.stat_3337107517"),
-    ("explicit.stat_2806391472", "explicit.stat_3332055899"),
-    ("explicit.stat_2806391472", "explicit.stat_2548097895"),
-    ("explicit.stat_2806391472", "explicit.stat_1016185292"),
-    ("explicit.stat_2806391472", "explicit.stat_3624529132"),
-    ("explicit.stat_2806391472", "explicit.stat_380220671"),
-    ("explicit.stat_2806391472", "explicit.stat_2189467271"),
-    ("explicit.stat_2806391472", "explicit.stat_3953667743"),
-    ("explicit.stat_2806391472", "explicit.stat_1723738042"),
-    ("explicit.stat_2806391472", "explicit.stat_556659145"),
-    ("explicit.stat_2806391472", "explicit.stat_2690790844"),
-    ("explicit.stat_2806391472", "explicit.stat_80470845"),
-    ("explicit.stat_2806391472", "explicit.stat_2444534954"),
-    ("explicit.stat_2806391472", "explicit.stat_1699077932"),
-    ("explicit.stat_2806391472", "explicit.stat_2383304564"),
-    ("explicit.stat_2806391472", "explicit.stat_121436064"),
-    ("explicit.stat_2806391472", "explicit.stat_2312747856"),
-    ("explicit.stat_2806391472", "explicit.stat_3656959867"),
-    ("explicit.stat_2806391472", "explicit.stat_281949611"),
-    ("explicit.stat_2567659895", "explicit.stat_4012281889"),
-    ("explicit.stat_2567659895", "explicit.stat_1173690938"),
-    ("explicit.stat_2567659895", "explicit.stat_2365917222"),
-    ("explicit.stat_2567659895", "explicit.stat_3223142064"),
-    ("explicit.stat_2567659895", "explicit.stat_1567542124"),
-    ("explicit.stat_2567659895", "explicit.stat_2647344903"),
-    ("explicit.stat_2567659895", "explicit.stat_1165583295"),
-    ("explicit.stat_2567659895", "explicit.stat_371612541"),
-    ("explicit.stat_2567659895", "explicit.stat_2720072724"),
-    ("explicit.stat_2567659895", "explicit.stat_1919069577"),
-    ("explicit.stat_2567659895", "explicit.stat_3772841281"),
-    ("explicit.stat_2567659895", "explicit.stat_4245204226"),
-    ("explicit.stat_2567659895", "explicit.stat_2163419452"),
-    ("explicit.stat_2567659895", "explicit.stat_3111519953"),
-    ("explicit.stat_2567659895", "explicit.stat_2434030180"),
-    ("explicit.stat_2567659895", "explicit.stat_1653848515"),
-    ("explicit.stat_2567659895", "explicit.stat_2731416566"),
-    ("explicit.stat_2567659895", "explicit.stat_3234824465"),
-    ("explicit.stat_2567659895", "explicit.stat_3627458291"),
-    ("explicit.stat_2567659895", "explicit.stat_2091518682"),
-    ("explicit.stat_2567659895", "explicit.stat_214835567"),
-    ("explicit.stat_2567659895", "explicit.stat_362838683"),
-    ("explicit.stat_2567659895", "explicit.stat_2457540491"),
-    ("explicit.stat_2567659895", "explicit.stat_65331133"),
-    ("explicit.stat_2567659895", "explicit.stat_3337107517"),
-    ("explicit.stat_2567659895", "explicit.stat_3332055899"),
-    ("explicit.stat_2567659895", "explicit.stat_2548097895"),
-    ("explicit.stat_2567659895", "explicit.stat_1016185292"),
-    ("explicit.stat_2567659895", "explicit.stat_3624529132"),
-    ("explicit.stat_2567659895", "explicit.stat_380220671"),
-    ("explicit.stat_2567659895", "explicit.stat_2189467271"),
-    ("explicit.stat_2567659895", "explicit.stat_3953667743"),
-    ("explicit.stat_2567659895", "explicit.stat_1723738042"),
-    ("explicit.stat_2567659895", "explicit.stat_556659145"),
-    ("explicit.stat_2567659895", "explicit.stat_2690790844"),
-    ("explicit.stat_2567659895", "explicit.stat_80470845"),
-    ("explicit.stat_2567659895", "explicit.stat_2444534954"),
-    ("explicit.stat_2567659895", "explicit.stat_1699077932"),
-    ("explicit.stat_2567659895", "explicit.stat_2383304564"),
-    ("explicit.stat_2567659895", "explicit.stat_121436064"),
-    ("explicit.stat_2567659895", "explicit.stat_2312747856"),
-    ("explicit.stat_2567659895", "explicit.stat_3656959867"),
-    ("explicit.stat_2567659895", "explicit.stat_281949611"),
-    ("explicit.stat_4012281889", "explicit.stat_1173690938"),
-    ("explicit.stat_4012281889", "explicit.stat_2365917222"),
-    ("explicit.stat_4012281889", "explicit.stat_3223142064"),
-    ("explicit.stat_4012281889", "explicit.stat_1567542124"),
-    ("explicit.stat_4012281889", "explicit.stat_2647344903"),
-    ("explicit.stat_4012281889", "explicit.stat_1165583295"),
-    ("explicit.stat_4012281889", "explicit.stat_371612541"),
-    ("explicit.stat_4012281889", "explicit.stat_2720072724"),
-    ("explicit.stat_4012281889", "explicit.stat_1919069577"),
-    ("explicit.stat_4012281889", "explicit.stat_3772841281"),
-    ("explicit.stat_4012281889", "explicit.stat_4245204226"),
-    ("explicit.stat_4012281889", "explicit.stat_2163419452"),
-    ("explicit.stat_4012281889", "explicit.stat_3111519953"),
-    ("explicit.stat_4012281889", "explicit.stat_2434030180"),
-    ("explicit.stat_4012281889", "explicit.stat_1653848515"),
-    ("explicit.stat_4012281889", "explicit.stat_2731416566"),
-    ("explicit.stat_4012281889", "explicit.stat_3234824465"),
-    ("explicit.stat_4012281889", "explicit.stat_3627458291"),
-    ("explicit.stat_4012281889", "explicit.stat_2091518682"),
-    ("explicit.stat_4012281889", "explicit.stat_214835567"),
-    ("explicit.stat_4012281889", "explicit.stat_362838683"),
-    ("explicit.stat_4012281889", "explicit.stat_2457540491"),
-    ("explicit.stat_4012281889", "explicit.stat_65331133"),
-    ("explicit.stat_4012281889", "explicit.stat_3337107517"),
-    ("explicit.stat_4012281889", "explicit.stat_3332055899"),
-    ("explicit.stat_4012281889", "explicit.stat_2548097895"),
-    ("explicit.stat_4012281889", "explicit.stat_1016185292"),
-    ("explicit.stat_4012281889", "explicit.stat_3624529132"),
-    ("explicit.stat_4012281889", "explicit.stat_380220671"),
-    ("explicit.stat_4012281889", "explicit.stat_2189467271"),
-    ("explicit.stat_4012281889", "explicit.stat_3953667743"),
-    ("explicit.stat_4012281889", "explicit.stat_1723738042"),
-    ("explicit.stat_4012281889", "explicit.stat_556659145"),
-    ("explicit.stat_4012281889", "explicit.stat_2690790844"),
-    ("explicit.stat_4012281889", "explicit.stat_80470845"),
-    ("explicit.stat_4012281889", "explicit.stat_2444534954"),
-    ("explicit.stat_4012281889", "explicit.stat_1699077932"),
-    ("explicit.stat_4012281889", "explicit.stat_2383304564"),
-    ("explicit.stat_4012281889", "explicit.stat_121436064"),
-    ("explicit.stat_4012281889", "explicit.stat_2312747856"),
-    ("explicit.stat_4012281889", "explicit.stat_3656959867"),
-    ("explicit.stat_4012281889", "explicit.stat_281949611"),
-    ("explicit.stat_1173690938", "explicit.stat_2365917222"),
-    ("explicit.stat_1173690938", "explicit.stat_3223142064"),
-    ("explicit.stat_1173690938", "explicit.stat_1567542124"),
-    ("explicit.stat_1173690938", "explicit.stat_2647344903"),
-    ("explicit.stat_1173690938", "explicit.stat_1165583295"),
-    ("explicit.stat_1173690938", "explicit.stat_371612541"),
-    ("explicit.stat_1173690938", "explicit.stat_2720072724"),
-    ("explicit.stat_1173690938", "explicit.stat_1919069577"),
-    ("explicit.stat_1173690938", "explicit.stat_3772841281"),
-    ("explicit.stat_1173690938", "explicit.stat_4245204226"),
-    ("explicit.stat_1173690938", "explicit.stat_2163419452"),
-    ("explicit.stat_1173690938", "explicit.stat_3111519953"),
-    ("explicit.stat_1173690938", "explicit.stat_2434030180"),
-    ("explicit.stat_1173690938", "explicit.stat_1653848515"),
-    ("explicit.stat_1173690938", "explicit.stat_2731416566"),
-    ("explicit.stat_1173690938", "explicit.stat_3234824465"),
-    ("explicit.stat_1173690938", "explicit.stat_3627458291"),
-    ("explicit.stat_1173690938", "explicit.stat_2091518682"),
-    ("explicit.stat_1173690938", "explicit.stat_214835567"),
-    ("explicit.stat_1173690938", "explicit.stat_362838683"),
-    ("explicit.stat_1173690938", "explicit.stat_2457540491"),
-    ("explicit.stat_1173690938", "explicit.stat_65331133"),
-    ("explicit.stat_1173690938", "explicit.stat_3337107517"),
-    ("explicit.stat_1173690938", "explicit.stat_3332055899"),
-    ("explicit.stat_1173690938", "explicit.stat_2548097895"),
-    ("explicit.stat_1173690938", "explicit.stat_1016185292"),
-    ("explicit.stat_1173690938", "explicit.stat_3624529132"),
-    ("explicit.stat_1173690938", "explicit.stat_380220671"),
-    ("explicit.stat_1173690938", "explicit.stat_2189467271"),
-    ("explicit.stat_1173690938", "explicit.stat_3953667743"),
-    ("explicit.stat_1173690938", "explicit.stat_1723738042"),
-    ("explicit.stat_1173690938", "explicit.stat_556659145"),
-    ("explicit.stat_1173690938", "explicit.stat_2690790844"),
-    ("explicit.stat_1173690938", "explicit.stat_80470845"),
-    ("explicit.stat_1173690938", "explicit.stat_2444534954"),
-    ("explicit.stat_1173690938", "explicit.stat_1699077932"),
-    ("explicit.stat_1173690938", "explicit.stat_2383304564"),
-    ("explicit.stat_1173690938", "explicit.stat_121436064"),
-    ("explicit.stat_1173690938", "explicit.stat_2312747856"),
-    ("explicit.stat_1173690938", "explicit.stat_3656959867"),
-    ("explicit.stat_1173690938", "explicit.stat_281949611"),
-    ("explicit.stat_2365917222", "explicit.stat_3223142064"),
-    ("explicit.stat_2365917222", "explicit.stat_1567542124"),
-    ("explicit.stat_2365917222", "explicit.stat_2647344903"),
-    ("explicit.stat_2365917222", "explicit.stat_1165583295"),
-    ("explicit.stat_2365917222", "explicit.stat_371612541"),
-    ("explicit.stat_2365917222", "explicit.stat_2720072724"),
-    ("explicit.stat_2365917222", "explicit.stat_1919069577"),
-    ("explicit.stat_2365917222", "explicit.stat_3772841281"),
-    ("explicit.stat_2365917222", "explicit.stat_4245204226"),
-    ("explicit.stat_2365917222", "explicit.stat_2163419452"),
-    ("explicit.stat_2365917222", "explicit.stat_3111519953"),
-    ("explicit.stat_2365917222", "explicit.stat_2434030180"),
-    ("explicit.stat_2365917222", "explicit.stat_1653848515"),
-    ("explicit.stat_2365917222", "explicit.stat_2731416566"),
-    ("explicit.stat_2365917222", "explicit.stat_3234824465"),
-    ("explicit.stat_2365917222", "explicit.stat_3627458291"),
-    ("explicit.stat_2365917222", "explicit.stat_2091518682"),
-    ("explicit.stat_2365917222", "explicit.stat_214835567"),
-    ("explicit.stat_2365917222", "explicit.stat_362838683"),
-    ("explicit.stat_2365917222", "explicit.stat_2457540491"),
-    ("explicit.stat_2365917222", "explicit.stat_65331133"),
-    ("explicit.stat_2365917222", "explicit.stat_3337107517"),
-    ("explicit.stat_2365917222", "explicit.stat_3332055899"),
-    ("explicit.stat_2365917222", "explicit.stat_2548097895"),
-    ("explicit.stat_2365917222", "explicit.stat_1016185292"),
-    ("explicit.stat_2365917222", "explicit.stat_3624529132"),
-    ("explicit.stat_2365917222", "explicit.stat_380220671"),
-    ("explicit.stat_2365917222", "explicit.stat_2189467271"),
-    ("explicit.stat_2365917222", "explicit.stat_3953667743"),
-    ("explicit.stat_2365917222", "explicit.stat_1723738042"),
-    ("explicit.stat_2365917222", "explicit.stat_556659145"),
-    ("explicit.stat_2365917222", "explicit.stat_2690790844"),
-    ("explicit.stat_2365917222", "explicit.stat_80470845"),
-    ("explicit.stat_2365917222", "explicit.stat_2444534954"),
-    ("explicit.stat_2365917222", "explicit.stat_1699077932"),
-    ("explicit.stat_2365917222", "explicit.stat_2383304564"),
-    ("explicit.stat_2365917222", "explicit.stat_121436064"),
-    ("explicit.stat_2365917222", "explicit.stat_2312747856"),
-    ("explicit.stat_2365917222", "explicit.stat_3656959867"),
-    ("explicit.stat_2365917222", "explicit.stat_281949611"),
-    ("explicit.stat_3223142064", "explicit.stat_1567542124"),
-    ("explicit.stat_3223142064", "explicit.stat_2647344903"),
-    ("explicit.stat_3223142064", "explicit.stat_1165583295"),
-    ("explicit.stat_3223142064", "explicit.stat_371612541"),
-    ("explicit.stat_3223142064", "explicit.stat_2720072724"),
-    ("explicit.stat_3223142064", "explicit.stat_1919069577"),
-    ("explicit.stat_3223142064", "explicit.stat_3772841281"),
-    ("explicit.stat_3223142064", "explicit.stat_4245204226"),
-    ("explicit.stat_3223142064", "explicit.stat_2163419452"),
-    ("explicit.stat_3223142064", "explicit.stat_3111519953"),
-    ("explicit.stat_3223142064", "explicit.stat_2434030180"),
-    ("explicit.stat_3223142064", "explicit.stat_1653848515"),
-    ("explicit.stat_3223142064", "explicit.stat_2731416566"),
-    ("explicit.stat_3223142064", "explicit.stat_3234824465"),
-    ("explicit.stat_3223142064", "explicit.stat_3627458291"),
-    ("explicit.stat_3223142064", "explicit.stat_2091518682"),
-    ("explicit.stat_3223142064", "explicit.stat_214835567"),
-    ("explicit.stat_3223142064", "explicit.stat_362838683"),
-    ("explicit.stat_3223142064", "explicit.stat_2457540491"),
-    ("explicit.stat_3223142064", "explicit.stat_65331133"),
-    ("explicit.stat_3223142064", "explicit.stat_3337107517"),
-    ("explicit.stat_3223142064", "explicit.stat_3332055899"),
-    ("explicit.stat_3223142064", "explicit.stat_2548097895"),
-    ("explicit.stat_3223142064", "explicit.stat_1016185292"),
-    ("explicit.stat_3223142064", "explicit.stat_3624529132"),
-    ("explicit.stat_3223142064", "explicit.stat_380220671"),
-    ("explicit.stat_3223142064", "explicit.stat_2189467271"),
-    ("explicit.stat_3223142064", "explicit.stat_3953667743"),
-    ("explicit.stat_3223142064", "explicit.stat_1723738042"),
-    ("explicit.stat_3223142064", "explicit.stat_556659145"),
-    ("explicit.stat_3223142064", "explicit.stat_2690790844"),
-    ("explicit.stat_3223142064", "explicit.stat_80470845"),
-    ("explicit.stat_3223142064", "explicit.stat_2444534954"),
-    ("explicit.stat_3223142064", "explicit.stat_1699077932"),
-    ("explicit.stat_3223142064", "explicit.stat_2383304564"),
-    ("explicit.stat_3223142064", "explicit.stat_121436064"),
-    ("explicit.stat_3223142064", "explicit.stat_2312747856"),
-    ("explicit.stat_3223142064", "explicit.stat_3656959867"),
-    ("explicit.stat_3223142064", "explicit.stat_281949611"),
-    ("explicit.stat_1567542124", "explicit.stat_2647344903"),
-    ("explicit.stat_1567542124", "explicit.stat_1165583295"),
-    ("explicit.stat_1567542124", "explicit.stat_371612541"),
-    ("explicit.stat_1567542124", "explicit.stat_2720072724"),
-    ("explicit.stat_1567542124", "explicit.stat_1919069577"),
-    ("explicit.stat_1567542124", "explicit.stat_3772841281"),
-    ("explicit.stat_1567542124", "explicit.stat_4245204226"),
-    ("explicit.stat_1567542124", "explicit.stat_2163419452"),
-    ("explicit.stat_1567542124", "explicit.stat_3111519953"),
-    ("explicit.stat_1567542124", "explicit.stat_2434030180"),
-    ("explicit.stat_1567542124", "explicit.stat_1653848515"),
-    ("explicit.stat_1567542124", "explicit.stat_2731416566"),
-    ("explicit.stat_1567542124", "explicit.stat_3234824465"),
-    ("explicit.stat_1567542124", "explicit.stat_3627458291"),
-    ("explicit.stat_1567542124", "explicit.stat_2091518682"),
-    ("explicit.stat_1567542124", "explicit.stat_214835567"),
-    ("explicit.stat_1567542124", "explicit.stat_362838683"),
-    ("explicit.stat_1567542124", "explicit.stat_2457540491"),
-    ("explicit.stat_1567542124", "explicit.stat_65331133"),
-    ("explicit.stat_1567542124", "explicit.stat_3337107517"),
-    ("explicit.stat_1567542124", "explicit.stat_3332055899"),
-    ("explicit.stat_1567542124", "explicit.stat_2548097895"),
-    ("explicit.stat_1567542124", "explicit.stat_1016185292"),
-    ("explicit.stat_1567542124", "explicit.stat_3624529132"),
-    ("explicit.stat_1567542124", "explicit.stat_380220671"),
-    ("explicit.stat_1567542124", "explicit.stat_2189467271"),
-    ("explicit.stat_1567542124", "explicit.stat_3953667743"),
-    ("explicit.stat_1567542124", "explicit.stat_1723738042"),
-    ("explicit.stat_1567542124", "explicit.stat_556659145"),
-    ("explicit.stat_1567542124", "explicit.stat_2690790844"),
-    ("explicit.stat_1567542124", "explicit.stat_80470845"),
-    ("explicit.stat_1567542124", "explicit.stat_2444534954"),
-    ("explicit.stat_1567542124", "explicit.stat_1699077932"),
-    ("explicit.stat_1567542124", "explicit.stat_2383304564"),
-    ("explicit.stat_1567542124", "explicit.stat_121436064"),
-    ("explicit.stat_1567542124", "explicit.stat_2312747856"),
-    ("explicit.stat_1567542124", "explicit.stat_3656959867"),
-    ("explicit.stat_1567542124", "explicit.stat_281949611"),
-    ("explicit.stat_2647344903", "explicit.stat_1165583295"),
-    ("explicit.stat_2647344903", "explicit.stat_371612541"),
-    ("explicit.stat_2647344903", "explicit.stat_2720072724"),
-    ("explicit.stat_2647344903", "explicit.stat_1919069577"),
-    ("explicit.stat_2647344903", "explicit.stat_3772841281"),
-    ("explicit.stat_2647344903", "explicit.stat_4245204226"),
-    ("explicit.stat_2647344903", "explicit.stat_2163419452"),
-    ("explicit.stat_2647344903", "explicit.stat_3111519953"),
-    ("explicit.stat_2647344903", "explicit.stat_2434030180"),
-    ("explicit.stat_2647344903", "explicit.stat_1653848515"),
-    ("explicit.stat_2647344903", "explicit.stat_2731416566"),
-    ("explicit.stat_2647344903", "explicit.stat_3234824465"),
-    ("explicit.stat_2647344903", "explicit.stat_3627458291"),
-    ("explicit.stat_2647344903", "explicit.stat_2091518682"),
-    ("explicit.stat_2647344903", "explicit.stat_214835567"),
-    ("explicit.stat_2647344903", "explicit.stat_362838683"),
-    ("explicit.stat_2647344903", "explicit.stat_2457540491"),
-    ("explicit.stat_2647344903", "explicit.stat_65331133"),
-    ("explicit.stat_2647344903", "explicit.stat_3337107517"),
-    ("explicit.stat_2647344903", "explicit.stat_3332055899"),
-    ("explicit.stat_2647344903", "explicit.stat_2548097895"),
-    ("explicit.stat_2647344903", "explicit.stat_1016185292"),
-    ("explicit.stat_2647344903", "explicit.stat_3624529132"),
-    ("explicit.stat_2647344903", "explicit.stat_380220671"),
-    ("explicit.stat_2647344903", "explicit.stat_2189467271"),
-    ("explicit.stat_2647344903", "explicit.stat_3953667743"),
-    ("explicit.stat_2647344903", "explicit.stat_1723738042"),
-    ("explicit.stat_2647344903", "explicit.stat_556659145"),
-    ("explicit.stat_2647344903", "explicit.stat_2690790844"),
-    ("explicit.stat_2647344903", "explicit.stat_80470845"),
-    ("explicit.stat_2647344903", "explicit.stat_2444534954"),
-    ("explicit.stat_2647344903", "explicit.stat_1699077932"),
-    ("explicit.stat_2647344903", "explicit.stat_2383304564"),
-    ("explicit.stat_2647344903", "explicit.stat_121436064"),
-    ("explicit.stat_2647344903", "explicit.stat_2312747856"),
-    ("explicit.stat_2647344903", "explicit.stat_3656959867"),
-    ("explicit.stat_2647344903", "explicit.stat_281949611"),
-    ("explicit.stat_1165583295", "explicit.stat_371612541"),
-    ("explicit.stat_1165583295", "explicit.stat_2720072724"),
-    ("explicit.stat_1165583295", "explicit.stat_1919069577"),
-    ("explicit.stat_1165583295", "explicit.stat_3772841281"),
-    ("explicit.stat_1165583295", "explicit.stat_4245204226"),
-    ("explicit.stat_1165583295", "explicit.stat_2163419452"),
-    ("explicit.stat_1165583295", "explicit.stat_3111519953"),
-    ("explicit.stat_1165583295", "explicit.stat_2434030180"),
-    ("explicit.stat_1165583295", "explicit.stat_1653848515"),
-    ("explicit.stat_1165583295", "explicit.stat_2731416566"),
-    ("explicit.stat_1165583295", "explicit.stat_3234824465"),
-    ("explicit.stat_1165583295", "explicit.stat_3627458291"),
-    ("explicit.stat_1165583295", "explicit.stat_2091518682"),
-    ("explicit.stat_1165583295", "explicit.stat_214835567"),
-    ("explicit.stat_1165583295", "explicit.stat_362838683"),
-    ("explicit.stat_1165583295", "explicit.stat_2457540491"),
-    ("explicit.stat_1165583295", "explicit.stat_65331133"),
-    ("explicit.stat_1165583295", "explicit.stat_3337107517"),
-    ("explicit.stat_1165583295", "explicit.stat_3332055899"),
-    ("explicit.stat_1165583295", "explicit.stat_2548097895"),
-    ("explicit.stat_1165583295", "explicit.stat_1016185292"),
-    ("explicit.stat_1165583295", "explicit.stat_3624529132"),
-    ("explicit.stat_1165583295", "explicit.stat_380220671"),
-    ("explicit.stat_1165583295", "explicit.stat_2189467271"),
-    ("explicit.stat_1165583295", "explicit.stat_3953667743"),
-    ("explicit.stat_1165583295", "explicit.stat_1723738042"),
-    ("explicit.stat_1165583295", "explicit.stat_556659145"),
-    ("explicit.stat_1165583295", "explicit.stat_2690790844"),
-    ("explicit.stat_1165583295", "explicit.stat_80470845"),
-    ("explicit.stat_1165583295", "explicit.stat_2444534954"),
-    ("explicit.stat_1165583295", "explicit.stat_1699077932"),
-    ("explicit.stat_1165583295", "explicit.stat_2383304564"),
-    ("explicit.stat_1165583295", "explicit.stat_121436064"),
-    ("explicit.stat_1165583295", "explicit.stat_2312747856"),
-    ("explicit.stat_1165583295", "explicit.stat_3656959867"),
-    ("explicit.stat_1165583295", "explicit.stat_281949611"),
-    ("explicit.stat_371612541", "explicit.stat_2720072724"),
-    ("explicit.stat_371612541", "explicit.stat_1919069577"),
-    ("explicit.stat_371612541", "explicit.stat_3772841281"),
-    ("explicit.stat_371612541", "explicit.stat_4245204226"),
-    ("explicit.stat_371612541", "explicit.stat_2163419452"),
-    ("explicit.stat_371612541", "explicit.stat_3111519953"),
-    ("explicit.stat_371612541", "explicit.stat_2434030180"),
-    ("explicit.stat_371612541", "explicit.stat_1653848515"),
-    ("explicit.stat_371612541", "explicit.stat_2731416566"),
-    ("explicit.stat_371612541", "explicit.stat_3234824465"),
-    ("explicit.stat_371612541", "explicit.stat_3627458291"),
-    ("explicit.stat_371612541", "explicit.stat_2091518682"),
-    ("explicit.stat_371612541", "explicit.stat_214835567"),
-    ("explicit.stat_371612541", "explicit.stat_362838683"),
-    ("explicit.stat_371612541", "explicit.stat_2457540491"),
-    ("explicit.stat_371612541", "explicit.stat_65331133"),
-    ("explicit.stat_371612541", "explicit.stat_3337107517"),
-    ("explicit.stat_371612541", "explicit.stat_3332055899"),
-    ("explicit.stat_371612541", "explicit.stat_2548097895"),
-    ("explicit.stat_371612541", "explicit.stat_1016185292"),
-    ("explicit.stat_371612541", "explicit.stat_3624529132"),
-    ("explicit.stat_371612541", "explicit.stat_380220671"),
-    ("explicit.stat_371612541", "explicit.stat_2189467271"),
-    ("explicit.stat_371612541", "explicit.stat_3953667743"),
-    ("explicit.stat_371612541", "explicit.stat_1723738042"),
-    ("explicit.stat_371612541", "explicit.stat_556659145"),
-    ("explicit.stat_371612541", "explicit.stat_2690790844"),
-    ("explicit.stat_371612541", "explicit.stat_80470845"),
-    ("explicit.stat_371612541", "explicit.stat_2444534954"),
-    ("explicit.stat_371612541", "explicit.stat_1699077932"),
-    ("explicit.stat_371612541", "explicit.stat_2383304564"),
-    ("explicit.stat_371612541", "explicit.stat_121436064"),
-    ("explicit.stat_371612541", "explicit.stat_2312747856"),
-    ("explicit.stat_371612541", "explicit.stat_3656959867"),
-    ("explicit.stat_371612541", "explicit.stat_281949611"),
-    ("explicit.stat_2720072724", "explicit.stat_1919069577"),
-    ("explicit.stat_2720072724", "explicit.stat_3772841281"),
-    ("explicit.stat_2720072724", "explicit.stat_4245204226"),
-    ("explicit.stat_2720072724", "explicit.stat_2163419452"),
-    ("explicit.stat_2720072724", "explicit.stat_3111519953"),
-    ("explicit.stat_2720072724", "explicit.stat_2434030180"),
-    ("explicit.stat_2720072724", "explicit.stat_1653848515"),
-    ("explicit.stat_2720072724", "explicit.stat_2731416566"),
-    ("explicit.stat_2720072724", "explicit.stat_3234824465"),
-    ("explicit.stat_2720072724", "explicit.stat_3627458291"),
-    ("explicit.stat_2720072724", "explicit.stat_2091518682"),
-    ("explicit.stat_2720072724", "explicit.stat_214835567"),
-    ("explicit.stat_2720072724", "explicit.stat_362838683"),
-    ("explicit.stat_2720072724", "explicit.stat_2457540491"),
-    ("explicit.stat_2720072724", "explicit.stat_65331133"),
-    ("explicit.stat_2720072724", "explicit.stat_3337107517"),
-    ("explicit.stat_2720072724", "explicit.stat_3332055899"),
-    ("explicit.stat_2720072724", "explicit.stat_2548097895"),
-    ("explicit.stat_2720072724", "explicit.stat_1016185292"),
-    ("explicit.stat_2720072724", "explicit.stat_3624529132"),
-    ("explicit.stat_2720072724", "explicit.stat_380220671"),
-    ("explicit.stat_2720072724", "explicit.stat_2189467271"),
-    ("explicit.stat_2720072724", "explicit.stat_3953667743"),
-    ("explicit.stat_2720072724", "explicit.stat_1723738042"),
-    ("explicit.stat_2720072724", "explicit.stat_556659145"),
-    ("explicit.stat_2720072724", "explicit.stat_2690790844"),
-    ("explicit.stat_2720072724", "explicit.stat_80470845"),
-    ("explicit.stat_2720072724", "explicit.stat_2444534954"),
-    ("explicit.stat_2720072724", "explicit.stat_1699077932"),
-    ("explicit.stat_2720072724", "explicit.stat_2383304564"),
-    ("explicit.stat_2720072724", "explicit.stat_121436064"),
-    ("explicit.stat_2720072724", "explicit.stat_2312747856"),
-    ("explicit.stat_2720072724", "explicit.stat_3656959867"),
-    ("explicit.stat_2720072724", "explicit.stat_281949611"),
-    ("explicit.stat_1919069577", "explicit.stat_3772841281"),
-    ("explicit.stat_1919069577", "explicit.stat_4245204226"),
-    ("explicit.stat_1919069577", "explicit.stat_2163419452"),
-    ("explicit.stat_1919069577", "explicit.stat_3111519953"),
-    ("explicit.stat_1919069577", "explicit.stat_2434030180"),
-    ("explicit.stat_1919069577", "explicit.stat_1653848515"),
-    ("explicit.stat_1919069577", "explicit.stat_2731416566"),
-    ("explicit.stat_1919069577", "explicit.stat_3234824465"),
-    ("explicit.stat_1919069577", "explicit.stat_3627458291"),
-    ("explicit.stat_1919069577", "explicit.stat_2091518682"),
-    ("explicit.stat_1919069577", "explicit.stat_214835567"),
-    ("explicit.stat_1919069577", "explicit.stat_362838683"),
-    ("explicit.stat_1919069577", "explicit.stat_2457540491"),
-    ("explicit.stat_1919069577", "explicit.stat_65331133"),
-    ("explicit.stat_1919069577", "explicit.stat_3337107517"),
-    ("explicit.stat_1919069577", "explicit.stat_3332055899"),
-    ("explicit.stat_1919069577", "explicit.stat_2548097895"),
-    ("explicit.stat_1919069577", "explicit.stat_1016185292"),
-    ("explicit.stat_1919069577", "explicit.stat_3624529132"),
-    ("explicit.stat_1919069577", "explicit.stat_380220671"),
-    ("explicit.stat_1919069577", "explicit.stat_2189467271"),
-    ("explicit.stat_1919069577", "explicit.stat_3953667743"),
-    ("explicit.stat_1919069577", "explicit.stat_1723738042"),
-    ("explicit.stat_1919069577", "explicit.stat_556659145"),
-    ("explicit.stat_1919069577", "explicit.stat_2690790844"),
-    ("explicit.stat_1919069577", "explicit.stat_80470845"),
-    ("explicit.stat_1919069577", "explicit.stat_2444534954"),
-    ("explicit.stat_1919069577", "explicit.stat_1699077932"),
-    ("explicit.stat_1919069577", "explicit.stat_2383304564"),
-    ("explicit.stat_1919069577", "explicit.stat_121436064"),
-    ("explicit.stat_1919069577", "explicit.stat_2312747856"),
-    ("explicit.stat_1919069577", "explicit.stat_3656959867"),
-    ("explicit.stat_1919069577", "explicit.stat_281949611"),
-    ("explicit.stat_3772841281", "explicit.stat_4245204226"),
-    ("explicit.stat_3772841281", "explicit.stat_2163419452"),
-    ("explicit.stat_3772841281", "explicit.stat_3111519953"),
-    ("explicit.stat_3772841281", "explicit.stat_2434030180"),
-    ("explicit.stat_3772841281", "explicit.stat_1653848515"),
-    ("explicit.stat_3772841281", "explicit.stat_2731416566"),
-    ("explicit.stat_3772841281", "explicit.stat_3234824465"),
-    ("explicit.stat_3772841281", "explicit.stat_3627458291"),
-    ("explicit.stat_3772841281", "explicit.stat_2091518682"),
-    ("explicit.stat_3772841281", "explicit.stat_214835567"),
-    ("explicit.stat_3772841281", "explicit.stat_362838683"),
-    ("explicit.stat_3772841281", "explicit.stat_2457540491"),
-    ("explicit.stat_3772841281", "explicit.stat_65331133"),
-    ("explicit.stat_3772841281", "explicit.stat_3337107517"),
-    ("explicit.stat_3772841281", "explicit.stat_3332055899"),
-    ("explicit.stat_3772841281", "explicit.stat_2548097895"),
-    ("explicit.stat_3772841281", "explicit.stat_1016185292"),
-    ("explicit.stat_3772841281", "explicit.stat_3624529132"),
-    ("explicit.stat_3772841281", "explicit.stat_380220671"),
-    ("explicit.stat_3772841281", "explicit.stat_2189467271"),
-    ("explicit.stat_3772841281", "explicit.stat_3953667743"),
-    ("explicit.stat_3772841281", "explicit.stat_1723738042"),
-    ("explicit.stat_3772841281", "explicit.stat_556659145"),
-    ("explicit.stat_3772841281", "explicit.stat_2690790844"),
-    ("explicit.stat_3772841281", "explicit.stat_80470845"),
-    ("explicit.stat_3772841281", "explicit.stat_2444534954"),
-    ("explicit.stat_3772841281", "explicit.stat_1699077932"),
-    ("explicit.stat_3772841281", "explicit.stat_2383304564"),
-    ("explicit.stat_3772841281", "explicit.stat_121436064"),
-    ("explicit.stat_3772841281", "explicit.stat_2312747856"),
-    ("explicit.stat_3772841281", "explicit.stat_3656959867"),
-    ("explicit.stat_3772841281", "explicit.stat_281949611"),
-    ("explicit.stat_4245204226", "explicit.stat_2163419452"),
-    ("explicit.stat_4245204226", "explicit.stat_3111519953"),
-    ("explicit.stat_4245204226", "explicit.stat_2434030180"),
-    ("explicit.stat_4245204226", "explicit.stat_1653848515"),
-    ("explicit.stat_4245204226", "explicit.stat_2731416566"),
-    ("explicit.stat_4245204226", "explicit.stat_3234824465"),
-    ("explicit.stat_4245204226", "explicit.stat_3627458291"),
-    ("explicit.stat_4245204226", "explicit.stat_2091518682"),
-    ("explicit.stat_4245204226", "explicit.stat_214835567"),
-    ("explicit.stat_4245204226", "explicit.stat_362838683"),
-    ("explicit.stat_4245204226", "explicit.stat_2457540491"),
-    ("explicit.stat_4245204226", "explicit.stat_65331133"),
-    ("explicit.stat_4245204226", "explicit.stat_3337107517"),
-    ("explicit.stat_4245204226", "explicit.stat_3332055899"),
-    ("explicit.stat_4245204226", "explicit.stat_2548097895"),
-    ("explicit.stat_4245204226", "explicit.stat_1016185292"),
-    ("explicit.stat_4245204226", "explicit.stat_3624529132"),
-    ("explicit.stat_4245204226", "explicit.stat_380220671"),
-    ("explicit.stat_4245204226", "explicit.stat_2189467271"),
-    ("explicit.stat_4245204226", "explicit.stat_3953667743"),
-    ("explicit.stat_4245204226", "explicit.stat_1723738042"),
-    ("explicit.stat_4245204226", "explicit.stat_556659145"),
-    ("explicit.stat_4245204226", "explicit.stat_2690790844"),
-    ("explicit.stat_4245204226", "explicit.stat_80470845"),
-    ("explicit.stat_4245204226", "explicit.stat_2444534954"),
-    ("explicit.stat_4245204226", "explicit.stat_1699077932"),
-    ("explicit.stat_4245204226", "explicit.stat_2383304564"),
-    ("explicit.stat_4245204226", "explicit.stat_121436064"),
-    ("explicit.stat_4245204226", "explicit.stat_2312747856"),
-    ("explicit.stat_4245204226", "explicit.stat_3656959867"),
-    ("explicit.stat_4245204226", "explicit.stat_281949611"),
-    ("explicit.stat_2163419452", "explicit.stat_3111519953"),
-    ("explicit.stat_2163419452", "explicit.stat_2434030180"),
-    ("explicit.stat_2163419452", "explicit.stat_1653848515"),
-    ("explicit.stat_2163419452", "explicit.stat_2731416566"),
-    ("explicit.stat_2163419452", "explicit.stat_3234824465"),
-    ("explicit.stat_2163419452", "explicit.stat_3627458291"),
-    ("explicit.stat_2163419452", "explicit.stat_2091518682"),
-    ("explicit.stat_2163419452", "explicit.stat_214835567"),
-    ("explicit.stat_2163419452", "explicit.stat_362838683"),
-    ("explicit.stat_2163419452", "explicit.stat_2457540491"),
-    ("explicit.stat_2163419452", "explicit.stat_65331133"),
-    ("explicit.stat_2163419452", "explicit.stat_3337107517"),
-    ("explicit.stat_2163419452", "explicit.stat_3332055899"),
-    ("explicit.stat_2163419452", "explicit.stat_2548097895"),
-    ("explicit.stat_2163419452", "explicit.stat_1016185292"),
-    ("explicit.stat_2163419452", "explicit.stat_3624529132"),
-    ("explicit.stat_2163419452", "explicit.stat_380220671"),
-    ("explicit.stat_2163419452", "explicit.stat_2189467271"),
-    ("explicit.stat_2163419452", "explicit.stat_3953667743"),
-    ("explicit.stat_2163419452", "explicit.stat_1723738042"),
-    ("explicit.stat_2163419452", "explicit.stat_556659145"),
-    ("explicit.stat_2163419452", "explicit.stat_2690790844"),
-    ("explicit.stat_2163419452", "explicit.stat_80470845"),
-    ("explicit.stat_2163419452", "explicit.stat_2444534954"),
-    ("explicit.stat_2163419452", "explicit.stat_1699077932"),
-    ("explicit.stat_2163419452", "explicit.stat_2383304564"),
-    ("explicit.stat_2163419452", "explicit.stat_121436064"),
-    ("explicit.stat_2163419452", "explicit.stat_2312747856"),
-    ("explicit.stat_2163419452", "explicit.stat_3656959867"),
-    ("explicit.stat_2163419452", "explicit.stat_281949611"),
-    ("explicit.stat_3111519953", "explicit.stat_2434030180"),
-    ("explicit.stat_3111519953", "explicit.stat_1653848515"),
-    ("explicit.stat_3111519953", "explicit.stat_2731416566"),
-    ("explicit.stat_3111519953", "explicit.stat_3234824465"),
-    ("explicit.stat_3111519953", "explicit.stat_3627458291"),
-    ("explicit.stat_3111519953", "explicit.stat_2091518682"),
-    ("explicit.stat_3111519953", "explicit.stat_214835567"),
-    ("explicit.stat_3111519953", "explicit.stat_362838683"),
-    ("explicit.stat_3111519953", "explicit.stat_2457540491"),
-    ("explicit.stat_3111519953", "explicit.stat_65331133"),
-    ("explicit.stat_3111519953", "explicit.stat_3337107517"),
-    ("explicit.stat_3111519953", "explicit.stat_3332055899"),
-    ("explicit.stat_3111519953", "explicit.stat_2548097895"),
-    ("explicit.stat_3111519953", "explicit.stat_1016185292"),
-    ("explicit.stat_3111519953", "explicit.stat_3624529132"),
-    ("explicit.stat_3111519953", "explicit.stat_380220671"),
-    ("explicit.stat_3111519953", "explicit.stat_2189467271"),
-    ("explicit.stat_3111519953", "explicit.stat_3953667743"),
-    ("explicit.stat_3111519953", "explicit.stat_1723738042"),
-    ("explicit.stat_3111519953", "explicit.stat_556659145"),
-    ("explicit.stat_3111519953", "explicit.stat_2690790844"),
-    ("explicit.stat_3111519953", "explicit.stat_80470845"),
-    ("explicit.stat_3111519953", "explicit.stat_2444534954"),
-    ("explicit.stat_3111519953", "explicit.stat_1699077932"),
-    ("explicit.stat_3111519953", "explicit.stat_2383304564"),
-    ("explicit.stat_3111519953", "explicit.stat_121436064"),
-    ("explicit.stat_3111519953", "explicit.stat_2312747856"),
-    ("explicit.stat_3111519953", "explicit.stat_3656959867"),
-    ("explicit.stat_3111519953", "explicit.stat_281949611"),
-    ("explicit.stat_2434030180", "explicit.stat_1653848515"),
-    ("explicit.stat_2434030180", "explicit.stat_2731416566"),
-    ("explicit.stat_2434030180", "explicit.stat_3234824465"),
-    ("explicit.stat_2434030180", "explicit.stat_3627458291"),
-    ("explicit.stat_2434030180", "explicit.stat_2091518682"),
-    ("explicit.stat_2434030180", "explicit.stat_214835567"),
-    ("explicit.stat_2434030180", "explicit.stat_362838683"),
-    ("explicit.stat_2434030180", "explicit.stat_2457540491"),
-    ("explicit.stat_2434030180", "explicit.stat_65331133"),
-    ("explicit.stat_2434030180", "explicit.stat_3337107517"),
-    ("explicit.stat_2434030180", "explicit.stat_3332055899"),
-    ("explicit.stat_2434030180", "explicit.stat_2548097895"),
-    ("explicit.stat_2434030180", "explicit.stat_1016185292"),
-    ("explicit.stat_2434030180", "explicit.stat_3624529132"),
-    ("explicit.stat_2434030180", "explicit.stat_380220671"),
-    ("explicit.stat_2434030180", "explicit.stat_2189467271"),
-    ("explicit.stat_2434030180", "explicit.stat_3953667743"),
-    ("explicit.stat_2434030180", "explicit.stat_1723738042"),
-    ("explicit.stat_2434030180", "explicit.stat_556659145"),
-    ("explicit.stat_2434030180", "explicit.stat_2690790844"),
-    ("explicit.stat_2434030180", "explicit.stat_80470845"),
-    ("explicit.stat_2434030180", "explicit.stat_2444534954"),
-    ("explicit.stat_2434030180", "explicit.stat_1699077932"),
-    ("explicit.stat_2434030180", "explicit.stat_2383304564"),
-    ("explicit.stat_2434030180", "explicit.stat_121436064"),
-    ("explicit.stat_2434030180", "explicit.stat_2312747856"),
-    ("explicit.stat_2434030180", "explicit.stat_3656959867"),
-    ("explicit.stat_2434030180", "explicit.stat_281949611"),
-    ("explicit.stat_1653848515", "explicit.stat_2731416566"),
-    ("explicit.stat_1653848515", "explicit.stat_3234824465"),
-    ("explicit.stat_1653848515", "explicit.stat_3627458291"),
-    ("explicit.stat_1653848515", "explicit.stat_2091518682"),
-    ("explicit.stat_1653848515", "explicit.stat_214835567"),
-    ("explicit.stat_1653848515", "explicit.stat_362838683"),
-    ("explicit.stat_1653848515", "explicit.stat_2457540491"),
-    ("explicit.stat_1653848515", "explicit.stat_65331133"),
-    ("explicit.stat_1653848515", "explicit.stat_3337107517"),
-    ("explicit.stat_1653848515", "explicit.stat_3332055899"),
-    ("explicit.stat_1653848515", "explicit.stat_2548097895"),
-    ("explicit.stat_1653848515", "explicit.stat_1016185292"),
-    ("explicit.stat_1653848515", "explicit.stat_3624529132"),
-    ("explicit.stat_1653848515", "explicit.stat_380220671"),
-    ("explicit.stat_1653848515", "explicit.stat_2189467271"),
-    ("explicit.stat_1653848515", "explicit.stat_3953667743"),
-    ("explicit.stat_1653848515", "explicit.stat_1723738042"),
-    ("explicit.stat_1653848515", "explicit.stat_556659145"),
-    ("explicit.stat_1653848515", "explicit.stat_2690790844"),
-    ("explicit.stat_1653848515", "explicit.stat_80470845"),
-    ("explicit.stat_1653848515", "explicit.stat_2444534954"),
-    ("explicit.stat_1653848515", "explicit.stat_1699077932"),
-    ("explicit.stat_1653848515", "explicit.stat_2383304564"),
-    ("explicit.stat_1653848515", "explicit.stat_121436064"),
-    ("explicit.stat_1653848515", "explicit.stat_2312747856"),
-    ("explicit.stat_1653848515", "explicit.stat_3656959867"),
-    ("explicit.stat_1653848515", "explicit.stat_281949611"),
-    ("explicit.stat_2731416566", "explicit.stat_3234824465"),
-    ("explicit.stat_2731416566", "explicit.stat_3627458291"),
-    ("explicit.stat_2731416566", "explicit.stat_2091518682"),
-    ("explicit.stat_2731416566", "explicit.stat_214835567"),
-    ("explicit.stat_2731416566", "explicit.stat_362838683"),
-    ("explicit.stat_2731416566", "explicit.stat_2457540491"),
-    ("explicit.stat_2731416566", "explicit.stat_65331133"),
-    ("explicit.stat_2731416566", "explicit.stat_3337107517"),
-    ("explicit.stat_2731416566", "explicit.stat_3332055899"),
-    ("explicit.stat_2731416566", "explicit.stat_2548097895"),
-    ("explicit.stat_2731416566", "explicit.stat_1016185292"),
-    ("explicit.stat_2731416566", "explicit.stat_3624529132"),
-    ("explicit.stat_2731416566", "explicit.stat_380220671"),
-    ("explicit.stat_2731416566", "explicit.stat_2189467271"),
-    ("explicit.stat_2731416566", "explicit.stat_3953667743"),
-    ("explicit.stat_2731416566", "explicit.stat_1723738042"),
-    ("explicit.stat_2731416566", "explicit.stat_556659145"),
-    ("explicit.stat_2731416566", "explicit.stat_2690790844"),
-    ("explicit.stat_2731416566", "explicit.stat_80470845"),
-    ("explicit.stat_2731416566", "explicit.stat_2444534954"),
-    ("explicit.stat_2731416566", "explicit.stat_1699077932"),
-    ("explicit.stat_2731416566", "explicit.stat_2383304564"),
-    ("explicit.stat_2731416566", "explicit.stat_121436064"),
-    ("explicit.stat_2731416566", "explicit.stat_2312747856"),
-    ("explicit.stat_2731416566", "explicit.stat_3656959867"),
-    ("explicit.stat_2731416566", "explicit.stat_281949611"),
-    ("explicit.stat_3234824465", "explicit.stat_3627458291"),
-    ("explicit.stat_3234824465", "explicit.stat_2091518682"),
-    ("explicit.stat_3234824465", "explicit.stat_214835567"),
-    ("explicit.stat_3234824465", "explicit.stat_362838683"),
-    ("explicit.stat_3234824465", "explicit.stat_2457540491"),
-    ("explicit.stat_3234824465", "explicit.stat_65331133"),
-    ("explicit.stat_3234824465", "explicit.stat_3337107517"),
-    ("explicit.stat_3234824465", "explicit.stat_3332055899"),
-    ("explicit.stat_3234824465", "explicit.stat_2548097895"),
-    ("explicit.stat_3234824465", "explicit.stat_1016185292"),
-    ("explicit.stat_3234824465", "explicit.stat_3624529132"),
-    ("explicit.stat_3234824465", "explicit.stat_380220671"),
-    ("explicit.stat_3234824465", "explicit.stat_2189467271"),
-    ("explicit.stat_3234824465", "explicit.stat_3953667743"),
-    ("explicit.stat_3234824465", "explicit.stat_1723738042"),
-    ("explicit.stat_3234824465", "explicit.stat_556659145"),
-    ("explicit.stat_3234824465", "explicit.stat_2690790844"),
-    ("explicit.stat_3234824465", "explicit.stat_80470845"),
-    ("explicit.stat_3234824465", "explicit.stat_2444534954"),
-    ("explicit.stat_3234824465", "explicit.stat_1699077932"),
-    ("explicit.stat_3234824465", "explicit.stat_2383304564"),
-    ("explicit.stat_3234824465", "explicit.stat_121436064"),
-    ("explicit.stat_3234824465", "explicit.stat_2312747856"),
-    ("explicit.stat_3234824465", "explicit.stat_3656959867"),
-    ("explicit.stat_3234824465", "explicit.stat_281949611"),
-    ("explicit.stat_3627458291", "explicit.stat_2091518682"),
-    ("explicit.stat_3627458291", "explicit.stat_214835567"),
-    ("explicit.stat_3627458291", "explicit.stat_362838683"),
-    ("explicit.stat_3627458291", "explicit.stat_2457540491"),
-    ("explicit.stat_3627458291", "explicit.stat_65331133"),
-    ("explicit.stat_3627458291", "explicit.stat_3337107517"),
-    ("explicit.stat_3627458291", "explicit.stat_3332055899"),
-    ("explicit.stat_3627458291", "explicit.stat_2548097895"),
-    ("explicit.stat_3627458291", "explicit.stat_1016185292"),
-    ("explicit.stat_3627458291", "explicit.stat_3624529132"),
-    ("explicit.stat_3627458291", "explicit.stat_380220671"),
-    ("explicit.stat_3627458291", "explicit.stat_2189467271"),
-    ("explicit.stat_3627458291", "explicit.stat_3953667743"),
-    ("explicit.stat_3627458291", "explicit.stat_1723738042"),
-    ("explicit.stat_3627458291", "explicit.stat_556659145"),
-    ("explicit.stat_3627458291", "explicit.stat_2690790844"),
-    ("explicit.stat_3627458291", "explicit.stat_80470845"),
-    ("explicit.stat_3627458291", "explicit.stat_2444534954"),
-    ("explicit.stat_3627458291", "explicit.stat_1699077932"),
-    ("explicit.stat_3627458291", "explicit.stat_2383304564"),
-    ("explicit.stat_3627458291", "explicit.stat_121436064"),
-    ("explicit.stat_3627458291", "explicit.stat_2312747856"),
-    ("explicit.stat_3627458291", "explicit.stat_3656959867"),
-    ("explicit.stat_3627458291", "explicit.stat_281949611"),
-    ("explicit.stat_2091518682", "explicit.stat_214835567"),
-    ("explicit.stat_2091518682", "explicit.stat_362838683"),
-    ("explicit.stat_2091518682", "explicit.stat_2457540491"),
-    ("explicit.stat_2091518682", "explicit.stat_65331133"),
-    ("explicit.stat_2091518682", "explicit.stat_3337107517"),
-    ("explicit.stat_2091518682", "explicit.stat_3332055899"),
-    ("explicit.stat_2091518682", "explicit.stat_2548097895"),
-    ("explicit.stat_2091518682", "explicit.stat_1016185292"),
-    ("explicit.stat_2091518682", "explicit.stat_3624529132"),
-    ("explicit.stat_2091518682", "explicit.stat_380220671"),
-    ("explicit.stat_2091518682", "explicit.stat_2189467271"),
-    ("explicit.stat_2091518682", "explicit.stat_3953667743"),
-    ("explicit.stat_2091518682", "explicit.stat_1723738042"),
-    ("explicit.stat_2091518682", "explicit.stat_556659145"),
-    ("explicit.stat_2091518682", "explicit.stat_2690790844"),
-    ("explicit.stat_2091518682", "explicit.stat_80470845"),
-    ("explicit.stat_2091518682", "explicit.stat_2444534954"),
-    ("explicit.stat_2091518682", "explicit.stat_1699077932"),
-    ("explicit.stat_2091518682", "explicit.stat_2383304564"),
-    ("explicit.stat_2091518682", "explicit.stat_121436064"),
-    ("explicit.stat_2091518682", "explicit.stat_2312747856"),
-    ("explicit.stat_2091518682", "explicit.stat_3656959867"),
-    ("explicit.stat_2091518682", "explicit.stat_281949611"),
-    ("explicit.stat_214835567", "explicit.stat_362838683"),
-    ("explicit.stat_214835567", "explicit.stat_2457540491"),
-    ("explicit.stat_214835567", "explicit.stat_65331133"),
-    ("explicit.stat_214835567", "explicit.stat_3337107517"),
-    ("explicit.stat_214835567", "explicit.stat_3332055899"),
-    ("explicit.stat_214835567", "explicit.stat_2548097895"),
-    ("explicit.stat_214835567", "explicit.stat_1016185292"),
-    ("explicit.stat_214835567", "explicit.stat_3624529132"),
-    ("explicit.stat_214835567", "explicit.stat_380220671"),
-    ("explicit.stat_214835567", "explicit.stat_2189467271"),
-    ("explicit.stat_214835567", "explicit.stat_3953667743"),
-    ("explicit.stat_214835567", "explicit.stat_1723738042"),
-    ("explicit.stat_214835567", "explicit.stat_556659145"),
-    ("explicit.stat_214835567", "explicit.stat_2690790844"),
-    ("explicit.stat_214835567", "explicit.stat_80470845"),
-    ("explicit.stat_214835567", "explicit.stat_2444534954"),
-    ("explicit.stat_214835567", "explicit.stat_1699077932"),
-    ("explicit.stat_214835567", "explicit.stat_2383304564"),
-    ("explicit.stat_214835567", "explicit.stat_121436064"),
-    ("explicit.stat_214835567", "explicit.stat_2312747856"),
-    ("explicit.stat_214835567", "explicit.stat_3656959867"),
-    ("explicit.stat_214835567", "explicit.stat_281949611"),
-    ("explicit.stat_362838683", "explicit.stat_2457540491"),
-    ("explicit.stat_362838683", "explicit.stat_65331133"),
-    ("explicit.stat_362838683", "explicit.stat_3337107517"),
-    ("explicit.stat_362838683", "explicit.stat_3332055899"),
-    ("explicit.stat_362838683", "explicit.stat_2548097895"),
-    ("explicit.stat_362838683", "explicit.stat_1016185292"),
-    ("explicit.stat_362838683", "explicit.stat_3624529132"),
-    ("explicit.stat_362838683", "explicit.stat_380220671"),
-    ("explicit.stat_362838683", "explicit.stat_2189467271"),
-    ("explicit.stat_362838683", "explicit.stat_3953667743"),
-    ("explicit.stat_362838683", "explicit.stat_1723738042"),
-    ("explicit.stat_362838683", "explicit.stat_556659145"),
-    ("explicit.stat_362838683", "explicit.stat_2690790844"),
-    ("explicit.stat_362838683", "explicit.stat_80470845"),
-    ("explicit.stat_362838683", "explicit.stat_2444534954"),
-    ("explicit.stat_362838683", "explicit.stat_1699077932"),
-    ("explicit.stat_362838683", "explicit.stat_2383304564"),
-    ("explicit.stat_362838683", "explicit.stat_121436064"),
-    ("explicit.stat_362838683", "explicit.stat_2312747856"),
-    ("explicit.stat_362838683", "explicit.stat_3656959867"),
-    ("explicit.stat_362838683", "explicit.stat_281949611"),
-    ("explicit.stat_2457540491", "explicit.stat_65331133"),
-    ("explicit.stat_2457540491", "explicit.stat_3337107517"),
-    ("explicit.stat_2457540491", "explicit.stat_3332055899"),
-    ("explicit.stat_2457540491", "explicit.stat_2548097895"),
-    ("explicit.stat_2457540491", "explicit.stat_1016185292"),
-    ("explicit.stat_2457540491", "explicit.stat_3624529132"),
-    ("explicit.stat_2457540491", "explicit.stat_380220671"),
-    ("explicit.stat_2457540491", "explicit.stat_2189467271"),
-    ("explicit.stat_2457540491", "explicit.stat_3953667743"),
-    ("explicit.stat_2457540491", "explicit.stat_1723738042"),
-    ("explicit.stat_2457540491", "explicit.stat_556659145"),
-    ("explicit.stat_2457540491", "explicit.stat_2690790844"),
-    ("explicit.stat_2457540491", "explicit.stat_80470845"),
-    ("explicit.stat_2457540491", "explicit.stat_2444534954"),
-    ("explicit.stat_2457540491", "explicit.stat_1699077932"),
-    ("explicit.stat_2457540491", "explicit.stat_2383304564"),
-    ("explicit.stat_2457540491", "explicit.stat_121436064"),
-    ("explicit.stat_2457540491", "explicit.stat_2312747856"),
-    ("explicit.stat_2457540491", "explicit.stat_3656959867"),
-    ("explicit.stat_2457540491", "explicit.stat_281949611"),
-    ("explicit.stat_65331133", "explicit.stat_3337107517"),
-    ("explicit.stat_65331133", "explicit.stat_3332055899"),
-    ("explicit.stat_65331133", "explicit.stat_2548097895"),
-    ("explicit.stat_65331133", "explicit.stat_1016185292"),
-    ("explicit.stat_65331133", "explicit.stat_3624529132"),
-    ("explicit.stat_65331133", "explicit.stat_380220671"),
-    ("explicit.stat_65331133", "explicit.stat_2189467271"),
-    ("explicit.stat_65331133", "explicit.stat_3953667743"),
-    ("explicit.stat_65331133", "explicit.stat_1723738042"),
-    ("explicit.stat_65331133", "explicit.stat_556659145"),
-    ("explicit.stat_65331133", "explicit.stat_2690790844"),
-    ("explicit.stat_65331133", "explicit.stat_80470845"),
-    ("explicit.stat_65331133", "explicit.stat_2444534954"),
-    ("explicit.stat_65331133", "explicit.stat_1699077932"),
-    ("explicit.stat_65331133", "explicit.stat_2383304564"),
-    ("explicit.stat_65331133", "explicit.stat_121436064"),
-    ("explicit.stat_65331133", "explicit.stat_2312747856"),
-    ("explicit.stat_65331133", "explicit.stat_3656959867"),
-    ("explicit.stat_65331133", "explicit.stat_281949611"),
-    ("explicit.stat_3337107517", "explicit.stat_3332055899"),
-    ("explicit.stat_3337107517", "explicit.stat_2548097895"),
-    ("explicit.stat_3337107517", "explicit.stat_1016185292"),
-    ("explicit.stat_3337107517", "explicit.stat_3624529132"),
-    ("explicit.stat_3337107517", "explicit.stat_380220671"),
-    ("explicit.stat_3337107517", "explicit.stat_2189467271"),
-    ("explicit.stat_3337107517", "explicit.stat_3953667743"),
-    ("explicit.stat_3337107517", "explicit.stat_1723738042"),
-    ("explicit.stat_3337107517", "explicit.stat_556659145"),
-    ("explicit.stat_3337107517", "explicit.stat_2690790844"),
-    ("explicit.stat_3337107517", "explicit.stat_80470845"),
-    ("explicit.stat_3337107517", "explicit.stat_2444534954"),
-    ("explicit.stat_3337107517", "explicit.stat_1699077932"),
-    ("explicit.stat_3337107517", "explicit.stat_2383304564"),
-    ("explicit.stat_3337107517", "explicit.stat_121436064"),
-    ("explicit.stat_3337107517", "explicit.stat_2312747856"),
-    ("explicit.stat_3337107517", "explicit.stat_3656959867"),
-    ("explicit.stat_3337107517", "explicit.stat_281949611"),
-    ("explicit.stat_3332055899", "explicit.stat_2548097895"),
-    ("explicit.stat_3332055899", "explicit.stat_1016185292"),
-    ("explicit.stat_3332055899", "explicit.stat_3624529132"),
-    ("explicit.stat_3332055899", "explicit.stat_380220671"),
-    ("explicit.stat_3332055899", "explicit.stat_2189467271"),
-    ("explicit.stat_3332055899", "explicit.stat_3953667743"),
-    ("explicit.stat_3332055899", "explicit.stat_1723738042"),
-    ("explicit.stat_3332055899", "explicit.stat_556659145"),
-    ("explicit.stat_3332055899", "explicit.stat_2690790844"),
-    ("explicit.stat_3332055899", "explicit.stat_80470845"),
-    ("explicit.stat_3332055899", "explicit.stat_2444534954"),
-    ("explicit.stat_3332055899", "explicit.stat_1699077932"),
-    ("explicit.stat_3332055899", "explicit.stat_2383304564"),
-    ("explicit.stat_3332055899", "explicit.stat_121436064"),
-    ("explicit.stat_3332055899", "explicit.stat_2312747856"),
-    ("explicit.stat_3332055899", "explicit.stat_3656959867"),
-    ("explicit.stat_3332055899", "explicit.stat_281949611"),
-    ("explicit.stat_2548097895", "explicit.stat_1016185292"),
-    ("explicit.stat_2548097895", "explicit.stat_3624529132"),
-    ("explicit.stat_2548097895", "explicit.stat_380220671"),
-    ("explicit.stat_2548097895", "explicit.stat_2189467271"),
-    ("explicit.stat_2548097895", "explicit.stat_3953667743"),
-    ("explicit.stat_2548097895", "explicit.stat_1723738042"),
-    ("explicit.stat_2548097895", "explicit.stat_556659145"),
-    ("explicit.stat_2548097895", "explicit.stat_2690790844"),
-    ("explicit.stat_2548097895", "explicit.stat_80470845"),
-    ("explicit.stat_2548097895", "explicit.stat_2444534954"),
-    ("explicit.stat_2548097895", "explicit.stat_1699077932"),
-    ("explicit.stat_2548097895", "explicit.stat_2383304564"),
-    ("explicit.stat_2548097895", "explicit.stat_121436064"),
-    ("explicit.stat_2548097895", "explicit.stat_2312747856"),
-    ("explicit.stat_2548097895", "explicit.stat_3656959867"),
-    ("explicit.stat_2548097895", "explicit.stat_281949611"),
-    ("explicit.stat_1016185292", "explicit.stat_3624529132"),
-    ("explicit.stat_1016185292", "explicit.stat_380220671"),
-    ("explicit.stat_1016185292", "explicit.stat_2189467271"),
-    ("explicit.stat_1016185292", "explicit.stat_3953667743"),
-    ("explicit.stat_1016185292", "explicit.stat_1723738042"),
-    ("explicit.stat_1016185292", "explicit.stat_556659145"),
-    ("explicit.stat_1016185292", "explicit.stat_2690790844"),
-    ("explicit.stat_1016185292", "explicit.stat_80470845"),
-    ("explicit.stat_1016185292", "explicit.stat_2444534954"),
-    ("explicit.stat_1016185292", "explicit.stat_1699077932"),
-    ("explicit.stat_1016185292", "explicit.stat_2383304564"),
-    ("explicit.stat_1016185292", "explicit.stat_121436064"),
-    ("explicit.stat_1016185292", "explicit.stat_2312747856"),
-    ("explicit.stat_1016185292", "explicit.stat_3656959867"),
-    ("explicit.stat_1016185292", "explicit.stat_281949611"),
-    ("explicit.stat_3624529132", "explicit.stat_380220671"),
-    ("explicit.stat_3624529132", "explicit.stat_2189467271"),
-    ("explicit.stat_3624529132", "explicit.stat_3953667743"),
-    ("explicit.stat_3624529132", "explicit.stat_1723738042"),
-    ("explicit.stat_3624529132", "explicit.stat_556659145"),
-    ("explicit.stat_3624529132", "explicit.stat_2690790844"),
-    ("explicit.stat_3624529132", "explicit.stat_80470845"),
-    ("explicit.stat_3624529132", "explicit.stat_2444534954"),
-    ("explicit.stat_3624529132", "explicit.stat_1699077932"),
-    ("explicit.stat_3624529132", "explicit.stat_2383304564"),
-    ("explicit.stat_3624529132", "explicit.stat_121436064"),
-    ("explicit.stat_3624529132", "explicit.stat_2312747856"),
-    ("explicit.stat_3624529132", "explicit.stat_3656959867"),
-    ("explicit.stat_3624529132", "explicit.stat_281949611"),
-    ("explicit.stat_380220671", "explicit.stat_2189467271"),
-    ("explicit.stat_380220671", "explicit.stat_3953667743"),
-    ("explicit.stat_380220671", "explicit.stat_1723738042"),
-    ("explicit.stat_380220671", "explicit.stat_556659145"),
-    ("explicit.stat_380220671", "explicit.stat_2690790844"),
-    ("explicit.stat_380220671", "explicit.stat_80470845"),
-    ("explicit.stat_380220671", "explicit.stat_2444534954"),
-    ("explicit.stat_380220671", "explicit.stat_1699077932"),
-    ("explicit.stat_380220671", "explicit.stat_2383304564"),
-    ("explicit.stat_380220671", "explicit.stat_121436064"),
-    ("explicit.stat_380220671", "explicit.stat_2312747856"),
-    ("explicit.stat_380220671", "explicit.stat_3656959867"),
-    ("explicit.stat_380220671", "explicit.stat_281949611"),
-    ("explicit.stat_2189467271", "explicit.stat_3953667743"),
-    ("explicit.stat_2189467271", "explicit.stat_1723738042"),
-    ("explicit.stat_2189467271", "explicit.stat_556659145"),
-    ("explicit.stat_2189467271", "explicit.stat_2690790844"),
-    ("explicit.stat_2189467271", "explicit.stat_80470845"),
-    ("explicit.stat_2189467271", "explicit.stat_2444534954"),
-    ("explicit.stat_2189467271", "explicit.stat_1699077932"),
-    ("explicit.stat_2189467271", "explicit.stat_2383304564"),
-    ("explicit.stat_2189467271", "explicit.stat_121436064"),
-    ("explicit.stat_2189467271", "explicit.stat_2312747856"),
-    ("explicit.stat_2189467271", "explicit.stat_3656959867"),
-    ("explicit.stat_2189467271", "explicit.stat_281949611"),
-    ("explicit.stat_3953667743", "explicit.stat_1723738042"),
-    ("explicit.stat_3953667743", "explicit.stat_556659145"),
-    ("explicit.stat_3953667743", "explicit.stat_2690790844"),
-    ("explicit.stat_3953667743", "explicit.stat_80470845"),
-    ("explicit.stat_3953667743", "explicit.stat_2444534954"),
-    ("explicit.stat_3953667743", "explicit.stat_1699077932"),
-    ("explicit.stat_3953667743", "explicit.stat_2383304564"),
-    ("explicit.stat_3953667743", "explicit.stat_121436064"),
-    ("explicit.stat_3953667743", "explicit.stat_2312747856"),
-    ("explicit.stat_3953667743", "explicit.stat_3656959867"),
-    ("explicit.stat_3953667743", "explicit.stat_281949611"),
-    ("explicit.stat_1723738042", "explicit.stat_556659145"),
-    ("explicit.stat_1723738042", "explicit.stat_2690790844"),
-    ("explicit.stat_1723738042", "explicit.stat_80470845"),
-    ("explicit.stat_1723738042", "explicit.stat_2444534954"),
-    ("explicit.stat_1723738042", "explicit.stat_1699077932"),
-    ("explicit.stat_1723738042", "explicit.stat_2383304564"),
-    ("explicit.stat_1723738042", "explicit.stat_121436064"),
-    ("explicit.stat_1723738042", "explicit.stat_2312747856"),
-    ("explicit.stat_1723738042", "explicit.stat_3656959867"),
-    ("explicit.stat_1723738042", "explicit.stat_281949611"),
-    ("explicit.stat_556659145", "explicit.stat_2690790844"),
-    ("explicit.stat_556659145", "explicit.stat_80470845"),
-    ("explicit.stat_556659145", "explicit.stat_2444534954"),
-    ("explicit.stat_556659145", "explicit.stat_1699077932"),
-    ("explicit.stat_556659145", "explicit.stat_2383304564"),
-    ("explicit.stat_556659145", "explicit.stat_121436064"),
-    ("explicit.stat_556659145", "explicit.stat_2312747856"),
-    ("explicit.stat_556659145", "explicit.stat_3656959867"),
-    ("explicit.stat_556659145", "explicit.stat_281949611"),
-    ("explicit.stat_2690790844", "explicit.stat_80470845"),
-    ("explicit.stat_2690790844", "explicit.stat_2444534954"),
-    ("explicit.stat_2690790844", "explicit.stat_1699077932"),
-    ("explicit.stat_2690790844", "explicit.stat_2383304564"),
-    ("explicit.stat_2690790844", "explicit.stat_121436064"),
-    ("explicit.stat_2690790844", "explicit.stat_2312747856"),
-    ("explicit.stat_2690790844", "explicit.stat_3656959867"),
-    ("explicit.stat_2690790844", "explicit.stat_281949611"),
-    ("explicit.stat_80470845", "explicit.stat_2444534954"),
-    ("explicit.stat_80470845", "explicit.stat_1699077932"),
-    ("explicit.stat_80470845", "explicit.stat_2383304564"),
-    ("explicit.stat_80470845", "explicit.stat_121436064"),
-    ("explicit.stat_80470845", "explicit.stat_2312747856"),
-    ("explicit.stat_80470845", "explicit.stat_3656959867"),
-    ("explicit.stat_80470845", "explicit.stat_281949611"),
-    ("explicit.stat_2444534954", "explicit.stat_1699077932"),
-    ("explicit.stat_2444534954", "explicit.stat_2383304564"),
-    ("explicit.stat_2444534954", "explicit.stat_121436064"),
-    ("explicit.stat_2444534954", "explicit.stat_2312747856"),
-    ("explicit.stat_2444534954", "explicit.stat_3656959867"),
-    ("explicit.stat_2444534954", "explicit.stat_281949611"),
-    ("explicit.stat_1699077932", "explicit.stat_2383304564"),
-    ("explicit.stat_1699077932", "explicit.stat_121436064"),
-    ("explicit.stat_1699077932", "explicit.stat_2312747856"),
-    ("explicit.stat_1699077932", "explicit.stat_3656959867"),
-    ("explicit.stat_1699077932", "explicit.stat_281949611"),
-    ("explicit.stat_2383304564", "explicit.stat_121436064"),
-    ("explicit.stat_2383304564", "explicit.stat_2312747856"),
-    ("explicit.stat_2383304564", "explicit.stat_3656959867"),
-    ("explicit.stat_2383304564", "explicit.stat_281949611"),
-    ("explicit.stat_121436064", "explicit.stat_2312747856"),
-    ("explicit.stat_121436064", "explicit.stat_3656959867"),
-    ("explicit.stat_121436064", "explicit.stat_281949611"),
-    ("explicit.stat_2312747856", "explicit.stat_3656959867"),
-    ("explicit.stat_2312747856", "explicit.stat_281949611"),
-    ("explicit.stat_3656959867", "explicit.stat_281949611"),
-]
-
 # Mapping of mod IDs to readable names
 MOD_NAMES = {
     "explicit.stat_1817023621": "+#% to Critical Strike Multiplier while affected by Precision",
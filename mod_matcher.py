@@ -0,0 +1,112 @@
+import random
+import re
+import sys
+from time import perf_counter
+
+# A rolled number as the trade site prints it in mod text
+_NUMBER = r"(\d+(?:\.\d+)?)"
+# Common jewel mods that are not Watcher's Eye mods, for the synthetic corpus
+_OTHER_LINES = (
+    "+# to maximum Life", "+# to maximum Energy Shield", "+# to maximum Mana",
+    "#% increased maximum Life", "#% increased maximum Energy Shield", "#% increased maximum Mana",
+)
+
+
+def template_pattern(template):
+    """Regex source for a mod name, with each ``#`` captured as a number."""
+    return re.escape(template).replace(r"\#", _NUMBER)
+
+
+class ModMatcher:
+    """Maps listing mod lines back to catalog indexes and their rolled values.
+
+    Every mod template is compiled into one alternation with a named group
+    per mod, so a line is classified by a single regex call instead of one
+    per template. A line's value is its rolled number, or the mean of both
+    for "Adds # to #" ranges; mods without a roll match with a value of None.
+    """
+
+    def __init__(self, names):
+        self.names = tuple(names)
+        branches = []
+        self.groups = {}
+        self.rolled = []
+        group = 1
+        for i, name in enumerate(self.names):
+            source = template_pattern(name)
+            # Every "#" becomes one numeric capture
+            rolls = name.count("#")
+            branches.append(f"(?P<m{i}>{source})")
+            # The branch's own group is followed by its numeric captures
+            self.groups[f"m{i}"] = (i, group + 1, group + 1 + rolls)
+            self.rolled.append(rolls > 0)
+            group += 1 + rolls
+        self.pattern = re.compile("|".join(branches))
+        # Per-template regexes of the reference matcher, compiled on first use
+        self._patterns = None
+
+    @classmethod
+    def from_catalog(cls, catalog):
+        return cls(catalog.names)
+
+    def match(self, line):
+        """``(index, value)`` for a mod line, or None when it is not a catalog mod."""
+        found = self.pattern.fullmatch(line)
+        if found is None:
+            return None
+        index, first, last = self.groups[found.lastgroup]
+        numbers = [float(found.group(g)) for g in range(first, last)]
+        return index, sum(numbers) / len(numbers) if numbers else None
+
+    def match_each(self, line):
+        """Reference matcher trying one template regex at a time."""
+        if self._patterns is None:
+            self._patterns = [(i, re.compile(template_pattern(name))) for i, name in enumerate(self.names)]
+        for index, pattern in self._patterns:
+            found = pattern.fullmatch(line)
+            if found:
+                numbers = [float(number) for number in found.groups()]
+                return index, sum(numbers) / len(numbers) if numbers else None
+        return None
+
+    def roll_values(self, lines):
+        """``{index: value}`` for every catalog mod among an item's mod lines."""
+        values = {}
+        for line in lines:
+            found = self.match(line)
+            if found:
+                values[found[0]] = found[1]
+        return values
+
+
+def synthetic_lines(names, listings, seed=0):
+    """Mod lines of ``listings`` fake jewels: two or three catalog mods plus common jewel mods."""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(listings):
+        templates = rng.sample(names, rng.randint(2, 3)) + rng.sample(_OTHER_LINES, 2)
+        for template in templates:
+            lines.append(re.sub("#", lambda _: str(rng.randint(1, 60)), template))
+    return lines
+
+
+def benchmark(listings=20000):
+    from mod_catalog import load_catalog
+
+    names = load_catalog().names
+    matcher = ModMatcher(names)
+    lines = synthetic_lines(names, listings)
+    timings = {}
+    for label, match in (("per-template", matcher.match_each), ("combined", matcher.match)):
+        start = perf_counter()
+        results = [match(line) for line in lines]
+        timings[label] = (perf_counter() - start, results)
+    if timings["combined"][1] != timings["per-template"][1]:
+        raise AssertionError("Combined matcher disagrees with the per-template matcher")
+    print(f"{len(lines)} mod lines from {listings} listings, {len(names)} templates")
+    for label, (seconds, _) in timings.items():
+        print(f"{label:>12}: {seconds * 1000:8.1f} ms  ({len(lines) / seconds:,.0f} lines/s)")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
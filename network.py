@@ -1,11 +1,12 @@
-import aiohttp
 import asyncio
-import json
 import random
 
-from mod_data import MOD_COMBOS, MOD_NAMES
-
-SINGLE_MODS = list(MOD_NAMES.keys())
+from currency_rates import ExchangeRates
+from fetch_decoder import extract_listings, loads
+from http_session import FETCH_TIMEOUT, SEARCH_TIMEOUT, ConnectionStats, create_session, warm_up
+from mod_catalog import load_catalog
+from price_aggregation import listing_prices, summarize
+from snapshot_store import ResultSnapshot, load_results
 
 
 class PriceFetcherBackend:
@@ -13,17 +14,18 @@ class PriceFetcherBackend:
         self.single_mode = single_mode
         self.running = True
         self.paused = False
-        self.results = []
+        self.results = ResultSnapshot(load_results())
         self.proxy_list = []
         self.proxy_index = 0
+        self.rates = ExchangeRates.load()
+        self.connection_stats = ConnectionStats()
 
-    async def load_proxies(self):
+    async def load_proxies(self, session):
         try:
             url = "https://raw.githubusercontent.com/TheSpeedX/PROXY-List/master/http.txt"
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as resp:
-                    text = await resp.text()
-                    self.proxy_list = list(set(line.strip() for line in text.splitlines() if line.strip()))
+            async with session.get(url) as resp:
+                text = await resp.text()
+                self.proxy_list = list(set(line.strip() for line in text.splitlines() if line.strip()))
         except Exception as e:
             print("Failed to load proxies:", str(e))
             self.proxy_list = []
@@ -35,37 +37,43 @@ class PriceFetcherBackend:
         return f"http://{self.proxy_list[self.proxy_index]}"
 
     async def run(self, on_result=None, on_status=None, on_debug=None, on_countdown=None):
-        await self.load_proxies()
-        headers = {
-            "User-Agent": "poe-watchers-eye-analyzer/1.0",
-            "Content-Type": "application/json"
-        }
+        catalog = load_catalog()
+        combos = catalog.singles() if self.single_mode else catalog.pairs()
 
-        mod_list = SINGLE_MODS if self.single_mode else MOD_COMBOS
+        async with create_session(self.connection_stats) as session:
+            await self.load_proxies(session)
+            await warm_up(session)
+            if self.rates.is_stale():
+                try:
+                    await self.rates.refresh(session)
+                except Exception as e:
+                    if on_debug:
+                        on_debug(f"Exchange rate refresh failed: {str(e)}")
 
-        async with aiohttp.ClientSession(headers=headers) as session:
-            for mod in mod_list:
+            for combo in combos:
                 if not self.running:
                     break
                 while self.paused:
                     await asyncio.sleep(1)
 
-                mod1, mod2 = (mod, None) if self.single_mode else mod
-                mod_label = MOD_NAMES[mod1] if not mod2 else f"{MOD_NAMES[mod1]} + {MOD_NAMES[mod2]}"
+                ids = catalog.combo_ids(combo)
+                mod1, mod2 = ids[0], ids[1] if len(ids) > 1 else None
+                name1 = catalog.names[combo[0]]
+                name2 = catalog.names[combo[1]] if mod2 else None
+                mod_label = name1 if not mod2 else f"{name1} + {name2}"
                 if on_status:
                     on_status(f"Fetching: {mod_label}")
 
                 price = await self.fetch_price(session, mod1, mod2, on_debug)
-                if on_result:
-                    on_result(price or 0.0, MOD_NAMES[mod1], MOD_NAMES[mod2] if mod2 else "-")
-
-                self.results.append({
-                    "mod1": MOD_NAMES[mod1],
-                    "mod2": MOD_NAMES[mod2] if mod2 else None,
-                    "avg_price": round(price or 0.0, 2)
-                })
-
-                await self.save_results()
+                if price is None:
+                    # A failed request keeps the combo's previous result
+                    if on_debug:
+                        on_debug(f"Search failed for {mod_label}; the previous result is kept")
+                else:
+                    if on_result:
+                        on_result(price, name1, name2 or "-")
+                    self.results.update(combo, price)
+                    await self.save_results()
                 for remaining in range(10, 0, -1):
                     if on_countdown:
                         on_countdown(remaining)
@@ -73,6 +81,9 @@ class PriceFetcherBackend:
                 if on_countdown:
                     on_countdown(0)
 
+        if on_debug:
+            on_debug(self.connection_stats.report())
+
     async def fetch_price(self, session, mod1, mod2, on_debug):
         payload = {
             "query": {
@@ -91,12 +102,6 @@ class PriceFetcherBackend:
                             "corrupted": {"option": "false"},
                             "ilvl": {"min": 86}
                         }
-                    },
-                    "trade_filters": {
-                        "disabled": False,
-                        "filters": {
-                            "price": {"option": "divine"}
-                        }
                     }
                 }
             },
@@ -109,7 +114,7 @@ class PriceFetcherBackend:
         proxy = self.get_next_proxy()
 
         try:
-            async with session.post(search_url, json=payload, proxy=proxy) as r:
+            async with session.post(search_url, json=payload, proxy=proxy, timeout=SEARCH_TIMEOUT) as r:
                 if r.status != 200:
                     if on_debug:
                         on_debug(f"Search Error: {r.status}")
@@ -117,28 +122,20 @@ class PriceFetcherBackend:
                 search_data = await r.json()
 
             if not search_data.get("result"):
-                return None
+                return 0.0
 
-            ids = search_data["result"][:5]
+            ids = search_data["result"][:10]
             fetch_url = f"{fetch_url_base}{','.join(ids)}?query={search_data['id']}"
 
-            async with session.get(fetch_url, proxy=proxy) as r:
+            async with session.get(fetch_url, proxy=proxy, timeout=FETCH_TIMEOUT) as r:
                 if r.status != 200:
                     if on_debug:
                         on_debug(f"Fetch Error: {r.status}")
                     return None
-                data = await r.json()
-
-            prices = []
-            for item in data.get("result", []):
-                try:
-                    price = item["listing"]["price"]
-                    if price["currency"] == "divine":
-                        prices.append(price["amount"])
-                except KeyError:
-                    continue
+                data = await r.json(loads=loads)
 
-            return sum(prices) / len(prices) if prices else None
+            summary = summarize([amount for _, amount in listing_prices(extract_listings(data), self.rates)])
+            return summary["trimmed_mean"] if summary["count"] else 0.0
 
         except Exception as e:
             if on_debug:
@@ -147,8 +144,7 @@ class PriceFetcherBackend:
 
     async def save_results(self):
         try:
-            with open("watcher_prices.json", "w", encoding="utf-8") as f:
-                json.dump(self.results, f, ensure_ascii=False, indent=2)
+            self.results.save()
         except Exception as e:
             print("File write error:", str(e))
 
@@ -0,0 +1,132 @@
+import numpy as np
+
+DEFAULT_PERCENTILES = (10, 25, 75, 90)
+DEFAULT_TRIM = 0.2
+# Listings further than this many robust deviations below the median are
+# treated as price-fixing bait and ignored
+FIXER_DEVIATIONS = 3.0
+# Lower bound on the log-price deviation so tight markets do not reject
+# ordinary undercuts
+MIN_LOG_DEVIATION = 0.15
+# Scale of the median absolute deviation to a normal standard deviation
+_MAD_SCALE = 1.4826
+
+
+def listing_prices(listings, rates=None):
+    """(listing id, divine amount) for every fetched listing.
+
+    Without exchange ``rates`` only divine-priced listings are kept.
+    """
+    prices = []
+    for listing in listings:
+        if rates is not None:
+            amount = rates.to_divine(listing.amount, listing.currency)
+        else:
+            amount = listing.amount if listing.currency == "divine" else None
+        if amount is not None:
+            prices.append((listing.id, amount))
+    return prices
+
+
+def pad(price_lists):
+    """Stack ragged price lists into one NaN-padded 2D array."""
+    width = max((len(prices) for prices in price_lists), default=0)
+    padded = np.full((len(price_lists), max(width, 1)), np.nan)
+    for row, prices in enumerate(price_lists):
+        padded[row, :len(prices)] = prices
+    return padded
+
+
+def _sorted_percentile(ordered, count, q):
+    """Linear-interpolated percentile of rows sorted with NaN padding last."""
+    position = np.clip(q / 100 * (count - 1), 0, None)
+    low = np.floor(position).astype(int)
+    high = np.minimum(low + 1, np.maximum(count - 1, 0))
+    frac = position - low
+    lows = np.take_along_axis(ordered, low[:, None], axis=1)[:, 0]
+    highs = np.take_along_axis(ordered, high[:, None], axis=1)[:, 0]
+    return np.where(count > 0, lows + (highs - lows) * frac, np.nan)
+
+
+def aggregate(padded, percentiles=DEFAULT_PERCENTILES, trim=DEFAULT_TRIM):
+    """Robust statistics for every row of a NaN-padded price array at once.
+
+    Returns a dict of 1D arrays: ``count``, ``rejected``, ``min``, ``median``,
+    ``trimmed_mean`` and ``p<q>`` for each requested percentile. Rows with
+    no usable listings are NaN. Everything is computed from row-wise sorts,
+    so there is no per-combo Python work.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        prices = np.sort(np.where(padded > 0, padded, np.nan), axis=1)
+        logs = np.log(prices)
+        total = np.count_nonzero(~np.isnan(logs), axis=1)
+        centre = _sorted_percentile(logs, total, 50)[:, None]
+        spread = np.sort(np.abs(logs - centre), axis=1)
+        deviation = _sorted_percentile(spread, total, 50)[:, None] * _MAD_SCALE
+        deviation = np.maximum(np.nan_to_num(deviation), MIN_LOG_DEVIATION)
+        fixers = logs < centre - FIXER_DEVIATIONS * deviation
+
+    # Re-sorting moves the rejected (now NaN) leading listings to the end
+    ordered = np.sort(np.where(fixers, np.nan, prices), axis=1)
+    count = total - fixers.sum(axis=1)
+    cut = np.floor(count * trim).astype(int)
+    ranks = np.arange(ordered.shape[1])[None, :]
+    inner = (ranks >= cut[:, None]) & (ranks < (count - cut)[:, None])
+    inner_count = inner.sum(axis=1)
+    trimmed_sum = np.where(inner, ordered, 0.0).sum(axis=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        stats = {
+            "count": count,
+            "rejected": total - count,
+            "min": np.where(count > 0, ordered[:, 0], np.nan),
+            "median": _sorted_percentile(ordered, count, 50),
+            "trimmed_mean": np.where(inner_count > 0, trimmed_sum / inner_count, np.nan),
+        }
+    for q in percentiles:
+        stats[f"p{q}"] = _sorted_percentile(ordered, count, q)
+    return stats
+
+
+def summarize(prices, **options):
+    """Aggregate a single list of prices; returns a dict of floats."""
+    stats = aggregate(pad([prices]), **options)
+    return {name: (int(values[0]) if name in ("count", "rejected") else float(values[0]))
+            for name, values in stats.items()}
+
+
+class ListingAggregator:
+    """Listing prices of the combos being priced, keyed by listing id.
+
+    A search of a combo starts its listing set over, so stale listings from
+    older searches do not linger; pages fetched during one search are
+    merged. Once summarized, a combo's listings are discarded so they are
+    not held for the rest of the session.
+    """
+
+    def __init__(self, percentiles=DEFAULT_PERCENTILES, trim=DEFAULT_TRIM):
+        self.percentiles = percentiles
+        self.trim = trim
+        self.listings = {}
+
+    def reset(self, key):
+        self.listings[key] = {}
+
+    def add(self, key, listings):
+        self.listings.setdefault(key, {}).update(listings)
+
+    def discard(self, keys):
+        for key in keys:
+            self.listings.pop(key, None)
+
+    def prices(self, key):
+        return list(self.listings.get(key, {}).values())
+
+    def summary(self, key):
+        return summarize(self.prices(key), percentiles=self.percentiles, trim=self.trim)
+
+    def summarize_all(self, keys=None):
+        """Vectorized statistics for many combos; returns ``(keys, stats)``."""
+        keys = list(self.listings) if keys is None else list(keys)
+        stats = aggregate(pad([self.prices(key) for key in keys]), percentiles=self.percentiles, trim=self.trim)
+        return keys, stats
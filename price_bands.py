@@ -0,0 +1,117 @@
+import json
+import math
+
+from atomic_file import atomic_write
+
+BANDS_PATH = "price_bands.json"
+# A trade search returns at most this many listing ids
+SEARCH_CAP = 100
+# Bisection range in divine; the outer bands stay open-ended
+MIN_PRICE, MAX_PRICE = 0.01, 100000.0
+# A capped band narrower than this is accepted as is (many identical prices)
+MIN_BAND_RATIO = 1.05
+# Learned bands are merged while their listings fill at most this share of the cap
+FILL_TARGET = 0.8
+
+
+def band_key(mods, payload):
+    query = payload["query"]
+    key = f"{'|'.join(mods)}/{query['status']['option']}"
+    return key + "/filtered" if "filters" in query else key
+
+
+def split_point(low, high):
+    """Geometric midpoint of a band, with open ends clamped to the bisection range."""
+    low = max(low or MIN_PRICE, MIN_PRICE)
+    high = min(high or MAX_PRICE, MAX_PRICE)
+    return math.sqrt(low * high)
+
+
+def can_split(low, high):
+    low = max(low or MIN_PRICE, MIN_PRICE)
+    high = min(high or MAX_PRICE, MAX_PRICE)
+    return high / low > MIN_BAND_RATIO
+
+
+def bands_from(boundaries):
+    """``[(low, high), ...]`` covering every price; ``None`` means open-ended."""
+    edges = [None] + list(boundaries) + [None]
+    return list(zip(edges[:-1], edges[1:]))
+
+
+async def collect_ids(search, boundaries=()):
+    """Every listing id of a search by bisecting it into price bands.
+
+    ``search(low, high)`` runs the search restricted to the band and returns
+    ``(query_id, ids, total)``. A band whose total exceeds the ids returned
+    is split at its geometric midpoint. Returns ``(groups, leaves, searches)``
+    where ``groups`` are ``(query_id, ids)`` to fetch, with ids unique across
+    bands, ``leaves`` are the final ``(low, high, total)`` bands and
+    ``searches`` is the number of searches made.
+    """
+    pending = bands_from(boundaries)
+    groups, leaves, seen = [], [], set()
+    searches = 0
+    while pending:
+        low, high = pending.pop(0)
+        query_id, ids, total = await search(low, high)
+        searches += 1
+        if total > len(ids) and can_split(low, high):
+            middle = split_point(low, high)
+            pending[:0] = [(low, middle), (middle, high)]
+            continue
+        # Band edges are inclusive on both sides, so listings on an edge repeat
+        fresh = [listing_id for listing_id in ids if listing_id not in seen]
+        seen.update(fresh)
+        if fresh:
+            groups.append((query_id, fresh))
+        leaves.append((low, high, total))
+    return groups, leaves, searches
+
+
+def learned_boundaries(leaves, cap=SEARCH_CAP):
+    """Merge adjacent leaf bands whose listings fit in one search together."""
+    boundaries = []
+    filled = 0
+    for low, _, total in leaves:
+        if filled and filled + total > cap * FILL_TARGET:
+            boundaries.append(low)
+            filled = 0
+        filled += total
+    return boundaries
+
+
+class PriceBands:
+    """Price band boundaries per search, learned from previous runs.
+
+    Reusing them means a liquid combo is covered with one search per band
+    instead of re-bisecting from the full price range every time.
+    """
+
+    def __init__(self, boundaries=None):
+        self.boundaries = dict(boundaries or {})
+
+    @classmethod
+    def load(cls, path=BANDS_PATH):
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls(json.load(f))
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError) as e:
+            print("Price band read error:", str(e))
+            return cls()
+
+    def save(self, path=BANDS_PATH):
+        with atomic_write(path, encoding="utf-8") as f:
+            json.dump(self.boundaries, f, indent=2)
+
+    def get(self, key):
+        return self.boundaries.get(key, [])
+
+    def learn(self, key, leaves):
+        boundaries = learned_boundaries(leaves)
+        if boundaries:
+            self.boundaries[key] = boundaries
+        else:
+            self.boundaries.pop(key, None)
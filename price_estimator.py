@@ -0,0 +1,93 @@
+import numpy as np
+
+DEFAULT_RANK = 4
+DEFAULT_SHRINKAGE = 1.0
+MIN_OBSERVATIONS = 30
+PRIOR_LOG_STD = 1.0
+PRIOR_WEIGHT = 100
+# Two-sided 90% interval of a normal distribution in log-price space
+Z_90 = 1.645
+
+
+class PriceEstimate:
+    """Predicted price and 90% interval for every pair, in divine."""
+
+    __slots__ = ("mean", "low", "high", "log_std", "observed", "confident")
+
+    def __init__(self, mean, low, high, log_std, observed, confident):
+        self.mean = mean
+        self.low = low
+        self.high = high
+        self.log_std = log_std
+        self.observed = observed
+        self.confident = confident
+
+
+def _symmetric_low_rank(residual, rank, shrinkage):
+    values, vectors = np.linalg.eigh(residual)
+    keep = np.argsort(-np.abs(values))[:rank]
+    # Soft-threshold the kept eigenvalues towards zero
+    shrunk = np.sign(values[keep]) * np.maximum(np.abs(values[keep]) - shrinkage, 0.0)
+    basis = vectors[:, keep]
+    return (basis * shrunk) @ basis.T
+
+
+def estimate_prices(matrix, rank=DEFAULT_RANK, shrinkage=DEFAULT_SHRINKAGE, iterations=60):
+    """Fill the pair-price matrix by low-rank completion of log prices.
+
+    Log prices are modelled as ``mu + a[i] + a[j] + L[i, j]``: an additive
+    per-mod effect, seeded from single-mod prices, plus a symmetric low-rank
+    interaction fitted with soft-impute on the observed pairs.
+    """
+    size = matrix.size
+    observed = matrix.observed() & (matrix.prices > 0)
+    np.fill_diagonal(observed, False)
+    logs = np.log(np.where(observed, matrix.prices, 1.0))
+    row_counts = observed.sum(axis=1)
+    n_observed = int(observed.sum() // 2)
+
+    single_logs = np.log(matrix.single_prices)
+    has_single = np.isfinite(single_logs)
+    if not n_observed and not has_single.any():
+        nan = np.full((size, size), np.nan)
+        return PriceEstimate(nan, nan, nan, nan, observed, False)
+    single_center = single_logs[has_single].mean() if has_single.any() else 0.0
+    mu = logs[observed].mean() if n_observed else single_center
+
+    # Additive effects start from the centred single-mod prices and are
+    # refined by alternating row means over the observed pairs
+    effects = np.where(has_single, single_logs - single_center, 0.0)
+    for _ in range(10):
+        partial = np.where(observed, logs - mu - effects[None, :], 0.0).sum(axis=1)
+        fitted = np.divide(partial, row_counts, out=np.zeros(size), where=row_counts > 0)
+        # Rows without pairs keep their single-mod seed
+        weight = row_counts / (row_counts + 1.0)
+        effects = weight * fitted + (1 - weight) * effects
+
+    baseline = mu + effects[:, None] + effects[None, :]
+    residual = np.where(observed, logs - baseline, 0.0)
+    interaction = np.zeros((size, size))
+    for _ in range(iterations):
+        filled = np.where(observed, residual, interaction)
+        interaction = _symmetric_low_rank(filled, rank, shrinkage)
+
+    predicted = baseline + interaction
+    # Residual spread, shrunk towards a wide prior while few pairs are known
+    errors = (logs - predicted)[observed]
+    sigma = float(np.sqrt((np.sum(errors ** 2) + PRIOR_WEIGHT * PRIOR_LOG_STD ** 2) / (errors.size + PRIOR_WEIGHT)))
+    # Wider intervals for mods with few observed pairs
+    support = 1.0 / (row_counts + 1.0)
+    log_std = sigma * np.sqrt(1.0 + support[:, None] + support[None, :])
+    log_std[observed] = sigma
+
+    mean = np.exp(predicted)
+    low = np.exp(predicted - Z_90 * log_std)
+    high = np.exp(predicted + Z_90 * log_std)
+    for values in (mean, low, high, log_std):
+        np.fill_diagonal(values, np.nan)
+    return PriceEstimate(mean, low, high, log_std, observed, n_observed >= MIN_OBSERVATIONS)
+
+
+def confidently_below(estimate, i, j, threshold):
+    """True when the pair has no price yet and its upper bound is under the threshold."""
+    return bool(estimate.confident and not estimate.observed[i, j] and estimate.high[i, j] < threshold)
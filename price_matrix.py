@@ -0,0 +1,69 @@
+import numpy as np
+
+
+class PriceMatrix:
+    """Symmetric pair prices indexed by catalog index.
+
+    ``prices`` is NaN where a pair has no price, ``counts`` holds how many
+    listings the price was built from and ``updated`` the epoch second of
+    the last search (0 = never searched). Single-mod prices live in the
+    parallel ``single_*`` vectors; the diagonal is unused. The few triples
+    that get priced are kept sparsely in ``triples`` as
+    ``{(i, j, k): (price, listings, updated)}`` with sorted indexes.
+    ``totals`` holds the listing count of the last liquidity scan (-1 = never
+    scanned) and ``totals_updated`` when it was taken.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.prices = np.full((size, size), np.nan)
+        self.counts = np.zeros((size, size), dtype=np.int32)
+        self.updated = np.zeros((size, size))
+        self.single_prices = np.full(size, np.nan)
+        self.single_counts = np.zeros(size, dtype=np.int32)
+        self.single_updated = np.zeros(size)
+        self.triples = {}
+        self.totals = np.full((size, size), -1, dtype=np.int32)
+        self.totals_updated = np.zeros((size, size))
+
+    @classmethod
+    def from_results(cls, catalog, rows):
+        matrix = cls(len(catalog))
+        for row in rows:
+            try:
+                i = catalog.index_of_name(row["mod1"])
+                j = catalog.index_of_name(row["mod2"]) if row.get("mod2") else None
+                k = catalog.index_of_name(row["mod3"]) if row.get("mod3") else None
+            except KeyError:
+                continue
+            price = row["avg_price"]
+            listings = row.get("listings", 1 if price else 0)
+            updated = row.get("updated", 0)
+            if k is not None:
+                matrix.set_triple(i, j, k, price, listings, updated)
+            elif j is None:
+                matrix.set_single(i, price, listings, updated)
+            else:
+                matrix.set_pair(i, j, price, listings, updated)
+        return matrix
+
+    def set_pair(self, i, j, price, listings, updated):
+        value = price if price and listings else np.nan
+        self.prices[i, j] = self.prices[j, i] = value
+        self.counts[i, j] = self.counts[j, i] = listings
+        self.updated[i, j] = self.updated[j, i] = updated
+
+    def set_total(self, i, j, total, updated):
+        self.totals[i, j] = self.totals[j, i] = total
+        self.totals_updated[i, j] = self.totals_updated[j, i] = updated
+
+    def set_single(self, i, price, listings, updated):
+        self.single_prices[i] = price if price and listings else np.nan
+        self.single_counts[i] = listings
+        self.single_updated[i] = updated
+
+    def set_triple(self, i, j, k, price, listings, updated):
+        self.triples[tuple(sorted((i, j, k)))] = (price if price and listings else np.nan, listings, updated)
+
+    def observed(self):
+        return ~np.isnan(self.prices)
@@ -0,0 +1,500 @@
+import asyncio
+import json
+import sys
+import time
+from PyQt5.QtCore import pyqtSignal, QObject
+from currency_rates import CHECK_SECONDS, ExchangeRates
+from http_session import FETCH_TIMEOUT, SEARCH_TIMEOUT, ConnectionStats, RequestPacer, create_session, warm_up
+from fetch_decoder import decode_listings, loads
+from filter_variants import PAIR_VARIANT, SINGLE_VARIANT, VARIANT_BATCHES, broad_payload, partition
+from liquidity import SCAN_COUNTDOWN, SCAN_SAVE_EVERY, LiquidityStore, load_liquidity, scanned_empty
+from metrics import Metrics, watch_loop_lag
+from mod_catalog import load_catalog
+from mod_matcher import ModMatcher
+from price_aggregation import ListingAggregator, listing_prices
+from price_bands import PriceBands, band_key, collect_ids
+from price_estimator import confidently_below, estimate_prices
+from price_matrix import PriceMatrix
+from query_selector import QuerySelector
+from roll_pricing import listing_rolls, roll_model, roll_price
+from snapshot_export import HistoryLog
+from snapshot_history import SnapshotHistory
+from snapshot_store import RESULTS_PATH, ResultSnapshot
+from sweep_profile import SweepProfiler
+from trade_api import CLEAN_FILTERS, FETCH_BATCH, SEARCH_URL, fetch_url, search_payload, with_price_range
+from triple_search import DEFAULT_TRIPLE_THRESHOLD, triple_candidates
+
+DEFAULT_SKIP_BELOW = 1.0
+ESTIMATE_REFRESH = 25
+FETCH_COUNTDOWN = 10
+
+
+class PriceWorker(QObject):
+    result_ready = pyqtSignal(float, str, str, str)
+    status_update = pyqtSignal(str)
+    debug_message = pyqtSignal(str)
+    countdown_update = pyqtSignal(int)
+    pair_updated = pyqtSignal(int, int, float, int, float)
+    snapshot_recorded = pyqtSignal(float, object)
+
+    def __init__(self, previous_results=()):
+        super().__init__()
+        self.running = True
+        self.paused = False
+        self.single_mode = False
+        self.triple_mode = False
+        self.adaptive_mode = False
+        self.variant_mode = False
+        self.paging_mode = False
+        self.liquidity_mode = False
+        self.triple_threshold = DEFAULT_TRIPLE_THRESHOLD
+        self.catalog = load_catalog()
+        self.results = ResultSnapshot(previous_results, self.catalog)
+        self.history = HistoryLog()
+        self.snapshots = SnapshotHistory()
+        self.matrix = PriceMatrix.from_results(self.catalog, self.results.to_list())
+        self.skip_below = DEFAULT_SKIP_BELOW
+        self.estimate = None
+        self.results_since_estimate = 0
+        self.listings = ListingAggregator()
+        self.matcher = ModMatcher.from_catalog(self.catalog)
+        # Rolled values of the listings fetched for the current combo, by listing id
+        self.rolls = {}
+        self.rates = ExchangeRates.load()
+        self.bands = PriceBands.load()
+        self.liquidity = LiquidityStore(load_liquidity(), self.catalog)
+        self.liquidity.apply_to(self.matrix)
+        self.metrics = Metrics()
+        self.pacer = RequestPacer()
+        self.profiler = SweepProfiler()
+
+    def start(self):
+        asyncio.run(self.sequential_fetch_loop())
+
+    async def sequential_fetch_loop(self):
+        self.debug_message.emit("=== API Debug Info ===")
+
+        stats = ConnectionStats(self.metrics)
+        async with create_session(stats) as session:
+            if not await warm_up(session):
+                self.debug_message.emit("Connection warm-up failed; continuing")
+            # Without a cached table only divine listings could be priced, so
+            # the first refresh finishes before the first combo
+            if not self.rates.fetched:
+                await self.refresh_rates(session)
+            tasks = [
+                asyncio.create_task(self.refresh_rates_loop(session)),
+                asyncio.create_task(watch_loop_lag(self.metrics)),
+            ]
+            try:
+                await self.fetch_combos(session)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                if self.liquidity_mode:
+                    if self.liquidity.unsaved:
+                        self.save_liquidity()
+                else:
+                    self.record_snapshot()
+                self.save_profile()
+                self.debug_message.emit(stats.report())
+
+    async def refresh_rates(self, session):
+        try:
+            await self.rates.refresh(session)
+            self.debug_message.emit(f"Exchange rates refreshed: {len(self.rates.rates)} currencies")
+        except Exception as e:
+            self.debug_message.emit(f"Exchange rate refresh failed: {str(e)}")
+
+    async def refresh_rates_loop(self, session):
+        while True:
+            if self.rates.is_stale():
+                await self.refresh_rates(session)
+            await asyncio.sleep(CHECK_SECONDS)
+
+    async def fetch_combos(self, session):
+        catalog = self.catalog
+        if self.single_mode:
+            combos = catalog.singles()
+        elif self.triple_mode:
+            combos = (candidate[:3] for candidate in triple_candidates(self.matrix, self.triple_threshold))
+        elif self.adaptive_mode:
+            combos = iter(QuerySelector(self.matrix))
+        else:
+            combos = catalog.pairs()
+        # The generated modes do not know their length up front
+        pending = None
+        if self.single_mode:
+            pending = catalog.combo_count(1)
+        elif not (self.triple_mode or self.adaptive_mode):
+            pending = catalog.combo_count(2)
+
+        span = self.profiler.span
+        combos = iter(combos)
+        while True:
+            with span("schedule"):
+                combo = next(combos, None)
+            if combo is None:
+                break
+            if pending is not None:
+                self.metrics.set("combos_pending", pending)
+                pending -= 1
+            while self.paused:
+                await asyncio.sleep(1)
+            if not self.running:
+                break
+
+            # None until a search succeeds; a failed search keeps the combo's previous result
+            summary = None
+            if self.liquidity_mode:
+                await self.scan_combo(session, combo)
+            elif self.single_mode:
+                mod1 = catalog.stat_ids[combo[0]]
+                self.status_update.emit(f"Fetching: {catalog.names[combo[0]]}")
+                if self.variant_mode:
+                    details = await self.query_variants(session, mod1)
+                    if details is not None:
+                        with span("aggregate"):
+                            summary = self.aggregate_variants(combo, details, SINGLE_VARIANT)
+                else:
+                    listings = await self.query_price_single(session, mod1)
+                    if listings is not None:
+                        with span("aggregate"):
+                            summary = self.aggregate_listings(combo, listings)
+                if summary is not None:
+                    with span("ui-flush"):
+                        self.result_ready.emit(summary["price"], catalog.names[combo[0]], "-", "")
+                    with span("aggregate"):
+                        self.add_result((mod1,), summary)
+            else:
+                mods = catalog.combo_ids(combo)
+                names = catalog.combo_names(combo)
+                with span("schedule"):
+                    empty = len(combo) == 2 and scanned_empty(self.matrix)[combo]
+                    skip = not empty and len(combo) == 2 and self.should_skip(*combo)
+                if empty:
+                    self.debug_message.emit(f"Skipped {' + '.join(names)}: no listings in the last scan")
+                    continue
+                if skip:
+                    self.debug_message.emit(
+                        f"Skipped {' + '.join(names)}: estimated below {self.skip_below} divine"
+                    )
+                    continue
+                self.status_update.emit(f"Fetching: {' + '.join(names)}")
+                if self.variant_mode:
+                    details = await self.query_variants(session, *mods)
+                    if details is not None:
+                        with span("aggregate"):
+                            summary = self.aggregate_variants(combo, details, PAIR_VARIANT)
+                else:
+                    listings = await self.query_price(session, *mods)
+                    if listings is not None:
+                        with span("aggregate"):
+                            summary = self.aggregate_listings(combo, listings)
+                if summary is not None:
+                    with span("ui-flush"):
+                        self.result_ready.emit(
+                            summary["price"], names[0], names[1], names[2] if len(names) > 2 else ""
+                        )
+                    with span("aggregate"):
+                        self.add_result(mods, summary)
+
+            if summary is None and not self.liquidity_mode:
+                self.debug_message.emit("Search failed; the previous result is kept")
+            with span("persist"):
+                if summary is not None:
+                    self.update_results_file()
+                self.metrics.combo_done()
+                self.save_metrics()
+
+            with span("rate-wait"):
+                for remaining in range(SCAN_COUNTDOWN if self.liquidity_mode else FETCH_COUNTDOWN, 0, -1):
+                    self.countdown_update.emit(remaining)
+                    await asyncio.sleep(1)
+                self.countdown_update.emit(0)
+
+    async def query_price(self, session, *mods):
+        return await self.search_listings(session, search_payload(mods), "SEARCH", mods)
+
+    async def query_price_single(self, session, mod1):
+        payload = search_payload((mod1,), misc_filters=CLEAN_FILTERS)
+        return await self.search_listings(session, payload, "SEARCH SINGLE", (mod1,))
+
+    async def query_variants(self, session, *mods):
+        """Listings of one broad search, with the fields every filter variant needs."""
+        return await self.search_listings(
+            session, broad_payload(mods), "SEARCH VARIANTS", mods, detailed=True, batches=VARIANT_BATCHES
+        )
+
+    async def search_listings(self, session, payload, label, mods, detailed=False, batches=1):
+        """Listings of a search, or None when a request failed."""
+        try:
+            self.debug_message.emit(f"\\n[{label}] {' + '.join(self.catalog.name_of(mod) for mod in mods)}\\n{json.dumps(payload)}")
+
+            if self.paging_mode:
+                groups = await self.band_search(session, payload, mods)
+            else:
+                search_data = await self.post_search(session, payload)
+                if search_data is None:
+                    return None
+                # A successful search without results is a real "no listings" observation
+                if not search_data.get("result"):
+                    return []
+                groups = [(search_data["id"], search_data["result"][:FETCH_BATCH * batches])]
+
+            listings = []
+            self.rolls = {}
+            queued = sum(len(ids) for _, ids in groups)
+            for query_id, ids in groups:
+                for start in range(0, len(ids), FETCH_BATCH):
+                    self.metrics.set("fetch_queue", queued)
+                    queued -= len(ids[start:start + FETCH_BATCH])
+                    batch = await self.get_listings(session, ids[start:start + FETCH_BATCH], query_id)
+                    if batch is None:
+                        return None
+                    listings.extend(batch)
+            self.metrics.set("fetch_queue", 0)
+
+            with self.profiler.span("parse"):
+                self.rolls = listing_rolls(listings, self.matcher)
+                return listings if detailed else listing_prices(listings, self.rates)
+
+        except Exception as e:
+            self.debug_message.emit(f"Exception: {str(e)}")
+            return None
+
+    async def post_search(self, session, payload):
+        body = json.dumps(payload).encode()
+        while True:
+            with self.profiler.span("rate-wait"):
+                await self.pacer.wait("search")
+            started = time.perf_counter()
+            with self.profiler.span("search"):
+                async with session.post(SEARCH_URL, data=body, timeout=SEARCH_TIMEOUT) as r:
+                    status, headers, content = r.status, r.headers, await r.read()
+            self.metrics.record_response("search", status, time.perf_counter() - started, len(body), len(content), headers)
+            self.pacer.observe("search", headers)
+            if status == 429:
+                wait_time = int(headers.get("Retry-After", 10))
+                self.debug_message.emit(f"Rate limit hit. Waiting {wait_time}s...")
+                with self.profiler.span("rate-wait"):
+                    await asyncio.sleep(wait_time)
+                continue
+            if status != 200:
+                self.debug_message.emit(f"Search Error: {status}")
+                return None
+            with self.profiler.span("parse"):
+                return loads(content)
+
+    async def get_listings(self, session, ids, query_id):
+        url = fetch_url(ids, query_id)
+        self.debug_message.emit(f"[FETCH] {url}")
+        while True:
+            with self.profiler.span("rate-wait"):
+                await self.pacer.wait("fetch")
+            started = time.perf_counter()
+            with self.profiler.span("fetch"):
+                async with session.get(url, timeout=FETCH_TIMEOUT) as r:
+                    status, headers, content = r.status, r.headers, await r.read()
+            self.metrics.record_response("fetch", status, time.perf_counter() - started, 0, len(content), headers)
+            self.pacer.observe("fetch", headers)
+            if status == 429:
+                wait_time = int(headers.get("Retry-After", 10))
+                self.debug_message.emit(f"Rate limit hit (fetch). Waiting {wait_time}s...")
+                with self.profiler.span("rate-wait"):
+                    await asyncio.sleep(wait_time)
+                continue
+            if status != 200:
+                self.debug_message.emit(f"Fetch Error: {status}")
+                return None
+            with self.profiler.span("parse"):
+                return decode_listings(content)
+
+    async def band_search(self, session, payload, mods):
+        """Listing ids of every listing of a search, paged by price band."""
+        chaos_per_divine = self.rates.from_divine(1.0, "chaos")
+        if chaos_per_divine is None:
+            raise ValueError("Paging needs a chaos exchange rate")
+
+        async def search(low, high):
+            band = with_price_range(
+                payload,
+                low * chaos_per_divine if low is not None else None,
+                high * chaos_per_divine if high is not None else None
+            )
+            search_data = await self.post_search(session, band)
+            if search_data is None:
+                raise ValueError(f"Band search failed ({low} – {high} divine)")
+            return search_data.get("id"), search_data.get("result") or [], search_data.get("total", 0)
+
+        key = band_key(mods, payload)
+        groups, leaves, searches = await collect_ids(search, self.bands.get(key))
+        self.bands.learn(key, leaves)
+        with self.profiler.span("persist"):
+            self.bands.save()
+        total = sum(len(ids) for _, ids in groups)
+        self.debug_message.emit(f"Paged {total} listing(s) in {searches} search(es) over {len(leaves)} band(s)")
+        return groups
+
+    async def scan_combo(self, session, combo):
+        """Record how many listings a combo has, without fetching any of them."""
+        mods = self.catalog.combo_ids(combo)
+        names = self.catalog.combo_names(combo)
+        self.status_update.emit(f"Scanning: {' + '.join(names)}")
+        payload = search_payload(mods, misc_filters=CLEAN_FILTERS if len(mods) == 1 else None)
+        try:
+            search_data = await self.post_search(session, payload)
+        except Exception as e:
+            self.debug_message.emit(f"Exception: {str(e)}")
+            return
+        if search_data is None:
+            return
+
+        total = search_data.get("total", 0)
+        record = self.liquidity.update(combo, total, search_data.get("result") or [])
+        if len(combo) == 2:
+            self.matrix.set_total(*combo, total, record.updated)
+        self.debug_message.emit(f"[SCAN] {' + '.join(names)}: {total} listing(s)")
+        if self.liquidity.unsaved >= SCAN_SAVE_EVERY:
+            self.save_liquidity()
+
+    def save_liquidity(self):
+        try:
+            with self.profiler.span("persist"):
+                self.liquidity.save()
+        except Exception as e:
+            self.debug_message.emit(f"❌ File write error: {str(e)}")
+
+    def should_skip(self, i, j):
+        if self.estimate is None or self.results_since_estimate >= ESTIMATE_REFRESH:
+            self.estimate = estimate_prices(self.matrix)
+            self.results_since_estimate = 0
+        return confidently_below(self.estimate, i, j, self.skip_below)
+
+    def aggregate_listings(self, combo, listings):
+        """Robust price over every listing fetched for the combo in this search."""
+        key = tuple(combo)
+        self.listings.reset(key)
+        self.listings.add(key, listings)
+        summary = self.listings.summary(key)
+        self.listings.discard([key])
+        summary["price"] = summary["trimmed_mean"] if summary["count"] else 0.0
+        for message in (f"- {amount} divine ({listing_id})" for listing_id, amount in listings):
+            self.debug_message.emit(message)
+        if summary["rejected"]:
+            self.debug_message.emit(f"Ignored {summary['rejected']} likely price-fixing listing(s)")
+        summary["rolls"] = self.roll_summary(combo, listings)
+        return summary
+
+    def aggregate_variants(self, combo, details, primary):
+        """Price of every filter variant from one broad result set.
+
+        The combo's price is that of the ``primary`` variant; the others are
+        kept alongside it. Variants that filter heavily only see the share
+        of the cheapest listings that passes them.
+        """
+        keys = []
+        partitions = partition(details, self.rates)
+        for name, listings in partitions.items():
+            key = (tuple(combo), name)
+            self.listings.reset(key)
+            self.listings.add(key, listings)
+            keys.append(key)
+        keys, stats = self.listings.summarize_all(keys)
+        variants = {}
+        for row, (_, name) in enumerate(keys):
+            count = int(stats["count"][row])
+            variants[name] = {"price": float(stats["trimmed_mean"][row]) if count else 0.0, "listings": count}
+        self.debug_message.emit(
+            "Variants: " + ", ".join(f"{name} {v['price']:.2f} ({v['listings']})" for name, v in variants.items())
+        )
+
+        summary = self.listings.summary((tuple(combo), primary))
+        self.listings.discard(keys)
+        summary["price"] = variants[primary]["price"]
+        summary["variants"] = variants
+        summary["rolls"] = self.roll_summary(combo, partitions[primary])
+        return summary
+
+    def roll_summary(self, combo, listings):
+        """Roll-aware prices of the combo from the rolls parsed out of its listings."""
+        indexes = [i for i in combo if self.matcher.rolled[i]]
+        model = roll_model(indexes, listings, self.rolls)
+        if model is None:
+            return None
+        model["mods"] = [self.catalog.names[i] for i in indexes]
+        self.debug_message.emit("Roll buckets (low → high): " + ", ".join(
+            f"{bucket['price']:.2f} ({bucket['listings']})" if bucket["price"] is not None else "-"
+            for bucket in model["buckets"]
+        ))
+        if model["slopes"] is not None:
+            low, high = (roll_price(model, [bounds[end] for bounds in model["ranges"]]) for end in (0, 1))
+            self.debug_message.emit(f"Fitted price at the lowest / highest rolls: {low:.2f} / {high:.2f}")
+        return model
+
+    def add_result(self, mods, summary):
+        avg_price = summary["price"]
+        listings = summary["count"]
+        indexes = [self.catalog.index(mod) for mod in mods]
+        result = self.results.update(
+            indexes, avg_price, listings=listings,
+            stats={"median": summary["median"], "min": summary["min"]} if listings else None,
+            variants=summary.get("variants"), rolls=summary.get("rolls")
+        )
+        try:
+            self.history.append([result], self.catalog)
+        except OSError as e:
+            self.debug_message.emit(f"❌ History write error: {str(e)}")
+        self.results_since_estimate += 1
+        if len(indexes) == 3:
+            self.matrix.set_triple(*indexes, avg_price, listings, result.updated)
+        elif len(indexes) == 2:
+            self.matrix.set_pair(*indexes, avg_price, listings, result.updated)
+            self.pair_updated.emit(*indexes, avg_price, listings, result.updated)
+        else:
+            self.matrix.set_single(*indexes, avg_price, listings, result.updated)
+
+    def update_results_file(self):
+        try:
+            self.results.save()
+            self.debug_message.emit(f"✅ Saved {RESULTS_PATH}")
+        except Exception as e:
+            self.debug_message.emit(f"❌ File write error: {str(e)}")
+
+    def record_snapshot(self):
+        """Add this run's snapshot to the compressed history."""
+        now = time.time()
+        try:
+            kind = self.snapshots.record(self.results.results.values(), self.catalog, now)
+        except (OSError, ValueError) as e:
+            self.debug_message.emit(f"❌ Snapshot history write error: {str(e)}")
+            return
+        if kind is not None:
+            self.debug_message.emit(f"✅ Stored {kind} frame in the snapshot history")
+            self.snapshot_recorded.emit(now, list(self.snapshots.latest(self.catalog).values()))
+
+    def save_profile(self):
+        if not self.profiler.enabled:
+            return
+        try:
+            self.profiler.save()
+            report = self.profiler.report()
+            self.debug_message.emit(report)
+            print(report, file=sys.stderr)
+        except Exception as e:
+            self.debug_message.emit(f"❌ Profile write error: {str(e)}")
+
+    def save_metrics(self):
+        try:
+            self.metrics.save()
+        except Exception as e:
+            self.debug_message.emit(f"❌ Metrics write error: {str(e)}")
+
+    def stop(self):
+        self.running = False
+
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
@@ -0,0 +1,64 @@
+import time
+
+import numpy as np
+
+from liquidity import scanned_empty
+from price_estimator import Z_90, estimate_prices
+
+# Log-price drift per sqrt(day) since a pair was last searched
+DRIFT_PER_DAY = 0.15
+# Stop once no pair's expected error is worth a request (in divine)
+DEFAULT_MIN_GAIN = 0.5
+
+
+class QuerySelector:
+    """Pick the next pair to search by expected information gain.
+
+    The gain of a pair is the width of its 90% price interval in divine, so
+    valuable pairs with uncertain or stale prices are searched first and
+    cheap or well-known pairs are left alone. Observed prices widen again
+    as they age. Pairs a liquidity scan found empty are not searched. Pairs
+    are searched at most once per selector.
+    """
+
+    def __init__(self, matrix, min_gain=DEFAULT_MIN_GAIN, drift_per_day=DRIFT_PER_DAY):
+        self.matrix = matrix
+        self.min_gain = min_gain
+        self.drift_per_day = drift_per_day
+        self.queried = np.zeros((matrix.size, matrix.size), dtype=bool)
+        np.fill_diagonal(self.queried, True)
+        self.estimate = None
+
+    def gains(self, now=None):
+        self.estimate = estimate = estimate_prices(self.matrix)
+        now = time.time() if now is None else now
+        age_days = np.where(self.matrix.updated > 0, (now - self.matrix.updated) / 86400, 0.0)
+        log_std = np.sqrt(estimate.log_std ** 2 + self.drift_per_day ** 2 * np.maximum(age_days, 0.0))
+        centre = np.where(estimate.observed, self.matrix.prices, estimate.mean)
+        gain = centre * (np.exp(Z_90 * log_std) - np.exp(-Z_90 * log_std))
+        # Without any data to estimate from, fall back to catalog order
+        gain = np.where(np.isnan(gain), np.inf, gain)
+        # Nothing to learn from pairs a recent scan found no listings for
+        gain = np.where(scanned_empty(self.matrix, now), 0.0, gain)
+        return np.where(self.queried, -np.inf, gain)
+
+    def next_pair(self):
+        gain = self.gains()
+        gain[np.tril_indices(self.matrix.size)] = -np.inf
+        best = int(np.argmax(gain))
+        i, j = divmod(best, self.matrix.size)
+        if gain[i, j] < self.min_gain:
+            return None
+        return i, j, float(gain[i, j])
+
+    def mark_queried(self, i, j):
+        self.queried[i, j] = self.queried[j, i] = True
+
+    def __iter__(self):
+        while True:
+            choice = self.next_pair()
+            if choice is None:
+                return
+            i, j, _ = choice
+            self.mark_queried(i, j)
+            yield i, j
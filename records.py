@@ -0,0 +1,126 @@
+import binascii
+
+# Trade listing ids are 64 hex digits, so a packed id takes 32 bytes
+_PACKED_ID = 32
+
+
+class Listing:
+    """The parts of a fetched trade listing the engine uses; everything else is dropped."""
+
+    __slots__ = ("id", "amount", "currency", "corrupted", "ilvl", "mods")
+
+    def __init__(self, id, amount, currency, corrupted=False, ilvl=0, mods=()):
+        self.id = id
+        self.amount = amount
+        self.currency = currency
+        self.corrupted = corrupted
+        self.ilvl = ilvl
+        self.mods = mods
+
+
+def _combo_names(catalog, combo):
+    names = [catalog.names[i] for i in combo] + [None, None]
+    return names[:3]
+
+
+def combo_from_row(catalog, row):
+    """Catalog indexes of a stored row's mods; None when a mod is no longer in the catalog."""
+    try:
+        return tuple(catalog.index_of_name(row[name]) for name in ("mod1", "mod2", "mod3") if row.get(name))
+    except KeyError:
+        return None
+
+
+class Observation:
+    """A combo's price at one point in time; ``combo`` holds catalog indexes in mod order."""
+
+    __slots__ = ("combo", "price", "listings", "updated")
+
+    def __init__(self, combo, price, listings, updated):
+        self.combo = combo
+        self.price = price
+        self.listings = listings
+        self.updated = updated
+
+
+class ComboResult(Observation):
+    """Latest result of a combo with its robust statistics, filter variants and roll pricing."""
+
+    __slots__ = ("median", "minimum", "variants", "rolls")
+
+    def __init__(self, combo, price, listings, updated, median=None, minimum=None, variants=None, rolls=None):
+        super().__init__(combo, price, listings, updated)
+        self.median = median
+        self.minimum = minimum
+        self.variants = variants
+        self.rolls = rolls
+
+    @classmethod
+    def from_row(cls, catalog, row):
+        combo = combo_from_row(catalog, row)
+        if combo is None:
+            return None
+        return cls(
+            combo, row["avg_price"], row.get("listings"), row.get("updated", 0),
+            row.get("median"), row.get("min"), row.get("variants"), row.get("rolls")
+        )
+
+    def to_row(self, catalog):
+        """The result as stored in the snapshot file, with mod names."""
+        mod1, mod2, mod3 = _combo_names(catalog, self.combo)
+        row = {"mod1": mod1, "mod2": mod2, "avg_price": self.price, "updated": self.updated}
+        if mod3 is not None:
+            row["mod3"] = mod3
+        if self.listings is not None:
+            row["listings"] = self.listings
+        if self.median is not None:
+            row["median"] = self.median
+        if self.minimum is not None:
+            row["min"] = self.minimum
+        if self.variants:
+            row["variants"] = self.variants
+        if self.rolls:
+            row["rolls"] = self.rolls
+        return row
+
+
+def pack_ids(ids):
+    """Listing ids as one bytes object when they are all trade-style hex ids."""
+    try:
+        if all(len(listing_id) == 2 * _PACKED_ID for listing_id in ids):
+            return binascii.unhexlify("".join(ids))
+    except (binascii.Error, ValueError):
+        pass
+    return tuple(ids)
+
+
+def unpack_ids(packed):
+    if isinstance(packed, bytes):
+        return [packed[start:start + _PACKED_ID].hex() for start in range(0, len(packed), _PACKED_ID)]
+    return list(packed)
+
+
+class ScanRecord:
+    """Listing count and result ids of a combo from a liquidity scan."""
+
+    __slots__ = ("combo", "total", "ids", "updated")
+
+    def __init__(self, combo, total, ids, updated):
+        self.combo = combo
+        self.total = total
+        self.ids = pack_ids(ids)
+        self.updated = updated
+
+    @classmethod
+    def from_row(cls, catalog, row):
+        combo = combo_from_row(catalog, row)
+        if combo is None:
+            return None
+        return cls(combo, row["total"], row.get("ids") or (), row.get("updated", 0))
+
+    def to_row(self, catalog):
+        mod1, mod2, mod3 = _combo_names(catalog, self.combo)
+        row = {"mod1": mod1, "mod2": mod2, "total": self.total, "ids": unpack_ids(self.ids), "updated": self.updated}
+        if mod3 is not None:
+            row["mod3"] = mod3
+        return row
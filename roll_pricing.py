@@ -0,0 +1,70 @@
+import numpy as np
+
+from price_aggregation import summarize
+
+# Listings are split into this many roll-quality buckets, low to high
+ROLL_BUCKETS = 3
+# Fewer listings with readable rolls than this give no roll model
+MIN_ROLL_LISTINGS = 4
+
+
+def listing_rolls(listings, matcher):
+    """``{listing id: {catalog index: value}}`` parsed from fetched listings' explicit mods."""
+    return {listing.id: matcher.roll_values(listing.mods) for listing in listings}
+
+
+def roll_model(indexes, listings, rolls):
+    """Roll-aware pricing of one combo from ``(listing id, price)`` pairs.
+
+    ``indexes`` are the combo's mods that have a numeric roll. Returns None
+    when too few listings have readable rolls, otherwise a dict with the
+    observed roll ``ranges`` and ``slopes`` of log price per unit of roll
+    (plus the ``intercept``), both in ``indexes`` order, and the price of
+    each roll-quality bucket from the lowest to the highest rolls. Quality
+    is the mean position of a listing's rolls within the observed ranges.
+    """
+    if not indexes:
+        return None
+    samples = []
+    for listing_id, price in listings:
+        values = rolls.get(listing_id, {})
+        if price > 0 and all(values.get(i) is not None for i in indexes):
+            samples.append([values[i] for i in indexes] + [price])
+    if len(samples) < MIN_ROLL_LISTINGS:
+        return None
+
+    samples = np.array(samples)
+    values, prices = samples[:, :-1], samples[:, -1]
+    low, high = values.min(axis=0), values.max(axis=0)
+    span = np.where(high > low, high - low, 1.0)
+    quality = np.where(high > low, (values - low) / span, 0.5).mean(axis=1)
+
+    model = {
+        "listings": len(samples),
+        "ranges": np.stack([low, high], axis=1).tolist(),
+        "intercept": None,
+        "slopes": None,
+        "buckets": [],
+    }
+    # One coefficient per mod plus the intercept needs at least one spare listing
+    if len(samples) > len(indexes) + 1:
+        design = np.column_stack([np.ones(len(samples)), values])
+        coefficients = np.linalg.lstsq(design, np.log(prices), rcond=None)[0]
+        model["intercept"] = float(coefficients[0])
+        model["slopes"] = coefficients[1:].tolist()
+    bucket = np.minimum((quality * ROLL_BUCKETS).astype(int), ROLL_BUCKETS - 1)
+    for b in range(ROLL_BUCKETS):
+        in_bucket = prices[bucket == b].tolist()
+        stats = summarize(in_bucket)
+        model["buckets"].append({
+            "price": stats["trimmed_mean"] if stats["count"] else None,
+            "listings": stats["count"],
+        })
+    return model
+
+
+def roll_price(model, values):
+    """Predicted price for the given rolls (in the model's mod order)."""
+    if not model or model["slopes"] is None:
+        return None
+    return float(np.exp(model["intercept"] + np.dot(model["slopes"], values)))
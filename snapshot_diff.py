@@ -0,0 +1,160 @@
+import warnings
+
+import numpy as np
+
+DEFAULT_MOVERS = 50
+RANKINGS = ("relative", "absolute", "listings")
+
+
+def pair_arrays(records, size):
+    """Pair prices and listing counts of a snapshot as symmetric matrices.
+
+    Prices are NaN and counts -1 where the snapshot has no priced pair; a
+    price of zero (no listings found) counts as absent.
+    """
+    pairs = [
+        (record.combo[0], record.combo[1], record.price, -1 if record.listings is None else record.listings)
+        for record in records if len(record.combo) == 2 and record.price > 0
+    ]
+    prices = np.full((size, size), np.nan)
+    counts = np.full((size, size), -1, dtype=np.int32)
+    if pairs:
+        i, j, price, listings = (np.array(column) for column in zip(*pairs))
+        prices[i, j] = prices[j, i] = price
+        counts[i, j] = counts[j, i] = listings
+    return prices, counts
+
+
+class SnapshotDiff:
+    """Pair-matrix changes from one snapshot to another.
+
+    ``absolute`` and ``relative`` are NaN unless the pair is priced in both
+    snapshots; ``new`` and ``vanished`` mark pairs priced in only one.
+    ``listings`` is the change in listing count, 0 where either is unknown.
+    """
+
+    __slots__ = ("before", "after", "before_counts", "after_counts", "absolute", "relative", "new", "vanished",
+                 "listings")
+
+    def __init__(self, before, after, before_counts, after_counts):
+        self.before = before
+        self.after = after
+        self.before_counts = before_counts
+        self.after_counts = after_counts
+        self.absolute = after - before
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.relative = self.absolute / before
+        had, has = ~np.isnan(before), ~np.isnan(after)
+        self.new = has & ~had
+        self.vanished = had & ~has
+        known = (before_counts >= 0) & (after_counts >= 0)
+        self.listings = np.where(known, after_counts - before_counts, 0)
+
+    def changed(self):
+        """Pairs whose price moved, as a mask."""
+        return np.nan_to_num(self.absolute) != 0
+
+    def summary(self):
+        upper = np.triu(np.ones(self.before.shape, dtype=bool), 1)
+        return {
+            "changed": int((self.changed() & upper).sum()),
+            "new": int((self.new & upper).sum()),
+            "vanished": int((self.vanished & upper).sum()),
+            "listings_changed": int(((self.listings != 0) & upper).sum()),
+        }
+
+    def top_movers(self, limit=DEFAULT_MOVERS, by="relative"):
+        """``(i, j)`` of the pairs that moved most, largest first, with ``i < j``."""
+        scores = {"relative": self.relative, "absolute": self.absolute, "listings": self.listings}[by]
+        return _top_pairs(np.abs(np.nan_to_num(scores.astype(float), nan=0.0)), limit)
+
+    def top_new(self, limit=DEFAULT_MOVERS):
+        """Newly priced pairs, most expensive first."""
+        return _top_pairs(np.where(self.new, self.after, 0.0), limit)
+
+    def top_vanished(self, limit=DEFAULT_MOVERS):
+        """Pairs that lost their price, most expensive first."""
+        return _top_pairs(np.where(self.vanished, self.before, 0.0), limit)
+
+
+def _top_pairs(scores, limit):
+    """Pairs of the upper triangle with the largest positive ``scores``."""
+    rows, cols = np.triu_indices(scores.shape[0], 1)
+    values = scores[rows, cols]
+    candidates = np.flatnonzero(values > 0)
+    if len(candidates) > limit:
+        candidates = candidates[np.argpartition(-values[candidates], limit - 1)[:limit]]
+    candidates = candidates[np.argsort(-values[candidates], kind="stable")]
+    return [(int(rows[n]), int(cols[n])) for n in candidates]
+
+
+def diff_snapshots(before, after, size):
+    """Diff two snapshots given as records with ``combo``, ``price`` and ``listings``."""
+    before_prices, before_counts = pair_arrays(before, size)
+    after_prices, after_counts = pair_arrays(after, size)
+    return SnapshotDiff(before_prices, after_prices, before_counts, after_counts)
+
+
+class SnapshotStack:
+    """Pair prices and listing counts of every stored snapshot, stacked over time.
+
+    ``prices`` and ``counts`` have shape ``(len(times), size, size)``, so a
+    diff between any two snapshots is a pair of array lookups.
+    """
+
+    def __init__(self, times, prices, counts):
+        self.times = times
+        self.prices = prices
+        self.counts = counts
+
+    @classmethod
+    def from_history(cls, history, catalog):
+        size = len(catalog)
+        times, prices, counts = [], [], []
+        for stamp, state, changed in history.states(catalog):
+            if changed is None:
+                frame_prices, frame_counts = pair_arrays(state.values(), size)
+            else:
+                # A delta only rewrites the pairs it touched
+                frame_prices, frame_counts = prices[-1].copy(), counts[-1].copy()
+                pairs = [key for key in changed if len(key) == 2]
+                if pairs:
+                    i, j = np.array(pairs).T
+                    frame_prices[i, j] = frame_prices[j, i] = np.nan
+                    frame_counts[i, j] = frame_counts[j, i] = -1
+                    update_prices, update_counts = pair_arrays((state[key] for key in pairs if key in state), size)
+                    touched = ~np.isnan(update_prices)
+                    frame_prices[touched] = update_prices[touched]
+                    frame_counts[touched] = update_counts[touched]
+            times.append(stamp)
+            prices.append(frame_prices)
+            counts.append(frame_counts)
+        if not times:
+            return cls(np.zeros(0), np.zeros((0, size, size)), np.zeros((0, size, size), dtype=np.int32))
+        return cls(np.array(times), np.stack(prices), np.stack(counts))
+
+    def __len__(self):
+        return len(self.times)
+
+    def append(self, stamp, records):
+        """Add a newer snapshot given as records with ``combo``, ``price`` and ``listings``."""
+        prices, counts = pair_arrays(records, self.prices.shape[1])
+        self.times = np.append(self.times, stamp)
+        self.prices = np.concatenate([self.prices, prices[None]])
+        self.counts = np.concatenate([self.counts, counts[None]])
+
+    def diff(self, first, second):
+        return SnapshotDiff(self.prices[first], self.prices[second], self.counts[first], self.counts[second])
+
+    def swings(self, first=0, last=None):
+        """Relative range (max / min - 1) of every pair's price over a span of snapshots."""
+        window = self.prices[first:None if last is None else last + 1]
+        # Pairs never priced in the span are all-NaN slices and stay NaN
+        with warnings.catch_warnings(), np.errstate(invalid="ignore", divide="ignore"):
+            warnings.simplefilter("ignore", RuntimeWarning)
+            return np.nanmax(window, axis=0) / np.nanmin(window, axis=0) - 1
+
+    def top_swings(self, limit=DEFAULT_MOVERS, first=0, last=None):
+        """``(i, j)`` of the pairs whose price ranged most over a span of snapshots."""
+        return _top_pairs(np.nan_to_num(self.swings(first, last), nan=0.0), limit)
+
@@ -0,0 +1,218 @@
+"""Export price snapshots and history to CSV and columnar files.
+
+Run ``python snapshot_export.py prices.parquet`` to export the latest
+snapshot, or ``--history`` to export every observation logged so far. The
+format follows the extension: ``.csv``, ``.parquet`` (needs pyarrow) or
+``.npz``. Columnar files key mods by catalog index and carry the catalog
+names alongside; absent mods and counts are -1, absent prices NaN.
+"""
+import argparse
+import csv
+import os
+import shutil
+import tempfile
+import zipfile
+from itertools import islice
+
+import numpy as np
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+from atomic_file import atomic_write
+from records import Observation, combo_from_row
+
+HISTORY_PATH = "price_history.csv"
+CSV_COLUMNS = ("mod1", "mod2", "mod3", "price", "listings", "median", "min", "updated")
+HISTORY_COLUMNS = ("mod1", "mod2", "mod3", "price", "listings", "updated")
+# Records are converted to columns this many at a time
+CHUNK_ROWS = 4096
+
+
+def _csv_value(value):
+    return "" if value is None else value
+
+
+def csv_row(catalog, record, columns=CSV_COLUMNS):
+    names = [catalog.names[i] for i in record.combo] + ["", ""]
+    values = {
+        "mod1": names[0], "mod2": names[1], "mod3": names[2],
+        "price": record.price, "listings": _csv_value(record.listings),
+        "median": _csv_value(getattr(record, "median", None)),
+        "min": _csv_value(getattr(record, "minimum", None)),
+        "updated": record.updated,
+    }
+    return [values[column] for column in columns]
+
+
+def write_csv(records, catalog, path, columns=CSV_COLUMNS):
+    with atomic_write(path, encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(csv_row(catalog, record, columns) for record in records)
+
+
+def _floats(values):
+    return np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+
+
+def columns_of(records):
+    """Numeric columns of a list of records."""
+    mods = np.full((len(records), 3), -1, dtype=np.int16)
+    for row, record in enumerate(records):
+        mods[row, :len(record.combo)] = record.combo
+    return {
+        "mod1": mods[:, 0], "mod2": mods[:, 1], "mod3": mods[:, 2],
+        "price": _floats(record.price for record in records),
+        "listings": np.array([-1 if r.listings is None else r.listings for r in records], dtype=np.int32),
+        "median": _floats(getattr(record, "median", None) for record in records),
+        "min": _floats(getattr(record, "minimum", None) for record in records),
+        "updated": np.array([record.updated for record in records], dtype=np.int64),
+    }
+
+
+def column_chunks(records, chunk_rows=CHUNK_ROWS):
+    """Columns of up to ``chunk_rows`` records at a time, so exports never hold every record."""
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, chunk_rows))
+        if not chunk:
+            return
+        yield columns_of(chunk)
+
+
+def write_parquet(records, catalog, path):
+    if pyarrow is None:
+        raise RuntimeError("Parquet export needs pyarrow; export to .npz instead")
+    metadata = {"names": "\n".join(catalog.names)}
+    with atomic_write(path, "wb") as f:
+        writer = None
+        try:
+            for chunk in column_chunks(records):
+                table = pyarrow.table(chunk).replace_schema_metadata(metadata)
+                if writer is None:
+                    writer = pyarrow.parquet.ParquetWriter(f, table.schema)
+                writer.write_table(table)
+            if writer is None:
+                pyarrow.parquet.write_table(pyarrow.table(columns_of([])).replace_schema_metadata(metadata), f)
+        finally:
+            if writer is not None:
+                writer.close()
+
+
+def write_npz(records, catalog, path):
+    """Stream ``records`` into an ``.npz`` archive a chunk at a time.
+
+    An ``.npy`` member needs its row count in the header, which a stream
+    only knows at the end, so each column is first spilled to a raw file
+    and then copied into its member behind the header.
+    """
+    dtypes = {name: column.dtype for name, column in columns_of([]).items()}
+    rows = 0
+    with tempfile.TemporaryDirectory() as spill:
+        spills = {name: open(os.path.join(spill, name), "wb") for name in dtypes}
+        try:
+            for chunk in column_chunks(records):
+                for name, column in chunk.items():
+                    column.tofile(spills[name])
+                rows += len(chunk["price"])
+        finally:
+            for f in spills.values():
+                f.close()
+
+        with atomic_write(path, "w", zipfile.ZIP_STORED, opener=zipfile.ZipFile, allowZip64=True) as archive:
+            with archive.open("names.npy", "w") as member:
+                np.lib.format.write_array(member, np.array(catalog.names))
+            for name, dtype in dtypes.items():
+                with archive.open(f"{name}.npy", "w", force_zip64=True) as member:
+                    np.lib.format.write_array_header_1_0(member, {
+                        "descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": (rows,),
+                    })
+                    with open(os.path.join(spill, name), "rb") as f:
+                        shutil.copyfileobj(f, member)
+
+
+WRITERS = {".csv": write_csv, ".parquet": write_parquet, ".npz": write_npz}
+
+
+def export(records, catalog, path):
+    """Write ``records`` (Observations or ComboResults) in the format named by the extension."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in WRITERS:
+        raise ValueError(f"Unknown export format: {extension or path}")
+    WRITERS[extension](records, catalog, path)
+
+
+def load_columns(path):
+    """Columns of a ``.parquet`` or ``.npz`` export as NumPy arrays, with ``names``."""
+    if path.lower().endswith(".parquet"):
+        if pyarrow is None:
+            raise RuntimeError("Reading Parquet needs pyarrow")
+        table = pyarrow.parquet.read_table(path)
+        columns = {name: table.column(name).to_numpy() for name in table.column_names}
+        columns["names"] = np.array(table.schema.metadata[b"names"].decode("utf-8").split("\n"))
+        return columns
+    with np.load(path) as data:
+        return {name: data[name] for name in data.files}
+
+
+class HistoryLog:
+    """Append-only CSV of every observed combo price, oldest first.
+
+    Mods are stored by name so the log stays readable when the catalog
+    changes; observations of mods no longer in the catalog are skipped
+    when read back.
+    """
+
+    def __init__(self, path=HISTORY_PATH):
+        self.path = path
+
+    def append(self, observations, catalog):
+        new_file = not os.path.exists(self.path)
+        with open(self.path, "a", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            if new_file:
+                writer.writerow(HISTORY_COLUMNS)
+            writer.writerows(csv_row(catalog, record, HISTORY_COLUMNS) for record in observations)
+
+    def read(self, catalog):
+        """Observations in log order, streamed from the file."""
+        try:
+            f = open(self.path, encoding="utf-8", newline="")
+        except FileNotFoundError:
+            return
+        with f:
+            for row in csv.DictReader(f):
+                combo = combo_from_row(catalog, row)
+                if combo is None:
+                    continue
+                listings = int(row["listings"]) if row["listings"] else None
+                yield Observation(combo, float(row["price"]), listings, int(row["updated"]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output", help="file to write; the extension picks the format (.csv, .parquet, .npz)")
+    parser.add_argument("--history", action="store_true", help="export the observation log instead of the snapshot")
+    args = parser.parse_args()
+
+    from mod_catalog import load_catalog
+    from snapshot_store import ResultSnapshot, load_results
+
+    catalog = load_catalog()
+    if args.history:
+        records = HistoryLog().read(catalog)
+    else:
+        records = ResultSnapshot(load_results(), catalog).results.values()
+    try:
+        export(records, catalog, args.output)
+    except (RuntimeError, ValueError) as e:
+        parser.error(str(e))
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
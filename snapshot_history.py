@@ -0,0 +1,215 @@
+"""Compressed history of price snapshots as keyframes and per-run deltas.
+
+Run ``python snapshot_history.py`` to list the stored frames, or
+``python snapshot_history.py --at 2026-10-01T12:00 prices.csv`` to export
+the market state at that time in any format ``snapshot_export`` writes.
+"""
+import argparse
+import json
+import lzma
+import os
+import time
+from datetime import datetime
+
+from atomic_file import atomic_write
+from records import Observation
+
+HISTORY_DIR = "snapshot_history"
+# Every this many frames the full snapshot is stored, bounding how many
+# deltas a lookup has to replay
+KEYFRAME_INTERVAL = 20
+KEYFRAME, DELTA = "key", "delta"
+_SUFFIX = ".json.xz"
+
+
+def _combo_key(combo):
+    return tuple(sorted(combo))
+
+
+def _frame_row(record):
+    return [list(record.combo), record.price, record.listings, record.updated]
+
+
+class SnapshotHistory:
+    """Snapshots of every run, stored as lzma-compressed JSON frames.
+
+    A keyframe holds every combo; a delta holds only the combos whose price
+    or listing count changed since the previous frame, and the combos that
+    disappeared. Frames store mods as indexes into the catalog names saved
+    with them, so a history survives catalog changes; combos whose mods left
+    the catalog are dropped on replay.
+    """
+
+    def __init__(self, directory=HISTORY_DIR, keyframe_interval=KEYFRAME_INTERVAL):
+        self.directory = directory
+        self.keyframe_interval = keyframe_interval
+        self._latest = None
+
+    def frames(self):
+        """``(sequence, time, kind, path)`` of every stored frame, oldest first."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        frames = []
+        for name in names:
+            if not name.endswith(_SUFFIX):
+                continue
+            try:
+                sequence, stamp, kind = name[:-len(_SUFFIX)].split("-")
+                frames.append((int(sequence), int(stamp), kind, os.path.join(self.directory, name)))
+            except ValueError:
+                continue
+        return sorted(frames)
+
+    def times(self):
+        return [stamp for _, stamp, _, _ in self.frames()]
+
+    def _read(self, path):
+        with lzma.open(path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _write(self, sequence, stamp, kind, frame):
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{sequence:06d}-{stamp}-{kind}{_SUFFIX}")
+        with atomic_write(path, "wt", opener=lzma.open, encoding="utf-8") as f:
+            json.dump(frame, f, ensure_ascii=False, separators=(",", ":"))
+        return path
+
+    def _replay(self, frames, catalog):
+        """``(time, state, changed)`` after each of ``frames`` in turn.
+
+        ``state`` is keyed by sorted combo and updated in place between
+        frames; ``changed`` lists the keys a delta touched and is None after
+        a keyframe.
+        """
+        state = {}
+        for _, stamp, kind, path in frames:
+            frame = self._read(path)
+            indexes = []
+            for name in frame["names"]:
+                try:
+                    indexes.append(catalog.index_of_name(name))
+                except KeyError:
+                    indexes.append(None)
+            if kind == KEYFRAME:
+                state.clear()
+            changed = None if kind == KEYFRAME else []
+            for combo in frame.get("removed", ()):
+                combo = tuple(indexes[i] for i in combo)
+                if None not in combo:
+                    state.pop(_combo_key(combo), None)
+                    if changed is not None:
+                        changed.append(_combo_key(combo))
+            for combo, price, listings, updated in frame["rows"]:
+                combo = tuple(indexes[i] for i in combo)
+                if None not in combo:
+                    state[_combo_key(combo)] = Observation(combo, price, listings, updated)
+                    if changed is not None:
+                        changed.append(_combo_key(combo))
+            yield stamp, state, changed
+
+    def state_at(self, when, catalog):
+        """Market state at time ``when`` as ``{sorted combo: Observation}``.
+
+        Replays the deltas stored at or before ``when`` on top of the nearest
+        earlier keyframe; empty before the first frame.
+        """
+        frames = [frame for frame in self.frames() if frame[1] <= when]
+        start = max((n for n, frame in enumerate(frames) if frame[2] == KEYFRAME), default=None)
+        state = {}
+        if start is not None:
+            for _, state, _ in self._replay(frames[start:], catalog):
+                pass
+        return state
+
+    def states(self, catalog):
+        """``(time, state, changed)`` after every stored frame, replaying the history once.
+
+        The state dict is updated in place, so copy whatever must outlive
+        the next step.
+        """
+        frames = self.frames()
+        start = next((n for n, frame in enumerate(frames) if frame[2] == KEYFRAME), len(frames))
+        return self._replay(frames[start:], catalog)
+
+    def latest(self, catalog):
+        if self._latest is None:
+            self._latest = self.state_at(float("inf"), catalog)
+        return self._latest
+
+    def record(self, results, catalog, now=None):
+        """Store the snapshot ``results`` (records with ``combo``); returns the frame kind or None.
+
+        Nothing is written when no combo changed since the last frame.
+        """
+        stamp = round(time.time() if now is None else now)
+        previous = self.latest(catalog)
+        current = {_combo_key(record.combo): record for record in results}
+        frames = self.frames()
+        sequence = frames[-1][0] + 1 if frames else 0
+        since_keyframe = next(
+            (n for n, frame in enumerate(reversed(frames)) if frame[2] == KEYFRAME), None
+        )
+
+        rows = [
+            _frame_row(record) for key, record in current.items()
+            if key not in previous
+            or previous[key].price != record.price or previous[key].listings != record.listings
+        ]
+        removed = [list(previous[key].combo) for key in previous.keys() - current.keys()]
+        if frames and not rows and not removed:
+            return None
+        if since_keyframe is None or since_keyframe + 1 >= self.keyframe_interval:
+            kind = KEYFRAME
+            rows = [_frame_row(record) for record in current.values()]
+            removed = []
+        else:
+            kind = DELTA
+
+        frame = {"time": stamp, "names": list(catalog.names), "rows": rows}
+        if removed:
+            frame["removed"] = removed
+        self._write(sequence, stamp, kind, frame)
+        self._latest = {
+            key: Observation(record.combo, record.price, record.listings, record.updated)
+            for key, record in current.items()
+        }
+        return kind
+
+
+def parse_time(text):
+    """Unix seconds from an epoch number or an ISO date in local time."""
+    try:
+        return float(text)
+    except ValueError:
+        return datetime.fromisoformat(text).timestamp()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output", nargs="?", help="export the state to this file (.csv, .parquet, .npz)")
+    parser.add_argument("--at", default="inf", help="time of the state, as Unix seconds or an ISO date")
+    args = parser.parse_args()
+
+    history = SnapshotHistory()
+    if not args.output:
+        for sequence, stamp, kind, path in history.frames():
+            print(f"{sequence:>6} {datetime.fromtimestamp(stamp):%Y-%m-%d %H:%M:%S} {kind:<5} "
+                  f"{os.path.getsize(path):>9} bytes")
+        return
+
+    from mod_catalog import load_catalog
+    from snapshot_export import export
+
+    catalog = load_catalog()
+    try:
+        when = parse_time(args.at)
+        export(history.state_at(when, catalog).values(), catalog, args.output)
+    except (RuntimeError, ValueError) as e:
+        parser.error(str(e))
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
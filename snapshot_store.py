@@ -0,0 +1,83 @@
+import json
+import time
+
+from atomic_file import atomic_write
+from mod_catalog import load_catalog
+from records import ComboResult
+
+RESULTS_PATH = "watcher_prices.json"
+
+
+def load_results(path=RESULTS_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError) as e:
+        print("Results read error:", str(e))
+        return []
+
+
+def _rounded_rolls(rolls):
+    rounded = dict(rolls)
+    rounded["ranges"] = [[round(value, 2) for value in pair] for pair in rolls["ranges"]]
+    if rolls["slopes"] is not None:
+        rounded["intercept"] = round(rolls["intercept"], 4)
+        rounded["slopes"] = [round(slope, 4) for slope in rolls["slopes"]]
+    rounded["buckets"] = [
+        dict(bucket, price=round(bucket["price"], 2) if bucket["price"] is not None else None)
+        for bucket in rolls["buckets"]
+    ]
+    return rounded
+
+
+def iter_result_chunks(rows, chunk_size=500):
+    for start in range(0, len(rows), chunk_size):
+        yield rows[start:start + chunk_size]
+
+
+class ResultSnapshot:
+    """Latest result per combo, seeded from the last persisted snapshot.
+
+    Fresh results replace the stored record in place, so a run that is
+    stopped early still leaves every combo it did not reach in the saved
+    file. Results are held as slotted records keyed by catalog indexes;
+    rows naming mods that are no longer in the catalog are written back
+    unchanged.
+    """
+
+    def __init__(self, rows=(), catalog=None):
+        self.catalog = catalog if catalog is not None else load_catalog()
+        self.results = {}
+        self.unmatched = []
+        for row in rows:
+            result = ComboResult.from_row(self.catalog, row)
+            if result is None:
+                self.unmatched.append(row)
+            else:
+                self.results[tuple(sorted(result.combo))] = result
+
+    def __len__(self):
+        return len(self.results) + len(self.unmatched)
+
+    def update(self, combo, avg_price, updated=None, listings=None, stats=None, variants=None, rolls=None):
+        stats = stats or {}
+        result = ComboResult(
+            tuple(combo), round(avg_price, 2), listings,
+            round(updated if updated is not None else time.time()),
+            round(stats["median"], 2) if "median" in stats else None,
+            round(stats["min"], 2) if "min" in stats else None,
+            {name: {"price": round(v["price"], 2), "listings": v["listings"]} for name, v in variants.items()}
+            if variants else None,
+            _rounded_rolls(rolls) if rolls else None,
+        )
+        self.results[tuple(sorted(result.combo))] = result
+        return result
+
+    def to_list(self):
+        return [result.to_row(self.catalog) for result in self.results.values()] + self.unmatched
+
+    def save(self, path=RESULTS_PATH):
+        with atomic_write(path, encoding="utf-8") as f:
+            json.dump(self.to_list(), f, ensure_ascii=False, indent=2)
@@ -0,0 +1,48 @@
+import sys
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+
+
+class StartupProfile:
+    """Wall-clock timings for each startup component.
+
+    Timings are always recorded; the report is only printed when profiling
+    was requested with ``--profile-startup``.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.started = perf_counter()
+        self.phases = []
+        self._lock = threading.Lock()
+
+    def elapsed(self):
+        return perf_counter() - self.started
+
+    @contextmanager
+    def phase(self, name):
+        begin = perf_counter()
+        try:
+            yield
+        finally:
+            self._record(name, begin - self.started, perf_counter() - begin)
+
+    def mark(self, name):
+        self._record(name, self.elapsed(), 0.0)
+
+    def _record(self, name, offset, duration):
+        with self._lock:
+            self.phases.append((name, offset, duration, threading.current_thread().name))
+
+    def report(self):
+        lines = ["=== Startup Profile ===", f"{'at ms':>9} {'took ms':>9}  {'thread':<12} phase"]
+        with self._lock:
+            phases = sorted(self.phases, key=lambda p: p[1])
+        for name, offset, duration, thread in phases:
+            lines.append(f"{offset * 1000:9.1f} {duration * 1000:9.1f}  {thread:<12} {name}")
+        return "\n".join(lines)
+
+    def print_report(self):
+        if self.enabled:
+            print(self.report(), file=sys.stderr)
@@ -0,0 +1,98 @@
+import cProfile
+import json
+import os
+import sys
+import threading
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+
+TRACE_PATH = "sweep_trace.json"
+# One cProfile dump per phase, e.g. sweep_search.prof
+CPROFILE_PATH = "sweep_{phase}.prof"
+
+
+class SweepProfiler:
+    """Spans of every phase of a sweep, written as a Chrome trace.
+
+    Spans may nest; a phase's self time excludes the spans nested inside it,
+    so the report shows where the run's wall time actually went. With
+    ``cprofile`` each phase also gets its own cProfile, active only while
+    that phase is the innermost span of the thread.
+    """
+
+    def __init__(self, enabled=False, cprofile=False):
+        self.enabled = enabled
+        self.cprofile = enabled and cprofile
+        self.started = perf_counter()
+        self.events = []
+        self.self_times = {}
+        self.profiles = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @classmethod
+    def from_argv(cls, argv=None):
+        argv = sys.argv if argv is None else argv
+        return cls("--profile" in argv or "--profile-cprofile" in argv, "--profile-cprofile" in argv)
+
+    def span(self, name, profile=True, **args):
+        if not self.enabled:
+            return nullcontext()
+        return self._span(name, profile and self.cprofile, args)
+
+    @contextmanager
+    def _span(self, name, profile, args):
+        stack = self._local.__dict__.setdefault("stack", [])
+        profiler = None
+        if profile:
+            with self._lock:
+                profiler = self.profiles.setdefault(name, cProfile.Profile())
+            if stack and stack[-1][1]:
+                stack[-1][1].disable()
+            profiler.enable()
+        # [name, profiler, time spent in nested spans]
+        frame = [name, profiler, 0.0]
+        stack.append(frame)
+        begin = perf_counter()
+        try:
+            yield
+        finally:
+            duration = perf_counter() - begin
+            stack.pop()
+            if profiler:
+                profiler.disable()
+            if stack:
+                stack[-1][2] += duration
+                if profile and stack[-1][1]:
+                    stack[-1][1].enable()
+            self._record(name, begin, duration, duration - frame[2], args)
+
+    def _record(self, name, begin, duration, self_time, args):
+        event = {
+            "name": name, "ph": "X", "pid": os.getpid(), "tid": threading.get_ident(),
+            "ts": round((begin - self.started) * 1e6, 1), "dur": round(duration * 1e6, 1),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+            self.self_times[name] = self.self_times.get(name, 0.0) + self_time
+
+    def report(self):
+        wall = perf_counter() - self.started
+        lines = ["=== Sweep Profile ===", f"{'self s':>9} {'share':>6}  phase"]
+        with self._lock:
+            totals = sorted(self.self_times.items(), key=lambda item: -item[1])
+        for name, seconds in totals:
+            lines.append(f"{seconds:9.2f} {seconds / wall:6.1%}  {name}")
+        lines.append(f"{wall:9.2f} {'':>6}  wall clock")
+        return "\n".join(lines)
+
+    def save(self, path=TRACE_PATH):
+        with self._lock:
+            events = list(self.events)
+            profiles = dict(self.profiles)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        for name, profiler in profiles.items():
+            profiler.dump_stats(CPROFILE_PATH.format(phase=name))
@@ -0,0 +1,61 @@
+import os
+import sys
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mod_catalog import AURAS, STAT_PREFIX, ModCatalog  # noqa: E402
+from records import Observation  # noqa: E402
+
+CATALOG_SIZE = 9
+RUNS = 30
+
+
+def synthetic_catalog(size=CATALOG_SIZE, skip=()):
+    """Catalog of ``size`` synthetic mods; ``skip`` leaves mods out as if they left the game."""
+    return ModCatalog.from_mod_names({
+        f"{STAT_PREFIX}{1000 + n}": f"Mod {n} while affected by {AURAS[n % len(AURAS)]}"
+        for n in range(size) if n not in skip
+    })
+
+
+def random_runs(size, count, seed=0):
+    """``(time, observations)`` of ``count`` fetch runs over a drifting market.
+
+    Each run reprices, adds and drops a few combos (pairs, singles and the
+    odd triple); prices of zero stand for searches that found nothing.
+    """
+    rng = np.random.default_rng(seed)
+    combos = [(i,) for i in range(size)] + list(combinations(range(size), 2)) + [(0, 1, 2), (3, 4, 5)]
+    market = {}
+    runs = []
+    for run in range(count):
+        stamp = 1_700_000_000 + 3600 * run
+        for n in rng.choice(len(combos), size=len(combos) // 4, replace=False):
+            combo = combos[n]
+            if combo in market and rng.random() < 0.2:
+                del market[combo]
+            else:
+                price = 0.0 if rng.random() < 0.1 else round(float(rng.lognormal(0.0, 1.0)), 2)
+                market[combo] = (price, int(rng.integers(0, 40)))
+        runs.append((stamp, [Observation(combo, price, listings, stamp) for combo, (price, listings) in market.items()]))
+    return runs
+
+
+@pytest.fixture
+def catalog():
+    return synthetic_catalog()
+
+
+@pytest.fixture
+def make_catalog():
+    """``synthetic_catalog`` itself, for tests that need a catalog with mods missing."""
+    return synthetic_catalog
+
+
+@pytest.fixture
+def runs():
+    return random_runs(CATALOG_SIZE, RUNS)
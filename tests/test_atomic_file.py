@@ -0,0 +1,35 @@
+import lzma
+
+import pytest
+
+from atomic_file import atomic_write
+
+
+def test_replaces_the_file_when_the_block_succeeds(tmp_path):
+    path = str(tmp_path / "data.json")
+    with open(path, "w") as f:
+        f.write("old")
+    with atomic_write(path, encoding="utf-8") as f:
+        f.write("new")
+    assert open(path).read() == "new"
+    assert not (tmp_path / "data.json.tmp").exists()
+
+
+def test_keeps_the_old_file_when_the_block_fails(tmp_path):
+    path = str(tmp_path / "data.json")
+    with open(path, "w") as f:
+        f.write("old")
+    with pytest.raises(RuntimeError):
+        with atomic_write(path) as f:
+            f.write("half")
+            raise RuntimeError("interrupted")
+    assert open(path).read() == "old"
+    assert not (tmp_path / "data.json.tmp").exists()
+
+
+def test_opener_writes_through_another_file_type(tmp_path):
+    path = str(tmp_path / "frame.json.xz")
+    with atomic_write(path, "wt", opener=lzma.open, encoding="utf-8") as f:
+        f.write("{}")
+    with lzma.open(path, "rt", encoding="utf-8") as f:
+        assert f.read() == "{}"
@@ -0,0 +1,54 @@
+import numpy as np
+
+from records import Observation
+from snapshot_diff import SnapshotStack, diff_snapshots
+from snapshot_history import SnapshotHistory
+
+
+def _assert_same_diff(diff, expected):
+    for name in ("before", "after", "before_counts", "after_counts", "absolute", "relative", "new", "vanished",
+                 "listings"):
+        np.testing.assert_array_equal(getattr(diff, name), getattr(expected, name))
+    assert diff.summary() == expected.summary()
+    assert diff.top_movers() == expected.top_movers()
+
+
+def test_stack_diffs_match_direct_diffs(tmp_path, catalog, runs):
+    history = SnapshotHistory(tmp_path, keyframe_interval=4)
+    for stamp, observations in runs:
+        history.record(observations, catalog, now=stamp)
+
+    stack = SnapshotStack.from_history(history, catalog)
+    assert stack.times.tolist() == [stamp for stamp, _ in runs]
+    size = len(catalog)
+    for first in range(len(runs)):
+        for second in range(len(runs)):
+            expected = diff_snapshots(runs[first][1], runs[second][1], size)
+            _assert_same_diff(stack.diff(first, second), expected)
+
+
+def test_appended_snapshots_match_history(tmp_path, catalog, runs):
+    history = SnapshotHistory(tmp_path, keyframe_interval=4)
+    for stamp, observations in runs[:10]:
+        history.record(observations, catalog, now=stamp)
+    stack = SnapshotStack.from_history(history, catalog)
+    for stamp, observations in runs[10:]:
+        history.record(observations, catalog, now=stamp)
+        stack.append(stamp, observations)
+
+    rebuilt = SnapshotStack.from_history(history, catalog)
+    np.testing.assert_array_equal(stack.times, rebuilt.times)
+    np.testing.assert_array_equal(stack.prices, rebuilt.prices)
+    np.testing.assert_array_equal(stack.counts, rebuilt.counts)
+
+
+def test_diff_marks_new_vanished_and_moved_pairs(catalog):
+    before = [Observation((0, 1), 2.0, 5, 0), Observation((1, 2), 4.0, 3, 0), Observation((2, 3), 1.0, 1, 0)]
+    after = [Observation((1, 0), 3.0, 7, 1), Observation((1, 2), 4.0, 3, 1), Observation((3, 4), 6.0, 2, 1)]
+    diff = diff_snapshots(before, after, len(catalog))
+    assert diff.summary() == {"changed": 1, "new": 1, "vanished": 1, "listings_changed": 1}
+    assert diff.relative[0, 1] == diff.relative[1, 0] == 0.5
+    assert diff.listings[0, 1] == 2
+    assert diff.top_movers() == [(0, 1)]
+    assert diff.top_new() == [(3, 4)]
+    assert diff.top_vanished() == [(2, 3)]
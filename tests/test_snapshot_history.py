@@ -0,0 +1,59 @@
+from snapshot_history import DELTA, KEYFRAME, SnapshotHistory
+
+
+# Deltas store combos whose price or listing count changed, so a re-search
+# that found the same market keeps its earlier time
+def _values(state):
+    return {key: (record.price, record.listings) for key, record in state.items()}
+
+
+def _expected(observations):
+    return {tuple(sorted(record.combo)): (record.price, record.listings) for record in observations}
+
+
+def _record_all(history, runs, catalog):
+    return [history.record(observations, catalog, now=stamp) for stamp, observations in runs]
+
+
+def test_state_at_replays_every_run(tmp_path, catalog, runs):
+    history = SnapshotHistory(tmp_path, keyframe_interval=4)
+    kinds = _record_all(history, runs, catalog)
+    assert kinds[0] == KEYFRAME
+    assert DELTA in kinds and kinds.count(KEYFRAME) > 1
+
+    # A fresh instance has to replay from disk rather than use the cached latest state
+    reread = SnapshotHistory(tmp_path, keyframe_interval=4)
+    for stamp, observations in runs:
+        assert _values(reread.state_at(stamp, catalog)) == _expected(observations)
+        assert _values(reread.state_at(stamp + 1, catalog)) == _expected(observations)
+    assert reread.state_at(runs[0][0] - 1, catalog) == {}
+    assert _values(reread.latest(catalog)) == _expected(runs[-1][1])
+
+
+def test_states_match_state_at(tmp_path, catalog, runs):
+    history = SnapshotHistory(tmp_path, keyframe_interval=4)
+    _record_all(history, runs, catalog)
+    replayed = [(stamp, _values(state)) for stamp, state, _ in history.states(catalog)]
+    assert replayed == [(stamp, _expected(observations)) for stamp, observations in runs]
+
+
+def test_unchanged_run_writes_nothing(tmp_path, catalog, runs):
+    history = SnapshotHistory(tmp_path)
+    stamp, observations = runs[0]
+    assert history.record(observations, catalog, now=stamp) == KEYFRAME
+    assert history.record(observations, catalog, now=stamp + 60) is None
+    assert len(history.frames()) == 1
+
+
+def test_replay_drops_mods_that_left_the_catalog(tmp_path, catalog, make_catalog, runs):
+    history = SnapshotHistory(tmp_path, keyframe_interval=4)
+    _record_all(history, runs, catalog)
+
+    smaller = make_catalog(skip={4})
+    state = history.state_at(runs[-1][0], smaller)
+    names = catalog.names
+    expected = {
+        tuple(sorted(smaller.index_of_name(names[i]) for i in combo)): value
+        for combo, value in _expected(runs[-1][1]).items() if 4 not in combo
+    }
+    assert _values(state) == expected
@@ -0,0 +1,56 @@
+import time
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from price_matrix import PriceMatrix
+from triple_search import known_empty_pairs, triple_candidates
+
+SIZE = 12
+
+
+def random_matrix(seed):
+    """Pair prices with gaps, ties, searched-empty pairs and scanned-empty pairs."""
+    rng = np.random.default_rng(seed)
+    matrix = PriceMatrix(SIZE)
+    now = time.time()
+    for i, j in combinations(range(SIZE), 2):
+        roll = rng.random()
+        if roll < 0.15:
+            continue
+        if roll < 0.25:
+            matrix.set_pair(i, j, 0.0, 0, now)
+        else:
+            # Coarse prices so several pairs tie
+            matrix.set_pair(i, j, float(rng.integers(1, 30)), int(rng.integers(1, 20)), now)
+        if rng.random() < 0.1:
+            matrix.set_total(i, j, 0, now)
+    return matrix
+
+
+def brute_force(matrix, threshold):
+    """``{triple: estimate}`` of every triple without a known-empty pair whose hottest pair meets the threshold."""
+    prices = np.where(np.isnan(matrix.prices), -np.inf, matrix.prices)
+    empty = known_empty_pairs(matrix)
+    expected = {}
+    for triple in combinations(range(SIZE), 3):
+        pairs = list(combinations(triple, 2))
+        if any(empty[i, j] for i, j in pairs):
+            continue
+        estimate = max(prices[i, j] for i, j in pairs)
+        if estimate >= threshold:
+            expected[triple] = float(estimate)
+    return expected
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("threshold", [1.0, 10.0, 25.0])
+def test_candidates_match_brute_force(seed, threshold):
+    matrix = random_matrix(seed)
+    candidates = list(triple_candidates(matrix, threshold))
+    triples = [candidate[:3] for candidate in candidates]
+    assert len(triples) == len(set(triples))
+    assert {candidate[:3]: candidate[3] for candidate in candidates} == brute_force(matrix, threshold)
+    estimates = [candidate[3] for candidate in candidates]
+    assert estimates == sorted(estimates, reverse=True)
@@ -0,0 +1,35 @@
+SEARCH_URL = "https://www.pathofexile.com/api/trade/search/Mercenaries"
+FETCH_URL = "https://www.pathofexile.com/api/trade/fetch/"
+# The fetch endpoint accepts at most 10 listing ids per request
+FETCH_BATCH = 10
+# Item filters of a "clean" listing: uncorrupted and able to roll every mod
+CLEAN_FILTERS = {"corrupted": {"option": "false"}, "ilvl": {"min": 86}}
+
+
+def search_payload(mods, status="online", misc_filters=None):
+    """Trade search body for listings carrying every one of ``mods``, cheapest first."""
+    query = {
+        "status": {"option": status},
+        "stats": [{
+            "type": "and",
+            "filters": [{"id": mod, "disabled": False} for mod in mods]
+        }]
+    }
+    if misc_filters:
+        query["filters"] = {"misc_filters": {"disabled": False, "filters": misc_filters}}
+    return {"query": query, "sort": {"price": "asc"}}
+
+
+def with_price_range(payload, low, high):
+    """Copy of a search body restricted to a chaos-equivalent price range.
+
+    Either bound may be None for an open-ended range.
+    """
+    bounds = {name: value for name, value in (("min", low), ("max", high)) if value is not None}
+    query = dict(payload["query"])
+    query["filters"] = dict(query.get("filters", {}), trade_filters={"disabled": False, "filters": {"price": bounds}})
+    return dict(payload, query=query)
+
+
+def fetch_url(ids, query_id):
+    return f"{FETCH_URL}{','.join(ids)}?query={query_id}"
@@ -0,0 +1,47 @@
+import numpy as np
+
+from liquidity import scanned_empty
+
+DEFAULT_TRIPLE_THRESHOLD = 10.0
+
+
+def known_empty_pairs(matrix):
+    """Pairs that were searched or scanned and had no listings, so no triple can contain them."""
+    return ((matrix.updated > 0) & (matrix.counts == 0)) | scanned_empty(matrix)
+
+
+def triple_candidates(matrix, threshold=DEFAULT_TRIPLE_THRESHOLD):
+    """Yield ``(i, j, k, estimate)`` triples worth querying, most valuable first.
+
+    A triple is estimated at the price of its most expensive pair, so only
+    pairs priced at or above the threshold can produce candidates. Each
+    triple is owned by its most expensive pair and hot pairs are walked in
+    descending price order, which keeps the output sorted without ever
+    materialising all C(87, 3) triples. Triples containing a pair known to
+    have no listings are pruned.
+    """
+    prices = np.where(np.isnan(matrix.prices), -np.inf, matrix.prices)
+    empty = known_empty_pairs(matrix)
+    rows, cols = np.nonzero(np.triu(prices >= threshold, 1))
+    hot_order = np.argsort(-prices[rows, cols], kind="stable")
+    third = np.arange(matrix.size)
+    tied = set()
+
+    for i, j in zip(rows[hot_order].tolist(), cols[hot_order].tolist()):
+        # A priced pair a later liquidity scan found empty can own no triple either
+        if empty[i, j]:
+            continue
+        price = prices[i, j]
+        other_best = np.maximum(prices[i], prices[j])
+        valid = ~empty[i] & ~empty[j] & (third != i) & (third != j)
+        # Triples with a strictly hotter pair were already yielded by that pair
+        ks = third[valid & (other_best <= price)]
+        # Within one owner, prefer triples whose other pairs are also expensive
+        secondary = np.minimum(prices[i, ks], prices[j, ks])
+        for k in ks[np.argsort(-secondary, kind="stable")].tolist():
+            triple = tuple(sorted((i, j, k)))
+            if other_best[k] == price:
+                if triple in tied:
+                    continue
+                tied.add(triple)
+            yield triple + (float(price),)
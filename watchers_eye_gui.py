@@ -1,229 +1,65 @@
 import sys
-import asyncio
-import aiohttp
-import json
-from PyQt5.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QPushButton,
-    QTableWidget, QTableWidgetItem, QLabel, QMessageBox, QTextEdit, QHBoxLayout
-)
-from PyQt5.QtCore import QThread, pyqtSignal, QObject
-from mod_data import MOD_COMBOS, MOD_NAMES
-
-SINGLE_MODS = list(MOD_NAMES.keys())
-
-class PriceWorker(QObject):
-    result_ready = pyqtSignal(float, str, str)
-    status_update = pyqtSignal(str)
-    debug_message = pyqtSignal(str)
-    countdown_update = pyqtSignal(int)
-
-    def __init__(self):
-        super().__init__()
-        self.running = True
-        self.paused = False
-        self.single_mode = False
-        self.results = []
-
-    def start(self):
-        asyncio.run(self.sequential_fetch_loop())
-
-    async def sequential_fetch_loop(self):
-        headers = {
-            "User-Agent": "poe-watchers-eye-analyzer/1.0",
-            "Content-Type": "application/json"
-        }
-        self.debug_message.emit("=== API Debug Info ===")
-
-        async with aiohttp.ClientSession(headers=headers) as session:
-            mod_list = SINGLE_MODS if self.single_mode else MOD_COMBOS
-
-            for mod in mod_list:
-                while self.paused:
-                    await asyncio.sleep(1)
-                if not self.running:
-                    break
-
-                if self.single_mode:
-                    mod1 = mod
-                    self.status_update.emit(f"Fetching: {MOD_NAMES[mod1]}")
-                    avg_price = await self.query_price_single(session, mod1)
-                    self.result_ready.emit(avg_price or 0.0, MOD_NAMES[mod1], "-")
-                    self.add_result(mod1, None, avg_price or 0.0)
-                else:
-                    mod1, mod2 = mod
-                    self.status_update.emit(f"Fetching: {MOD_NAMES[mod1]} + {MOD_NAMES[mod2]}")
-                    avg_price = await self.query_price(session, mod1, mod2)
-                    self.result_ready.emit(avg_price or 0.0, MOD_NAMES[mod1], MOD_NAMES[mod2])
-                    self.add_result(mod1, mod2, avg_price or 0.0)
-
-                self.update_results_file()
-
-                for remaining in range(10, 0, -1):
-                    self.countdown_update.emit(remaining)
-                    await asyncio.sleep(1)
-                self.countdown_update.emit(0)
-
-    async def query_price(self, session, mod1, mod2):
-        try:
-            payload = {
-                "query": {
-                    "status": {"option": "online"},
-                    "stats": [{
-                        "type": "and",
-                        "filters": [
-                            {"id": mod1, "disabled": False},
-                            {"id": mod2, "disabled": False}
-                        ]
-                    }],
-                    "filters": {
-                        "trade_filters": {
-                            "disabled": False,
-                            "filters": {
-                                "price": {"option": "divine"}
-                            }
-                        }
-                    }
-                },
-                "sort": {"price": "asc"}
-            }
-            url = "https://www.pathofexile.com/api/trade/search/Mercenaries"
-            self.debug_message.emit(f"\\n[SEARCH] {MOD_NAMES[mod1]} + {MOD_NAMES[mod2]}\\n{json.dumps(payload)}")
-
-            async with session.post(url, json=payload) as r:
-                if r.status == 429:
-                    wait_time = int(r.headers.get("Retry-After", 10))
-                    self.debug_message.emit(f"Rate limit hit. Waiting {wait_time}s...")
-                    await asyncio.sleep(wait_time)
-                    return await self.query_price(session, mod1, mod2)
-                if r.status != 200:
-                    self.debug_message.emit(f"Search Error: {r.status}")
-                    return None
-                search_data = await r.json()
-
-            if not search_data.get("result"):
-                return None
-
-            ids = search_data["result"][:5]
-            fetch_url = f"https://www.pathofexile.com/api/trade/fetch/{','.join(ids)}?query={search_data['id']}"
-            self.debug_message.emit(f"[FETCH] {fetch_url}")
-
-            async with session.get(fetch_url) as r:
-                if r.status == 429:
-                    wait_time = int(r.headers.get("Retry-After", 10))
-                    self.debug_message.emit(f"Rate limit hit (fetch). Waiting {wait_time}s...")
-                    await asyncio.sleep(wait_time)
-                    return await self.query_price(session, mod1, mod2)
-                if r.status != 200:
-                    self.debug_message.emit(f"Fetch Error: {r.status}")
-                    return None
-                data = await r.json()
-
-            prices = [
-                item["listing"]["price"]["amount"]
-                for item in data.get("result", [])
-                if item["listing"]["price"]["currency"] == "divine"
-            ]
-
-            return sum(prices) / len(prices) if prices else None
-
-        except Exception as e:
-            self.debug_message.emit(f"Exception: {str(e)}")
-            return None
-
-    async def query_price_single(self, session, mod1):
-        try:
-            payload = {
-                "query": {
-                    "status": {"option": "online"},
-                    "stats": [{
-                        "type": "and",
-                        "filters": [{"id": mod1, "disabled": False}]
-                    }],
-                    "filters": {
-                        "misc_filters": {
-                            "disabled": False,
-                            "filters": {
-                                "corrupted": {"option": "false"},
-                                "ilvl": {"min": 86}
-                            }
-                        },
-                        "trade_filters": {
-                            "disabled": False,
-                            "filters": {
-                                "price": {"option": "divine"}
-                            }
-                        }
-                    }
-                },
-                "sort": {"price": "asc"}
-            }
-            url = "https://www.pathofexile.com/api/trade/search/Mercenaries"
-            self.debug_message.emit(f"\\n[SEARCH SINGLE] {MOD_NAMES[mod1]}\\n{json.dumps(payload)}")
-
-            async with session.post(url, json=payload) as r:
-                if r.status == 429:
-                    wait_time = int(r.headers.get("Retry-After", 10))
-                    self.debug_message.emit(f"Rate limit hit. Waiting {wait_time}s...")
-                    await asyncio.sleep(wait_time)
-                    return await self.query_price_single(session, mod1)
-                if r.status != 200:
-                    self.debug_message.emit(f"Search Error: {r.status}")
-                    return None
-                search_data = await r.json()
-
-            if not search_data.get("result"):
-                return None
-
-            ids = search_data["result"][:5]
-            fetch_url = f"https://www.pathofexile.com/api/trade/fetch/{','.join(ids)}?query={search_data['id']}"
-            self.debug_message.emit(f"[FETCH SINGLE] {fetch_url}")
-
-            async with session.get(fetch_url) as r:
-                if r.status == 429:
-                    wait_time = int(r.headers.get("Retry-After", 10))
-                    self.debug_message.emit(f"Rate limit hit (fetch). Waiting {wait_time}s...")
-                    await asyncio.sleep(wait_time)
-                    return await self.query_price_single(session, mod1)
-                if r.status != 200:
-                    self.debug_message.emit(f"Fetch Error: {r.status}")
-                    return None
-                data = await r.json()
-
-            prices = [
-                item["listing"]["price"]["amount"]
-                for item in data.get("result", [])
-                if item["listing"]["price"]["currency"] == "divine"
-            ]
-
-            return sum(prices) / len(prices) if prices else None
-
-        except Exception as e:
-            self.debug_message.emit(f"Exception: {str(e)}")
-            return None
-
-    def add_result(self, mod1, mod2, avg_price):
-        self.results.append({
-            "mod1": MOD_NAMES[mod1],
-            "mod2": MOD_NAMES[mod2] if mod2 else None,
-            "avg_price": round(avg_price, 2)
-        })
-
-    def update_results_file(self):
-        try:
-            with open("watcher_prices.json", "w", encoding="utf-8") as f:
-                json.dump(self.results, f, ensure_ascii=False, indent=2)
-            self.debug_message.emit("✅ Saved watcher_prices.json")
-        except Exception as e:
-            self.debug_message.emit(f"❌ File write error: {str(e)}")
-
-    def stop(self):
-        self.running = False
-
-    def pause(self):
-        self.paused = True
-
-    def resume(self):
-        self.paused = False
+import time
+
+from startup_profile import StartupProfile
+
+# Only what is needed to paint the window is imported here; the network
+# stack, the catalog and previous results are loaded by StartupLoader.
+PROFILE = StartupProfile(enabled="--profile-startup" in sys.argv)
+
+with PROFILE.phase("import PyQt5"):
+    from PyQt5.QtWidgets import (
+        QApplication, QWidget, QVBoxLayout, QPushButton,
+        QTableWidget, QTableWidgetItem, QLabel, QMessageBox, QTextEdit, QHBoxLayout, QTabWidget,
+        QDoubleSpinBox, QCheckBox
+    )
+    from PyQt5.QtCore import QThread, QTimer, pyqtSignal, QObject
+    from PyQt5.QtGui import QColor
+from mod_catalog import load_catalog
+from snapshot_store import iter_result_chunks, load_results
+from sweep_profile import SweepProfiler
+
+STALE_COLOR = QColor(128, 128, 128)
+ESTIMATE_INTERVAL_MS = 30000
+STATS_INTERVAL_MS = 2000
+
+
+def format_age(seconds):
+    if seconds is None:
+        return "?"
+    if seconds < 60:
+        return "now"
+    if seconds < 3600:
+        return f"{seconds // 60:.0f}m"
+    if seconds < 86400:
+        return f"{seconds // 3600:.0f}h"
+    return f"{seconds // 86400:.0f}d"
+
+
+class StartupLoader(QObject):
+    results_chunk = pyqtSignal(object)
+    loaded = pyqtSignal(object, object, object, object)
+
+    def run(self):
+        # The snapshot goes first so the table is filled before the slower imports
+        with PROFILE.phase("load previous results"):
+            results = load_results()
+            for chunk in iter_result_chunks(results):
+                self.results_chunk.emit(chunk)
+        with PROFILE.phase("import network stack"):
+            import price_worker
+        with PROFILE.phase("load catalog"):
+            catalog = load_catalog()
+        with PROFILE.phase("build price matrix"):
+            import diff_view
+            import heatmap_view
+            from price_matrix import PriceMatrix
+            matrix = PriceMatrix.from_results(catalog, results)
+        with PROFILE.phase("load snapshot history"):
+            from snapshot_diff import SnapshotStack
+            from snapshot_history import SnapshotHistory
+            stack = SnapshotStack.from_history(SnapshotHistory(), catalog)
+        self.loaded.emit(catalog, results, matrix, stack)
 
 
 class PriceFetcher(QWidget):
@@ -245,6 +81,33 @@ class PriceFetcher(QWidget):
         self.single_button.clicked.connect(self.start_single_fetching)
         button_layout.addWidget(self.single_button)
 
+        self.adaptive_button = QPushButton("Start Adaptive Fetch")
+        self.adaptive_button.clicked.connect(self.start_adaptive_fetching)
+        button_layout.addWidget(self.adaptive_button)
+
+        self.liquidity_button = QPushButton("Start Liquidity Scan")
+        self.liquidity_button.clicked.connect(self.start_liquidity_scan)
+        button_layout.addWidget(self.liquidity_button)
+
+        self.triple_button = QPushButton("Start Triple Mod Fetch")
+        self.triple_button.clicked.connect(self.start_triple_fetching)
+        button_layout.addWidget(self.triple_button)
+
+        self.triple_threshold = QDoubleSpinBox()
+        self.triple_threshold.setPrefix("Min est. ")
+        self.triple_threshold.setSuffix(" div")
+        self.triple_threshold.setRange(0.0, 10000.0)
+        self.triple_threshold.setValue(10.0)
+        button_layout.addWidget(self.triple_threshold)
+
+        self.variant_checkbox = QCheckBox("Filter variants")
+        self.variant_checkbox.setToolTip("Price every filter variant from one broad search per combo")
+        button_layout.addWidget(self.variant_checkbox)
+
+        self.paging_checkbox = QCheckBox("All listings")
+        self.paging_checkbox.setToolTip("Page through every listing of a combo by price band (many more requests)")
+        button_layout.addWidget(self.paging_checkbox)
+
         self.pause_button = QPushButton("Pause")
         self.pause_button.clicked.connect(self.pause_fetching)
         button_layout.addWidget(self.pause_button)
@@ -269,13 +132,104 @@ class PriceFetcher(QWidget):
         self.countdown_label = QLabel("Waiting: 0s")
         layout.addWidget(self.countdown_label)
 
-        self.table = QTableWidget(0, 3)
-        self.table.setHorizontalHeaderLabels(["Mod 1", "Mod 2", "Avg Price (Divine)"])
-        layout.addWidget(self.table)
+        self.table = QTableWidget(0, 5)
+        self.table.setHorizontalHeaderLabels(["Mod 1", "Mod 2", "Mod 3", "Avg Price (Divine)", "Age"])
+
+        self.tabs = QTabWidget()
+        self.tabs.addTab(self.table, "Table")
+        self.stats_view = QTextEdit()
+        self.stats_view.setReadOnly(True)
+        self.tabs.addTab(self.stats_view, "Stats")
+        layout.addWidget(self.tabs)
 
         self.debug_info = ""
         self.thread = None
         self.worker = None
+        self.catalog = None
+        self.matrix = None
+        self.heatmap = None
+        self.diff_view = None
+        self.previous_results = []
+        self.window_shown_at = None
+        self.run_started = None
+        self.row_index = {}
+        self.row_updated = []
+        self.sweep_profiler = SweepProfiler.from_argv()
+
+        self.age_timer = QTimer(self)
+        self.age_timer.timeout.connect(self.refresh_ages)
+        self.age_timer.start(30000)
+
+        self.estimate_dirty = False
+        self.estimate_timer = QTimer(self)
+        self.estimate_timer.timeout.connect(self.refresh_estimate)
+
+        self.stats_timer = QTimer(self)
+        self.stats_timer.timeout.connect(self.refresh_stats)
+        self.stats_timer.start(STATS_INTERVAL_MS)
+
+        self.set_fetch_buttons_enabled(False)
+        self.status_label.setText("Loading...")
+
+    def set_fetch_buttons_enabled(self, enabled):
+        self.refresh_button.setEnabled(enabled)
+        self.single_button.setEnabled(enabled)
+        self.triple_button.setEnabled(enabled)
+        self.adaptive_button.setEnabled(enabled)
+        self.liquidity_button.setEnabled(enabled)
+
+    def start_background_loading(self):
+        self.window_shown_at = PROFILE.elapsed()
+        PROFILE.mark("window shown")
+
+        self.loader_thread = QThread()
+        self.loader = StartupLoader()
+        self.loader.moveToThread(self.loader_thread)
+        self.loader.results_chunk.connect(self.show_results_chunk)
+        self.loader.loaded.connect(self.on_startup_loaded)
+        self.loader.loaded.connect(self.loader_thread.quit)
+        self.loader_thread.started.connect(self.loader.run)
+        self.loader_thread.start()
+
+    def show_results_chunk(self, rows):
+        with PROFILE.phase("show previous results"):
+            self.table.setUpdatesEnabled(False)
+            for row in rows:
+                self.update_table(
+                    row["avg_price"], row["mod1"], row["mod2"] or "-", row.get("mod3") or "", row.get("updated") or 0
+                )
+            self.table.setUpdatesEnabled(True)
+
+    def on_startup_loaded(self, catalog, results, matrix, stack):
+        from diff_view import DiffView
+        from heatmap_view import HeatmapView
+
+        self.catalog = catalog
+        self.matrix = matrix
+        self.previous_results = results
+        with PROFILE.phase("create heatmap"):
+            self.heatmap = HeatmapView(catalog, matrix)
+            self.tabs.addTab(self.heatmap, "Heatmap")
+        with PROFILE.phase("create diff view"):
+            self.diff_view = DiffView(catalog, stack)
+            self.tabs.addTab(self.diff_view, "Changes")
+        with PROFILE.phase("estimate prices"):
+            self.estimate_dirty = True
+            self.refresh_estimate()
+        self.estimate_timer.start(ESTIMATE_INTERVAL_MS)
+        self.set_fetch_buttons_enabled(True)
+        PROFILE.mark("ready")
+        self.report_startup()
+
+    def report_startup(self):
+        message = (
+            f"Ready. Window in {self.window_shown_at * 1000:.0f} ms, loaded in {PROFILE.elapsed() * 1000:.0f} ms "
+            f"(catalog {self.catalog.load_seconds * 1000:.1f} ms, {self.catalog.load_source})"
+        )
+        self.status_label.setText(message)
+        self.collect_debug(message)
+        self.collect_debug(PROFILE.report())
+        PROFILE.print_report()
 
     def start_fetching(self):
         self._start_worker(single=False)
@@ -283,19 +237,40 @@ class PriceFetcher(QWidget):
     def start_single_fetching(self):
         self._start_worker(single=True)
 
-    def _start_worker(self, single):
-        self.table.setRowCount(0)
+    def start_triple_fetching(self):
+        self._start_worker(single=False, triple=True)
+
+    def start_adaptive_fetching(self):
+        self._start_worker(single=False, adaptive=True)
+
+    def start_liquidity_scan(self):
+        self._start_worker(single=False, liquidity=True)
+
+    def _start_worker(self, single, triple=False, adaptive=False, liquidity=False):
+        from price_worker import PriceWorker
+
+        # Keep the last snapshot on screen; rows are replaced as fresh prices arrive
+        self.run_started = time.time()
         self.status_label.setText("Loading...")
 
         self.thread = QThread()
-        self.worker = PriceWorker()
+        self.worker = PriceWorker(self.worker.results.to_list() if self.worker else self.previous_results)
         self.worker.single_mode = single
+        self.worker.triple_mode = triple
+        self.worker.adaptive_mode = adaptive
+        self.worker.liquidity_mode = liquidity
+        self.worker.triple_threshold = self.triple_threshold.value()
+        self.worker.variant_mode = self.variant_checkbox.isChecked()
+        self.worker.paging_mode = self.paging_checkbox.isChecked()
+        self.worker.profiler = self.sweep_profiler
         self.worker.moveToThread(self.thread)
 
-        self.worker.result_ready.connect(self.update_table)
+        self.worker.result_ready.connect(self.show_result)
         self.worker.status_update.connect(self.status_label.setText)
         self.worker.debug_message.connect(self.collect_debug)
         self.worker.countdown_update.connect(self.update_countdown)
+        self.worker.pair_updated.connect(self.update_heatmap)
+        self.worker.snapshot_recorded.connect(self.diff_view.add_snapshot)
 
         self.thread.started.connect(self.worker.start)
         self.thread.start()
@@ -315,12 +290,64 @@ class PriceFetcher(QWidget):
             self.worker.stop()
             self.status_label.setText("Stopping...")
 
-    def update_table(self, price, mod1, mod2):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        self.table.setItem(row, 0, QTableWidgetItem(mod1))
-        self.table.setItem(row, 1, QTableWidgetItem(mod2))
-        self.table.setItem(row, 2, QTableWidgetItem(f"{price:.2f}" if price else "N/A"))
+    def show_result(self, price, mod1, mod2, mod3):
+        # Only the worker thread is cProfiled; the GUI side is traced as spans
+        with self.sweep_profiler.span("ui-flush", profile=False):
+            self.update_table(price, mod1, mod2, mod3)
+
+    def update_table(self, price, mod1, mod2, mod3="", updated=None):
+        fresh = updated is None
+        if fresh:
+            updated = time.time()
+
+        key = (mod1, mod2, mod3)
+        row = self.row_index.get(key)
+        if row is None:
+            row = self.table.rowCount()
+            self.table.insertRow(row)
+            self.table.setItem(row, 0, QTableWidgetItem(mod1))
+            self.table.setItem(row, 1, QTableWidgetItem(mod2))
+            self.table.setItem(row, 2, QTableWidgetItem(mod3))
+            self.row_index[key] = row
+            self.row_updated.append(None)
+
+        self.row_updated[row] = updated
+        self.table.setItem(row, 3, QTableWidgetItem(f"{price:.2f}" if price else "N/A"))
+        self.table.setItem(row, 4, QTableWidgetItem(format_age(self._age_of(row))))
+        stale = not fresh and (self.run_started is None or updated < self.run_started)
+        for column in range(self.table.columnCount()):
+            item = self.table.item(row, column)
+            item.setForeground(STALE_COLOR if stale else self.table.palette().text())
+
+    def _age_of(self, row):
+        updated = self.row_updated[row]
+        # Rows saved before ages were tracked have no timestamp
+        return max(0.0, time.time() - updated) if updated else None
+
+    def refresh_ages(self):
+        self.table.setUpdatesEnabled(False)
+        for row in range(self.table.rowCount()):
+            self.table.item(row, 4).setText(format_age(self._age_of(row)))
+        self.table.setUpdatesEnabled(True)
+
+    def update_heatmap(self, i, j, price, listings, updated):
+        with self.sweep_profiler.span("ui-flush", profile=False):
+            self.matrix.set_pair(i, j, price, listings, updated)
+            self.heatmap.update_pair(i, j)
+        self.estimate_dirty = True
+
+    def refresh_estimate(self):
+        from price_estimator import estimate_prices
+
+        if not self.estimate_dirty:
+            return
+        self.estimate_dirty = False
+        self.heatmap.set_estimate(estimate_prices(self.matrix))
+
+    def refresh_stats(self):
+        if self.worker is None or self.tabs.currentWidget() is not self.stats_view:
+            return
+        self.stats_view.setPlainText("\n".join(self.worker.metrics.summary()))
 
     def update_countdown(self, seconds):
         self.countdown_label.setText(f"Waiting: {seconds}s")
@@ -343,8 +370,10 @@ class PriceFetcher(QWidget):
 
 def main():
     app = QApplication(sys.argv)
-    window = PriceFetcher()
+    with PROFILE.phase("create window"):
+        window = PriceFetcher()
     window.show()
+    QTimer.singleShot(0, window.start_background_loading)
     sys.exit(app.exec_())
 
 
@@ -1,3836 +0,0 @@
-# Mapping of mod IDs to readable names
-MOD_COMBOS = [
-    ("explicit.stat_1817023621", "explicit.stat_3375743050"),
-    ("explicit.stat_1817023621", "explicit.stat_2048747572"),
-    ("explicit.stat_1817023621", "explicit.stat_418293304"),
-    ("explicit.stat_1817023621", "explicit.stat_2106756686"),
-    ("explicit.stat_1817023621", "explicit.stat_3357049845"),
-    ("explicit.stat_1817023621", "explicit.stat_1077131949"),
-    ("explicit.stat_1817023621", "explicit.stat_2255914633"),
-    ("explicit.stat_1817023621", "explicit.stat_2753985507"),
-    ("explicit.stat_1817023621", "explicit.stat_2643562209"),
-    ("explicit.stat_1817023621", "explicit.stat_1413864591"),
-    ("explicit.stat_1817023621", "explicit.stat_1222888897"),
-    ("explicit.stat_1817023621", "explicit.stat_664849247"),
-    ("explicit.stat_1817023621", "explicit.stat_68410701"),
-    ("explicit.stat_1817023621", "explicit.stat_3742808908"),
-    ("explicit.stat_1817023621", "explicit.stat_1873457881"),
-    ("explicit.stat_1817023621", "explicit.stat_3692646597"),
-    ("explicit.stat_1817023621", "explicit.stat_1011863394"),
-    ("explicit.stat_1817023621", "explicit.stat_3371719014"),
-    ("explicit.stat_1817023621", "explicit.stat_4173751044"),
-    ("explicit.stat_1817023621", "explicit.stat_576528026"),
-    ("explicit.stat_1817023621", "explicit.stat_3772848194"),
-    ("explicit.stat_1817023621", "explicit.stat_969576725"),
-    ("explicit.stat_1817023621", "explicit.stat_4071658793"),
-    ("explicit.stat_1817023621", "explicit.stat_3329402420"),
-    ("explicit.stat_1817023621", "explicit.stat_4259701244"),
-    ("explicit.stat_1817023621", "explicit.stat_3765507527"),
-    ("explicit.stat_1817023621", "explicit.stat_1313498929"),
-    ("explicit.stat_1817023621", "explicit.stat_991194404"),
-    ("explicit.stat_1817023621", "explicit.stat_1424006185"),
-    ("explicit.stat_1817023621", "explicit.stat_1346311588"),
-    ("explicit.stat_1817023621", "explicit.stat_207635700"),
-    ("explicit.stat_1817023621", "explicit.stat_1853636813"),
-    ("explicit.stat_1817023621", "explicit.stat_2831391506"),
-    ("explicit.stat_1817023621", "explicit.stat_1138813382"),
-    ("explicit.stat_1817023621", "explicit.stat_2736708072"),
-    ("explicit.stat_1817023621", "explicit.stat_3308185931"),
-    ("explicit.stat_1817023621", "explicit.stat_4104891138"),
-    ("explicit.stat_1817023621", "explicit.stat_34059570"),
-    ("explicit.stat_1817023621", "explicit.stat_3643449791"),
-    ("explicit.stat_1817023621", "explicit.stat_3468843137"),
-    ("explicit.stat_1817023621", "explicit.stat_3207781478"),
-    ("explicit.stat_1817023621", "explicit.stat_2806391472"),
-    ("explicit.stat_1817023621", "explicit.stat_2567659895"),
-    ("explicit.stat_1817023621", "explicit.stat_4012281889"),
-    ("explicit.stat_1817023621", "explicit.stat_1173690938"),
-    ("explicit.stat_1817023621", "explicit.stat_2365917222"),
-    ("explicit.stat_1817023621", "explicit.stat_3223142064"),
-    ("explicit.stat_1817023621", "explicit.stat_1567542124"),
-    ("explicit.stat_1817023621", "explicit.stat_2647344903"),
-    ("explicit.stat_1817023621", "explicit.stat_1165583295"),
-    ("explicit.stat_1817023621", "explicit.stat_371612541"),
-    ("explicit.stat_1817023621", "explicit.stat_2720072724"),
-    ("explicit.stat_1817023621", "explicit.stat_1919069577"),
-    ("explicit.stat_1817023621", "explicit.stat_3772841281"),
-    ("explicit.stat_1817023621", "explicit.stat_4245204226"),
-    ("explicit.stat_1817023621", "explicit.stat_2163419452"),
-    ("explicit.stat_1817023621", "explicit.stat_3111519953"),
-    ("explicit.stat_1817023621", "explicit.stat_2434030180"),
-    ("explicit.stat_1817023621", "explicit.stat_1653848515"),
-    ("explicit.stat_1817023621", "explicit.stat_2731416566"),
-    ("explicit.stat_1817023621", "explicit.stat_3234824465"),
-    ("explicit.stat_1817023621", "explicit.stat_3627458291"),
-    ("explicit.stat_1817023621", "explicit.stat_2091518682"),
-    ("explicit.stat_1817023621", "explicit.stat_214835567"),
-    ("explicit.stat_1817023621", "explicit.stat_362838683"),
-    ("explicit.stat_1817023621", "explicit.stat_2457540491"),
-    ("explicit.stat_1817023621", "explicit.stat_65331133"),
-    ("explicit.stat_1817023621", "explicit.stat_3337107517"),
-    ("explicit.stat_1817023621", "explicit.stat_3332055899"),
-    ("explicit.stat_1817023621", "explicit.stat_2548097895"),
-    ("explicit.stat_1817023621", "explicit.stat_1016185292"),
-    ("explicit.stat_1817023621", "explicit.stat_3624529132"),
-    ("explicit.stat_1817023621", "explicit.stat_380220671"),
-    ("explicit.stat_1817023621", "explicit.stat_2189467271"),
-    ("explicit.stat_1817023621", "explicit.stat_3953667743"),
-    ("explicit.stat_1817023621", "explicit.stat_1723738042"),
-    ("explicit.stat_1817023621", "explicit.stat_556659145"),
-    ("explicit.stat_1817023621", "explicit.stat_2690790844"),
-    ("explicit.stat_1817023621", "explicit.stat_80470845"),
-    ("explicit.stat_1817023621", "explicit.stat_2444534954"),
-    ("explicit.stat_1817023621", "explicit.stat_1699077932"),
-    ("explicit.stat_1817023621", "explicit.stat_2383304564"),
-    ("explicit.stat_1817023621", "explicit.stat_121436064"),
-    ("explicit.stat_1817023621", "explicit.stat_2312747856"),
-    ("explicit.stat_1817023621", "explicit.stat_3656959867"),
-    ("explicit.stat_1817023621", "explicit.stat_281949611"),
-    ("explicit.stat_3375743050", "explicit.stat_2048747572"),
-    ("explicit.stat_3375743050", "explicit.stat_418293304"),
-    ("explicit.stat_3375743050", "explicit.stat_2106756686"),
-    ("explicit.stat_3375743050", "explicit.stat_3357049845"),
-    ("explicit.stat_3375743050", "explicit.stat_1077131949"),
-    ("explicit.stat_3375743050", "explicit.stat_2255914633"),
-    ("explicit.stat_3375743050", "explicit.stat_2753985507"),
-    ("explicit.stat_3375743050", "explicit.stat_2643562209"),
-    ("explicit.stat_3375743050", "explicit.stat_1413864591"),
-    ("explicit.stat_3375743050", "explicit.stat_1222888897"),
-    ("explicit.stat_3375743050", "explicit.stat_664849247"),
-    ("explicit.stat_3375743050", "explicit.stat_68410701"),
-    ("explicit.stat_3375743050", "explicit.stat_3742808908"),
-    ("explicit.stat_3375743050", "explicit.stat_1873457881"),
-    ("explicit.stat_3375743050", "explicit.stat_3692646597"),
-    ("explicit.stat_3375743050", "explicit.stat_1011863394"),
-    ("explicit.stat_3375743050", "explicit.stat_3371719014"),
-    ("explicit.stat_3375743050", "explicit.stat_4173751044"),
-    ("explicit.stat_3375743050", "explicit.stat_576528026"),
-    ("explicit.stat_3375743050", "explicit.stat_3772848194"),
-    ("explicit.stat_3375743050", "explicit.stat_969576725"),
-    ("explicit.stat_3375743050", "explicit.stat_4071658793"),
-    ("explicit.stat_3375743050", "explicit.stat_3329402420"),
-    ("explicit.stat_3375743050", "explicit.stat_4259701244"),
-    ("explicit.stat_3375743050", "explicit.stat_3765507527"),
-    ("explicit.stat_3375743050", "explicit.stat_1313498929"),
-    ("explicit.stat_3375743050", "explicit.stat_991194404"),
-    ("explicit.stat_3375743050", "explicit.stat_1424006185"),
-    ("explicit.stat_3375743050", "explicit.stat_1346311588"),
-    ("explicit.stat_3375743050", "explicit.stat_207635700"),
-    ("explicit.stat_3375743050", "explicit.stat_1853636813"),
-    ("explicit.stat_3375743050", "explicit.stat_2831391506"),
-    ("explicit.stat_3375743050", "explicit.stat_1138813382"),
-    ("explicit.stat_3375743050", "explicit.stat_2736708072"),
-    ("explicit.stat_3375743050", "explicit.stat_3308185931"),
-    ("explicit.stat_3375743050", "explicit.stat_4104891138"),
-    ("explicit.stat_3375743050", "explicit.stat_34059570"),
-    ("explicit.stat_3375743050", "explicit.stat_3643449791"),
-    ("explicit.stat_3375743050", "explicit.stat_3468843137"),
-    ("explicit.stat_3375743050", "explicit.stat_3207781478"),
-    ("explicit.stat_3375743050", "explicit.stat_2806391472"),
-    ("explicit.stat_3375743050", "explicit.stat_2567659895"),
-    ("explicit.stat_3375743050", "explicit.stat_4012281889"),
-    ("explicit.stat_3375743050", "explicit.stat_1173690938"),
-    ("explicit.stat_3375743050", "explicit.stat_2365917222"),
-    ("explicit.stat_3375743050", "explicit.stat_3223142064"),
-    ("explicit.stat_3375743050", "explicit.stat_1567542124"),
-    ("explicit.stat_3375743050", "explicit.stat_2647344903"),
-    ("explicit.stat_3375743050", "explicit.stat_1165583295"),
-    ("explicit.stat_3375743050", "explicit.stat_371612541"),
-    ("explicit.stat_3375743050", "explicit.stat_2720072724"),
-    ("explicit.stat_3375743050", "explicit.stat_1919069577"),
-    ("explicit.stat_3375743050", "explicit.stat_3772841281"),
-    ("explicit.stat_3375743050", "explicit.stat_4245204226"),
-    ("explicit.stat_3375743050", "explicit.stat_2163419452"),
-    ("explicit.stat_3375743050", "explicit.stat_3111519953"),
-    ("explicit.stat_3375743050", "explicit.stat_2434030180"),
-    ("explicit.stat_3375743050", "explicit.stat_1653848515"),
-    ("explicit.stat_3375743050", "explicit.stat_2731416566"),
-    ("explicit.stat_3375743050", "explicit.stat_3234824465"),
-    ("explicit.stat_3375743050", "explicit.stat_3627458291"),
-    ("explicit.stat_3375743050", "explicit.stat_2091518682"),
-    ("explicit.stat_3375743050", "explicit.stat_214835567"),
-    ("explicit.stat_3375743050", "explicit.stat_362838683"),
-    ("explicit.stat_3375743050", "explicit.stat_2457540491"),
-    ("explicit.stat_3375743050", "explicit.stat_65331133"),
-    ("explicit.stat_3375743050", "explicit.stat_3337107517"),
-    ("explicit.stat_3375743050", "explicit.stat_3332055899"),
-    ("explicit.stat_3375743050", "explicit.stat_2548097895"),
-    ("explicit.stat_3375743050", "explicit.stat_1016185292"),
-    ("explicit.stat_3375743050", "explicit.stat_3624529132"),
-    ("explicit.stat_3375743050", "explicit.stat_380220671"),
-    ("explicit.stat_3375743050", "explicit.stat_2189467271"),
-    ("explicit.stat_3375743050", "explicit.stat_3953667743"),
-    ("explicit.stat_3375743050", "explicit.stat_1723738042"),
-    ("explicit.stat_3375743050", "explicit.stat_556659145"),
-    ("explicit.stat_3375743050", "explicit.stat_2690790844"),
-    ("explicit.stat_3375743050", "explicit.stat_80470845"),
-    ("explicit.stat_3375743050", "explicit.stat_2444534954"),
-    ("explicit.stat_3375743050", "explicit.stat_1699077932"),
-    ("explicit.stat_3375743050", "explicit.stat_2383304564"),
-    ("explicit.stat_3375743050", "explicit.stat_121436064"),
-    ("explicit.stat_3375743050", "explicit.stat_2312747856"),
-    ("explicit.stat_3375743050", "explicit.stat_3656959867"),
-    ("explicit.stat_3375743050", "explicit.stat_281949611"),
-    ("explicit.stat_2048747572", "explicit.stat_418293304"),
-    ("explicit.stat_2048747572", "explicit.stat_2106756686"),
-    ("explicit.stat_2048747572", "explicit.stat_3357049845"),
-    ("explicit.stat_2048747572", "explicit.stat_1077131949"),
-    ("explicit.stat_2048747572", "explicit.stat_2255914633"),
-    ("explicit.stat_2048747572", "explicit.stat_2753985507"),
-    ("explicit.stat_2048747572", "explicit.stat_2643562209"),
-    ("explicit.stat_2048747572", "explicit.stat_1413864591"),
-    ("explicit.stat_2048747572", "explicit.stat_1222888897"),
-    ("explicit.stat_2048747572", "explicit.stat_664849247"),
-    ("explicit.stat_2048747572", "explicit.stat_68410701"),
-    ("explicit.stat_2048747572", "explicit.stat_3742808908"),
-    ("explicit.stat_2048747572", "explicit.stat_1873457881"),
-    ("explicit.stat_2048747572", "explicit.stat_3692646597"),
-    ("explicit.stat_2048747572", "explicit.stat_1011863394"),
-    ("explicit.stat_2048747572", "explicit.stat_3371719014"),
-    ("explicit.stat_2048747572", "explicit.stat_4173751044"),
-    ("explicit.stat_2048747572", "explicit.stat_576528026"),
-    ("explicit.stat_2048747572", "explicit.stat_3772848194"),
-    ("explicit.stat_2048747572", "explicit.stat_969576725"),
-    ("explicit.stat_2048747572", "explicit.stat_4071658793"),
-    ("explicit.stat_2048747572", "explicit.stat_3329402420"),
-    ("explicit.stat_2048747572", "explicit.stat_4259701244"),
-    ("explicit.stat_2048747572", "explicit.stat_3765507527"),
-    ("explicit.stat_2048747572", "explicit.stat_1313498929"),
-    ("explicit.stat_2048747572", "explicit.stat_991194404"),
-    ("explicit.stat_2048747572", "explicit.stat_1424006185"),
-    ("explicit.stat_2048747572", "explicit.stat_1346311588"),
-    ("explicit.stat_2048747572", "explicit.stat_207635700"),
-    ("explicit.stat_2048747572", "explicit.stat_1853636813"),
-    ("explicit.stat_2048747572", "explicit.stat_2831391506"),
-    ("explicit.stat_2048747572", "explicit.stat_1138813382"),
-    ("explicit.stat_2048747572", "explicit.stat_2736708072"),
-    ("explicit.stat_2048747572", "explicit.stat_3308185931"),
-    ("explicit.stat_2048747572", "explicit.stat_4104891138"),
-    ("explicit.stat_2048747572", "explicit.stat_34059570"),
-    ("explicit.stat_2048747572", "explicit.stat_3643449791"),
-    ("explicit.stat_2048747572", "explicit.stat_3468843137"),
-    ("explicit.stat_2048747572", "explicit.stat_3207781478"),
-    ("explicit.stat_2048747572", "explicit.stat_2806391472"),
-    ("explicit.stat_2048747572", "explicit.stat_2567659895"),
-    ("explicit.stat_2048747572", "explicit.stat_4012281889"),
-    ("explicit.stat_2048747572", "explicit.stat_1173690938"),
-    ("explicit.stat_2048747572", "explicit.stat_2365917222"),
-    ("explicit.stat_2048747572", "explicit.stat_3223142064"),
-    ("explicit.stat_2048747572", "explicit.stat_1567542124"),
-    ("explicit.stat_2048747572", "explicit.stat_2647344903"),
-    ("explicit.stat_2048747572", "explicit.stat_1165583295"),
-    ("explicit.stat_2048747572", "explicit.stat_371612541"),
-    ("explicit.stat_2048747572", "explicit.stat_2720072724"),
-    ("explicit.stat_2048747572", "explicit.stat_1919069577"),
-    ("explicit.stat_2048747572", "explicit.stat_3772841281"),
-    ("explicit.stat_2048747572", "explicit.stat_4245204226"),
-    ("explicit.stat_2048747572", "explicit.stat_2163419452"),
-    ("explicit.stat_2048747572", "explicit.stat_3111519953"),
-    ("explicit.stat_2048747572", "explicit.stat_2434030180"),
-    ("explicit.stat_2048747572", "explicit.stat_1653848515"),
-    ("explicit.stat_2048747572", "explicit.stat_2731416566"),
-    ("explicit.stat_2048747572", "explicit.stat_3234824465"),
-    ("explicit.stat_2048747572", "explicit.stat_3627458291"),
-    ("explicit.stat_2048747572", "explicit.stat_2091518682"),
-    ("explicit.stat_2048747572", "explicit.stat_214835567"),
-    ("explicit.stat_2048747572", "explicit.stat_362838683"),
-    ("explicit.stat_2048747572", "explicit.stat_2457540491"),
-    ("explicit.stat_2048747572", "explicit.stat_65331133"),
-    ("explicit.stat_2048747572", "explicit.stat_3337107517"),
-    ("explicit.stat_2048747572", "explicit.stat_3332055899"),
-    ("explicit.stat_2048747572", "explicit.stat_2548097895"),
-    ("explicit.stat_2048747572", "explicit.stat_1016185292"),
-    ("explicit.stat_2048747572", "explicit.stat_3624529132"),
-    ("explicit.stat_2048747572", "explicit.stat_380220671"),
-    ("explicit.stat_2048747572", "explicit.stat_2189467271"),
-    ("explicit.stat_2048747572", "explicit.stat_3953667743"),
-    ("explicit.stat_2048747572", "explicit.stat_1723738042"),
-    ("explicit.stat_2048747572", "explicit.stat_556659145"),
-    ("explicit.stat_2048747572", "explicit.stat_2690790844"),
-    ("explicit.stat_2048747572", "explicit.stat_80470845"),
-    ("explicit.stat_2048747572", "explicit.stat_2444534954"),
-    ("explicit.stat_2048747572", "explicit.stat_1699077932"),
-    ("explicit.stat_2048747572", "explicit.stat_2383304564"),
-    ("explicit.stat_2048747572", "explicit.stat_121436064"),
-    ("explicit.stat_2048747572", "explicit.stat_2312747856"),
-    ("explicit.stat_2048747572", "explicit.stat_3656959867"),
-    ("explicit.stat_2048747572", "explicit.stat_281949611"),
-    ("explicit.stat_418293304", "explicit.stat_2106756686"),
-    ("explicit.stat_418293304", "explicit.stat_3357049845"),
-    ("explicit.stat_418293304", "explicit.stat_1077131949"),
-    ("explicit.stat_418293304", "explicit.stat_2255914633"),
-    ("explicit.stat_418293304", "explicit.stat_2753985507"),
-    ("explicit.stat_418293304", "explicit.stat_2643562209"),
-    ("explicit.stat_418293304", "explicit.stat_1413864591"),
-    ("explicit.stat_418293304", "explicit.stat_1222888897"),
-    ("explicit.stat_418293304", "explicit.stat_664849247"),
-    ("explicit.stat_418293304", "explicit.stat_68410701"),
-    ("explicit.stat_418293304", "explicit.stat_3742808908"),
-    ("explicit.stat_418293304", "explicit.stat_1873457881"),
-    ("explicit.stat_418293304", "explicit.stat_3692646597"),
-    ("explicit.stat_418293304", "explicit.stat_1011863394"),
-    ("explicit.stat_418293304", "explicit.stat_3371719014"),
-    ("explicit.stat_418293304", "explicit.stat_4173751044"),
-    ("explicit.stat_418293304", "explicit.stat_576528026"),
-    ("explicit.stat_418293304", "explicit.stat_3772848194"),
-    ("explicit.stat_418293304", "explicit.stat_969576725"),
-    ("explicit.stat_418293304", "explicit.stat_4071658793"),
-    ("explicit.stat_418293304", "explicit.stat_3329402420"),
-    ("explicit.stat_418293304", "explicit.stat_4259701244"),
-    ("explicit.stat_418293304", "explicit.stat_3765507527"),
-    ("explicit.stat_418293304", "explicit.stat_1313498929"),
-    ("explicit.stat_418293304", "explicit.stat_991194404"),
-    ("explicit.stat_418293304", "explicit.stat_1424006185"),
-    ("explicit.stat_418293304", "explicit.stat_1346311588"),
-    ("explicit.stat_418293304", "explicit.stat_207635700"),
-    ("explicit.stat_418293304", "explicit.stat_1853636813"),
-    ("explicit.stat_418293304", "explicit.stat_2831391506"),
-    ("explicit.stat_418293304", "explicit.stat_1138813382"),
-    ("explicit.stat_418293304", "explicit.stat_2736708072"),
-    ("explicit.stat_418293304", "explicit.stat_3308185931"),
-    ("explicit.stat_418293304", "explicit.stat_4104891138"),
-    ("explicit.stat_418293304", "explicit.stat_34059570"),
-    ("explicit.stat_418293304", "explicit.stat_3643449791"),
-    ("explicit.stat_418293304", "explicit.stat_3468843137"),
-    ("explicit.stat_418293304", "explicit.stat_3207781478"),
-    ("explicit.stat_418293304", "explicit.stat_2806391472"),
-    ("explicit.stat_418293304", "explicit.stat_2567659895"),
-    ("explicit.stat_418293304", "explicit.stat_4012281889"),
-    ("explicit.stat_418293304", "explicit.stat_1173690938"),
-    ("explicit.stat_418293304", "explicit.stat_2365917222"),
-    ("explicit.stat_418293304", "explicit.stat_3223142064"),
-    ("explicit.stat_418293304", "explicit.stat_1567542124"),
-    ("explicit.stat_418293304", "explicit.stat_2647344903"),
-    ("explicit.stat_418293304", "explicit.stat_1165583295"),
-    ("explicit.stat_418293304", "explicit.stat_371612541"),
-    ("explicit.stat_418293304", "explicit.stat_2720072724"),
-    ("explicit.stat_418293304", "explicit.stat_1919069577"),
-    ("explicit.stat_418293304", "explicit.stat_3772841281"),
-    ("explicit.stat_418293304", "explicit.stat_4245204226"),
-    ("explicit.stat_418293304", "explicit.stat_2163419452"),
-    ("explicit.stat_418293304", "explicit.stat_3111519953"),
-    ("explicit.stat_418293304", "explicit.stat_2434030180"),
-    ("explicit.stat_418293304", "explicit.stat_1653848515"),
-    ("explicit.stat_418293304", "explicit.stat_2731416566"),
-    ("explicit.stat_418293304", "explicit.stat_3234824465"),
-    ("explicit.stat_418293304", "explicit.stat_3627458291"),
-    ("explicit.stat_418293304", "explicit.stat_2091518682"),
-    ("explicit.stat_418293304", "explicit.stat_214835567"),
-    ("explicit.stat_418293304", "explicit.stat_362838683"),
-    ("explicit.stat_418293304", "explicit.stat_2457540491"),
-    ("explicit.stat_418293304", "explicit.stat_65331133"),
-    ("explicit.stat_418293304", "explicit.stat_3337107517"),
-    ("explicit.stat_418293304", "explicit.stat_3332055899"),
-    ("explicit.stat_418293304", "explicit.stat_2548097895"),
-    ("explicit.stat_418293304", "explicit.stat_1016185292"),
-    ("explicit.stat_418293304", "explicit.stat_3624529132"),
-    ("explicit.stat_418293304", "explicit.stat_380220671"),
-    ("explicit.stat_418293304", "explicit.stat_2189467271"),
-    ("explicit.stat_418293304", "explicit.stat_3953667743"),
-    ("explicit.stat_418293304", "explicit.stat_1723738042"),
-    ("explicit.stat_418293304", "explicit.stat_556659145"),
-    ("explicit.stat_418293304", "explicit.stat_2690790844"),
-    ("explicit.stat_418293304", "explicit.stat_80470845"),
-    ("explicit.stat_418293304", "explicit.stat_2444534954"),
-    ("explicit.stat_418293304", "explicit.stat_1699077932"),
-    ("explicit.stat_418293304", "explicit.stat_2383304564"),
-    ("explicit.stat_418293304", "explicit.stat_121436064"),
-    ("explicit.stat_418293304", "explicit.stat_2312747856"),
-    ("explicit.stat_418293304", "explicit.stat_3656959867"),
-    ("explicit.stat_418293304", "explicit.stat_281949611"),
-    ("explicit.stat_2106756686", "explicit.stat_3357049845"),
-    ("explicit.stat_2106756686", "explicit.stat_1077131949"),
-    ("explicit.stat_2106756686", "explicit.stat_2255914633"),
-    ("explicit.stat_2106756686", "explicit.stat_2753985507"),
-    ("explicit.stat_2106756686", "explicit.stat_2643562209"),
-    ("explicit.stat_2106756686", "explicit.stat_1413864591"),
-    ("explicit.stat_2106756686", "explicit.stat_1222888897"),
-    ("explicit.stat_2106756686", "explicit.stat_664849247"),
-    ("explicit.stat_2106756686", "explicit.stat_68410701"),
-    ("explicit.stat_2106756686", "explicit.stat_3742808908"),
-    ("explicit.stat_2106756686", "explicit.stat_1873457881"),
-    ("explicit.stat_2106756686", "explicit.stat_3692646597"),
-    ("explicit.stat_2106756686", "explicit.stat_1011863394"),
-    ("explicit.stat_2106756686", "explicit.stat_3371719014"),
-    ("explicit.stat_2106756686", "explicit.stat_4173751044"),
-    ("explicit.stat_2106756686", "explicit.stat_576528026"),
-    ("explicit.stat_2106756686", "explicit.stat_3772848194"),
-    ("explicit.stat_2106756686", "explicit.stat_969576725"),
-    ("explicit.stat_2106756686", "explicit.stat_4071658793"),
-    ("explicit.stat_2106756686", "explicit.stat_3329402420"),
-    ("explicit.stat_2106756686", "explicit.stat_4259701244"),
-    ("explicit.stat_2106756686", "explicit.stat_3765507527"),
-    ("explicit.stat_2106756686", "explicit.stat_1313498929"),
-    ("explicit.stat_2106756686", "explicit.stat_991194404"),
-    ("explicit.stat_2106756686", "explicit.stat_1424006185"),
-    ("explicit.stat_2106756686", "explicit.stat_1346311588"),
-    ("explicit.stat_2106756686", "explicit.stat_207635700"),
-    ("explicit.stat_2106756686", "explicit.stat_1853636813"),
-    ("explicit.stat_2106756686", "explicit.stat_2831391506"),
-    ("explicit.stat_2106756686", "explicit.stat_1138813382"),
-    ("explicit.stat_2106756686", "explicit.stat_2736708072"),
-    ("explicit.stat_2106756686", "explicit.stat_3308185931"),
-    ("explicit.stat_2106756686", "explicit.stat_4104891138"),
-    ("explicit.stat_2106756686", "explicit.stat_34059570"),
-    ("explicit.stat_2106756686", "explicit.stat_3643449791"),
-    ("explicit.stat_2106756686", "explicit.stat_3468843137"),
-    ("explicit.stat_2106756686", "explicit.stat_3207781478"),
-    ("explicit.stat_2106756686", "explicit.stat_2806391472"),
-    ("explicit.stat_2106756686", "explicit.stat_2567659895"),
-    ("explicit.stat_2106756686", "explicit.stat_4012281889"),
-    ("explicit.stat_2106756686", "explicit.stat_1173690938"),
-    ("explicit.stat_2106756686", "explicit.stat_2365917222"),
-    ("explicit.stat_2106756686", "explicit.stat_3223142064"),
-    ("explicit.stat_2106756686", "explicit.stat_1567542124"),
-    ("explicit.stat_2106756686", "explicit.stat_2647344903"),
-    ("explicit.stat_2106756686", "explicit.stat_1165583295"),
-    ("explicit.stat_2106756686", "explicit.stat_371612541"),
-    ("explicit.stat_2106756686", "explicit.stat_2720072724"),
-    ("explicit.stat_2106756686", "explicit.stat_1919069577"),
-    ("explicit.stat_2106756686", "explicit.stat_3772841281"),
-    ("explicit.stat_2106756686", "explicit.stat_4245204226"),
-    ("explicit.stat_2106756686", "explicit.stat_2163419452"),
-    ("explicit.stat_2106756686", "explicit.stat_3111519953"),
-    ("explicit.stat_2106756686", "explicit.stat_2434030180"),
-    ("explicit.stat_2106756686", "explicit.stat_1653848515"),
-    ("explicit.stat_2106756686", "explicit.stat_2731416566"),
-    ("explicit.stat_2106756686", "explicit.stat_3234824465"),
-    ("explicit.stat_2106756686", "explicit.stat_3627458291"),
-    ("explicit.stat_2106756686", "explicit.stat_2091518682"),
-    ("explicit.stat_2106756686", "explicit.stat_214835567"),
-    ("explicit.stat_2106756686", "explicit.stat_362838683"),
-    ("explicit.stat_2106756686", "explicit.stat_2457540491"),
-    ("explicit.stat_2106756686", "explicit.stat_65331133"),
-    ("explicit.stat_2106756686", "explicit.stat_3337107517"),
-    ("explicit.stat_2106756686", "explicit.stat_3332055899"),
-    ("explicit.stat_2106756686", "explicit.stat_2548097895"),
-    ("explicit.stat_2106756686", "explicit.stat_1016185292"),
-    ("explicit.stat_2106756686", "explicit.stat_3624529132"),
-    ("explicit.stat_2106756686", "explicit.stat_380220671"),
-    ("explicit.stat_2106756686", "explicit.stat_2189467271"),
-    ("explicit.stat_2106756686", "explicit.stat_3953667743"),
-    ("explicit.stat_2106756686", "explicit.stat_1723738042"),
-    ("explicit.stat_2106756686", "explicit.stat_556659145"),
-    ("explicit.stat_2106756686", "explicit.stat_2690790844"),
-    ("explicit.stat_2106756686", "explicit.stat_80470845"),
-    ("explicit.stat_2106756686", "explicit.stat_2444534954"),
-    ("explicit.stat_2106756686", "explicit.stat_1699077932"),
-    ("explicit.stat_2106756686", "explicit.stat_2383304564"),
-    ("explicit.stat_2106756686", "explicit.stat_121436064"),
-    ("explicit.stat_2106756686", "explicit.stat_2312747856"),
-    ("explicit.stat_2106756686", "explicit.stat_3656959867"),
-    ("explicit.stat_2106756686", "explicit.stat_281949611"),
-    ("explicit.stat_3357049845", "explicit.stat_1077131949"),
-    ("explicit.stat_3357049845", "explicit.stat_2255914633"),
-    ("explicit.stat_3357049845", "explicit.stat_2753985507"),
-    ("explicit.stat_3357049845", "explicit.stat_2643562209"),
-    ("explicit.stat_3357049845", "explicit.stat_1413864591"),
-    ("explicit.stat_3357049845", "explicit.stat_1222888897"),
-    ("explicit.stat_3357049845", "explicit.stat_664849247"),
-    ("explicit.stat_3357049845", "explicit.stat_68410701"),
-    ("explicit.stat_3357049845", "explicit.stat_3742808908"),
-    ("explicit.stat_3357049845", "explicit.stat_1873457881"),
-    ("explicit.stat_3357049845", "explicit.stat_3692646597"),
-    ("explicit.stat_3357049845", "explicit.stat_1011863394"),
-    ("explicit.stat_3357049845", "explicit.stat_3371719014"),
-    ("explicit.stat_3357049845", "explicit.stat_4173751044"),
-    ("explicit.stat_3357049845", "explicit.stat_576528026"),
-    ("explicit.stat_3357049845", "explicit.stat_3772848194"),
-    ("explicit.stat_3357049845", "explicit.stat_969576725"),
-    ("explicit.stat_3357049845", "explicit.stat_4071658793"),
-    ("explicit.stat_3357049845", "explicit.stat_3329402420"),
-    ("explicit.stat_3357049845", "explicit.stat_4259701244"),
-    ("explicit.stat_3357049845", "explicit.stat_3765507527"),
-    ("explicit.stat_3357049845", "explicit.stat_1313498929"),
-    ("explicit.stat_3357049845", "explicit.stat_991194404"),
-    ("explicit.stat_3357049845", "explicit.stat_1424006185"),
-    ("explicit.stat_3357049845", "explicit.stat_1346311588"),
-    ("explicit.stat_3357049845", "explicit.stat_207635700"),
-    ("explicit.stat_3357049845", "explicit.stat_1853636813"),
-    ("explicit.stat_3357049845", "explicit.stat_2831391506"),
-    ("explicit.stat_3357049845", "explicit.stat_1138813382"),
-    ("explicit.stat_3357049845", "explicit.stat_2736708072"),
-    ("explicit.stat_3357049845", "explicit.stat_3308185931"),
-    ("explicit.stat_3357049845", "explicit.stat_4104891138"),
-    ("explicit.stat_3357049845", "explicit.stat_34059570"),
-    ("explicit.stat_3357049845", "explicit.stat_3643449791"),
-    ("explicit.stat_3357049845", "explicit.stat_3468843137"),
-    ("explicit.stat_3357049845", "explicit.stat_3207781478"),
-    ("explicit.stat_3357049845", "explicit.stat_2806391472"),
-    ("explicit.stat_3357049845", "explicit.stat_2567659895"),
-    ("explicit.stat_3357049845", "explicit.stat_4012281889"),
-    ("explicit.stat_3357049845", "explicit.stat_1173690938"),
-    ("explicit.stat_3357049845", "explicit.stat_2365917222"),
-    ("explicit.stat_3357049845", "explicit.stat_3223142064"),
-    ("explicit.stat_3357049845", "explicit.stat_1567542124"),
-    ("explicit.stat_3357049845", "explicit.stat_2647344903"),
-    ("explicit.stat_3357049845", "explicit.stat_1165583295"),
-    ("explicit.stat_3357049845", "explicit.stat_371612541"),
-    ("explicit.stat_3357049845", "explicit.stat_2720072724"),
-    ("explicit.stat_3357049845", "explicit.stat_1919069577"),
-    ("explicit.stat_3357049845", "explicit.stat_3772841281"),
-    ("explicit.stat_3357049845", "explicit.stat_4245204226"),
-    ("explicit.stat_3357049845", "explicit.stat_2163419452"),
-    ("explicit.stat_3357049845", "explicit.stat_3111519953"),
-    ("explicit.stat_3357049845", "explicit.stat_2434030180"),
-    ("explicit.stat_3357049845", "explicit.stat_1653848515"),
-    ("explicit.stat_3357049845", "explicit.stat_2731416566"),
-    ("explicit.stat_3357049845", "explicit.stat_3234824465"),
-    ("explicit.stat_3357049845", "explicit.stat_3627458291"),
-    ("explicit.stat_3357049845", "explicit.stat_2091518682"),
-    ("explicit.stat_3357049845", "explicit.stat_214835567"),
-    ("explicit.stat_3357049845", "explicit.stat_362838683"),
-    ("explicit.stat_3357049845", "explicit.stat_2457540491"),
-    ("explicit.stat_3357049845", "explicit.stat_65331133"),
-    ("explicit.stat_3357049845", "explicit.stat_3337107517"),
-    ("explicit.stat_3357049845", "explicit.stat_3332055899"),
-    ("explicit.stat_3357049845", "explicit.stat_2548097895"),
-    ("explicit.stat_3357049845", "explicit.stat_1016185292"),
-    ("explicit.stat_3357049845", "explicit.stat_3624529132"),
-    ("explicit.stat_3357049845", "explicit.stat_380220671"),
-    ("explicit.stat_3357049845", "explicit.stat_2189467271"),
-    ("explicit.stat_3357049845", "explicit.stat_3953667743"),
-    ("explicit.stat_3357049845", "explicit.stat_1723738042"),
-    ("explicit.stat_3357049845", "explicit.stat_556659145"),
-    ("explicit.stat_3357049845", "explicit.stat_2690790844"),
-    ("explicit.stat_3357049845", "explicit.stat_80470845"),
-    ("explicit.stat_3357049845", "explicit.stat_2444534954"),
-    ("explicit.stat_3357049845", "explicit.stat_1699077932"),
-    ("explicit.stat_3357049845", "explicit.stat_2383304564"),
-    ("explicit.stat_3357049845", "explicit.stat_121436064"),
-    ("explicit.stat_3357049845", "explicit.stat_2312747856"),
-    ("explicit.stat_3357049845", "explicit.stat_3656959867"),
-    ("explicit.stat_3357049845", "explicit.stat_281949611"),
-    ("explicit.stat_1077131949", "explicit.stat_2255914633"),
-    ("explicit.stat_1077131949", "explicit.stat_2753985507"),
-    ("explicit.stat_1077131949", "explicit.stat_2643562209"),
-    ("explicit.stat_1077131949", "explicit.stat_1413864591"),
-    ("explicit.stat_1077131949", "explicit.stat_1222888897"),
-    ("explicit.stat_1077131949", "explicit.stat_664849247"),
-    ("explicit.stat_1077131949", "explicit.stat_68410701"),
-    ("explicit.stat_1077131949", "explicit.stat_3742808908"),
-    ("explicit.stat_1077131949", "explicit.stat_1873457881"),
-    ("explicit.stat_1077131949", "explicit.stat_3692646597"),
-    ("explicit.stat_1077131949", "explicit.stat_1011863394"),
-    ("explicit.stat_1077131949", "explicit.stat_3371719014"),
-    ("explicit.stat_1077131949", "explicit.stat_4173751044"),
-    ("explicit.stat_1077131949", "explicit.stat_576528026"),
-    ("explicit.stat_1077131949", "explicit.stat_3772848194"),
-    ("explicit.stat_1077131949", "explicit.stat_969576725"),
-    ("explicit.stat_1077131949", "explicit.stat_4071658793"),
-    ("explicit.stat_1077131949", "explicit.stat_3329402420"),
-    ("explicit.stat_1077131949", "explicit.stat_4259701244"),
-    ("explicit.stat_1077131949", "explicit.stat_3765507527"),
-    ("explicit.stat_1077131949", "explicit.stat_1313498929"),
-    ("explicit.stat_1077131949", "explicit.stat_991194404"),
-    ("explicit.stat_1077131949", "explicit.stat_1424006185"),
-    ("explicit.stat_1077131949", "explicit.stat_1346311588"),
-    ("explicit.stat_1077131949", "explicit.stat_207635700"),
-    ("explicit.stat_1077131949", "explicit.stat_1853636813"),
-    ("explicit.stat_1077131949", "explicit.stat_2831391506"),
-    ("explicit.stat_1077131949", "explicit.stat_1138813382"),
-    ("explicit.stat_1077131949", "explicit.stat_2736708072"),
-    ("explicit.stat_1077131949", "explicit.stat_3308185931"),
-    ("explicit.stat_1077131949", "explicit.stat_4104891138"),
-    ("explicit.stat_1077131949", "explicit.stat_34059570"),
-    ("explicit.stat_1077131949", "explicit.stat_3643449791"),
-    ("explicit.stat_1077131949", "explicit.stat_3468843137"),
-    ("explicit.stat_1077131949", "explicit.stat_3207781478"),
-    ("explicit.stat_1077131949", "explicit.stat_2806391472"),
-    ("explicit.stat_1077131949", "explicit.stat_2567659895"),
-    ("explicit.stat_1077131949", "explicit.stat_4012281889"),
-    ("explicit.stat_1077131949", "explicit.stat_1173690938"),
-    ("explicit.stat_1077131949", "explicit.stat_2365917222"),
-    ("explicit.stat_1077131949", "explicit.stat_3223142064"),
-    ("explicit.stat_1077131949", "explicit.stat_1567542124"),
-    ("explicit.stat_1077131949", "explicit.stat_2647344903"),
-    ("explicit.stat_1077131949", "explicit.stat_1165583295"),
-    ("explicit.stat_1077131949", "explicit.stat_371612541"),
-    ("explicit.stat_1077131949", "explicit.stat_2720072724"),
-    ("explicit.stat_1077131949", "explicit.stat_1919069577"),
-    ("explicit.stat_1077131949", "explicit.stat_3772841281"),
-    ("explicit.stat_1077131949", "explicit.stat_4245204226"),
-    ("explicit.stat_1077131949", "explicit.stat_2163419452"),
-    ("explicit.stat_1077131949", "explicit.stat_3111519953"),
-    ("explicit.stat_1077131949", "explicit.stat_2434030180"),
-    ("explicit.stat_1077131949", "explicit.stat_1653848515"),
-    ("explicit.stat_1077131949", "explicit.stat_2731416566"),
-    ("explicit.stat_1077131949", "explicit.stat_3234824465"),
-    ("explicit.stat_1077131949", "explicit.stat_3627458291"),
-    ("explicit.stat_1077131949", "explicit.stat_2091518682"),
-    ("explicit.stat_1077131949", "explicit.stat_214835567"),
-    ("explicit.stat_1077131949", "explicit.stat_362838683"),
-    ("explicit.stat_1077131949", "explicit.stat_2457540491"),
-    ("explicit.stat_1077131949", "explicit.stat_65331133"),
-    ("explicit.stat_1077131949", "explicit.stat_3337107517"),
-    ("explicit.stat_1077131949", "explicit.stat_3332055899"),
-    ("explicit.stat_1077131949", "explicit.stat_2548097895"),
-    ("explicit.stat_1077131949", "explicit.stat_1016185292"),
-    ("explicit.stat_1077131949", "explicit.stat_3624529132"),
-    ("explicit.stat_1077131949", "explicit.stat_380220671"),
-    ("explicit.stat_1077131949", "explicit.stat_2189467271"),
-    ("explicit.stat_1077131949", "explicit.stat_3953667743"),
-    ("explicit.stat_1077131949", "explicit.stat_1723738042"),
-    ("explicit.stat_1077131949", "explicit.stat_556659145"),
-    ("explicit.stat_1077131949", "explicit.stat_2690790844"),
-    ("explicit.stat_1077131949", "explicit.stat_80470845"),
-    ("explicit.stat_1077131949", "explicit.stat_2444534954"),
-    ("explicit.stat_1077131949", "explicit.stat_1699077932"),
-    ("explicit.stat_1077131949", "explicit.stat_2383304564"),
-    ("explicit.stat_1077131949", "explicit.stat_121436064"),
-    ("explicit.stat_1077131949", "explicit.stat_2312747856"),
-    ("explicit.stat_1077131949", "explicit.stat_3656959867"),
-    ("explicit.stat_1077131949", "explicit.stat_281949611"),
-    ("explicit.stat_2255914633", "explicit.stat_2753985507"),
-    ("explicit.stat_2255914633", "explicit.stat_2643562209"),
-    ("explicit.stat_2255914633", "explicit.stat_1413864591"),
-    ("explicit.stat_2255914633", "explicit.stat_1222888897"),
-    ("explicit.stat_2255914633", "explicit.stat_664849247"),
-    ("explicit.stat_2255914633", "explicit.stat_68410701"),
-    ("explicit.stat_2255914633", "explicit.stat_3742808908"),
-    ("explicit.stat_2255914633", "explicit.stat_1873457881"),
-    ("explicit.stat_2255914633", "explicit.stat_3692646597"),
-    ("explicit.stat_2255914633", "explicit.stat_1011863394"),
-    ("explicit.stat_2255914633", "explicit.stat_3371719014"),
-    ("explicit.stat_2255914633", "explicit.stat_4173751044"),
-    ("explicit.stat_2255914633", "explicit.stat_576528026"),
-    ("explicit.stat_2255914633", "explicit.stat_3772848194"),
-    ("explicit.stat_2255914633", "explicit.stat_969576725"),
-    ("explicit.stat_2255914633", "explicit.stat_4071658793"),
-    ("explicit.stat_2255914633", "explicit.stat_3329402420"),
-    ("explicit.stat_2255914633", "explicit.stat_4259701244"),
-    ("explicit.stat_2255914633", "explicit.stat_3765507527"),
-    ("explicit.stat_2255914633", "explicit.stat_1313498929"),
-    ("explicit.stat_2255914633", "explicit.stat_991194404"),
-    ("explicit.stat_2255914633", "explicit.stat_1424006185"),
-    ("explicit.stat_2255914633", "explicit.stat_1346311588"),
-    ("explicit.stat_2255914633", "explicit.stat_207635700"),
-    ("explicit.stat_2255914633", "explicit.stat_1853636813"),
-    ("explicit.stat_2255914633", "explicit.stat_2831391506"),
-    ("explicit.stat_2255914633", "explicit.stat_1138813382"),
-    ("explicit.stat_2255914633", "explicit.stat_2736708072"),
-    ("explicit.stat_2255914633", "explicit.stat_3308185931"),
-    ("explicit.stat_2255914633", "explicit.stat_4104891138"),
-    ("explicit.stat_2255914633", "explicit.stat_34059570"),
-    ("explicit.stat_2255914633", "explicit.stat_3643449791"),
-    ("explicit.stat_2255914633", "explicit.stat_3468843137"),
-    ("explicit.stat_2255914633", "explicit.stat_3207781478"),
-    ("explicit.stat_2255914633", "explicit.stat_2806391472"),
-    ("explicit.stat_2255914633", "explicit.stat_2567659895"),
-    ("explicit.stat_2255914633", "explicit.stat_4012281889"),
-    ("explicit.stat_2255914633", "explicit.stat_1173690938"),
-    ("explicit.stat_2255914633", "explicit.stat_2365917222"),
-    ("explicit.stat_2255914633", "explicit.stat_3223142064"),
-    ("explicit.stat_2255914633", "explicit.stat_1567542124"),
-    ("explicit.stat_2255914633", "explicit.stat_2647344903"),
-    ("explicit.stat_2255914633", "explicit.stat_1165583295"),
-    ("explicit.stat_2255914633", "explicit.stat_371612541"),
-    ("explicit.stat_2255914633", "explicit.stat_2720072724"),
-    ("explicit.stat_2255914633", "explicit.stat_1919069577"),
-    ("explicit.stat_2255914633", "explicit.stat_3772841281"),
-    ("explicit.stat_2255914633", "explicit.stat_4245204226"),
-    ("explicit.stat_2255914633", "explicit.stat_2163419452"),
-    ("explicit.stat_2255914633", "explicit.stat_3111519953"),
-    ("explicit.stat_2255914633", "explicit.stat_2434030180"),
-    ("explicit.stat_2255914633", "explicit.stat_1653848515"),
-    ("explicit.stat_2255914633", "explicit.stat_2731416566"),
-    ("explicit.stat_2255914633", "explicit.stat_3234824465"),
-    ("explicit.stat_2255914633", "explicit.stat_3627458291"),
-    ("explicit.stat_2255914633", "explicit.stat_2091518682"),
-    ("explicit.stat_2255914633", "explicit.stat_214835567"),
-    ("explicit.stat_2255914633", "explicit.stat_362838683"),
-    ("explicit.stat_2255914633", "explicit.stat_2457540491"),
-    ("explicit.stat_2255914633", "explicit.stat_65331133"),
-    ("explicit.stat_2255914633", "explicit.stat_3337107517"),
-    ("explicit.stat_2255914633", "explicit.stat_3332055899"),
-    ("explicit.stat_2255914633", "explicit.stat_2548097895"),
-    ("explicit.stat_2255914633", "explicit.stat_1016185292"),
-    ("explicit.stat_2255914633", "explicit.stat_3624529132"),
-    ("explicit.stat_2255914633", "explicit.stat_380220671"),
-    ("explicit.stat_2255914633", "explicit.stat_2189467271"),
-    ("explicit.stat_2255914633", "explicit.stat_3953667743"),
-    ("explicit.stat_2255914633", "explicit.stat_1723738042"),
-    ("explicit.stat_2255914633", "explicit.stat_556659145"),
-    ("explicit.stat_2255914633", "explicit.stat_2690790844"),
-    ("explicit.stat_2255914633", "explicit.stat_80470845"),
-    ("explicit.stat_2255914633", "explicit.stat_2444534954"),
-    ("explicit.stat_2255914633", "explicit.stat_1699077932"),
-    ("explicit.stat_2255914633", "explicit.stat_2383304564"),
-    ("explicit.stat_2255914633", "explicit.stat_121436064"),
-    ("explicit.stat_2255914633", "explicit.stat_2312747856"),
-    ("explicit.stat_2255914633", "explicit.stat_3656959867"),
-    ("explicit.stat_2255914633", "explicit.stat_281949611"),
-    ("explicit.stat_2753985507", "explicit.stat_2643562209"),
-    ("explicit.stat_2753985507", "explicit.stat_1413864591"),
-    ("explicit.stat_2753985507", "explicit.stat_1222888897"),
-    ("explicit.stat_2753985507", "explicit.stat_664849247"),
-    ("explicit.stat_2753985507", "explicit.stat_68410701"),
-    ("explicit.stat_2753985507", "explicit.stat_3742808908"),
-    ("explicit.stat_2753985507", "explicit.stat_1873457881"),
-    ("explicit.stat_2753985507", "explicit.stat_3692646597"),
-    ("explicit.stat_2753985507", "explicit.stat_1011863394"),
-    ("explicit.stat_2753985507", "explicit.stat_3371719014"),
-    ("explicit.stat_2753985507", "explicit.stat_4173751044"),
-    ("explicit.stat_2753985507", "explicit.stat_576528026"),
-    ("explicit.stat_2753985507", "explicit.stat_3772848194"),
-    ("explicit.stat_2753985507", "explicit.stat_969576725"),
-    ("explicit.stat_2753985507", "explicit.stat_4071658793"),
-    ("explicit.stat_2753985507", "explicit.stat_3329402420"),
-    ("explicit.stat_2753985507", "explicit.stat_4259701244"),
-    ("explicit.stat_2753985507", "explicit.stat_3765507527"),
-    ("explicit.stat_2753985507", "explicit.stat_1313498929"),
-    ("explicit.stat_2753985507", "explicit.stat_991194404"),
-    ("explicit.stat_2753985507", "explicit.stat_1424006185"),
-    ("explicit.stat_2753985507", "explicit.stat_1346311588"),
-    ("explicit.stat_2753985507", "explicit.stat_207635700"),
-    ("explicit.stat_2753985507", "explicit.stat_1853636813"),
-    ("explicit.stat_2753985507", "explicit.stat_2831391506"),
-    ("explicit.stat_2753985507", "explicit.stat_1138813382"),
-    ("explicit.stat_2753985507", "explicit.stat_2736708072"),
-    ("explicit.stat_2753985507", "explicit.stat_3308185931"),
-    ("explicit.stat_2753985507", "explicit.stat_4104891138"),
-    ("explicit.stat_2753985507", "explicit.stat_34059570"),
-    ("explicit.stat_2753985507", "explicit.stat_3643449791"),
-    ("explicit.stat_2753985507", "explicit.stat_3468843137"),
-    ("explicit.stat_2753985507", "explicit.stat_3207781478"),
-    ("explicit.stat_2753985507", "explicit.stat_2806391472"),
-    ("explicit.stat_2753985507", "explicit.stat_2567659895"),
-    ("explicit.stat_2753985507", "explicit.stat_4012281889"),
-    ("explicit.stat_2753985507", "explicit.stat_1173690938"),
-    ("explicit.stat_2753985507", "explicit.stat_2365917222"),
-    ("explicit.stat_2753985507", "explicit.stat_3223142064"),
-    ("explicit.stat_2753985507", "explicit.stat_1567542124"),
-    ("explicit.stat_2753985507", "explicit.stat_2647344903"),
-    ("explicit.stat_2753985507", "explicit.stat_1165583295"),
-    ("explicit.stat_2753985507", "explicit.stat_371612541"),
-    ("explicit.stat_2753985507", "explicit.stat_2720072724"),
-    ("explicit.stat_2753985507", "explicit.stat_1919069577"),
-    ("explicit.stat_2753985507", "explicit.stat_3772841281"),
-    ("explicit.stat_2753985507", "explicit.stat_4245204226"),
-    ("explicit.stat_2753985507", "explicit.stat_2163419452"),
-    ("explicit.stat_2753985507", "explicit.stat_3111519953"),
-    ("explicit.stat_2753985507", "explicit.stat_2434030180"),
-    ("explicit.stat_2753985507", "explicit.stat_1653848515"),
-    ("explicit.stat_2753985507", "explicit.stat_2731416566"),
-    ("explicit.stat_2753985507", "explicit.stat_3234824465"),
-    ("explicit.stat_2753985507", "explicit.stat_3627458291"),
-    ("explicit.stat_2753985507", "explicit.stat_2091518682"),
-    ("explicit.stat_2753985507", "explicit.stat_214835567"),
-    ("explicit.stat_2753985507", "explicit.stat_362838683"),
-    ("explicit.stat_2753985507", "explicit.stat_2457540491"),
-    ("explicit.stat_2753985507", "explicit.stat_65331133"),
-    ("explicit.stat_2753985507", "explicit.stat_3337107517"),
-    ("explicit.stat_2753985507", "explicit.stat_3332055899"),
-    ("explicit.stat_2753985507", "explicit.stat_2548097895"),
-    ("explicit.stat_2753985507", "explicit.stat_1016185292"),
-    ("explicit.stat_2753985507", "explicit.stat_3624529132"),
-    ("explicit.stat_2753985507", "explicit.stat_380220671"),
-    ("explicit.stat_2753985507", "explicit.stat_2189467271"),
-    ("explicit.stat_2753985507", "explicit.stat_3953667743"),
-    ("explicit.stat_2753985507", "explicit.stat_1723738042"),
-    ("explicit.stat_2753985507", "explicit.stat_556659145"),
-    ("explicit.stat_2753985507", "explicit.stat_2690790844"),
-    ("explicit.stat_2753985507", "explicit.stat_80470845"),
-    ("explicit.stat_2753985507", "explicit.stat_2444534954"),
-    ("explicit.stat_2753985507", "explicit.stat_1699077932"),
-    ("explicit.stat_2753985507", "explicit.stat_2383304564"),
-    ("explicit.stat_2753985507", "explicit.stat_121436064"),
-    ("explicit.stat_2753985507", "explicit.stat_2312747856"),
-    ("explicit.stat_2753985507", "explicit.stat_3656959867"),
-    ("explicit.stat_2753985507", "explicit.stat_281949611"),
-    ("explicit.stat_2643562209", "explicit.stat_1413864591"),
-    ("explicit.stat_2643562209", "explicit.stat_1222888897"),
-    ("explicit.stat_2643562209", "explicit.stat_664849247"),
-    ("explicit.stat_2643562209", "explicit.stat_68410701"),
-    ("explicit.stat_2643562209", "explicit.stat_3742808908"),
-    ("explicit.stat_2643562209", "explicit.stat_1873457881"),
-    ("explicit.stat_2643562209", "explicit.stat_3692646597"),
-    ("explicit.stat_2643562209", "explicit.stat_1011863394"),
-    ("explicit.stat_2643562209", "explicit.stat_3371719014"),
-    ("explicit.stat_2643562209", "explicit.stat_4173751044"),
-    ("explicit.stat_2643562209", "explicit.stat_576528026"),
-    ("explicit.stat_2643562209", "explicit.stat_3772848194"),
-    ("explicit.stat_2643562209", "explicit.stat_969576725"),
-    ("explicit.stat_2643562209", "explicit.stat_4071658793"),
-    ("explicit.stat_2643562209", "explicit.stat_3329402420"),
-    ("explicit.stat_2643562209", "explicit.stat_4259701244"),
-    ("explicit.stat_2643562209", "explicit.stat_3765507527"),
-    ("explicit.stat_2643562209", "explicit.stat_1313498929"),
-    ("explicit.stat_2643562209", "explicit.stat_991194404"),
-    ("explicit.stat_2643562209", "explicit.stat_1424006185"),
-    ("explicit.stat_2643562209", "explicit.stat_1346311588"),
-    ("explicit.stat_2643562209", "explicit.stat_207635700"),
-    ("explicit.stat_2643562209", "explicit.stat_1853636813"),
-    ("explicit.stat_2643562209", "explicit.stat_2831391506"),
-    ("explicit.stat_2643562209", "explicit.stat_1138813382"),
-    ("explicit.stat_2643562209", "explicit.stat_2736708072"),
-    ("explicit.stat_2643562209", "explicit.stat_3308185931"),
-    ("explicit.stat_2643562209", "explicit.stat_4104891138"),
-    ("explicit.stat_2643562209", "explicit.stat_34059570"),
-    ("explicit.stat_2643562209", "explicit.stat_3643449791"),
-    ("explicit.stat_2643562209", "explicit.stat_3468843137"),
-    ("explicit.stat_2643562209", "explicit.stat_3207781478"),
-    ("explicit.stat_2643562209", "explicit.stat_2806391472"),
-    ("explicit.stat_2643562209", "explicit.stat_2567659895"),
-    ("explicit.stat_2643562209", "explicit.stat_4012281889"),
-    ("explicit.stat_2643562209", "explicit.stat_1173690938"),
-    ("explicit.stat_2643562209", "explicit.stat_2365917222"),
-    ("explicit.stat_2643562209", "explicit.stat_3223142064"),
-    ("explicit.stat_2643562209", "explicit.stat_1567542124"),
-    ("explicit.stat_2643562209", "explicit.stat_2647344903"),
-    ("explicit.stat_2643562209", "explicit.stat_1165583295"),
-    ("explicit.stat_2643562209", "explicit.stat_371612541"),
-    ("explicit.stat_2643562209", "explicit.stat_2720072724"),
-    ("explicit.stat_2643562209", "explicit.stat_1919069577"),
-    ("explicit.stat_2643562209", "explicit.stat_3772841281"),
-    ("explicit.stat_2643562209", "explicit.stat_4245204226"),
-    ("explicit.stat_2643562209", "explicit.stat_2163419452"),
-    ("explicit.stat_2643562209", "explicit.stat_3111519953"),
-    ("explicit.stat_2643562209", "explicit.stat_2434030180"),
-    ("explicit.stat_2643562209", "explicit.stat_1653848515"),
-    ("explicit.stat_2643562209", "explicit.stat_2731416566"),
-    ("explicit.stat_2643562209", "explicit.stat_3234824465"),
-    ("explicit.stat_2643562209", "explicit.stat_3627458291"),
-    ("explicit.stat_2643562209", "explicit.stat_2091518682"),
-    ("explicit.stat_2643562209", "explicit.stat_214835567"),
-    ("explicit.stat_2643562209", "explicit.stat_362838683"),
-    ("explicit.stat_2643562209", "explicit.stat_2457540491"),
-    ("explicit.stat_2643562209", "explicit.stat_65331133"),
-    ("explicit.stat_2643562209", "explicit.stat_3337107517"),
-    ("explicit.stat_2643562209", "explicit.stat_3332055899"),
-    ("explicit.stat_2643562209", "explicit.stat_2548097895"),
-    ("explicit.stat_2643562209", "explicit.stat_1016185292"),
-    ("explicit.stat_2643562209", "explicit.stat_3624529132"),
-    ("explicit.stat_2643562209", "explicit.stat_380220671"),
-    ("explicit.stat_2643562209", "explicit.stat_2189467271"),
-    ("explicit.stat_2643562209", "explicit.stat_3953667743"),
-    ("explicit.stat_2643562209", "explicit.stat_1723738042"),
-    ("explicit.stat_2643562209", "explicit.stat_556659145"),
-    ("explicit.stat_2643562209", "explicit.stat_2690790844"),
-    ("explicit.stat_2643562209", "explicit.stat_80470845"),
-    ("explicit.stat_2643562209", "explicit.stat_2444534954"),
-    ("explicit.stat_2643562209", "explicit.stat_1699077932"),
-    ("explicit.stat_2643562209", "explicit.stat_2383304564"),
-    ("explicit.stat_2643562209", "explicit.stat_121436064"),
-    ("explicit.stat_2643562209", "explicit.stat_2312747856"),
-    ("explicit.stat_2643562209", "explicit.stat_3656959867"),
-    ("explicit.stat_2643562209", "explicit.stat_281949611"),
-    ("explicit.stat_1413864591", "explicit.stat_1222888897"),
-    ("explicit.stat_1413864591", "explicit.stat_664849247"),
-    ("explicit.stat_1413864591", "explicit.stat_68410701"),
-    ("explicit.stat_1413864591", "explicit.stat_3742808908"),
-    ("explicit.stat_1413864591", "explicit.stat_1873457881"),
-    ("explicit.stat_1413864591", "explicit.stat_3692646597"),
-    ("explicit.stat_1413864591", "explicit.stat_1011863394"),
-    ("explicit.stat_1413864591", "explicit.stat_3371719014"),
-    ("explicit.stat_1413864591", "explicit.stat_4173751044"),
-    ("explicit.stat_1413864591", "explicit.stat_576528026"),
-    ("explicit.stat_1413864591", "explicit.stat_3772848194"),
-    ("explicit.stat_1413864591", "explicit.stat_969576725"),
-    ("explicit.stat_1413864591", "explicit.stat_4071658793"),
-    ("explicit.stat_1413864591", "explicit.stat_3329402420"),
-    ("explicit.stat_1413864591", "explicit.stat_4259701244"),
-    ("explicit.stat_1413864591", "explicit.stat_3765507527"),
-    ("explicit.stat_1413864591", "explicit.stat_1313498929"),
-    ("explicit.stat_1413864591", "explicit.stat_991194404"),
-    ("explicit.stat_1413864591", "explicit.stat_1424006185"),
-    ("explicit.stat_1413864591", "explicit.stat_1346311588"),
-    ("explicit.stat_1413864591", "explicit.stat_207635700"),
-    ("explicit.stat_1413864591", "explicit.stat_1853636813"),
-    ("explicit.stat_1413864591", "explicit.stat_2831391506"),
-    ("explicit.stat_1413864591", "explicit.stat_1138813382"),
-    ("explicit.stat_1413864591", "explicit.stat_2736708072"),
-    ("explicit.stat_1413864591", "explicit.stat_3308185931"),
-    ("explicit.stat_1413864591", "explicit.stat_4104891138"),
-    ("explicit.stat_1413864591", "explicit.stat_34059570"),
-    ("explicit.stat_1413864591", "explicit.stat_3643449791"),
-    ("explicit.stat_1413864591", "explicit.stat_3468843137"),
-    ("explicit.stat_1413864591", "explicit.stat_3207781478"),
-    ("explicit.stat_1413864591", "explicit.stat_2806391472"),
-    ("explicit.stat_1413864591", "explicit.stat_2567659895"),
-    ("explicit.stat_1413864591", "explicit.stat_4012281889"),
-    ("explicit.stat_1413864591", "explicit.stat_1173690938"),
-    ("explicit.stat_1413864591", "explicit.stat_2365917222"),
-    ("explicit.stat_1413864591", "explicit.stat_3223142064"),
-    ("explicit.stat_1413864591", "explicit.stat_1567542124"),
-    ("explicit.stat_1413864591", "explicit.stat_2647344903"),
-    ("explicit.stat_1413864591", "explicit.stat_1165583295"),
-    ("explicit.stat_1413864591", "explicit.stat_371612541"),
-    ("explicit.stat_1413864591", "explicit.stat_2720072724"),
-    ("explicit.stat_1413864591", "explicit.stat_1919069577"),
-    ("explicit.stat_1413864591", "explicit.stat_3772841281"),
-    ("explicit.stat_1413864591", "explicit.stat_4245204226"),
-    ("explicit.stat_1413864591", "explicit.stat_2163419452"),
-    ("explicit.stat_1413864591", "explicit.stat_3111519953"),
-    ("explicit.stat_1413864591", "explicit.stat_2434030180"),
-    ("explicit.stat_1413864591", "explicit.stat_1653848515"),
-    ("explicit.stat_1413864591", "explicit.stat_2731416566"),
-    ("explicit.stat_1413864591", "explicit.stat_3234824465"),
-    ("explicit.stat_1413864591", "explicit.stat_3627458291"),
-    ("explicit.stat_1413864591", "explicit.stat_2091518682"),
-    ("explicit.stat_1413864591", "explicit.stat_214835567"),
-    ("explicit.stat_1413864591", "explicit.stat_362838683"),
-    ("explicit.stat_1413864591", "explicit.stat_2457540491"),
-    ("explicit.stat_1413864591", "explicit.stat_65331133"),
-    ("explicit.stat_1413864591", "explicit.stat_3337107517"),
-    ("explicit.stat_1413864591", "explicit.stat_3332055899"),
-    ("explicit.stat_1413864591", "explicit.stat_2548097895"),
-    ("explicit.stat_1413864591", "explicit.stat_1016185292"),
-    ("explicit.stat_1413864591", "explicit.stat_3624529132"),
-    ("explicit.stat_1413864591", "explicit.stat_380220671"),
-    ("explicit.stat_1413864591", "explicit.stat_2189467271"),
-    ("explicit.stat_1413864591", "explicit.stat_3953667743"),
-    ("explicit.stat_1413864591", "explicit.stat_1723738042"),
-    ("explicit.stat_1413864591", "explicit.stat_556659145"),
-    ("explicit.stat_1413864591", "explicit.stat_2690790844"),
-    ("explicit.stat_1413864591", "explicit.stat_80470845"),
-    ("explicit.stat_1413864591", "explicit.stat_2444534954"),
-    ("explicit.stat_1413864591", "explicit.stat_1699077932"),
-    ("explicit.stat_1413864591", "explicit.stat_2383304564"),
-    ("explicit.stat_1413864591", "explicit.stat_121436064"),
-    ("explicit.stat_1413864591", "explicit.stat_2312747856"),
-    ("explicit.stat_1413864591", "explicit.stat_3656959867"),
-    ("explicit.stat_1413864591", "explicit.stat_281949611"),
-    ("explicit.stat_1222888897", "explicit.stat_664849247"),
-    ("explicit.stat_1222888897", "explicit.stat_68410701"),
-    ("explicit.stat_1222888897", "explicit.stat_3742808908"),
-    ("explicit.stat_1222888897", "explicit.stat_1873457881"),
-    ("explicit.stat_1222888897", "explicit.stat_3692646597"),
-    ("explicit.stat_1222888897", "explicit.stat_1011863394"),
-    ("explicit.stat_1222888897", "explicit.stat_3371719014"),
-    ("explicit.stat_1222888897", "explicit.stat_4173751044"),
-    ("explicit.stat_1222888897", "explicit.stat_576528026"),
-    ("explicit.stat_1222888897", "explicit.stat_3772848194"),
-    ("explicit.stat_1222888897", "explicit.stat_969576725"),
-    ("explicit.stat_1222888897", "explicit.stat_4071658793"),
-    ("explicit.stat_1222888897", "explicit.stat_3329402420"),
-    ("explicit.stat_1222888897", "explicit.stat_4259701244"),
-    ("explicit.stat_1222888897", "explicit.stat_3765507527"),
-    ("explicit.stat_1222888897", "explicit.stat_1313498929"),
-    ("explicit.stat_1222888897", "explicit.stat_991194404"),
-    ("explicit.stat_1222888897", "explicit.stat_1424006185"),
-    ("explicit.stat_1222888897", "explicit.stat_1346311588"),
-    ("explicit.stat_1222888897", "explicit.stat_207635700"),
-    ("explicit.stat_1222888897", "explicit.stat_1853636813"),
-    ("explicit.stat_1222888897", "explicit.stat_2831391506"),
-    ("explicit.stat_1222888897", "explicit.stat_1138813382"),
-    ("explicit.stat_1222888897", "explicit.stat_2736708072"),
-    ("explicit.stat_1222888897", "explicit.stat_3308185931"),
-    ("explicit.stat_1222888897", "explicit.stat_4104891138"),
-    ("explicit.stat_1222888897", "explicit.stat_34059570"),
-    ("explicit.stat_1222888897", "explicit.stat_3643449791"),
-    ("explicit.stat_1222888897", "explicit.stat_3468843137"),
-    ("explicit.stat_1222888897", "explicit.stat_3207781478"),
-    ("explicit.stat_1222888897", "explicit.stat_2806391472"),
-    ("explicit.stat_1222888897", "explicit.stat_2567659895"),
-    ("explicit.stat_1222888897", "explicit.stat_4012281889"),
-    ("explicit.stat_1222888897", "explicit.stat_1173690938"),
-    ("explicit.stat_1222888897", "explicit.stat_2365917222"),
-    ("explicit.stat_1222888897", "explicit.stat_3223142064"),
-    ("explicit.stat_1222888897", "explicit.stat_1567542124"),
-    ("explicit.stat_1222888897", "explicit.stat_2647344903"),
-    ("explicit.stat_1222888897", "explicit.stat_1165583295"),
-    ("explicit.stat_1222888897", "explicit.stat_371612541"),
-    ("explicit.stat_1222888897", "explicit.stat_2720072724"),
-    ("explicit.stat_1222888897", "explicit.stat_1919069577"),
-    ("explicit.stat_1222888897", "explicit.stat_3772841281"),
-    ("explicit.stat_1222888897", "explicit.stat_4245204226"),
-    ("explicit.stat_1222888897", "explicit.stat_2163419452"),
-    ("explicit.stat_1222888897", "explicit.stat_3111519953"),
-    ("explicit.stat_1222888897", "explicit.stat_2434030180"),
-    ("explicit.stat_1222888897", "explicit.stat_1653848515"),
-    ("explicit.stat_1222888897", "explicit.stat_2731416566"),
-    ("explicit.stat_1222888897", "explicit.stat_3234824465"),
-    ("explicit.stat_1222888897", "explicit.stat_3627458291"),
-    ("explicit.stat_1222888897", "explicit.stat_2091518682"),
-    ("explicit.stat_1222888897", "explicit.stat_214835567"),
-    ("explicit.stat_1222888897", "explicit.stat_362838683"),
-    ("explicit.stat_1222888897", "explicit.stat_2457540491"),
-    ("explicit.stat_1222888897", "explicit.stat_65331133"),
-    ("explicit.stat_1222888897", "explicit.stat_3337107517"),
-    ("explicit.stat_1222888897", "explicit.stat_3332055899"),
-    ("explicit.stat_1222888897", "explicit.stat_2548097895"),
-    ("explicit.stat_1222888897", "explicit.stat_1016185292"),
-    ("explicit.stat_1222888897", "explicit.stat_3624529132"),
-    ("explicit.stat_1222888897", "explicit.stat_380220671"),
-    ("explicit.stat_1222888897", "explicit.stat_2189467271"),
-    ("explicit.stat_1222888897", "explicit.stat_3953667743"),
-    ("explicit.stat_1222888897", "explicit.stat_1723738042"),
-    ("explicit.stat_1222888897", "explicit.stat_556659145"),
-    ("explicit.stat_1222888897", "explicit.stat_2690790844"),
-    ("explicit.stat_1222888897", "explicit.stat_80470845"),
-    ("explicit.stat_1222888897", "explicit.stat_2444534954"),
-    ("explicit.stat_1222888897", "explicit.stat_1699077932"),
-    ("explicit.stat_1222888897", "explicit.stat_2383304564"),
-    ("explicit.stat_1222888897", "explicit.stat_121436064"),
-    ("explicit.stat_1222888897", "explicit.stat_2312747856"),
-    ("explicit.stat_1222888897", "explicit.stat_3656959867"),
-    ("explicit.stat_1222888897", "explicit.stat_281949611"),
-    ("explicit.stat_664849247", "explicit.stat_68410701"),
-    ("explicit.stat_664849247", "explicit.stat_3742808908"),
-    ("explicit.stat_664849247", "explicit.stat_1873457881"),
-    ("explicit.stat_664849247", "explicit.stat_3692646597"),
-    ("explicit.stat_664849247", "explicit.stat_1011863394"),
-    ("explicit.stat_664849247", "explicit.stat_3371719014"),
-    ("explicit.stat_664849247", "explicit.stat_4173751044"),
-    ("explicit.stat_664849247", "explicit.stat_576528026"),
-    ("explicit.stat_664849247", "explicit.stat_3772848194"),
-    ("explicit.stat_664849247", "explicit.stat_969576725"),
-    ("explicit.stat_664849247", "explicit.stat_4071658793"),
-    ("explicit.stat_664849247", "explicit.stat_3329402420"),
-    ("explicit.stat_664849247", "explicit.stat_4259701244"),
-    ("explicit.stat_664849247", "explicit.stat_3765507527"),
-    ("explicit.stat_664849247", "explicit.stat_1313498929"),
-    ("explicit.stat_664849247", "explicit.stat_991194404"),
-    ("explicit.stat_664849247", "explicit.stat_1424006185"),
-    ("explicit.stat_664849247", "explicit.stat_1346311588"),
-    ("explicit.stat_664849247", "explicit.stat_207635700"),
-    ("explicit.stat_664849247", "explicit.stat_1853636813"),
-    ("explicit.stat_664849247", "explicit.stat_2831391506"),
-    ("explicit.stat_664849247", "explicit.stat_1138813382"),
-    ("explicit.stat_664849247", "explicit.stat_2736708072"),
-    ("explicit.stat_664849247", "explicit.stat_3308185931"),
-    ("explicit.stat_664849247", "explicit.stat_4104891138"),
-    ("explicit.stat_664849247", "explicit.stat_34059570"),
-    ("explicit.stat_664849247", "explicit.stat_3643449791"),
-    ("explicit.stat_664849247", "explicit.stat_3468843137"),
-    ("explicit.stat_664849247", "explicit.stat_3207781478"),
-    ("explicit.stat_664849247", "explicit.stat_2806391472"),
-    ("explicit.stat_664849247", "explicit.stat_2567659895"),
-    ("explicit.stat_664849247", "explicit.stat_4012281889"),
-    ("explicit.stat_664849247", "explicit.stat_1173690938"),
-    ("explicit.stat_664849247", "explicit.stat_2365917222"),
-    ("explicit.stat_664849247", "explicit.stat_3223142064"),
-    ("explicit.stat_664849247", "explicit.stat_1567542124"),
-    ("explicit.stat_664849247", "explicit.stat_2647344903"),
-    ("explicit.stat_664849247", "explicit.stat_1165583295"),
-    ("explicit.stat_664849247", "explicit.stat_371612541"),
-    ("explicit.stat_664849247", "explicit.stat_2720072724"),
-    ("explicit.stat_664849247", "explicit.stat_1919069577"),
-    ("explicit.stat_664849247", "explicit.stat_3772841281"),
-    ("explicit.stat_664849247", "explicit.stat_4245204226"),
-    ("explicit.stat_664849247", "explicit.stat_2163419452"),
-    ("explicit.stat_664849247", "explicit.stat_3111519953"),
-    ("explicit.stat_664849247", "explicit.stat_2434030180"),
-    ("explicit.stat_664849247", "explicit.stat_1653848515"),
-    ("explicit.stat_664849247", "explicit.stat_2731416566"),
-    ("explicit.stat_664849247", "explicit.stat_3234824465"),
-    ("explicit.stat_664849247", "explicit.stat_3627458291"),
-    ("explicit.stat_664849247", "explicit.stat_2091518682"),
-    ("explicit.stat_664849247", "explicit.stat_214835567"),
-    ("explicit.stat_664849247", "explicit.stat_362838683"),
-    ("explicit.stat_664849247", "explicit.stat_2457540491"),
-    ("explicit.stat_664849247", "explicit.stat_65331133"),
-    ("explicit.stat_664849247", "explicit.stat_3337107517"),
-    ("explicit.stat_664849247", "explicit.stat_3332055899"),
-    ("explicit.stat_664849247", "explicit.stat_2548097895"),
-    ("explicit.stat_664849247", "explicit.stat_1016185292"),
-    ("explicit.stat_664849247", "explicit.stat_3624529132"),
-    ("explicit.stat_664849247", "explicit.stat_380220671"),
-    ("explicit.stat_664849247", "explicit.stat_2189467271"),
-    ("explicit.stat_664849247", "explicit.stat_3953667743"),
-    ("explicit.stat_664849247", "explicit.stat_1723738042"),
-    ("explicit.stat_664849247", "explicit.stat_556659145"),
-    ("explicit.stat_664849247", "explicit.stat_2690790844"),
-    ("explicit.stat_664849247", "explicit.stat_80470845"),
-    ("explicit.stat_664849247", "explicit.stat_2444534954"),
-    ("explicit.stat_664849247", "explicit.stat_1699077932"),
-    ("explicit.stat_664849247", "explicit.stat_2383304564"),
-    ("explicit.stat_664849247", "explicit.stat_121436064"),
-    ("explicit.stat_664849247", "explicit.stat_2312747856"),
-    ("explicit.stat_664849247", "explicit.stat_3656959867"),
-    ("explicit.stat_664849247", "explicit.stat_281949611"),
-    ("explicit.stat_68410701", "explicit.stat_3742808908"),
-    ("explicit.stat_68410701", "explicit.stat_1873457881"),
-    ("explicit.stat_68410701", "explicit.stat_3692646597"),
-    ("explicit.stat_68410701", "explicit.stat_1011863394"),
-    ("explicit.stat_68410701", "explicit.stat_3371719014"),
-    ("explicit.stat_68410701", "explicit.stat_4173751044"),
-    ("explicit.stat_68410701", "explicit.stat_576528026"),
-    ("explicit.stat_68410701", "explicit.stat_3772848194"),
-    ("explicit.stat_68410701", "explicit.stat_969576725"),
-    ("explicit.stat_68410701", "explicit.stat_4071658793"),
-    ("explicit.stat_68410701", "explicit.stat_3329402420"),
-    ("explicit.stat_68410701", "explicit.stat_4259701244"),
-    ("explicit.stat_68410701", "explicit.stat_3765507527"),
-    ("explicit.stat_68410701", "explicit.stat_1313498929"),
-    ("explicit.stat_68410701", "explicit.stat_991194404"),
-    ("explicit.stat_68410701", "explicit.stat_1424006185"),
-    ("explicit.stat_68410701", "explicit.stat_1346311588"),
-    ("explicit.stat_68410701", "explicit.stat_207635700"),
-    ("explicit.stat_68410701", "explicit.stat_1853636813"),
-    ("explicit.stat_68410701", "explicit.stat_2831391506"),
-    ("explicit.stat_68410701", "explicit.stat_1138813382"),
-    ("explicit.stat_68410701", "explicit.stat_2736708072"),
-    ("explicit.stat_68410701", "explicit.stat_3308185931"),
-    ("explicit.stat_68410701", "explicit.stat_4104891138"),
-    ("explicit.stat_68410701", "explicit.stat_34059570"),
-    ("explicit.stat_68410701", "explicit.stat_3643449791"),
-    ("explicit.stat_68410701", "explicit.stat_3468843137"),
-    ("explicit.stat_68410701", "explicit.stat_3207781478"),
-    ("explicit.stat_68410701", "explicit.stat_2806391472"),
-    ("explicit.stat_68410701", "explicit.stat_2567659895"),
-    ("explicit.stat_68410701", "explicit.stat_4012281889"),
-    ("explicit.stat_68410701", "explicit.stat_1173690938"),
-    ("explicit.stat_68410701", "explicit.stat_2365917222"),
-    ("explicit.stat_68410701", "explicit.stat_3223142064"),
-    ("explicit.stat_68410701", "explicit.stat_1567542124"),
-    ("explicit.stat_68410701", "explicit.stat_2647344903"),
-    ("explicit.stat_68410701", "explicit.stat_1165583295"),
-    ("explicit.stat_68410701", "explicit.stat_371612541"),
-    ("explicit.stat_68410701", "explicit.stat_2720072724"),
-    ("explicit.stat_68410701", "explicit.stat_1919069577"),
-    ("explicit.stat_68410701", "explicit.stat_3772841281"),
-    ("explicit.stat_68410701", "explicit.stat_4245204226"),
-    ("explicit.stat_68410701", "explicit.stat_2163419452"),
-    ("explicit.stat_68410701", "explicit.stat_3111519953"),
-    ("explicit.stat_68410701", "explicit.stat_2434030180"),
-    ("explicit.stat_68410701", "explicit.stat_1653848515"),
-    ("explicit.stat_68410701", "explicit.stat_2731416566"),
-    ("explicit.stat_68410701", "explicit.stat_3234824465"),
-    ("explicit.stat_68410701", "explicit.stat_3627458291"),
-    ("explicit.stat_68410701", "explicit.stat_2091518682"),
-    ("explicit.stat_68410701", "explicit.stat_214835567"),
-    ("explicit.stat_68410701", "explicit.stat_362838683"),
-    ("explicit.stat_68410701", "explicit.stat_2457540491"),
-    ("explicit.stat_68410701", "explicit.stat_65331133"),
-    ("explicit.stat_68410701", "explicit.stat_3337107517"),
-    ("explicit.stat_68410701", "explicit.stat_3332055899"),
-    ("explicit.stat_68410701", "explicit.stat_2548097895"),
-    ("explicit.stat_68410701", "explicit.stat_1016185292"),
-    ("explicit.stat_68410701", "explicit.stat_3624529132"),
-    ("explicit.stat_68410701", "explicit.stat_380220671"),
-    ("explicit.stat_68410701", "explicit.stat_2189467271"),
-    ("explicit.stat_68410701", "explicit.stat_3953667743"),
-    ("explicit.stat_68410701", "explicit.stat_1723738042"),
-    ("explicit.stat_68410701", "explicit.stat_556659145"),
-    ("explicit.stat_68410701", "explicit.stat_2690790844"),
-    ("explicit.stat_68410701", "explicit.stat_80470845"),
-    ("explicit.stat_68410701", "explicit.stat_2444534954"),
-    ("explicit.stat_68410701", "explicit.stat_1699077932"),
-    ("explicit.stat_68410701", "explicit.stat_2383304564"),
-    ("explicit.stat_68410701", "explicit.stat_121436064"),
-    ("explicit.stat_68410701", "explicit.stat_2312747856"),
-    ("explicit.stat_68410701", "explicit.stat_3656959867"),
-    ("explicit.stat_68410701", "explicit.stat_281949611"),
-    ("explicit.stat_3742808908", "explicit.stat_1873457881"),
-    ("explicit.stat_3742808908", "explicit.stat_3692646597"),
-    ("explicit.stat_3742808908", "explicit.stat_1011863394"),
-    ("explicit.stat_3742808908", "explicit.stat_3371719014"),
-    ("explicit.stat_3742808908", "explicit.stat_4173751044"),
-    ("explicit.stat_3742808908", "explicit.stat_576528026"),
-    ("explicit.stat_3742808908", "explicit.stat_3772848194"),
-    ("explicit.stat_3742808908", "explicit.stat_969576725"),
-    ("explicit.stat_3742808908", "explicit.stat_4071658793"),
-    ("explicit.stat_3742808908", "explicit.stat_3329402420"),
-    ("explicit.stat_3742808908", "explicit.stat_4259701244"),
-    ("explicit.stat_3742808908", "explicit.stat_3765507527"),
-    ("explicit.stat_3742808908", "explicit.stat_1313498929"),
-    ("explicit.stat_3742808908", "explicit.stat_991194404"),
-    ("explicit.stat_3742808908", "explicit.stat_1424006185"),
-    ("explicit.stat_3742808908", "explicit.stat_1346311588"),
-    ("explicit.stat_3742808908", "explicit.stat_207635700"),
-    ("explicit.stat_3742808908", "explicit.stat_1853636813"),
-    ("explicit.stat_3742808908", "explicit.stat_2831391506"),
-    ("explicit.stat_3742808908", "explicit.stat_1138813382"),
-    ("explicit.stat_3742808908", "explicit.stat_2736708072"),
-    ("explicit.stat_3742808908", "explicit.stat_3308185931"),
-    ("explicit.stat_3742808908", "explicit.stat_4104891138"),
-    ("explicit.stat_3742808908", "explicit.stat_34059570"),
-    ("explicit.stat_3742808908", "explicit.stat_3643449791"),
-    ("explicit.stat_3742808908", "explicit.stat_3468843137"),
-    ("explicit.stat_3742808908", "explicit.stat_3207781478"),
-    ("explicit.stat_3742808908", "explicit.stat_2806391472"),
-    ("explicit.stat_3742808908", "explicit.stat_2567659895"),
-    ("explicit.stat_3742808908", "explicit.stat_4012281889"),
-    ("explicit.stat_3742808908", "explicit.stat_1173690938"),
-    ("explicit.stat_3742808908", "explicit.stat_2365917222"),
-    ("explicit.stat_3742808908", "explicit.stat_3223142064"),
-    ("explicit.stat_3742808908", "explicit.stat_1567542124"),
-    ("explicit.stat_3742808908", "explicit.stat_2647344903"),
-    ("explicit.stat_3742808908", "explicit.stat_1165583295"),
-    ("explicit.stat_3742808908", "explicit.stat_371612541"),
-    ("explicit.stat_3742808908", "explicit.stat_2720072724"),
-    ("explicit.stat_3742808908", "explicit.stat_1919069577"),
-    ("explicit.stat_3742808908", "explicit.stat_3772841281"),
-    ("explicit.stat_3742808908", "explicit.stat_4245204226"),
-    ("explicit.stat_3742808908", "explicit.stat_2163419452"),
-    ("explicit.stat_3742808908", "explicit.stat_3111519953"),
-    ("explicit.stat_3742808908", "explicit.stat_2434030180"),
-    ("explicit.stat_3742808908", "explicit.stat_1653848515"),
-    ("explicit.stat_3742808908", "explicit.stat_2731416566"),
-    ("explicit.stat_3742808908", "explicit.stat_3234824465"),
-    ("explicit.stat_3742808908", "explicit.stat_3627458291"),
-    ("explicit.stat_3742808908", "explicit.stat_2091518682"),
-    ("explicit.stat_3742808908", "explicit.stat_214835567"),
-    ("explicit.stat_3742808908", "explicit.stat_362838683"),
-    ("explicit.stat_3742808908", "explicit.stat_2457540491"),
-    ("explicit.stat_3742808908", "explicit.stat_65331133"),
-    ("explicit.stat_3742808908", "explicit.stat_3337107517"),
-    ("explicit.stat_3742808908", "explicit.stat_3332055899"),
-    ("explicit.stat_3742808908", "explicit.stat_2548097895"),
-    ("explicit.stat_3742808908", "explicit.stat_1016185292"),
-    ("explicit.stat_3742808908", "explicit.stat_3624529132"),
-    ("explicit.stat_3742808908", "explicit.stat_380220671"),
-    ("explicit.stat_3742808908", "explicit.stat_2189467271"),
-    ("explicit.stat_3742808908", "explicit.stat_3953667743"),
-    ("explicit.stat_3742808908", "explicit.stat_1723738042"),
-    ("explicit.stat_3742808908", "explicit.stat_556659145"),
-    ("explicit.stat_3742808908", "explicit.stat_2690790844"),
-    ("explicit.stat_3742808908", "explicit.stat_80470845"),
-    ("explicit.stat_3742808908", "explicit.stat_2444534954"),
-    ("explicit.stat_3742808908", "explicit.stat_1699077932"),
-    ("explicit.stat_3742808908", "explicit.stat_2383304564"),
-    ("explicit.stat_3742808908", "explicit.stat_121436064"),
-    ("explicit.stat_3742808908", "explicit.stat_2312747856"),
-    ("explicit.stat_3742808908", "explicit.stat_3656959867"),
-    ("explicit.stat_3742808908", "explicit.stat_281949611"),
-    ("explicit.stat_1873457881", "explicit.stat_3692646597"),
-    ("explicit.stat_1873457881", "explicit.stat_1011863394"),
-    ("explicit.stat_1873457881", "explicit.stat_3371719014"),
-    ("explicit.stat_1873457881", "explicit.stat_4173751044"),
-    ("explicit.stat_1873457881", "explicit.stat_576528026"),
-    ("explicit.stat_1873457881", "explicit.stat_3772848194"),
-    ("explicit.stat_1873457881", "explicit.stat_969576725"),
-    ("explicit.stat_1873457881", "explicit.stat_4071658793"),
-    ("explicit.stat_1873457881", "explicit.stat_3329402420"),
-    ("explicit.stat_1873457881", "explicit.stat_4259701244"),
-    ("explicit.stat_1873457881", "explicit.stat_3765507527"),
-    ("explicit.stat_1873457881", "explicit.stat_1313498929"),
-    ("explicit.stat_1873457881", "explicit.stat_991194404"),
-    ("explicit.stat_1873457881", "explicit.stat_1424006185"),
-    ("explicit.stat_1873457881", "explicit.stat_1346311588"),
-    ("explicit.stat_1873457881", "explicit.stat_207635700"),
-    ("explicit.stat_1873457881", "explicit.stat_1853636813"),
-    ("explicit.stat_1873457881", "explicit.stat_2831391506"),
-    ("explicit.stat_1873457881", "explicit.stat_1138813382"),
-    ("explicit.stat_1873457881", "explicit.stat_2736708072"),
-    ("explicit.stat_1873457881", "explicit.stat_3308185931"),
-    ("explicit.stat_1873457881", "explicit.stat_4104891138"),
-    ("explicit.stat_1873457881", "explicit.stat_34059570"),
-    ("explicit.stat_1873457881", "explicit.stat_3643449791"),
-    ("explicit.stat_1873457881", "explicit.stat_3468843137"),
-    ("explicit.stat_1873457881", "explicit.stat_3207781478"),
-    ("explicit.stat_1873457881", "explicit.stat_2806391472"),
-    ("explicit.stat_1873457881", "explicit.stat_2567659895"),
-    ("explicit.stat_1873457881", "explicit.stat_4012281889"),
-    ("explicit.stat_1873457881", "explicit.stat_1173690938"),
-    ("explicit.stat_1873457881", "explicit.stat_2365917222"),
-    ("explicit.stat_1873457881", "explicit.stat_3223142064"),
-    ("explicit.stat_1873457881", "explicit.stat_1567542124"),
-    ("explicit.stat_1873457881", "explicit.stat_2647344903"),
-    ("explicit.stat_1873457881", "explicit.stat_1165583295"),
-    ("explicit.stat_1873457881", "explicit.stat_371612541"),
-    ("explicit.stat_1873457881", "explicit.stat_2720072724"),
-    ("explicit.stat_1873457881", "explicit.stat_1919069577"),
-    ("explicit.stat_1873457881", "explicit.stat_3772841281"),
-    ("explicit.stat_1873457881", "explicit.stat_4245204226"),
-    ("explicit.stat_1873457881", "explicit.stat_2163419452"),
-    ("explicit.stat_1873457881", "explicit.stat_3111519953"),
-    ("explicit.stat_1873457881", "explicit.stat_2434030180"),
-    ("explicit.stat_1873457881", "explicit.stat_1653848515"),
-    ("explicit.stat_1873457881", "explicit.stat_2731416566"),
-    ("explicit.stat_1873457881", "explicit.stat_3234824465"),
-    ("explicit.stat_1873457881", "explicit.stat_3627458291"),
-    ("explicit.stat_1873457881", "explicit.stat_2091518682"),
-    ("explicit.stat_1873457881", "explicit.stat_214835567"),
-    ("explicit.stat_1873457881", "explicit.stat_362838683"),
-    ("explicit.stat_1873457881", "explicit.stat_2457540491"),
-    ("explicit.stat_1873457881", "explicit.stat_65331133"),
-    ("explicit.stat_1873457881", "explicit.stat_3337107517"),
-    ("explicit.stat_1873457881", "explicit.stat_3332055899"),
-    ("explicit.stat_1873457881", "explicit.stat_2548097895"),
-    ("explicit.stat_1873457881", "explicit.stat_1016185292"),
-    ("explicit.stat_1873457881", "explicit.stat_3624529132"),
-    ("explicit.stat_1873457881", "explicit.stat_380220671"),
-    ("explicit.stat_1873457881", "explicit.stat_2189467271"),
-    ("explicit.stat_1873457881", "explicit.stat_3953667743"),
-    ("explicit.stat_1873457881", "explicit.stat_1723738042"),
-    ("explicit.stat_1873457881", "explicit.stat_556659145"),
-    ("explicit.stat_1873457881", "explicit.stat_2690790844"),
-    ("explicit.stat_1873457881", "explicit.stat_80470845"),
-    ("explicit.stat_1873457881", "explicit.stat_2444534954"),
-    ("explicit.stat_1873457881", "explicit.stat_1699077932"),
-    ("explicit.stat_1873457881", "explicit.stat_2383304564"),
-    ("explicit.stat_1873457881", "explicit.stat_121436064"),
-    ("explicit.stat_1873457881", "explicit.stat_2312747856"),
-    ("explicit.stat_1873457881", "explicit.stat_3656959867"),
-    ("explicit.stat_1873457881", "explicit.stat_281949611"),
-    ("explicit.stat_3692646597", "explicit.stat_1011863394"),
-    ("explicit.stat_3692646597", "explicit.stat_3371719014"),
-    ("explicit.stat_3692646597", "explicit.stat_4173751044"),
-    ("explicit.stat_3692646597", "explicit.stat_576528026"),
-    ("explicit.stat_3692646597", "explicit.stat_3772848194"),
-    ("explicit.stat_3692646597", "explicit.stat_969576725"),
-    ("explicit.stat_3692646597", "explicit.stat_4071658793"),
-    ("explicit.stat_3692646597", "explicit.stat_3329402420"),
-    ("explicit.stat_3692646597", "explicit.stat_4259701244"),
-    ("explicit.stat_3692646597", "explicit.stat_3765507527"),
-    ("explicit.stat_3692646597", "explicit.stat_1313498929"),
-    ("explicit.stat_3692646597", "explicit.stat_991194404"),
-    ("explicit.stat_3692646597", "explicit.stat_1424006185"),
-    ("explicit.stat_3692646597", "explicit.stat_1346311588"),
-    ("explicit.stat_3692646597", "explicit.stat_207635700"),
-    ("explicit.stat_3692646597", "explicit.stat_1853636813"),
-    ("explicit.stat_3692646597", "explicit.stat_2831391506"),
-    ("explicit.stat_3692646597", "explicit.stat_1138813382"),
-    ("explicit.stat_3692646597", "explicit.stat_2736708072"),
-    ("explicit.stat_3692646597", "explicit.stat_3308185931"),
-    ("explicit.stat_3692646597", "explicit.stat_4104891138"),
-    ("explicit.stat_3692646597", "explicit.stat_34059570"),
-    ("explicit.stat_3692646597", "explicit.stat_3643449791"),
-    ("explicit.stat_3692646597", "explicit.stat_3468843137"),
-    ("explicit.stat_3692646597", "explicit.stat_3207781478"),
-    ("explicit.stat_3692646597", "explicit.stat_2806391472"),
-    ("explicit.stat_3692646597", "explicit.stat_2567659895"),
-    ("explicit.stat_3692646597", "explicit.stat_4012281889"),
-    ("explicit.stat_3692646597", "explicit.stat_1173690938"),
-    ("explicit.stat_3692646597", "explicit.stat_2365917222"),
-    ("explicit.stat_3692646597", "explicit.stat_3223142064"),
-    ("explicit.stat_3692646597", "explicit.stat_1567542124"),
-    ("explicit.stat_3692646597", "explicit.stat_2647344903"),
-    ("explicit.stat_3692646597", "explicit.stat_1165583295"),
-    ("explicit.stat_3692646597", "explicit.stat_371612541"),
-    ("explicit.stat_3692646597", "explicit.stat_2720072724"),
-    ("explicit.stat_3692646597", "explicit.stat_1919069577"),
-    ("explicit.stat_3692646597", "explicit.stat_3772841281"),
-    ("explicit.stat_3692646597", "explicit.stat_4245204226"),
-    ("explicit.stat_3692646597", "explicit.stat_2163419452"),
-    ("explicit.stat_3692646597", "explicit.stat_3111519953"),
-    ("explicit.stat_3692646597", "explicit.stat_2434030180"),
-    ("explicit.stat_3692646597", "explicit.stat_1653848515"),
-    ("explicit.stat_3692646597", "explicit.stat_2731416566"),
-    ("explicit.stat_3692646597", "explicit.stat_3234824465"),
-    ("explicit.stat_3692646597", "explicit.stat_3627458291"),
-    ("explicit.stat_3692646597", "explicit.stat_2091518682"),
-    ("explicit.stat_3692646597", "explicit.stat_214835567"),
-    ("explicit.stat_3692646597", "explicit.stat_362838683"),
-    ("explicit.stat_3692646597", "explicit.stat_2457540491"),
-    ("explicit.stat_3692646597", "explicit.stat_65331133"),
-    ("explicit.stat_3692646597", "explicit.stat_3337107517"),
-    ("explicit.stat_3692646597", "explicit.stat_3332055899"),
-    ("explicit.stat_3692646597", "explicit.stat_2548097895"),
-    ("explicit.stat_3692646597", "explicit.stat_1016185292"),
-    ("explicit.stat_3692646597", "explicit.stat_3624529132"),
-    ("explicit.stat_3692646597", "explicit.stat_380220671"),
-    ("explicit.stat_3692646597", "explicit.stat_2189467271"),
-    ("explicit.stat_3692646597", "explicit.stat_3953667743"),
-    ("explicit.stat_3692646597", "explicit.stat_1723738042"),
-    ("explicit.stat_3692646597", "explicit.stat_556659145"),
-    ("explicit.stat_3692646597", "explicit.stat_2690790844"),
-    ("explicit.stat_3692646597", "explicit.stat_80470845"),
-    ("explicit.stat_3692646597", "explicit.stat_2444534954"),
-    ("explicit.stat_3692646597", "explicit.stat_1699077932"),
-    ("explicit.stat_3692646597", "explicit.stat_2383304564"),
-    ("explicit.stat_3692646597", "explicit.stat_121436064"),
-    ("explicit.stat_3692646597", "explicit.stat_2312747856"),
-    ("explicit.stat_3692646597", "explicit.stat_3656959867"),
-    ("explicit.stat_3692646597", "explicit.stat_281949611"),
-    ("explicit.stat_1011863394", "explicit.stat_3371719014"),
-    ("explicit.stat_1011863394", "explicit.stat_4173751044"),
-    ("explicit.stat_1011863394", "explicit.stat_576528026"),
-    ("explicit.stat_1011863394", "explicit.stat_3772848194"),
-    ("explicit.stat_1011863394", "explicit.stat_969576725"),
-    ("explicit.stat_1011863394", "explicit.stat_4071658793"),
-    ("explicit.stat_1011863394", "explicit.stat_3329402420"),
-    ("explicit.stat_1011863394", "explicit.stat_4259701244"),
-    ("explicit.stat_1011863394", "explicit.stat_3765507527"),
-    ("explicit.stat_1011863394", "explicit.stat_1313498929"),
-    ("explicit.stat_1011863394", "explicit.stat_991194404"),
-    ("explicit.stat_1011863394", "explicit.stat_1424006185"),
-    ("explicit.stat_1011863394", "explicit.stat_1346311588"),
-    ("explicit.stat_1011863394", "explicit.stat_207635700"),
-    ("explicit.stat_1011863394", "explicit.stat_1853636813"),
-    ("explicit.stat_1011863394", "explicit.stat_2831391506"),
-    ("explicit.stat_1011863394", "explicit.stat_1138813382"),
-    ("explicit.stat_1011863394", "explicit.stat_2736708072"),
-    ("explicit.stat_1011863394", "explicit.stat_3308185931"),
-    ("explicit.stat_1011863394", "explicit.stat_4104891138"),
-    ("explicit.stat_1011863394", "explicit.stat_34059570"),
-    ("explicit.stat_1011863394", "explicit.stat_3643449791"),
-    ("explicit.stat_1011863394", "explicit.stat_3468843137"),
-    ("explicit.stat_1011863394", "explicit.stat_3207781478"),
-    ("explicit.stat_1011863394", "explicit.stat_2806391472"),
-    ("explicit.stat_1011863394", "explicit.stat_2567659895"),
-    ("explicit.stat_1011863394", "explicit.stat_4012281889"),
-    ("explicit.stat_1011863394", "explicit.stat_1173690938"),
-    ("explicit.stat_1011863394", "explicit.stat_2365917222"),
-    ("explicit.stat_1011863394", "explicit.stat_3223142064"),
-    ("explicit.stat_1011863394", "explicit.stat_1567542124"),
-    ("explicit.stat_1011863394", "explicit.stat_2647344903"),
-    ("explicit.stat_1011863394", "explicit.stat_1165583295"),
-    ("explicit.stat_1011863394", "explicit.stat_371612541"),
-    ("explicit.stat_1011863394", "explicit.stat_2720072724"),
-    ("explicit.stat_1011863394", "explicit.stat_1919069577"),
-    ("explicit.stat_1011863394", "explicit.stat_3772841281"),
-    ("explicit.stat_1011863394", "explicit.stat_4245204226"),
-    ("explicit.stat_1011863394", "explicit.stat_2163419452"),
-    ("explicit.stat_1011863394", "explicit.stat_3111519953"),
-    ("explicit.stat_1011863394", "explicit.stat_2434030180"),
-    ("explicit.stat_1011863394", "explicit.stat_1653848515"),
-    ("explicit.stat_1011863394", "explicit.stat_2731416566"),
-    ("explicit.stat_1011863394", "explicit.stat_3234824465"),
-    ("explicit.stat_1011863394", "explicit.stat_3627458291"),
-    ("explicit.stat_1011863394", "explicit.stat_2091518682"),
-    ("explicit.stat_1011863394", "explicit.stat_214835567"),
-    ("explicit.stat_1011863394", "explicit.stat_362838683"),
-    ("explicit.stat_1011863394", "explicit.stat_2457540491"),
-    ("explicit.stat_1011863394", "explicit.stat_65331133"),
-    ("explicit.stat_1011863394", "explicit.stat_3337107517"),
-    ("explicit.stat_1011863394", "explicit.stat_3332055899"),
-    ("explicit.stat_1011863394", "explicit.stat_2548097895"),
-    ("explicit.stat_1011863394", "explicit.stat_1016185292"),
-    ("explicit.stat_1011863394", "explicit.stat_3624529132"),
-    ("explicit.stat_1011863394", "explicit.stat_380220671"),
-    ("explicit.stat_1011863394", "explicit.stat_2189467271"),
-    ("explicit.stat_1011863394", "explicit.stat_3953667743"),
-    ("explicit.stat_1011863394", "explicit.stat_1723738042"),
-    ("explicit.stat_1011863394", "explicit.stat_556659145"),
-    ("explicit.stat_1011863394", "explicit.stat_2690790844"),
-    ("explicit.stat_1011863394", "explicit.stat_80470845"),
-    ("explicit.stat_1011863394", "explicit.stat_2444534954"),
-    ("explicit.stat_1011863394", "explicit.stat_1699077932"),
-    ("explicit.stat_1011863394", "explicit.stat_2383304564"),
-    ("explicit.stat_1011863394", "explicit.stat_121436064"),
-    ("explicit.stat_1011863394", "explicit.stat_2312747856"),
-    ("explicit.stat_1011863394", "explicit.stat_3656959867"),
-    ("explicit.stat_1011863394", "explicit.stat_281949611"),
-    ("explicit.stat_3371719014", "explicit.stat_4173751044"),
-    ("explicit.stat_3371719014", "explicit.stat_576528026"),
-    ("explicit.stat_3371719014", "explicit.stat_3772848194"),
-    ("explicit.stat_3371719014", "explicit.stat_969576725"),
-    ("explicit.stat_3371719014", "explicit.stat_4071658793"),
-    ("explicit.stat_3371719014", "explicit.stat_3329402420"),
-    ("explicit.stat_3371719014", "explicit.stat_4259701244"),
-    ("explicit.stat_3371719014", "explicit.stat_3765507527"),
-    ("explicit.stat_3371719014", "explicit.stat_1313498929"),
-    ("explicit.stat_3371719014", "explicit.stat_991194404"),
-    ("explicit.stat_3371719014", "explicit.stat_1424006185"),
-    ("explicit.stat_3371719014", "explicit.stat_1346311588"),
-    ("explicit.stat_3371719014", "explicit.stat_207635700"),
-    ("explicit.stat_3371719014", "explicit.stat_1853636813"),
-    ("explicit.stat_3371719014", "explicit.stat_2831391506"),
-    ("explicit.stat_3371719014", "explicit.stat_1138813382"),
-    ("explicit.stat_3371719014", "explicit.stat_2736708072"),
-    ("explicit.stat_3371719014", "explicit.stat_3308185931"),
-    ("explicit.stat_3371719014", "explicit.stat_4104891138"),
-    ("explicit.stat_3371719014", "explicit.stat_34059570"),
-    ("explicit.stat_3371719014", "explicit.stat_3643449791"),
-    ("explicit.stat_3371719014", "explicit.stat_3468843137"),
-    ("explicit.stat_3371719014", "explicit.stat_3207781478"),
-    ("explicit.stat_3371719014", "explicit.stat_2806391472"),
-    ("explicit.stat_3371719014", "explicit.stat_2567659895"),
-    ("explicit.stat_3371719014", "explicit.stat_4012281889"),
-    ("explicit.stat_3371719014", "explicit.stat_1173690938"),
-    ("explicit.stat_3371719014", "explicit.stat_2365917222"),
-    ("explicit.stat_3371719014", "explicit.stat_3223142064"),
-    ("explicit.stat_3371719014", "explicit.stat_1567542124"),
-    ("explicit.stat_3371719014", "explicit.stat_2647344903"),
-    ("explicit.stat_3371719014", "explicit.stat_1165583295"),
-    ("explicit.stat_3371719014", "explicit.stat_371612541"),
-    ("explicit.stat_3371719014", "explicit.stat_2720072724"),
-    ("explicit.stat_3371719014", "explicit.stat_1919069577"),
-    ("explicit.stat_3371719014", "explicit.stat_3772841281"),
-    ("explicit.stat_3371719014", "explicit.stat_4245204226"),
-    ("explicit.stat_3371719014", "explicit.stat_2163419452"),
-    ("explicit.stat_3371719014", "explicit.stat_3111519953"),
-    ("explicit.stat_3371719014", "explicit.stat_2434030180"),
-    ("explicit.stat_3371719014", "explicit.stat_1653848515"),
-    ("explicit.stat_3371719014", "explicit.stat_2731416566"),
-    ("explicit.stat_3371719014", "explicit.stat_3234824465"),
-    ("explicit.stat_3371719014", "explicit.stat_3627458291"),
-    ("explicit.stat_3371719014", "explicit.stat_2091518682"),
-    ("explicit.stat_3371719014", "explicit.stat_214835567"),
-    ("explicit.stat_3371719014", "explicit.stat_362838683"),
-    ("explicit.stat_3371719014", "explicit.stat_2457540491"),
-    ("explicit.stat_3371719014", "explicit.stat_65331133"),
-    ("explicit.stat_3371719014", "explicit.stat_3337107517"),
-    ("explicit.stat_3371719014", "explicit.stat_3332055899"),
-    ("explicit.stat_3371719014", "explicit.stat_2548097895"),
-    ("explicit.stat_3371719014", "explicit.stat_1016185292"),
-    ("explicit.stat_3371719014", "explicit.stat_3624529132"),
-    ("explicit.stat_3371719014", "explicit.stat_380220671"),
-    ("explicit.stat_3371719014", "explicit.stat_2189467271"),
-    ("explicit.stat_3371719014", "explicit.stat_3953667743"),
-    ("explicit.stat_3371719014", "explicit.stat_1723738042"),
-    ("explicit.stat_3371719014", "explicit.stat_556659145"),
-    ("explicit.stat_3371719014", "explicit.stat_2690790844"),
-    ("explicit.stat_3371719014", "explicit.stat_80470845"),
-    ("explicit.stat_3371719014", "explicit.stat_2444534954"),
-    ("explicit.stat_3371719014", "explicit.stat_1699077932"),
-    ("explicit.stat_3371719014", "explicit.stat_2383304564"),
-    ("explicit.stat_3371719014", "explicit.stat_121436064"),
-    ("explicit.stat_3371719014", "explicit.stat_2312747856"),
-    ("explicit.stat_3371719014", "explicit.stat_3656959867"),
-    ("explicit.stat_3371719014", "explicit.stat_281949611"),
-    ("explicit.stat_4173751044", "explicit.stat_576528026"),
-    ("explicit.stat_4173751044", "explicit.stat_3772848194"),
-    ("explicit.stat_4173751044", "explicit.stat_969576725"),
-    ("explicit.stat_4173751044", "explicit.stat_4071658793"),
-    ("explicit.stat_4173751044", "explicit.stat_3329402420"),
-    ("explicit.stat_4173751044", "explicit.stat_4259701244"),
-    ("explicit.stat_4173751044", "explicit.stat_3765507527"),
-    ("explicit.stat_4173751044", "explicit.stat_1313498929"),
-    ("explicit.stat_4173751044", "explicit.stat_991194404"),
-    ("explicit.stat_4173751044", "explicit.stat_1424006185"),
-    ("explicit.stat_4173751044", "explicit.stat_1346311588"),
-    ("explicit.stat_4173751044", "explicit.stat_207635700"),
-    ("explicit.stat_4173751044", "explicit.stat_1853636813"),
-    ("explicit.stat_4173751044", "explicit.stat_2831391506"),
-    ("explicit.stat_4173751044", "explicit.stat_1138813382"),
-    ("explicit.stat_4173751044", "explicit.stat_2736708072"),
-    ("explicit.stat_4173751044", "explicit.stat_3308185931"),
-    ("explicit.stat_4173751044", "explicit.stat_4104891138"),
-    ("explicit.stat_4173751044", "explicit.stat_34059570"),
-    ("explicit.stat_4173751044", "explicit.stat_3643449791"),
-    ("explicit.stat_4173751044", "explicit.stat_3468843137"),
-    ("explicit.stat_4173751044", "explicit.stat_3207781478"),
-    ("explicit.stat_4173751044", "explicit.stat_2806391472"),
-    ("explicit.stat_4173751044", "explicit.stat_2567659895"),
-    ("explicit.stat_4173751044", "explicit.stat_4012281889"),
-    ("explicit.stat_4173751044", "explicit.stat_1173690938"),
-    ("explicit.stat_4173751044", "explicit.stat_2365917222"),
-    ("explicit.stat_4173751044", "explicit.stat_3223142064"),
-    ("explicit.stat_4173751044", "explicit.stat_1567542124"),
-    ("explicit.stat_4173751044", "explicit.stat_2647344903"),
-    ("explicit.stat_4173751044", "explicit.stat_1165583295"),
-    ("explicit.stat_4173751044", "explicit.stat_371612541"),
-    ("explicit.stat_4173751044", "explicit.stat_2720072724"),
-    ("explicit.stat_4173751044", "explicit.stat_1919069577"),
-    ("explicit.stat_4173751044", "explicit.stat_3772841281"),
-    ("explicit.stat_4173751044", "explicit.stat_4245204226"),
-    ("explicit.stat_4173751044", "explicit.stat_2163419452"),
-    ("explicit.stat_4173751044", "explicit.stat_3111519953"),
-    ("explicit.stat_4173751044", "explicit.stat_2434030180"),
-    ("explicit.stat_4173751044", "explicit.stat_1653848515"),
-    ("explicit.stat_4173751044", "explicit.stat_2731416566"),
-    ("explicit.stat_4173751044", "explicit.stat_3234824465"),
-    ("explicit.stat_4173751044", "explicit.stat_3627458291"),
-    ("explicit.stat_4173751044", "explicit.stat_2091518682"),
-    ("explicit.stat_4173751044", "explicit.stat_214835567"),
-    ("explicit.stat_4173751044", "explicit.stat_362838683"),
-    ("explicit.stat_4173751044", "explicit.stat_2457540491"),
-    ("explicit.stat_4173751044", "explicit.stat_65331133"),
-    ("explicit.stat_4173751044", "explicit.stat_3337107517"),
-    ("explicit.stat_4173751044", "explicit.stat_3332055899"),
-    ("explicit.stat_4173751044", "explicit.stat_2548097895"),
-    ("explicit.stat_4173751044", "explicit.stat_1016185292"),
-    ("explicit.stat_4173751044", "explicit.stat_3624529132"),
-    ("explicit.stat_4173751044", "explicit.stat_380220671"),
-    ("explicit.stat_4173751044", "explicit.stat_2189467271"),
-    ("explicit.stat_4173751044", "explicit.stat_3953667743"),
-    ("explicit.stat_4173751044", "explicit.stat_1723738042"),
-    ("explicit.stat_4173751044", "explicit.stat_556659145"),
-    ("explicit.stat_4173751044", "explicit.stat_2690790844"),
-    ("explicit.stat_4173751044", "explicit.stat_80470845"),
-    ("explicit.stat_4173751044", "explicit.stat_2444534954"),
-    ("explicit.stat_4173751044", "explicit.stat_1699077932"),
-    ("explicit.stat_4173751044", "explicit.stat_2383304564"),
-    ("explicit.stat_4173751044", "explicit.stat_121436064"),
-    ("explicit.stat_4173751044", "explicit.stat_2312747856"),
-    ("explicit.stat_4173751044", "explicit.stat_3656959867"),
-    ("explicit.stat_4173751044", "explicit.stat_281949611"),
-    ("explicit.stat_576528026", "explicit.stat_3772848194"),
-    ("explicit.stat_576528026", "explicit.stat_969576725"),
-    ("explicit.stat_576528026", "explicit.stat_4071658793"),
-    ("explicit.stat_576528026", "explicit.stat_3329402420"),
-    ("explicit.stat_576528026", "explicit.stat_4259701244"),
-    ("explicit.stat_576528026", "explicit.stat_3765507527"),
-    ("explicit.stat_576528026", "explicit.stat_1313498929"),
-    ("explicit.stat_576528026", "explicit.stat_991194404"),
-    ("explicit.stat_576528026", "explicit.stat_1424006185"),
-    ("explicit.stat_576528026", "explicit.stat_1346311588"),
-    ("explicit.stat_576528026", "explicit.stat_207635700"),
-    ("explicit.stat_576528026", "explicit.stat_1853636813"),
-    ("explicit.stat_576528026", "explicit.stat_2831391506"),
-    ("explicit.stat_576528026", "explicit.stat_1138813382"),
-    ("explicit.stat_576528026", "explicit.stat_2736708072"),
-    ("explicit.stat_576528026", "explicit.stat_3308185931"),
-    ("explicit.stat_576528026", "explicit.stat_4104891138"),
-    ("explicit.stat_576528026", "explicit.stat_34059570"),
-    ("explicit.stat_576528026", "explicit.stat_3643449791"),
-    ("explicit.stat_576528026", "explicit.stat_3468843137"),
-    ("explicit.stat_576528026", "explicit.stat_3207781478"),
-    ("explicit.stat_576528026", "explicit.stat_2806391472"),
-    ("explicit.stat_576528026", "explicit.stat_2567659895"),
-    ("explicit.stat_576528026", "explicit.stat_4012281889"),
-    ("explicit.stat_576528026", "explicit.stat_1173690938"),
-    ("explicit.stat_576528026", "explicit.stat_2365917222"),
-    ("explicit.stat_576528026", "explicit.stat_3223142064"),
-    ("explicit.stat_576528026", "explicit.stat_1567542124"),
-    ("explicit.stat_576528026", "explicit.stat_2647344903"),
-    ("explicit.stat_576528026", "explicit.stat_1165583295"),
-    ("explicit.stat_576528026", "explicit.stat_371612541"),
-    ("explicit.stat_576528026", "explicit.stat_2720072724"),
-    ("explicit.stat_576528026", "explicit.stat_1919069577"),
-    ("explicit.stat_576528026", "explicit.stat_3772841281"),
-    ("explicit.stat_576528026", "explicit.stat_4245204226"),
-    ("explicit.stat_576528026", "explicit.stat_2163419452"),
-    ("explicit.stat_576528026", "explicit.stat_3111519953"),
-    ("explicit.stat_576528026", "explicit.stat_2434030180"),
-    ("explicit.stat_576528026", "explicit.stat_1653848515"),
-    ("explicit.stat_576528026", "explicit.stat_2731416566"),
-    ("explicit.stat_576528026", "explicit.stat_3234824465"),
-    ("explicit.stat_576528026", "explicit.stat_3627458291"),
-    ("explicit.stat_576528026", "explicit.stat_2091518682"),
-    ("explicit.stat_576528026", "explicit.stat_214835567"),
-    ("explicit.stat_576528026", "explicit.stat_362838683"),
-    ("explicit.stat_576528026", "explicit.stat_2457540491"),
-    ("explicit.stat_576528026", "explicit.stat_65331133"),
-    ("explicit.stat_576528026", "explicit.stat_3337107517"),
-    ("explicit.stat_576528026", "explicit.stat_3332055899"),
-    ("explicit.stat_576528026", "explicit.stat_2548097895"),
-    ("explicit.stat_576528026", "explicit.stat_1016185292"),
-    ("explicit.stat_576528026", "explicit.stat_3624529132"),
-    ("explicit.stat_576528026", "explicit.stat_380220671"),
-    ("explicit.stat_576528026", "explicit.stat_2189467271"),
-    ("explicit.stat_576528026", "explicit.stat_3953667743"),
-    ("explicit.stat_576528026", "explicit.stat_1723738042"),
-    ("explicit.stat_576528026", "explicit.stat_556659145"),
-    ("explicit.stat_576528026", "explicit.stat_2690790844"),
-    ("explicit.stat_576528026", "explicit.stat_80470845"),
-    ("explicit.stat_576528026", "explicit.stat_2444534954"),
-    ("explicit.stat_576528026", "explicit.stat_1699077932"),
-    ("explicit.stat_576528026", "explicit.stat_2383304564"),
-    ("explicit.stat_576528026", "explicit.stat_121436064"),
-    ("explicit.stat_576528026", "explicit.stat_2312747856"),
-    ("explicit.stat_576528026", "explicit.stat_3656959867"),
-    ("explicit.stat_576528026", "explicit.stat_281949611"),
-    ("explicit.stat_3772848194", "explicit.stat_969576725"),
-    ("explicit.stat_3772848194", "explicit.stat_4071658793"),
-    ("explicit.stat_3772848194", "explicit.stat_3329402420"),
-    ("explicit.stat_3772848194", "explicit.stat_4259701244"),
-    ("explicit.stat_3772848194", "explicit.stat_3765507527"),
-    ("explicit.stat_3772848194", "explicit.stat_1313498929"),
-    ("explicit.stat_3772848194", "explicit.stat_991194404"),
-    ("explicit.stat_3772848194", "explicit.stat_1424006185"),
-    ("explicit.stat_3772848194", "explicit.stat_1346311588"),
-    ("explicit.stat_3772848194", "explicit.stat_207635700"),
-    ("explicit.stat_3772848194", "explicit.stat_1853636813"),
-    ("explicit.stat_3772848194", "explicit.stat_2831391506"),
-    ("explicit.stat_3772848194", "explicit.stat_1138813382"),
-    ("explicit.stat_3772848194", "explicit.stat_2736708072"),
-    ("explicit.stat_3772848194", "explicit.stat_3308185931"),
-    ("explicit.stat_3772848194", "explicit.stat_4104891138"),
-    ("explicit.stat_3772848194", "explicit.stat_34059570"),
-    ("explicit.stat_3772848194", "explicit.stat_3643449791"),
-    ("explicit.stat_3772848194", "explicit.stat_3468843137"),
-    ("explicit.stat_3772848194", "explicit.stat_3207781478"),
-    ("explicit.stat_3772848194", "explicit.stat_2806391472"),
-    ("explicit.stat_3772848194", "explicit.stat_2567659895"),
-    ("explicit.stat_3772848194", "explicit.stat_4012281889"),
-    ("explicit.stat_3772848194", "explicit.stat_1173690938"),
-    ("explicit.stat_3772848194", "explicit.stat_2365917222"),
-    ("explicit.stat_3772848194", "explicit.stat_3223142064"),
-    ("explicit.stat_3772848194", "explicit.stat_1567542124"),
-    ("explicit.stat_3772848194", "explicit.stat_2647344903"),
-    ("explicit.stat_3772848194", "explicit.stat_1165583295"),
-    ("explicit.stat_3772848194", "explicit.stat_371612541"),
-    ("explicit.stat_3772848194", "explicit.stat_2720072724"),
-    ("explicit.stat_3772848194", "explicit.stat_1919069577"),
-    ("explicit.stat_3772848194", "explicit.stat_3772841281"),
-    ("explicit.stat_3772848194", "explicit.stat_4245204226"),
-    ("explicit.stat_3772848194", "explicit.stat_2163419452"),
-    ("explicit.stat_3772848194", "explicit.stat_3111519953"),
-    ("explicit.stat_3772848194", "explicit.stat_2434030180"),
-    ("explicit.stat_3772848194", "explicit.stat_1653848515"),
-    ("explicit.stat_3772848194", "explicit.stat_2731416566"),
-    ("explicit.stat_3772848194", "explicit.stat_3234824465"),
-    ("explicit.stat_3772848194", "explicit.stat_3627458291"),
-    ("explicit.stat_3772848194", "explicit.stat_2091518682"),
-    ("explicit.stat_3772848194", "explicit.stat_214835567"),
-    ("explicit.stat_3772848194", "explicit.stat_362838683"),
-    ("explicit.stat_3772848194", "explicit.stat_2457540491"),
-    ("explicit.stat_3772848194", "explicit.stat_65331133"),
-    ("explicit.stat_3772848194", "explicit.stat_3337107517"),
-    ("explicit.stat_3772848194", "explicit.stat_3332055899"),
-    ("explicit.stat_3772848194", "explicit.stat_2548097895"),
-    ("explicit.stat_3772848194", "explicit.stat_1016185292"),
-    ("explicit.stat_3772848194", "explicit.stat_3624529132"),
-    ("explicit.stat_3772848194", "explicit.stat_380220671"),
-    ("explicit.stat_3772848194", "explicit.stat_2189467271"),
-    ("explicit.stat_3772848194", "explicit.stat_3953667743"),
-    ("explicit.stat_3772848194", "explicit.stat_1723738042"),
-    ("explicit.stat_3772848194", "explicit.stat_556659145"),
-    ("explicit.stat_3772848194", "explicit.stat_2690790844"),
-    ("explicit.stat_3772848194", "explicit.stat_80470845"),
-    ("explicit.stat_3772848194", "explicit.stat_2444534954"),
-    ("explicit.stat_3772848194", "explicit.stat_1699077932"),
-    ("explicit.stat_3772848194", "explicit.stat_2383304564"),
-    ("explicit.stat_3772848194", "explicit.stat_121436064"),
-    ("explicit.stat_3772848194", "explicit.stat_2312747856"),
-    ("explicit.stat_3772848194", "explicit.stat_3656959867"),
-    ("explicit.stat_3772848194", "explicit.stat_281949611"),
-    ("explicit.stat_969576725", "explicit.stat_4071658793"),
-    ("explicit.stat_969576725", "explicit.stat_3329402420"),
-    ("explicit.stat_969576725", "explicit.stat_4259701244"),
-    ("explicit.stat_969576725", "explicit.stat_3765507527"),
-    ("explicit.stat_969576725", "explicit.stat_1313498929"),
-    ("explicit.stat_969576725", "explicit.stat_991194404"),
-    ("explicit.stat_969576725", "explicit.stat_1424006185"),
-    ("explicit.stat_969576725", "explicit.stat_1346311588"),
-    ("explicit.stat_969576725", "explicit.stat_207635700"),
-    ("explicit.stat_969576725", "explicit.stat_1853636813"),
-    ("explicit.stat_969576725", "explicit.stat_2831391506"),
-    ("explicit.stat_969576725", "explicit.stat_1138813382"),
-    ("explicit.stat_969576725", "explicit.stat_2736708072"),
-    ("explicit.stat_969576725", "explicit.stat_3308185931"),
-    ("explicit.stat_969576725", "explicit.stat_4104891138"),
-    ("explicit.stat_969576725", "explicit.stat_34059570"),
-    ("explicit.stat_969576725", "explicit.stat_3643449791"),
-    ("explicit.stat_969576725", "explicit.stat_3468843137"),
-    ("explicit.stat_969576725", "explicit.stat_3207781478"),
-    ("explicit.stat_969576725", "explicit.stat_2806391472"),
-    ("explicit.stat_969576725", "explicit.stat_2567659895"),
-    ("explicit.stat_969576725", "explicit.stat_4012281889"),
-    ("explicit.stat_969576725", "explicit.stat_1173690938"),
-    ("explicit.stat_969576725", "explicit.stat_2365917222"),
-    ("explicit.stat_969576725", "explicit.stat_3223142064"),
-    ("explicit.stat_969576725", "explicit.stat_1567542124"),
-    ("explicit.stat_969576725", "explicit.stat_2647344903"),
-    ("explicit.stat_969576725", "explicit.stat_1165583295"),
-    ("explicit.stat_969576725", "explicit.stat_371612541"),
-    ("explicit.stat_969576725", "explicit.stat_2720072724"),
-    ("explicit.stat_969576725", "explicit.stat_1919069577"),
-    ("explicit.stat_969576725", "explicit.stat_3772841281"),
-    ("explicit.stat_969576725", "explicit.stat_4245204226"),
-    ("explicit.stat_969576725", "explicit.stat_2163419452"),
-    ("explicit.stat_969576725", "explicit.stat_3111519953"),
-    ("explicit.stat_969576725", "explicit.stat_2434030180"),
-    ("explicit.stat_969576725", "explicit.stat_1653848515"),
-    ("explicit.stat_969576725", "explicit.stat_2731416566"),
-    ("explicit.stat_969576725", "explicit.stat_3234824465"),
-    ("explicit.stat_969576725", "explicit.stat_3627458291"),
-    ("explicit.stat_969576725", "explicit.stat_2091518682"),
-    ("explicit.stat_969576725", "explicit.stat_214835567"),
-    ("explicit.stat_969576725", "explicit.stat_362838683"),
-    ("explicit.stat_969576725", "explicit.stat_2457540491"),
-    ("explicit.stat_969576725", "explicit.stat_65331133"),
-    ("explicit.stat_969576725", "explicit.stat_3337107517"),
-    ("explicit.stat_969576725", "explicit.stat_3332055899"),
-    ("explicit.stat_969576725", "explicit.stat_2548097895"),
-    ("explicit.stat_969576725", "explicit.stat_1016185292"),
-    ("explicit.stat_969576725", "explicit.stat_3624529132"),
-    ("explicit.stat_969576725", "explicit.stat_380220671"),
-    ("explicit.stat_969576725", "explicit.stat_2189467271"),
-    ("explicit.stat_969576725", "explicit.stat_3953667743"),
-    ("explicit.stat_969576725", "explicit.stat_1723738042"),
-    ("explicit.stat_969576725", "explicit.stat_556659145"),
-    ("explicit.stat_969576725", "explicit.stat_2690790844"),
-    ("explicit.stat_969576725", "explicit.stat_80470845"),
-    ("explicit.stat_969576725", "explicit.stat_2444534954"),
-    ("explicit.stat_969576725", "explicit.stat_1699077932"),
-    ("explicit.stat_969576725", "explicit.stat_2383304564"),
-    ("explicit.stat_969576725", "explicit.stat_121436064"),
-    ("explicit.stat_969576725", "explicit.stat_2312747856"),
-    ("explicit.stat_969576725", "explicit.stat_3656959867"),
-    ("explicit.stat_969576725", "explicit.stat_281949611"),
-    ("explicit.stat_4071658793", "explicit.stat_3329402420"),
-    ("explicit.stat_4071658793", "explicit.stat_4259701244"),
-    ("explicit.stat_4071658793", "explicit.stat_3765507527"),
-    ("explicit.stat_4071658793", "explicit.stat_1313498929"),
-    ("explicit.stat_4071658793", "explicit.stat_991194404"),
-    ("explicit.stat_4071658793", "explicit.stat_1424006185"),
-    ("explicit.stat_4071658793", "explicit.stat_1346311588"),
-    ("explicit.stat_4071658793", "explicit.stat_207635700"),
-    ("explicit.stat_4071658793", "explicit.stat_1853636813"),
-    ("explicit.stat_4071658793", "explicit.stat_2831391506"),
-    ("explicit.stat_4071658793", "explicit.stat_1138813382"),
-    ("explicit.stat_4071658793", "explicit.stat_2736708072"),
-    ("explicit.stat_4071658793", "explicit.stat_3308185931"),
-    ("explicit.stat_4071658793", "explicit.stat_4104891138"),
-    ("explicit.stat_4071658793", "explicit.stat_34059570"),
-    ("explicit.stat_4071658793", "explicit.stat_3643449791"),
-    ("explicit.stat_4071658793", "explicit.stat_3468843137"),
-    ("explicit.stat_4071658793", "explicit.stat_3207781478"),
-    ("explicit.stat_4071658793", "explicit.stat_2806391472"),
-    ("explicit.stat_4071658793", "explicit.stat_2567659895"),
-    ("explicit.stat_4071658793", "explicit.stat_4012281889"),
-    ("explicit.stat_4071658793", "explicit.stat_1173690938"),
-    ("explicit.stat_4071658793", "explicit.stat_2365917222"),
-    ("explicit.stat_4071658793", "explicit.stat_3223142064"),
-    ("explicit.stat_4071658793", "explicit.stat_1567542124"),
-    ("explicit.stat_4071658793", "explicit.stat_2647344903"),
-    ("explicit.stat_4071658793", "explicit.stat_1165583295"),
-    ("explicit.stat_4071658793", "explicit.stat_371612541"),
-    ("explicit.stat_4071658793", "explicit.stat_2720072724"),
-    ("explicit.stat_4071658793", "explicit.stat_1919069577"),
-    ("explicit.stat_4071658793", "explicit.stat_3772841281"),
-    ("explicit.stat_4071658793", "explicit.stat_4245204226"),
-    ("explicit.stat_4071658793", "explicit.stat_2163419452"),
-    ("explicit.stat_4071658793", "explicit.stat_3111519953"),
-    ("explicit.stat_4071658793", "explicit.stat_2434030180"),
-    ("explicit.stat_4071658793", "explicit.stat_1653848515"),
-    ("explicit.stat_4071658793", "explicit.stat_2731416566"),
-    ("explicit.stat_4071658793", "explicit.stat_3234824465"),
-    ("explicit.stat_4071658793", "explicit.stat_3627458291"),
-    ("explicit.stat_4071658793", "explicit.stat_2091518682"),
-    ("explicit.stat_4071658793", "explicit.stat_214835567"),
-    ("explicit.stat_4071658793", "explicit.stat_362838683"),
-    ("explicit.stat_4071658793", "explicit.stat_2457540491"),
-    ("explicit.stat_4071658793", "explicit.stat_65331133"),
-    ("explicit.stat_4071658793", "explicit.stat_3337107517"),
-    ("explicit.stat_4071658793", "explicit.stat_3332055899"),
-    ("explicit.stat_4071658793", "explicit.stat_2548097895"),
-    ("explicit.stat_4071658793", "explicit.stat_1016185292"),
-    ("explicit.stat_4071658793", "explicit.stat_3624529132"),
-    ("explicit.stat_4071658793", "explicit.stat_380220671"),
-    ("explicit.stat_4071658793", "explicit.stat_2189467271"),
-    ("explicit.stat_4071658793", "explicit.stat_3953667743"),
-    ("explicit.stat_4071658793", "explicit.stat_1723738042"),
-    ("explicit.stat_4071658793", "explicit.stat_556659145"),
-    ("explicit.stat_4071658793", "explicit.stat_2690790844"),
-    ("explicit.stat_4071658793", "explicit.stat_80470845"),
-    ("explicit.stat_4071658793", "explicit.stat_2444534954"),
-    ("explicit.stat_4071658793", "explicit.stat_1699077932"),
-    ("explicit.stat_4071658793", "explicit.stat_2383304564"),
-    ("explicit.stat_4071658793", "explicit.stat_121436064"),
-    ("explicit.stat_4071658793", "explicit.stat_2312747856"),
-    ("explicit.stat_4071658793", "explicit.stat_3656959867"),
-    ("explicit.stat_4071658793", "explicit.stat_281949611"),
-    ("explicit.stat_3329402420", "explicit.stat_4259701244"),
-    ("explicit.stat_3329402420", "explicit.stat_3765507527"),
-    ("explicit.stat_3329402420", "explicit.stat_1313498929"),
-    ("explicit.stat_3329402420", "explicit.stat_991194404"),
-    ("explicit.stat_3329402420", "explicit.stat_1424006185"),
-    ("explicit.stat_3329402420", "explicit.stat_1346311588"),
-    ("explicit.stat_3329402420", "explicit.stat_207635700"),
-    ("explicit.stat_3329402420", "explicit.stat_1853636813"),
-    ("explicit.stat_3329402420", "explicit.stat_2831391506"),
-    ("explicit.stat_3329402420", "explicit.stat_1138813382"),
-    ("explicit.stat_3329402420", "explicit.stat_2736708072"),
-    ("explicit.stat_3329402420", "explicit.stat_3308185931"),
-    ("explicit.stat_3329402420", "explicit.stat_4104891138"),
-    ("explicit.stat_3329402420", "explicit.stat_34059570"),
-    ("explicit.stat_3329402420", "explicit.stat_3643449791"),
-    ("explicit.stat_3329402420", "explicit.stat_3468843137"),
-    ("explicit.stat_3329402420", "explicit.stat_3207781478"),
-    ("explicit.stat_3329402420", "explicit.stat_2806391472"),
-    ("explicit.stat_3329402420", "explicit.stat_2567659895"),
-    ("explicit.stat_3329402420", "explicit.stat_4012281889"),
-    ("explicit.stat_3329402420", "explicit.stat_1173690938"),
-    ("explicit.stat_3329402420", "explicit.stat_2365917222"),
-    ("explicit.stat_3329402420", "explicit.stat_3223142064"),
-    ("explicit.stat_3329402420", "explicit.stat_1567542124"),
-    ("explicit.stat_3329402420", "explicit.stat_2647344903"),
-    ("explicit.stat_3329402420", "explicit.stat_1165583295"),
-    ("explicit.stat_3329402420", "explicit.stat_371612541"),
-    ("explicit.stat_3329402420", "explicit.stat_2720072724"),
-    ("explicit.stat_3329402420", "explicit.stat_1919069577"),
-    ("explicit.stat_3329402420", "explicit.stat_3772841281"),
-    ("explicit.stat_3329402420", "explicit.stat_4245204226"),
-    ("explicit.stat_3329402420", "explicit.stat_2163419452"),
-    ("explicit.stat_3329402420", "explicit.stat_3111519953"),
-    ("explicit.stat_3329402420", "explicit.stat_2434030180"),
-    ("explicit.stat_3329402420", "explicit.stat_1653848515"),
-    ("explicit.stat_3329402420", "explicit.stat_2731416566"),
-    ("explicit.stat_3329402420", "explicit.stat_3234824465"),
-    ("explicit.stat_3329402420", "explicit.stat_3627458291"),
-    ("explicit.stat_3329402420", "explicit.stat_2091518682"),
-    ("explicit.stat_3329402420", "explicit.stat_214835567"),
-    ("explicit.stat_3329402420", "explicit.stat_362838683"),
-    ("explicit.stat_3329402420", "explicit.stat_2457540491"),
-    ("explicit.stat_3329402420", "explicit.stat_65331133"),
-    ("explicit.stat_3329402420", "explicit.stat_3337107517"),
-    ("explicit.stat_3329402420", "explicit.stat_3332055899"),
-    ("explicit.stat_3329402420", "explicit.stat_2548097895"),
-    ("explicit.stat_3329402420", "explicit.stat_1016185292"),
-    ("explicit.stat_3329402420", "explicit.stat_3624529132"),
-    ("explicit.stat_3329402420", "explicit.stat_380220671"),
-    ("explicit.stat_3329402420", "explicit.stat_2189467271"),
-    ("explicit.stat_3329402420", "explicit.stat_3953667743"),
-    ("explicit.stat_3329402420", "explicit.stat_1723738042"),
-    ("explicit.stat_3329402420", "explicit.stat_556659145"),
-    ("explicit.stat_3329402420", "explicit.stat_2690790844"),
-    ("explicit.stat_3329402420", "explicit.stat_80470845"),
-    ("explicit.stat_3329402420", "explicit.stat_2444534954"),
-    ("explicit.stat_3329402420", "explicit.stat_1699077932"),
-    ("explicit.stat_3329402420", "explicit.stat_2383304564"),
-    ("explicit.stat_3329402420", "explicit.stat_121436064"),
-    ("explicit.stat_3329402420", "explicit.stat_2312747856"),
-    ("explicit.stat_3329402420", "explicit.stat_3656959867"),
-    ("explicit.stat_3329402420", "explicit.stat_281949611"),
-    ("explicit.stat_4259701244", "explicit.stat_3765507527"),
-    ("explicit.stat_4259701244", "explicit.stat_1313498929"),
-    ("explicit.stat_4259701244", "explicit.stat_991194404"),
-    ("explicit.stat_4259701244", "explicit.stat_1424006185"),
-    ("explicit.stat_4259701244", "explicit.stat_1346311588"),
-    ("explicit.stat_4259701244", "explicit.stat_207635700"),
-    ("explicit.stat_4259701244", "explicit.stat_1853636813"),
-    ("explicit.stat_4259701244", "explicit.stat_2831391506"),
-    ("explicit.stat_4259701244", "explicit.stat_1138813382"),
-    ("explicit.stat_4259701244", "explicit.stat_2736708072"),
-    ("explicit.stat_4259701244", "explicit.stat_3308185931"),
-    ("explicit.stat_4259701244", "explicit.stat_4104891138"),
-    ("explicit.stat_4259701244", "explicit.stat_34059570"),
-    ("explicit.stat_4259701244", "explicit.stat_3643449791"),
-    ("explicit.stat_4259701244", "explicit.stat_3468843137"),
-    ("explicit.stat_4259701244", "explicit.stat_3207781478"),
-    ("explicit.stat_4259701244", "explicit.stat_2806391472"),
-    ("explicit.stat_4259701244", "explicit.stat_2567659895"),
-    ("explicit.stat_4259701244", "explicit.stat_4012281889"),
-    ("explicit.stat_4259701244", "explicit.stat_1173690938"),
-    ("explicit.stat_4259701244", "explicit.stat_2365917222"),
-    ("explicit.stat_4259701244", "explicit.stat_3223142064"),
-    ("explicit.stat_4259701244", "explicit.stat_1567542124"),
-    ("explicit.stat_4259701244", "explicit.stat_2647344903"),
-    ("explicit.stat_4259701244", "explicit.stat_1165583295"),
-    ("explicit.stat_4259701244", "explicit.stat_371612541"),
-    ("explicit.stat_4259701244", "explicit.stat_2720072724"),
-    ("explicit.stat_4259701244", "explicit.stat_1919069577"),
-    ("explicit.stat_4259701244", "explicit.stat_3772841281"),
-    ("explicit.stat_4259701244", "explicit.stat_4245204226"),
-    ("explicit.stat_4259701244", "explicit.stat_2163419452"),
-    ("explicit.stat_4259701244", "explicit.stat_3111519953"),
-    ("explicit.stat_4259701244", "explicit.stat_2434030180"),
-    ("explicit.stat_4259701244", "explicit.stat_1653848515"),
-    ("explicit.stat_4259701244", "explicit.stat_2731416566"),
-    ("explicit.stat_4259701244", "explicit.stat_3234824465"),
-    ("explicit.stat_4259701244", "explicit.stat_3627458291"),
-    ("explicit.stat_4259701244", "explicit.stat_2091518682"),
-    ("explicit.stat_4259701244", "explicit.stat_214835567"),
-    ("explicit.stat_4259701244", "explicit.stat_362838683"),
-    ("explicit.stat_4259701244", "explicit.stat_2457540491"),
-    ("explicit.stat_4259701244", "explicit.stat_65331133"),
-    ("explicit.stat_4259701244", "explicit.stat_3337107517"),
-    ("explicit.stat_4259701244", "explicit.stat_3332055899"),
-    ("explicit.stat_4259701244", "explicit.stat_2548097895"),
-    ("explicit.stat_4259701244", "explicit.stat_1016185292"),
-    ("explicit.stat_4259701244", "explicit.stat_3624529132"),
-    ("explicit.stat_4259701244", "explicit.stat_380220671"),
-    ("explicit.stat_4259701244", "explicit.stat_2189467271"),
-    ("explicit.stat_4259701244", "explicit.stat_3953667743"),
-    ("explicit.stat_4259701244", "explicit.stat_1723738042"),
-    ("explicit.stat_4259701244", "explicit.stat_556659145"),
-    ("explicit.stat_4259701244", "explicit.stat_2690790844"),
-    ("explicit.stat_4259701244", "explicit.stat_80470845"),
-    ("explicit.stat_4259701244", "explicit.stat_2444534954"),
-    ("explicit.stat_4259701244", "explicit.stat_1699077932"),
-    ("explicit.stat_4259701244", "explicit.stat_2383304564"),
-    ("explicit.stat_4259701244", "explicit.stat_121436064"),
-    ("explicit.stat_4259701244", "explicit.stat_2312747856"),
-    ("explicit.stat_4259701244", "explicit.stat_3656959867"),
-    ("explicit.stat_4259701244", "explicit.stat_281949611"),
-    ("explicit.stat_3765507527", "explicit.stat_1313498929"),
-    ("explicit.stat_3765507527", "explicit.stat_991194404"),
-    ("explicit.stat_3765507527", "explicit.stat_1424006185"),
-    ("explicit.stat_3765507527", "explicit.stat_1346311588"),
-    ("explicit.stat_3765507527", "explicit.stat_207635700"),
-    ("explicit.stat_3765507527", "explicit.stat_1853636813"),
-    ("explicit.stat_3765507527", "explicit.stat_2831391506"),
-    ("explicit.stat_3765507527", "explicit.stat_1138813382"),
-    ("explicit.stat_3765507527", "explicit.stat_2736708072"),
-    ("explicit.stat_3765507527", "explicit.stat_3308185931"),
-    ("explicit.stat_3765507527", "explicit.stat_4104891138"),
-    ("explicit.stat_3765507527", "explicit.stat_34059570"),
-    ("explicit.stat_3765507527", "explicit.stat_3643449791"),
-    ("explicit.stat_3765507527", "explicit.stat_3468843137"),
-    ("explicit.stat_3765507527", "explicit.stat_3207781478"),
-    ("explicit.stat_3765507527", "explicit.stat_2806391472"),
-    ("explicit.stat_3765507527", "explicit.stat_2567659895"),
-    ("explicit.stat_3765507527", "explicit.stat_4012281889"),
-    ("explicit.stat_3765507527", "explicit.stat_1173690938"),
-    ("explicit.stat_3765507527", "explicit.stat_2365917222"),
-    ("explicit.stat_3765507527", "explicit.stat_3223142064"),
-    ("explicit.stat_3765507527", "explicit.stat_1567542124"),
-    ("explicit.stat_3765507527", "explicit.stat_2647344903"),
-    ("explicit.stat_3765507527", "explicit.stat_1165583295"),
-    ("explicit.stat_3765507527", "explicit.stat_371612541"),
-    ("explicit.stat_3765507527", "explicit.stat_2720072724"),
-    ("explicit.stat_3765507527", "explicit.stat_1919069577"),
-    ("explicit.stat_3765507527", "explicit.stat_3772841281"),
-    ("explicit.stat_3765507527", "explicit.stat_4245204226"),
-    ("explicit.stat_3765507527", "explicit.stat_2163419452"),
-    ("explicit.stat_3765507527", "explicit.stat_3111519953"),
-    ("explicit.stat_3765507527", "explicit.stat_2434030180"),
-    ("explicit.stat_3765507527", "explicit.stat_1653848515"),
-    ("explicit.stat_3765507527", "explicit.stat_2731416566"),
-    ("explicit.stat_3765507527", "explicit.stat_3234824465"),
-    ("explicit.stat_3765507527", "explicit.stat_3627458291"),
-    ("explicit.stat_3765507527", "explicit.stat_2091518682"),
-    ("explicit.stat_3765507527", "explicit.stat_214835567"),
-    ("explicit.stat_3765507527", "explicit.stat_362838683"),
-    ("explicit.stat_3765507527", "explicit.stat_2457540491"),
-    ("explicit.stat_3765507527", "explicit.stat_65331133"),
-    ("explicit.stat_3765507527", "explicit.stat_3337107517"),
-    ("explicit.stat_3765507527", "explicit.stat_3332055899"),
-    ("explicit.stat_3765507527", "explicit.stat_2548097895"),
-    ("explicit.stat_3765507527", "explicit.stat_1016185292"),
-    ("explicit.stat_3765507527", "explicit.stat_3624529132"),
-    ("explicit.stat_3765507527", "explicit.stat_380220671"),
-    ("explicit.stat_3765507527", "explicit.stat_2189467271"),
-    ("explicit.stat_3765507527", "explicit.stat_3953667743"),
-    ("explicit.stat_3765507527", "explicit.stat_1723738042"),
-    ("explicit.stat_3765507527", "explicit.stat_556659145"),
-    ("explicit.stat_3765507527", "explicit.stat_2690790844"),
-    ("explicit.stat_3765507527", "explicit.stat_80470845"),
-    ("explicit.stat_3765507527", "explicit.stat_2444534954"),
-    ("explicit.stat_3765507527", "explicit.stat_1699077932"),
-    ("explicit.stat_3765507527", "explicit.stat_2383304564"),
-    ("explicit.stat_3765507527", "explicit.stat_121436064"),
-    ("explicit.stat_3765507527", "explicit.stat_2312747856"),
-    ("explicit.stat_3765507527", "explicit.stat_3656959867"),
-    ("explicit.stat_3765507527", "explicit.stat_281949611"),
-    ("explicit.stat_1313498929", "explicit.stat_991194404"),
-    ("explicit.stat_1313498929", "explicit.stat_1424006185"),
-    ("explicit.stat_1313498929", "explicit.stat_1346311588"),
-    ("explicit.stat_1313498929", "explicit.stat_207635700"),
-    ("explicit.stat_1313498929", "explicit.stat_1853636813"),
-    ("explicit.stat_1313498929", "explicit.stat_2831391506"),
-    ("explicit.stat_1313498929", "explicit.stat_1138813382"),
-    ("explicit.stat_1313498929", "explicit.stat_2736708072"),
-    ("explicit.stat_1313498929", "explicit.stat_3308185931"),
-    ("explicit.stat_1313498929", "explicit.stat_4104891138"),
-    ("explicit.stat_1313498929", "explicit.stat_34059570"),
-    ("explicit.stat_1313498929", "explicit.stat_3643449791"),
-    ("explicit.stat_1313498929", "explicit.stat_3468843137"),
-    ("explicit.stat_1313498929", "explicit.stat_3207781478"),
-    ("explicit.stat_1313498929", "explicit.stat_2806391472"),
-    ("explicit.stat_1313498929", "explicit.stat_2567659895"),
-    ("explicit.stat_1313498929", "explicit.stat_4012281889"),
-    ("explicit.stat_1313498929", "explicit.stat_1173690938"),
-    ("explicit.stat_1313498929", "explicit.stat_2365917222"),
-    ("explicit.stat_1313498929", "explicit.stat_3223142064"),
-    ("explicit.stat_1313498929", "explicit.stat_1567542124"),
-    ("explicit.stat_1313498929", "explicit.stat_2647344903"),
-    ("explicit.stat_1313498929", "explicit.stat_1165583295"),
-    ("explicit.stat_1313498929", "explicit.stat_371612541"),
-    ("explicit.stat_1313498929", "explicit.stat_2720072724"),
-    ("explicit.stat_1313498929", "explicit.stat_1919069577"),
-    ("explicit.stat_1313498929", "explicit.stat_3772841281"),
-    ("explicit.stat_1313498929", "explicit.stat_4245204226"),
-    ("explicit.stat_1313498929", "explicit.stat_2163419452"),
-    ("explicit.stat_1313498929", "explicit.stat_3111519953"),
-    ("explicit.stat_1313498929", "explicit.stat_2434030180"),
-    ("explicit.stat_1313498929", "explicit.stat_1653848515"),
-    ("explicit.stat_1313498929", "explicit.stat_2731416566"),
-    ("explicit.stat_1313498929", "explicit.stat_3234824465"),
-    ("explicit.stat_1313498929", "explicit.stat_3627458291"),
-    ("explicit.stat_1313498929", "explicit.stat_2091518682"),
-    ("explicit.stat_1313498929", "explicit.stat_214835567"),
-    ("explicit.stat_1313498929", "explicit.stat_362838683"),
-    ("explicit.stat_1313498929", "explicit.stat_2457540491"),
-    ("explicit.stat_1313498929", "explicit.stat_65331133"),
-    ("explicit.stat_1313498929", "explicit.stat_3337107517"),
-    ("explicit.stat_1313498929", "explicit.stat_3332055899"),
-    ("explicit.stat_1313498929", "explicit.stat_2548097895"),
-    ("explicit.stat_1313498929", "explicit.stat_1016185292"),
-    ("explicit.stat_1313498929", "explicit.stat_3624529132"),
-    ("explicit.stat_1313498929", "explicit.stat_380220671"),
-    ("explicit.stat_1313498929", "explicit.stat_2189467271"),
-    ("explicit.stat_1313498929", "explicit.stat_3953667743"),
-    ("explicit.stat_1313498929", "explicit.stat_1723738042"),
-    ("explicit.stat_1313498929", "explicit.stat_556659145"),
-    ("explicit.stat_1313498929", "explicit.stat_2690790844"),
-    ("explicit.stat_1313498929", "explicit.stat_80470845"),
-    ("explicit.stat_1313498929", "explicit.stat_2444534954"),
-    ("explicit.stat_1313498929", "explicit.stat_1699077932"),
-    ("explicit.stat_1313498929", "explicit.stat_2383304564"),
-    ("explicit.stat_1313498929", "explicit.stat_121436064"),
-    ("explicit.stat_1313498929", "explicit.stat_2312747856"),
-    ("explicit.stat_1313498929", "explicit.stat_3656959867"),
-    ("explicit.stat_1313498929", "explicit.stat_281949611"),
-    ("explicit.stat_991194404", "explicit.stat_1424006185"),
-    ("explicit.stat_991194404", "explicit.stat_1346311588"),
-    ("explicit.stat_991194404", "explicit.stat_207635700"),
-    ("explicit.stat_991194404", "explicit.stat_1853636813"),
-    ("explicit.stat_991194404", "explicit.stat_2831391506"),
-    ("explicit.stat_991194404", "explicit.stat_1138813382"),
-    ("explicit.stat_991194404", "explicit.stat_2736708072"),
-    ("explicit.stat_991194404", "explicit.stat_3308185931"),
-    ("explicit.stat_991194404", "explicit.stat_4104891138"),
-    ("explicit.stat_991194404", "explicit.stat_34059570"),
-    ("explicit.stat_991194404", "explicit.stat_3643449791"),
-    ("explicit.stat_991194404", "explicit.stat_3468843137"),
-    ("explicit.stat_991194404", "explicit.stat_3207781478"),
-    ("explicit.stat_991194404", "explicit.stat_2806391472"),
-    ("explicit.stat_991194404", "explicit.stat_2567659895"),
-    ("explicit.stat_991194404", "explicit.stat_4012281889"),
-    ("explicit.stat_991194404", "explicit.stat_1173690938"),
-    ("explicit.stat_991194404", "explicit.stat_2365917222"),
-    ("explicit.stat_991194404", "explicit.stat_3223142064"),
-    ("explicit.stat_991194404", "explicit.stat_1567542124"),
-    ("explicit.stat_991194404", "explicit.stat_2647344903"),
-    ("explicit.stat_991194404", "explicit.stat_1165583295"),
-    ("explicit.stat_991194404", "explicit.stat_371612541"),
-    ("explicit.stat_991194404", "explicit.stat_2720072724"),
-    ("explicit.stat_991194404", "explicit.stat_1919069577"),
-    ("explicit.stat_991194404", "explicit.stat_3772841281"),
-    ("explicit.stat_991194404", "explicit.stat_4245204226"),
-    ("explicit.stat_991194404", "explicit.stat_2163419452"),
-    ("explicit.stat_991194404", "explicit.stat_3111519953"),
-    ("explicit.stat_991194404", "explicit.stat_2434030180"),
-    ("explicit.stat_991194404", "explicit.stat_1653848515"),
-    ("explicit.stat_991194404", "explicit.stat_2731416566"),
-    ("explicit.stat_991194404", "explicit.stat_3234824465"),
-    ("explicit.stat_991194404", "explicit.stat_3627458291"),
-    ("explicit.stat_991194404", "explicit.stat_2091518682"),
-    ("explicit.stat_991194404", "explicit.stat_214835567"),
-    ("explicit.stat_991194404", "explicit.stat_362838683"),
-    ("explicit.stat_991194404", "explicit.stat_2457540491"),
-    ("explicit.stat_991194404", "explicit.stat_65331133"),
-    ("explicit.stat_991194404", "explicit.stat_3337107517"),
-    ("explicit.stat_991194404", "explicit.stat_3332055899"),
-    ("explicit.stat_991194404", "explicit.stat_2548097895"),
-    ("explicit.stat_991194404", "explicit.stat_1016185292"),
-    ("explicit.stat_991194404", "explicit.stat_3624529132"),
-    ("explicit.stat_991194404", "explicit.stat_380220671"),
-    ("explicit.stat_991194404", "explicit.stat_2189467271"),
-    ("explicit.stat_991194404", "explicit.stat_3953667743"),
-    ("explicit.stat_991194404", "explicit.stat_1723738042"),
-    ("explicit.stat_991194404", "explicit.stat_556659145"),
-    ("explicit.stat_991194404", "explicit.stat_2690790844"),
-    ("explicit.stat_991194404", "explicit.stat_80470845"),
-    ("explicit.stat_991194404", "explicit.stat_2444534954"),
-    ("explicit.stat_991194404", "explicit.stat_1699077932"),
-    ("explicit.stat_991194404", "explicit.stat_2383304564"),
-    ("explicit.stat_991194404", "explicit.stat_121436064"),
-    ("explicit.stat_991194404", "explicit.stat_2312747856"),
-    ("explicit.stat_991194404", "explicit.stat_3656959867"),
-    ("explicit.stat_991194404", "explicit.stat_281949611"),
-    ("explicit.stat_1424006185", "explicit.stat_1346311588"),
-    ("explicit.stat_1424006185", "explicit.stat_207635700"),
-    ("explicit.stat_1424006185", "explicit.stat_1853636813"),
-    ("explicit.stat_1424006185", "explicit.stat_2831391506"),
-    ("explicit.stat_1424006185", "explicit.stat_1138813382"),
-    ("explicit.stat_1424006185", "explicit.stat_2736708072"),
-    ("explicit.stat_1424006185", "explicit.stat_3308185931"),
-    ("explicit.stat_1424006185", "explicit.stat_4104891138"),
-    ("explicit.stat_1424006185", "explicit.stat_34059570"),
-    ("explicit.stat_1424006185", "explicit.stat_3643449791"),
-    ("explicit.stat_1424006185", "explicit.stat_3468843137"),
-    ("explicit.stat_1424006185", "explicit.stat_3207781478"),
-    ("explicit.stat_1424006185", "explicit.stat_2806391472"),
-    ("explicit.stat_1424006185", "explicit.stat_2567659895"),
-    ("explicit.stat_1424006185", "explicit.stat_4012281889"),
-    ("explicit.stat_1424006185", "explicit.stat_1173690938"),
-    ("explicit.stat_1424006185", "explicit.stat_2365917222"),
-    ("explicit.stat_1424006185", "explicit.stat_3223142064"),
-    ("explicit.stat_1424006185", "explicit.stat_1567542124"),
-    ("explicit.stat_1424006185", "explicit.stat_2647344903"),
-    ("explicit.stat_1424006185", "explicit.stat_1165583295"),
-    ("explicit.stat_1424006185", "explicit.stat_371612541"),
-    ("explicit.stat_1424006185", "explicit.stat_2720072724"),
-    ("explicit.stat_1424006185", "explicit.stat_1919069577"),
-    ("explicit.stat_1424006185", "explicit.stat_3772841281"),
-    ("explicit.stat_1424006185", "explicit.stat_4245204226"),
-    ("explicit.stat_1424006185", "explicit.stat_2163419452"),
-    ("explicit.stat_1424006185", "explicit.stat_3111519953"),
-    ("explicit.stat_1424006185", "explicit.stat_2434030180"),
-    ("explicit.stat_1424006185", "explicit.stat_1653848515"),
-    ("explicit.stat_1424006185", "explicit.stat_2731416566"),
-    ("explicit.stat_1424006185", "explicit.stat_3234824465"),
-    ("explicit.stat_1424006185", "explicit.stat_3627458291"),
-    ("explicit.stat_1424006185", "explicit.stat_2091518682"),
-    ("explicit.stat_1424006185", "explicit.stat_214835567"),
-    ("explicit.stat_1424006185", "explicit.stat_362838683"),
-    ("explicit.stat_1424006185", "explicit.stat_2457540491"),
-    ("explicit.stat_1424006185", "explicit.stat_65331133"),
-    ("explicit.stat_1424006185", "explicit.stat_3337107517"),
-    ("explicit.stat_1424006185", "explicit.stat_3332055899"),
-    ("explicit.stat_1424006185", "explicit.stat_2548097895"),
-    ("explicit.stat_1424006185", "explicit.stat_1016185292"),
-    ("explicit.stat_1424006185", "explicit.stat_3624529132"),
-    ("explicit.stat_1424006185", "explicit.stat_380220671"),
-    ("explicit.stat_1424006185", "explicit.stat_2189467271"),
-    ("explicit.stat_1424006185", "explicit.stat_3953667743"),
-    ("explicit.stat_1424006185", "explicit.stat_1723738042"),
-    ("explicit.stat_1424006185", "explicit.stat_556659145"),
-    ("explicit.stat_1424006185", "explicit.stat_2690790844"),
-    ("explicit.stat_1424006185", "explicit.stat_80470845"),
-    ("explicit.stat_1424006185", "explicit.stat_2444534954"),
-    ("explicit.stat_1424006185", "explicit.stat_1699077932"),
-    ("explicit.stat_1424006185", "explicit.stat_2383304564"),
-    ("explicit.stat_1424006185", "explicit.stat_121436064"),
-    ("explicit.stat_1424006185", "explicit.stat_2312747856"),
-    ("explicit.stat_1424006185", "explicit.stat_3656959867"),
-    ("explicit.stat_1424006185", "explicit.stat_281949611"),
-    ("explicit.stat_1346311588", "explicit.stat_207635700"),
-    ("explicit.stat_1346311588", "explicit.stat_1853636813"),
-    ("explicit.stat_1346311588", "explicit.stat_2831391506"),
-    ("explicit.stat_1346311588", "explicit.stat_1138813382"),
-    ("explicit.stat_1346311588", "explicit.stat_2736708072"),
-    ("explicit.stat_1346311588", "explicit.stat_3308185931"),
-    ("explicit.stat_1346311588", "explicit.stat_4104891138"),
-    ("explicit.stat_1346311588", "explicit.stat_34059570"),
-    ("explicit.stat_1346311588", "explicit.stat_3643449791"),
-    ("explicit.stat_1346311588", "explicit.stat_3468843137"),
-    ("explicit.stat_1346311588", "explicit.stat_3207781478"),
-    ("explicit.stat_1346311588", "explicit.stat_2806391472"),
-    ("explicit.stat_1346311588", "explicit.stat_2567659895"),
-    ("explicit.stat_1346311588", "explicit.stat_4012281889"),
-    ("explicit.stat_1346311588", "explicit.stat_1173690938"),
-    ("explicit.stat_1346311588", "explicit.stat_2365917222"),
-    ("explicit.stat_1346311588", "explicit.stat_3223142064"),
-    ("explicit.stat_1346311588", "explicit.stat_1567542124"),
-    ("explicit.stat_1346311588", "explicit.stat_2647344903"),
-    ("explicit.stat_1346311588", "explicit.stat_1165583295"),
-    ("explicit.stat_1346311588", "explicit.stat_371612541"),
-    ("explicit.stat_1346311588", "explicit.stat_2720072724"),
-    ("explicit.stat_1346311588", "explicit.stat_1919069577"),
-    ("explicit.stat_1346311588", "explicit.stat_3772841281"),
-    ("explicit.stat_1346311588", "explicit.stat_4245204226"),
-    ("explicit.stat_1346311588", "explicit.stat_2163419452"),
-    ("explicit.stat_1346311588", "explicit.stat_3111519953"),
-    ("explicit.stat_1346311588", "explicit.stat_2434030180"),
-    ("explicit.stat_1346311588", "explicit.stat_1653848515"),
-    ("explicit.stat_1346311588", "explicit.stat_2731416566"),
-    ("explicit.stat_1346311588", "explicit.stat_3234824465"),
-    ("explicit.stat_1346311588", "explicit.stat_3627458291"),
-    ("explicit.stat_1346311588", "explicit.stat_2091518682"),
-    ("explicit.stat_1346311588", "explicit.stat_214835567"),
-    ("explicit.stat_1346311588", "explicit.stat_362838683"),
-    ("explicit.stat_1346311588", "explicit.stat_2457540491"),
-    ("explicit.stat_1346311588", "explicit.stat_65331133"),
-    ("explicit.stat_1346311588", "explicit.stat_3337107517"),
-    ("explicit.stat_1346311588", "explicit.stat_3332055899"),
-    ("explicit.stat_1346311588", "explicit.stat_2548097895"),
-    ("explicit.stat_1346311588", "explicit.stat_1016185292"),
-    ("explicit.stat_1346311588", "explicit.stat_3624529132"),
-    ("explicit.stat_1346311588", "explicit.stat_380220671"),
-    ("explicit.stat_1346311588", "explicit.stat_2189467271"),
-    ("explicit.stat_1346311588", "explicit.stat_3953667743"),
-    ("explicit.stat_1346311588", "explicit.stat_1723738042"),
-    ("explicit.stat_1346311588", "explicit.stat_556659145"),
-    ("explicit.stat_1346311588", "explicit.stat_2690790844"),
-    ("explicit.stat_1346311588", "explicit.stat_80470845"),
-    ("explicit.stat_1346311588", "explicit.stat_2444534954"),
-    ("explicit.stat_1346311588", "explicit.stat_1699077932"),
-    ("explicit.stat_1346311588", "explicit.stat_2383304564"),
-    ("explicit.stat_1346311588", "explicit.stat_121436064"),
-    ("explicit.stat_1346311588", "explicit.stat_2312747856"),
-    ("explicit.stat_1346311588", "explicit.stat_3656959867"),
-    ("explicit.stat_1346311588", "explicit.stat_281949611"),
-    ("explicit.stat_207635700", "explicit.stat_1853636813"),
-    ("explicit.stat_207635700", "explicit.stat_2831391506"),
-    ("explicit.stat_207635700", "explicit.stat_1138813382"),
-    ("explicit.stat_207635700", "explicit.stat_2736708072"),
-    ("explicit.stat_207635700", "explicit.stat_3308185931"),
-    ("explicit.stat_207635700", "explicit.stat_4104891138"),
-    ("explicit.stat_207635700", "explicit.stat_34059570"),
-    ("explicit.stat_207635700", "explicit.stat_3643449791"),
-    ("explicit.stat_207635700", "explicit.stat_3468843137"),
-    ("explicit.stat_207635700", "explicit.stat_3207781478"),
-    ("explicit.stat_207635700", "explicit.stat_2806391472"),
-    ("explicit.stat_207635700", "explicit.stat_2567659895"),
-    ("explicit.stat_207635700", "explicit.stat_4012281889"),
-    ("explicit.stat_207635700", "explicit.stat_1173690938"),
-    ("explicit.stat_207635700", "explicit.stat_2365917222"),
-    ("explicit.stat_207635700", "explicit.stat_3223142064"),
-    ("explicit.stat_207635700", "explicit.stat_1567542124"),
-    ("explicit.stat_207635700", "explicit.stat_2647344903"),
-    ("explicit.stat_207635700", "explicit.stat_1165583295"),
-    ("explicit.stat_207635700", "explicit.stat_371612541"),
-    ("explicit.stat_207635700", "explicit.stat_2720072724"),
-    ("explicit.stat_207635700", "explicit.stat_1919069577"),
-    ("explicit.stat_207635700", "explicit.stat_3772841281"),
-    ("explicit.stat_207635700", "explicit.stat_4245204226"),
-    ("explicit.stat_207635700", "explicit.stat_2163419452"),
-    ("explicit.stat_207635700", "explicit.stat_3111519953"),
-    ("explicit.stat_207635700", "explicit.stat_2434030180"),
-    ("explicit.stat_207635700", "explicit.stat_1653848515"),
-    ("explicit.stat_207635700", "explicit.stat_2731416566"),
-    ("explicit.stat_207635700", "explicit.stat_3234824465"),
-    ("explicit.stat_207635700", "explicit.stat_3627458291"),
-    ("explicit.stat_207635700", "explicit.stat_2091518682"),
-    ("explicit.stat_207635700", "explicit.stat_214835567"),
-    ("explicit.stat_207635700", "explicit.stat_362838683"),
-    ("explicit.stat_207635700", "explicit.stat_2457540491"),
-    ("explicit.stat_207635700", "explicit.stat_65331133"),
-    ("explicit.stat_207635700", "explicit.stat_3337107517"),
-    ("explicit.stat_207635700", "explicit.stat_3332055899"),
-    ("explicit.stat_207635700", "explicit.stat_2548097895"),
-    ("explicit.stat_207635700", "explicit.stat_1016185292"),
-    ("explicit.stat_207635700", "explicit.stat_3624529132"),
-    ("explicit.stat_207635700", "explicit.stat_380220671"),
-    ("explicit.stat_207635700", "explicit.stat_2189467271"),
-    ("explicit.stat_207635700", "explicit.stat_3953667743"),
-    ("explicit.stat_207635700", "explicit.stat_1723738042"),
-    ("explicit.stat_207635700", "explicit.stat_556659145"),
-    ("explicit.stat_207635700", "explicit.stat_2690790844"),
-    ("explicit.stat_207635700", "explicit.stat_80470845"),
-    ("explicit.stat_207635700", "explicit.stat_2444534954"),
-    ("explicit.stat_207635700", "explicit.stat_1699077932"),
-    ("explicit.stat_207635700", "explicit.stat_2383304564"),
-    ("explicit.stat_207635700", "explicit.stat_121436064"),
-    ("explicit.stat_207635700", "explicit.stat_2312747856"),
-    ("explicit.stat_207635700", "explicit.stat_3656959867"),
-    ("explicit.stat_207635700", "explicit.stat_281949611"),
-    ("explicit.stat_1853636813", "explicit.stat_2831391506"),
-    ("explicit.stat_1853636813", "explicit.stat_1138813382"),
-    ("explicit.stat_1853636813", "explicit.stat_2736708072"),
-    ("explicit.stat_1853636813", "explicit.stat_3308185931"),
-    ("explicit.stat_1853636813", "explicit.stat_4104891138"),
-    ("explicit.stat_1853636813", "explicit.stat_34059570"),
-    ("explicit.stat_1853636813", "explicit.stat_3643449791"),
-    ("explicit.stat_1853636813", "explicit.stat_3468843137"),
-    ("explicit.stat_1853636813", "explicit.stat_3207781478"),
-    ("explicit.stat_1853636813", "explicit.stat_2806391472"),
-    ("explicit.stat_1853636813", "explicit.stat_2567659895"),
-    ("explicit.stat_1853636813", "explicit.stat_4012281889"),
-    ("explicit.stat_1853636813", "explicit.stat_1173690938"),
-    ("explicit.stat_1853636813", "explicit.stat_2365917222"),
-    ("explicit.stat_1853636813", "explicit.stat_3223142064"),
-    ("explicit.stat_1853636813", "explicit.stat_1567542124"),
-    ("explicit.stat_1853636813", "explicit.stat_2647344903"),
-    ("explicit.stat_1853636813", "explicit.stat_1165583295"),
-    ("explicit.stat_1853636813", "explicit.stat_371612541"),
-    ("explicit.stat_1853636813", "explicit.stat_2720072724"),
-    ("explicit.stat_1853636813", "explicit.stat_1919069577"),
-    ("explicit.stat_1853636813", "explicit.stat_3772841281"),
-    ("explicit.stat_1853636813", "explicit.stat_4245204226"),
-    ("explicit.stat_1853636813", "explicit.stat_2163419452"),
-    ("explicit.stat_1853636813", "explicit.stat_3111519953"),
-    ("explicit.stat_1853636813", "explicit.stat_2434030180"),
-    ("explicit.stat_1853636813", "explicit.stat_1653848515"),
-    ("explicit.stat_1853636813", "explicit.stat_2731416566"),
-    ("explicit.stat_1853636813", "explicit.stat_3234824465"),
-    ("explicit.stat_1853636813", "explicit.stat_3627458291"),
-    ("explicit.stat_1853636813", "explicit.stat_2091518682"),
-    ("explicit.stat_1853636813", "explicit.stat_214835567"),
-    ("explicit.stat_1853636813", "explicit.stat_362838683"),
-    ("explicit.stat_1853636813", "explicit.stat_2457540491"),
-    ("explicit.stat_1853636813", "explicit.stat_65331133"),
-    ("explicit.stat_1853636813", "explicit.stat_3337107517"),
-    ("explicit.stat_1853636813", "explicit.stat_3332055899"),
-    ("explicit.stat_1853636813", "explicit.stat_2548097895"),
-    ("explicit.stat_1853636813", "explicit.stat_1016185292"),
-    ("explicit.stat_1853636813", "explicit.stat_3624529132"),
-    ("explicit.stat_1853636813", "explicit.stat_380220671"),
-    ("explicit.stat_1853636813", "explicit.stat_2189467271"),
-    ("explicit.stat_1853636813", "explicit.stat_3953667743"),
-    ("explicit.stat_1853636813", "explicit.stat_1723738042"),
-    ("explicit.stat_1853636813", "explicit.stat_556659145"),
-    ("explicit.stat_1853636813", "explicit.stat_2690790844"),
-    ("explicit.stat_1853636813", "explicit.stat_80470845"),
-    ("explicit.stat_1853636813", "explicit.stat_2444534954"),
-    ("explicit.stat_1853636813", "explicit.stat_1699077932"),
-    ("explicit.stat_1853636813", "explicit.stat_2383304564"),
-    ("explicit.stat_1853636813", "explicit.stat_121436064"),
-    ("explicit.stat_1853636813", "explicit.stat_2312747856"),
-    ("explicit.stat_1853636813", "explicit.stat_3656959867"),
-    ("explicit.stat_1853636813", "explicit.stat_281949611"),
-    ("explicit.stat_2831391506", "explicit.stat_1138813382"),
-    ("explicit.stat_2831391506", "explicit.stat_2736708072"),
-    ("explicit.stat_2831391506", "explicit.stat_3308185931"),
-    ("explicit.stat_2831391506", "explicit.stat_4104891138"),
-    ("explicit.stat_2831391506", "explicit.stat_34059570"),
-    ("explicit.stat_2831391506", "explicit.stat_3643449791"),
-    ("explicit.stat_2831391506", "explicit.stat_3468843137"),
-    ("explicit.stat_2831391506", "explicit.stat_3207781478"),
-    ("explicit.stat_2831391506", "explicit.stat_2806391472"),
-    ("explicit.stat_2831391506", "explicit.stat_2567659895"),
-    ("explicit.stat_2831391506", "explicit.stat_4012281889"),
-    ("explicit.stat_2831391506", "explicit.stat_1173690938"),
-    ("explicit.stat_2831391506", "explicit.stat_2365917222"),
-    ("explicit.stat_2831391506", "explicit.stat_3223142064"),
-    ("explicit.stat_2831391506", "explicit.stat_1567542124"),
-    ("explicit.stat_2831391506", "explicit.stat_2647344903"),
-    ("explicit.stat_2831391506", "explicit.stat_1165583295"),
-    ("explicit.stat_2831391506", "explicit.stat_371612541"),
-    ("explicit.stat_2831391506", "explicit.stat_2720072724"),
-    ("explicit.stat_2831391506", "explicit.stat_1919069577"),
-    ("explicit.stat_2831391506", "explicit.stat_3772841281"),
-    ("explicit.stat_2831391506", "explicit.stat_4245204226"),
-    ("explicit.stat_2831391506", "explicit.stat_2163419452"),
-    ("explicit.stat_2831391506", "explicit.stat_3111519953"),
-    ("explicit.stat_2831391506", "explicit.stat_2434030180"),
-    ("explicit.stat_2831391506", "explicit.stat_1653848515"),
-    ("explicit.stat_2831391506", "explicit.stat_2731416566"),
-    ("explicit.stat_2831391506", "explicit.stat_3234824465"),
-    ("explicit.stat_2831391506", "explicit.stat_3627458291"),
-    ("explicit.stat_2831391506", "explicit.stat_2091518682"),
-    ("explicit.stat_2831391506", "explicit.stat_214835567"),
-    ("explicit.stat_2831391506", "explicit.stat_362838683"),
-    ("explicit.stat_2831391506", "explicit.stat_2457540491"),
-    ("explicit.stat_2831391506", "explicit.stat_65331133"),
-    ("explicit.stat_2831391506", "explicit.stat_3337107517"),
-    ("explicit.stat_2831391506", "explicit.stat_3332055899"),
-    ("explicit.stat_2831391506", "explicit.stat_2548097895"),
-    ("explicit.stat_2831391506", "explicit.stat_1016185292"),
-    ("explicit.stat_2831391506", "explicit.stat_3624529132"),
-    ("explicit.stat_2831391506", "explicit.stat_380220671"),
-    ("explicit.stat_2831391506", "explicit.stat_2189467271"),
-    ("explicit.stat_2831391506", "explicit.stat_3953667743"),
-    ("explicit.stat_2831391506", "explicit.stat_1723738042"),
-    ("explicit.stat_2831391506", "explicit.stat_556659145"),
-    ("explicit.stat_2831391506", "explicit.stat_2690790844"),
-    ("explicit.stat_2831391506", "explicit.stat_80470845"),
-    ("explicit.stat_2831391506", "explicit.stat_2444534954"),
-    ("explicit.stat_2831391506", "explicit.stat_1699077932"),
-    ("explicit.stat_2831391506", "explicit.stat_2383304564"),
-    ("explicit.stat_2831391506", "explicit.stat_121436064"),
-    ("explicit.stat_2831391506", "explicit.stat_2312747856"),
-    ("explicit.stat_2831391506", "explicit.stat_3656959867"),
-    ("explicit.stat_2831391506", "explicit.stat_281949611"),
-    ("explicit.stat_1138813382", "explicit.stat_2736708072"),
-    ("explicit.stat_1138813382", "explicit.stat_3308185931"),
-    ("explicit.stat_1138813382", "explicit.stat_4104891138"),
-    ("explicit.stat_1138813382", "explicit.stat_34059570"),
-    ("explicit.stat_1138813382", "explicit.stat_3643449791"),
-    ("explicit.stat_1138813382", "explicit.stat_3468843137"),
-    ("explicit.stat_1138813382", "explicit.stat_3207781478"),
-    ("explicit.stat_1138813382", "explicit.stat_2806391472"),
-    ("explicit.stat_1138813382", "explicit.stat_2567659895"),
-    ("explicit.stat_1138813382", "explicit.stat_4012281889"),
-    ("explicit.stat_1138813382", "explicit.stat_1173690938"),
-    ("explicit.stat_1138813382", "explicit.stat_2365917222"),
-    ("explicit.stat_1138813382", "explicit.stat_3223142064"),
-    ("explicit.stat_1138813382", "explicit.stat_1567542124"),
-    ("explicit.stat_1138813382", "explicit.stat_2647344903"),
-    ("explicit.stat_1138813382", "explicit.stat_1165583295"),
-    ("explicit.stat_1138813382", "explicit.stat_371612541"),
-    ("explicit.stat_1138813382", "explicit.stat_2720072724"),
-    ("explicit.stat_1138813382", "explicit.stat_1919069577"),
-    ("explicit.stat_1138813382", "explicit.stat_3772841281"),
-    ("explicit.stat_1138813382", "explicit.stat_4245204226"),
-    ("explicit.stat_1138813382", "explicit.stat_2163419452"),
-    ("explicit.stat_1138813382", "explicit.stat_3111519953"),
-    ("explicit.stat_1138813382", "explicit.stat_2434030180"),
-    ("explicit.stat_1138813382", "explicit.stat_1653848515"),
-    ("explicit.stat_1138813382", "explicit.stat_2731416566"),
-    ("explicit.stat_1138813382", "explicit.stat_3234824465"),
-    ("explicit.stat_1138813382", "explicit.stat_3627458291"),
-    ("explicit.stat_1138813382", "explicit.stat_2091518682"),
-    ("explicit.stat_1138813382", "explicit.stat_214835567"),
-    ("explicit.stat_1138813382", "explicit.stat_362838683"),
-    ("explicit.stat_1138813382", "explicit.stat_2457540491"),
-    ("explicit.stat_1138813382", "explicit.stat_65331133"),
-    ("explicit.stat_1138813382", "explicit.stat_3337107517"),
-    ("explicit.stat_1138813382", "explicit.stat_3332055899"),
-    ("explicit.stat_1138813382", "explicit.stat_2548097895"),
-    ("explicit.stat_1138813382", "explicit.stat_1016185292"),
-    ("explicit.stat_1138813382", "explicit.stat_3624529132"),
-    ("explicit.stat_1138813382", "explicit.stat_380220671"),
-    ("explicit.stat_1138813382", "explicit.stat_2189467271"),
-    ("explicit.stat_1138813382", "explicit.stat_3953667743"),
-    ("explicit.stat_1138813382", "explicit.stat_1723738042"),
-    ("explicit.stat_1138813382", "explicit.stat_556659145"),
-    ("explicit.stat_1138813382", "explicit.stat_2690790844"),
-    ("explicit.stat_1138813382", "explicit.stat_80470845"),
-    ("explicit.stat_1138813382", "explicit.stat_2444534954"),
-    ("explicit.stat_1138813382", "explicit.stat_1699077932"),
-    ("explicit.stat_1138813382", "explicit.stat_2383304564"),
-    ("explicit.stat_1138813382", "explicit.stat_121436064"),
-    ("explicit.stat_1138813382", "explicit.stat_2312747856"),
-    ("explicit.stat_1138813382", "explicit.stat_3656959867"),
-    ("explicit.stat_1138813382", "explicit.stat_281949611"),
-    ("explicit.stat_2736708072", "explicit.stat_3308185931"),
-    ("explicit.stat_2736708072", "explicit.stat_4104891138"),
-    ("explicit.stat_2736708072", "explicit.stat_34059570"),
-    ("explicit.stat_2736708072", "explicit.stat_3643449791"),
-    ("explicit.stat_2736708072", "explicit.stat_3468843137"),
-    ("explicit.stat_2736708072", "explicit.stat_3207781478"),
-    ("explicit.stat_2736708072", "explicit.stat_2806391472"),
-    ("explicit.stat_2736708072", "explicit.stat_2567659895"),
-    ("explicit.stat_2736708072", "explicit.stat_4012281889"),
-    ("explicit.stat_2736708072", "explicit.stat_1173690938"),
-    ("explicit.stat_2736708072", "explicit.stat_2365917222"),
-    ("explicit.stat_2736708072", "explicit.stat_3223142064"),
-    ("explicit.stat_2736708072", "explicit.stat_1567542124"),
-    ("explicit.stat_2736708072", "explicit.stat_2647344903"),
-    ("explicit.stat_2736708072", "explicit.stat_1165583295"),
-    ("explicit.stat_2736708072", "explicit.stat_371612541"),
-    ("explicit.stat_2736708072", "explicit.stat_2720072724"),
-    ("explicit.stat_2736708072", "explicit.stat_1919069577"),
-    ("explicit.stat_2736708072", "explicit.stat_3772841281"),
-    ("explicit.stat_2736708072", "explicit.stat_4245204226"),
-    ("explicit.stat_2736708072", "explicit.stat_2163419452"),
-    ("explicit.stat_2736708072", "explicit.stat_3111519953"),
-    ("explicit.stat_2736708072", "explicit.stat_2434030180"),
-    ("explicit.stat_2736708072", "explicit.stat_1653848515"),
-    ("explicit.stat_2736708072", "explicit.stat_2731416566"),
-    ("explicit.stat_2736708072", "explicit.stat_3234824465"),
-    ("explicit.stat_2736708072", "explicit.stat_3627458291"),
-    ("explicit.stat_2736708072", "explicit.stat_2091518682"),
-    ("explicit.stat_2736708072", "explicit.stat_214835567"),
-    ("explicit.stat_2736708072", "explicit.stat_362838683"),
-    ("explicit.stat_2736708072", "explicit.stat_2457540491"),
-    ("explicit.stat_2736708072", "explicit.stat_65331133"),
-    ("explicit.stat_2736708072", "explicit.stat_3337107517"),
-    ("explicit.stat_2736708072", "explicit.stat_3332055899"),
-    ("explicit.stat_2736708072", "explicit.stat_2548097895"),
-    ("explicit.stat_2736708072", "explicit.stat_1016185292"),
-    ("explicit.stat_2736708072", "explicit.stat_3624529132"),
-    ("explicit.stat_2736708072", "explicit.stat_380220671"),
-    ("explicit.stat_2736708072", "explicit.stat_2189467271"),
-    ("explicit.stat_2736708072", "explicit.stat_3953667743"),
-    ("explicit.stat_2736708072", "explicit.stat_1723738042"),
-    ("explicit.stat_2736708072", "explicit.stat_556659145"),
-    ("explicit.stat_2736708072", "explicit.stat_2690790844"),
-    ("explicit.stat_2736708072", "explicit.stat_80470845"),
-    ("explicit.stat_2736708072", "explicit.stat_2444534954"),
-    ("explicit.stat_2736708072", "explicit.stat_1699077932"),
-    ("explicit.stat_2736708072", "explicit.stat_2383304564"),
-    ("explicit.stat_2736708072", "explicit.stat_121436064"),
-    ("explicit.stat_2736708072", "explicit.stat_2312747856"),
-    ("explicit.stat_2736708072", "explicit.stat_3656959867"),
-    ("explicit.stat_2736708072", "explicit.stat_281949611"),
-    ("explicit.stat_3308185931", "explicit.stat_4104891138"),
-    ("explicit.stat_3308185931", "explicit.stat_34059570"),
-    ("explicit.stat_3308185931", "explicit.stat_3643449791"),
-    ("explicit.stat_3308185931", "explicit.stat_3468843137"),
-    ("explicit.stat_3308185931", "explicit.stat_3207781478"),
-    ("explicit.stat_3308185931", "explicit.stat_2806391472"),
-    ("explicit.stat_3308185931", "explicit.stat_2567659895"),
-    ("explicit.stat_3308185931", "explicit.stat_4012281889"),
-    ("explicit.stat_3308185931", "explicit.stat_1173690938"),
-    ("explicit.stat_3308185931", "explicit.stat_2365917222"),
-    ("explicit.stat_3308185931", "explicit.stat_3223142064"),
-    ("explicit.stat_3308185931", "explicit.stat_1567542124"),
-    ("explicit.stat_3308185931", "explicit.stat_2647344903"),
-    ("explicit.stat_3308185931", "explicit.stat_1165583295"),
-    ("explicit.stat_3308185931", "explicit.stat_371612541"),
-    ("explicit.stat_3308185931", "explicit.stat_2720072724"),
-    ("explicit.stat_3308185931", "explicit.stat_1919069577"),
-    ("explicit.stat_3308185931", "explicit.stat_3772841281"),
-    ("explicit.stat_3308185931", "explicit.stat_4245204226"),
-    ("explicit.stat_3308185931", "explicit.stat_2163419452"),
-    ("explicit.stat_3308185931", "explicit.stat_3111519953"),
-    ("explicit.stat_3308185931", "explicit.stat_2434030180"),
-    ("explicit.stat_3308185931", "explicit.stat_1653848515"),
-    ("explicit.stat_3308185931", "explicit.stat_2731416566"),
-    ("explicit.stat_3308185931", "explicit.stat_3234824465"),
-    ("explicit.stat_3308185931", "explicit.stat_3627458291"),
-    ("explicit.stat_3308185931", "explicit.stat_2091518682"),
-    ("explicit.stat_3308185931", "explicit.stat_214835567"),
-    ("explicit.stat_3308185931", "explicit.stat_362838683"),
-    ("explicit.stat_3308185931", "explicit.stat_2457540491"),
-    ("explicit.stat_3308185931", "explicit.stat_65331133"),
-    ("explicit.stat_3308185931", "explicit.stat_3337107517"),
-    ("explicit.stat_3308185931", "explicit.stat_3332055899"),
-    ("explicit.stat_3308185931", "explicit.stat_2548097895"),
-    ("explicit.stat_3308185931", "explicit.stat_1016185292"),
-    ("explicit.stat_3308185931", "explicit.stat_3624529132"),
-    ("explicit.stat_3308185931", "explicit.stat_380220671"),
-    ("explicit.stat_3308185931", "explicit.stat_2189467271"),
-    ("explicit.stat_3308185931", "explicit.stat_3953667743"),
-    ("explicit.stat_3308185931", "explicit.stat_1723738042"),
-    ("explicit.stat_3308185931", "explicit.stat_556659145"),
-    ("explicit.stat_3308185931", "explicit.stat_2690790844"),
-    ("explicit.stat_3308185931", "explicit.stat_80470845"),
-    ("explicit.stat_3308185931", "explicit.stat_2444534954"),
-    ("explicit.stat_3308185931", "explicit.stat_1699077932"),
-    ("explicit.stat_3308185931", "explicit.stat_2383304564"),
-    ("explicit.stat_3308185931", "explicit.stat_121436064"),
-    ("explicit.stat_3308185931", "explicit.stat_2312747856"),
-    ("explicit.stat_3308185931", "explicit.stat_3656959867"),
-    ("explicit.stat_3308185931", "explicit.stat_281949611"),
-    ("explicit.stat_4104891138", "explicit.stat_34059570"),
-    ("explicit.stat_4104891138", "explicit.stat_3643449791"),
-    ("explicit.stat_4104891138", "explicit.stat_3468843137"),
-    ("explicit.stat_4104891138", "explicit.stat_3207781478"),
-    ("explicit.stat_4104891138", "explicit.stat_2806391472"),
-    ("explicit.stat_4104891138", "explicit.stat_2567659895"),
-    ("explicit.stat_4104891138", "explicit.stat_4012281889"),
-    ("explicit.stat_4104891138", "explicit.stat_1173690938"),
-    ("explicit.stat_4104891138", "explicit.stat_2365917222"),
-    ("explicit.stat_4104891138", "explicit.stat_3223142064"),
-    ("explicit.stat_4104891138", "explicit.stat_1567542124"),
-    ("explicit.stat_4104891138", "explicit.stat_2647344903"),
-    ("explicit.stat_4104891138", "explicit.stat_1165583295"),
-    ("explicit.stat_4104891138", "explicit.stat_371612541"),
-    ("explicit.stat_4104891138", "explicit.stat_2720072724"),
-    ("explicit.stat_4104891138", "explicit.stat_1919069577"),
-    ("explicit.stat_4104891138", "explicit.stat_3772841281"),
-    ("explicit.stat_4104891138", "explicit.stat_4245204226"),
-    ("explicit.stat_4104891138", "explicit.stat_2163419452"),
-    ("explicit.stat_4104891138", "explicit.stat_3111519953"),
-    ("explicit.stat_4104891138", "explicit.stat_2434030180"),
-    ("explicit.stat_4104891138", "explicit.stat_1653848515"),
-    ("explicit.stat_4104891138", "explicit.stat_2731416566"),
-    ("explicit.stat_4104891138", "explicit.stat_3234824465"),
-    ("explicit.stat_4104891138", "explicit.stat_3627458291"),
-    ("explicit.stat_4104891138", "explicit.stat_2091518682"),
-    ("explicit.stat_4104891138", "explicit.stat_214835567"),
-    ("explicit.stat_4104891138", "explicit.stat_362838683"),
-    ("explicit.stat_4104891138", "explicit.stat_2457540491"),
-    ("explicit.stat_4104891138", "explicit.stat_65331133"),
-    ("explicit.stat_4104891138", "explicit.stat_3337107517"),
-    ("explicit.stat_4104891138", "explicit.stat_3332055899"),
-    ("explicit.stat_4104891138", "explicit.stat_2548097895"),
-    ("explicit.stat_4104891138", "explicit.stat_1016185292"),
-    ("explicit.stat_4104891138", "explicit.stat_3624529132"),
-    ("explicit.stat_4104891138", "explicit.stat_380220671"),
-    ("explicit.stat_4104891138", "explicit.stat_2189467271"),
-    ("explicit.stat_4104891138", "explicit.stat_3953667743"),
-    ("explicit.stat_4104891138", "explicit.stat_1723738042"),
-    ("explicit.stat_4104891138", "explicit.stat_556659145"),
-    ("explicit.stat_4104891138", "explicit.stat_2690790844"),
-    ("explicit.stat_4104891138", "explicit.stat_80470845"),
-    ("explicit.stat_4104891138", "explicit.stat_2444534954"),
-    ("explicit.stat_4104891138", "explicit.stat_1699077932"),
-    ("explicit.stat_4104891138", "explicit.stat_2383304564"),
-    ("explicit.stat_4104891138", "explicit.stat_121436064"),
-    ("explicit.stat_4104891138", "explicit.stat_2312747856"),
-    ("explicit.stat_4104891138", "explicit.stat_3656959867"),
-    ("explicit.stat_4104891138", "explicit.stat_281949611"),
-    ("explicit.stat_34059570", "explicit.stat_3643449791"),
-    ("explicit.stat_34059570", "explicit.stat_3468843137"),
-    ("explicit.stat_34059570", "explicit.stat_3207781478"),
-    ("explicit.stat_34059570", "explicit.stat_2806391472"),
-    ("explicit.stat_34059570", "explicit.stat_2567659895"),
-    ("explicit.stat_34059570", "explicit.stat_4012281889"),
-    ("explicit.stat_34059570", "explicit.stat_1173690938"),
-    ("explicit.stat_34059570", "explicit.stat_2365917222"),
-    ("explicit.stat_34059570", "explicit.stat_3223142064"),
-    ("explicit.stat_34059570", "explicit.stat_1567542124"),
-    ("explicit.stat_34059570", "explicit.stat_2647344903"),
-    ("explicit.stat_34059570", "explicit.stat_1165583295"),
-    ("explicit.stat_34059570", "explicit.stat_371612541"),
-    ("explicit.stat_34059570", "explicit.stat_2720072724"),
-    ("explicit.stat_34059570", "explicit.stat_1919069577"),
-    ("explicit.stat_34059570", "explicit.stat_3772841281"),
-    ("explicit.stat_34059570", "explicit.stat_4245204226"),
-    ("explicit.stat_34059570", "explicit.stat_2163419452"),
-    ("explicit.stat_34059570", "explicit.stat_3111519953"),
-    ("explicit.stat_34059570", "explicit.stat_2434030180"),
-    ("explicit.stat_34059570", "explicit.stat_1653848515"),
-    ("explicit.stat_34059570", "explicit.stat_2731416566"),
-    ("explicit.stat_34059570", "explicit.stat_3234824465"),
-    ("explicit.stat_34059570", "explicit.stat_3627458291"),
-    ("explicit.stat_34059570", "explicit.stat_2091518682"),
-    ("explicit.stat_34059570", "explicit.stat_214835567"),
-    ("explicit.stat_34059570", "explicit.stat_362838683"),
-    ("explicit.stat_34059570", "explicit.stat_2457540491"),
-    ("explicit.stat_34059570", "explicit.stat_65331133"),
-    ("explicit.stat_34059570", "explicit.stat_3337107517"),
-    ("explicit.stat_34059570", "explicit.stat_3332055899"),
-    ("explicit.stat_34059570", "explicit.stat_2548097895"),
-    ("explicit.stat_34059570", "explicit.stat_1016185292"),
-    ("explicit.stat_34059570", "explicit.stat_3624529132"),
-    ("explicit.stat_34059570", "explicit.stat_380220671"),
-    ("explicit.stat_34059570", "explicit.stat_2189467271"),
-    ("explicit.stat_34059570", "explicit.stat_3953667743"),
-    ("explicit.stat_34059570", "explicit.stat_1723738042"),
-    ("explicit.stat_34059570", "explicit.stat_556659145"),
-    ("explicit.stat_34059570", "explicit.stat_2690790844"),
-    ("explicit.stat_34059570", "explicit.stat_80470845"),
-    ("explicit.stat_34059570", "explicit.stat_2444534954"),
-    ("explicit.stat_34059570", "explicit.stat_1699077932"),
-    ("explicit.stat_34059570", "explicit.stat_2383304564"),
-    ("explicit.stat_34059570", "explicit.stat_121436064"),
-    ("explicit.stat_34059570", "explicit.stat_2312747856"),
-    ("explicit.stat_34059570", "explicit.stat_3656959867"),
-    ("explicit.stat_34059570", "explicit.stat_281949611"),
-    ("explicit.stat_3643449791", "explicit.stat_3468843137"),
-    ("explicit.stat_3643449791", "explicit.stat_3207781478"),
-    ("explicit.stat_3643449791", "explicit.stat_2806391472"),
-    ("explicit.stat_3643449791", "explicit.stat_2567659895"),
-    ("explicit.stat_3643449791", "explicit.stat_4012281889"),
-    ("explicit.stat_3643449791", "explicit.stat_1173690938"),
-    ("explicit.stat_3643449791", "explicit.stat_2365917222"),
-    ("explicit.stat_3643449791", "explicit.stat_3223142064"),
-    ("explicit.stat_3643449791", "explicit.stat_1567542124"),
-    ("explicit.stat_3643449791", "explicit.stat_2647344903"),
-    ("explicit.stat_3643449791", "explicit.stat_1165583295"),
-    ("explicit.stat_3643449791", "explicit.stat_371612541"),
-    ("explicit.stat_3643449791", "explicit.stat_2720072724"),
-    ("explicit.stat_3643449791", "explicit.stat_1919069577"),
-    ("explicit.stat_3643449791", "explicit.stat_3772841281"),
-    ("explicit.stat_3643449791", "explicit.stat_4245204226"),
-    ("explicit.stat_3643449791", "explicit.stat_2163419452"),
-    ("explicit.stat_3643449791", "explicit.stat_3111519953"),
-    ("explicit.stat_3643449791", "explicit.stat_2434030180"),
-    ("explicit.stat_3643449791", "explicit.stat_1653848515"),
-    ("explicit.stat_3643449791", "explicit.stat_2731416566"),
-    ("explicit.stat_3643449791", "explicit.stat_3234824465"),
-    ("explicit.stat_3643449791", "explicit.stat_3627458291"),
-    ("explicit.stat_3643449791", "explicit.stat_2091518682"),
-    ("explicit.stat_3643449791", "explicit.stat_214835567"),
-    ("explicit.stat_3643449791", "explicit.stat_362838683"),
-    ("explicit.stat_3643449791", "explicit.stat_2457540491"),
-    ("explicit.stat_3643449791", "explicit.stat_65331133"),
-    ("explicit.stat_3643449791", "explicit.stat_3337107517"),
-    ("explicit.stat_3643449791", "explicit.stat_3332055899"),
-    ("explicit.stat_3643449791", "explicit.stat_2548097895"),
-    ("explicit.stat_3643449791", "explicit.stat_1016185292"),
-    ("explicit.stat_3643449791", "explicit.stat_3624529132"),
-    ("explicit.stat_3643449791", "explicit.stat_380220671"),
-    ("explicit.stat_3643449791", "explicit.stat_2189467271"),
-    ("explicit.stat_3643449791", "explicit.stat_3953667743"),
-    ("explicit.stat_3643449791", "explicit.stat_1723738042"),
-    ("explicit.stat_3643449791", "explicit.stat_556659145"),
-    ("explicit.stat_3643449791", "explicit.stat_2690790844"),
-    ("explicit.stat_3643449791", "explicit.stat_80470845"),
-    ("explicit.stat_3643449791", "explicit.stat_2444534954"),
-    ("explicit.stat_3643449791", "explicit.stat_1699077932"),
-    ("explicit.stat_3643449791", "explicit.stat_2383304564"),
-    ("explicit.stat_3643449791", "explicit.stat_121436064"),
-    ("explicit.stat_3643449791", "explicit.stat_2312747856"),
-    ("explicit.stat_3643449791", "explicit.stat_3656959867"),
-    ("explicit.stat_3643449791", "explicit.stat_281949611"),
-    ("explicit.stat_3468843137", "explicit.stat_3207781478"),
-    ("explicit.stat_3468843137", "explicit.stat_2806391472"),
-    ("explicit.stat_3468843137", "explicit.stat_2567659895"),
-    ("explicit.stat_3468843137", "explicit.stat_4012281889"),
-    ("explicit.stat_3468843137", "explicit.stat_1173690938"),
-    ("explicit.stat_3468843137", "explicit.stat_2365917222"),
-    ("explicit.stat_3468843137", "explicit.stat_3223142064"),
-    ("explicit.stat_3468843137", "explicit.stat_1567542124"),
-    ("explicit.stat_3468843137", "explicit.stat_2647344903"),
-    ("explicit.stat_3468843137", "explicit.stat_1165583295"),
-    ("explicit.stat_3468843137", "explicit.stat_371612541"),
-    ("explicit.stat_3468843137", "explicit.stat_2720072724"),
-    ("explicit.stat_3468843137", "explicit.stat_1919069577"),
-    ("explicit.stat_3468843137", "explicit.stat_3772841281"),
-    ("explicit.stat_3468843137", "explicit.stat_4245204226"),
-    ("explicit.stat_3468843137", "explicit.stat_2163419452"),
-    ("explicit.stat_3468843137", "explicit.stat_3111519953"),
-    ("explicit.stat_3468843137", "explicit.stat_2434030180"),
-    ("explicit.stat_3468843137", "explicit.stat_1653848515"),
-    ("explicit.stat_3468843137", "explicit.stat_2731416566"),
-    ("explicit.stat_3468843137", "explicit.stat_3234824465"),
-    ("explicit.stat_3468843137", "explicit.stat_3627458291"),
-    ("explicit.stat_3468843137", "explicit.stat_2091518682"),
-    ("explicit.stat_3468843137", "explicit.stat_214835567"),
-    ("explicit.stat_3468843137", "explicit.stat_362838683"),
-    ("explicit.stat_3468843137", "explicit.stat_2457540491"),
-    ("explicit.stat_3468843137", "explicit.stat_65331133"),
-    ("explicit.stat_3468843137", "explicit.stat_3337107517"),
-    ("explicit.stat_3468843137", "explicit.stat_3332055899"),
-    ("explicit.stat_3468843137", "explicit.stat_2548097895"),
-    ("explicit.stat_3468843137", "explicit.stat_1016185292"),
-    ("explicit.stat_3468843137", "explicit.stat_3624529132"),
-    ("explicit.stat_3468843137", "explicit.stat_380220671"),
-    ("explicit.stat_3468843137", "explicit.stat_2189467271"),
-    ("explicit.stat_3468843137", "explicit.stat_3953667743"),
-    ("explicit.stat_3468843137", "explicit.stat_1723738042"),
-    ("explicit.stat_3468843137", "explicit.stat_556659145"),
-    ("explicit.stat_3468843137", "explicit.stat_2690790844"),
-    ("explicit.stat_3468843137", "explicit.stat_80470845"),
-    ("explicit.stat_3468843137", "explicit.stat_2444534954"),
-    ("explicit.stat_3468843137", "explicit.stat_1699077932"),
-    ("explicit.stat_3468843137", "explicit.stat_2383304564"),
-    ("explicit.stat_3468843137", "explicit.stat_121436064"),
-    ("explicit.stat_3468843137", "explicit.stat_2312747856"),
-    ("explicit.stat_3468843137", "explicit.stat_3656959867"),
-    ("explicit.stat_3468843137", "explicit.stat_281949611"),
-    ("explicit.stat_3207781478", "explicit.stat_2806391472"),
-    ("explicit.stat_3207781478", "explicit.stat_2567659895"),
-    ("explicit.stat_3207781478", "explicit.stat_4012281889"),
-    ("explicit.stat_3207781478", "explicit.stat_1173690938"),
-    ("explicit.stat_3207781478", "explicit.stat_2365917222"),
-    ("explicit.stat_3207781478", "explicit.stat_3223142064"),
-    ("explicit.stat_3207781478", "explicit.stat_1567542124"),
-    ("explicit.stat_3207781478", "explicit.stat_2647344903"),
-    ("explicit.stat_3207781478", "explicit.stat_1165583295"),
-    ("explicit.stat_3207781478", "explicit.stat_371612541"),
-    ("explicit.stat_3207781478", "explicit.stat_2720072724"),
-    ("explicit.stat_3207781478", "explicit.stat_1919069577"),
-    ("explicit.stat_3207781478", "explicit.stat_3772841281"),
-    ("explicit.stat_3207781478", "explicit.stat_4245204226"),
-    ("explicit.stat_3207781478", "explicit.stat_2163419452"),
-    ("explicit.stat_3207781478", "explicit.stat_3111519953"),
-    ("explicit.stat_3207781478", "explicit.stat_2434030180"),
-    ("explicit.stat_3207781478", "explicit.stat_1653848515"),
-    ("explicit.stat_3207781478", "explicit.stat_2731416566"),
-    ("explicit.stat_3207781478", "explicit.stat_3234824465"),
-    ("explicit.stat_3207781478", "explicit.stat_3627458291"),
-    ("explicit.stat_3207781478", "explicit.stat_2091518682"),
-    ("explicit.stat_3207781478", "explicit.stat_214835567"),
-    ("explicit.stat_3207781478", "explicit.stat_362838683"),
-    ("explicit.stat_3207781478", "explicit.stat_2457540491"),
-    ("explicit.stat_3207781478", "explicit.stat_65331133"),
-    ("explicit.stat_3207781478", "explicit.stat_3337107517"),
-    ("explicit.stat_3207781478", "explicit.stat_3332055899"),
-    ("explicit.stat_3207781478", "explicit.stat_2548097895"),
-    ("explicit.stat_3207781478", "explicit.stat_1016185292"),
-    ("explicit.stat_3207781478", "explicit.stat_3624529132"),
-    ("explicit.stat_3207781478", "explicit.stat_380220671"),
-    ("explicit.stat_3207781478", "explicit.stat_2189467271"),
-    ("explicit.stat_3207781478", "explicit.stat_3953667743"),
-    ("explicit.stat_3207781478", "explicit.stat_1723738042"),
-    ("explicit.stat_3207781478", "explicit.stat_556659145"),
-    ("explicit.stat_3207781478", "explicit.stat_2690790844"),
-    ("explicit.stat_3207781478", "explicit.stat_80470845"),
-    ("explicit.stat_3207781478", "explicit.stat_2444534954"),
-    ("explicit.stat_3207781478", "explicit.stat_1699077932"),
-    ("explicit.stat_3207781478", "explicit.stat_2383304564"),
-    ("explicit.stat_3207781478", "explicit.stat_121436064"),
-    ("explicit.stat_3207781478", "explicit.stat_2312747856"),
-    ("explicit.stat_3207781478", "explicit.stat_3656959867"),
-    ("explicit.stat_3207781478", "explicit.stat_281949611"),
-    ("explicit.stat_2806391472", "explicit.stat_2567659895"),
-    ("explicit.stat_2806391472", "explicit.stat_4012281889"),
-    ("explicit.stat_2806391472", "explicit.stat_1173690938"),
-    ("explicit.stat_2806391472", "explicit.stat_2365917222"),
-    ("explicit.stat_2806391472", "explicit.stat_3223142064"),
-    ("explicit.stat_2806391472", "explicit.stat_1567542124"),
-    ("explicit.stat_2806391472", "explicit.stat_2647344903"),
-    ("explicit.stat_2806391472", "explicit.stat_1165583295"),
-    ("explicit.stat_2806391472", "explicit.stat_371612541"),
-    ("explicit.stat_2806391472", "explicit.stat_2720072724"),
-    ("explicit.stat_2806391472", "explicit.stat_1919069577"),
-    ("explicit.stat_2806391472", "explicit.stat_3772841281"),
-    ("explicit.stat_2806391472", "explicit.stat_4245204226"),
-    ("explicit.stat_2806391472", "explicit.stat_2163419452"),
-    ("explicit.stat_2806391472", "explicit.stat_3111519953"),
-    ("explicit.stat_2806391472", "explicit.stat_2434030180"),
-    ("explicit.stat_2806391472", "explicit.stat_1653848515"),
-    ("explicit.stat_2806391472", "explicit.stat_2731416566"),
-    ("explicit.stat_2806391472", "explicit.stat_3234824465"),
-    ("explicit.stat_2806391472", "explicit.stat_3627458291"),
-    ("explicit.stat_2806391472", "explicit.stat_2091518682"),
-    ("explicit.stat_2806391472", "explicit.stat_214835567"),
-    ("explicit.stat_2806391472", "explicit.stat_362838683"),
-    ("explicit.stat_2806391472", "explicit.stat_2457540491"),
-    ("explicit.stat_2806391472", "explicit.stat_65331133"),
-    ("explicit.stat_2806391472", "explicit.stat_3337107517"),
-    ("explicit.stat_2806391472", "explicit.stat_3332055899"),
-    ("explicit.stat_2806391472", "explicit.stat_2548097895"),
-    ("explicit.stat_2806391472", "explicit.stat_1016185292"),
-    ("explicit.stat_2806391472", "explicit.stat_3624529132"),
-    ("explicit.stat_2806391472", "explicit.stat_380220671"),
-    ("explicit.stat_2806391472", "explicit.stat_2189467271"),
-    ("explicit.stat_2806391472", "explicit.stat_3953667743"),
-    ("explicit.stat_2806391472", "explicit.stat_1723738042"),
-    ("explicit.stat_2806391472", "explicit.stat_556659145"),
-    ("explicit.stat_2806391472", "explicit.stat_2690790844"),
-    ("explicit.stat_2806391472", "explicit.stat_80470845"),
-    ("explicit.stat_2806391472", "explicit.stat_2444534954"),
-    ("explicit.stat_2806391472", "explicit.stat_1699077932"),
-    ("explicit.stat_2806391472", "explicit.stat_2383304564"),
-    ("explicit.stat_2806391472", "explicit.stat_121436064"),
-    ("explicit.stat_2806391472", "explicit.stat_2312747856"),
-    ("explicit.stat_2806391472", "explicit.stat_3656959867"),
-    ("explicit.stat_2806391472", "explicit.stat_281949611"),
-    ("explicit.stat_2567659895", "explicit.stat_4012281889"),
-    ("explicit.stat_2567659895", "explicit.stat_1173690938"),
-    ("explicit.stat_2567659895", "explicit.stat_2365917222"),
-    ("explicit.stat_2567659895", "explicit.stat_3223142064"),
-    ("explicit.stat_2567659895", "explicit.stat_1567542124"),
-    ("explicit.stat_2567659895", "explicit.stat_2647344903"),
-    ("explicit.stat_2567659895", "explicit.stat_1165583295"),
-    ("explicit.stat_2567659895", "explicit.stat_371612541"),
-    ("explicit.stat_2567659895", "explicit.stat_2720072724"),
-    ("explicit.stat_2567659895", "explicit.stat_1919069577"),
-    ("explicit.stat_2567659895", "explicit.stat_3772841281"),
-    ("explicit.stat_2567659895", "explicit.stat_4245204226"),
-    ("explicit.stat_2567659895", "explicit.stat_2163419452"),
-    ("explicit.stat_2567659895", "explicit.stat_3111519953"),
-    ("explicit.stat_2567659895", "explicit.stat_2434030180"),
-    ("explicit.stat_2567659895", "explicit.stat_1653848515"),
-    ("explicit.stat_2567659895", "explicit.stat_2731416566"),
-    ("explicit.stat_2567659895", "explicit.stat_3234824465"),
-    ("explicit.stat_2567659895", "explicit.stat_3627458291"),
-    ("explicit.stat_2567659895", "explicit.stat_2091518682"),
-    ("explicit.stat_2567659895", "explicit.stat_214835567"),
-    ("explicit.stat_2567659895", "explicit.stat_362838683"),
-    ("explicit.stat_2567659895", "explicit.stat_2457540491"),
-    ("explicit.stat_2567659895", "explicit.stat_65331133"),
-    ("explicit.stat_2567659895", "explicit.stat_3337107517"),
-    ("explicit.stat_2567659895", "explicit.stat_3332055899"),
-    ("explicit.stat_2567659895", "explicit.stat_2548097895"),
-    ("explicit.stat_2567659895", "explicit.stat_1016185292"),
-    ("explicit.stat_2567659895", "explicit.stat_3624529132"),
-    ("explicit.stat_2567659895", "explicit.stat_380220671"),
-    ("explicit.stat_2567659895", "explicit.stat_2189467271"),
-    ("explicit.stat_2567659895", "explicit.stat_3953667743"),
-    ("explicit.stat_2567659895", "explicit.stat_1723738042"),
-    ("explicit.stat_2567659895", "explicit.stat_556659145"),
-    ("explicit.stat_2567659895", "explicit.stat_2690790844"),
-    ("explicit.stat_2567659895", "explicit.stat_80470845"),
-    ("explicit.stat_2567659895", "explicit.stat_2444534954"),
-    ("explicit.stat_2567659895", "explicit.stat_1699077932"),
-    ("explicit.stat_2567659895", "explicit.stat_2383304564"),
-    ("explicit.stat_2567659895", "explicit.stat_121436064"),
-    ("explicit.stat_2567659895", "explicit.stat_2312747856"),
-    ("explicit.stat_2567659895", "explicit.stat_3656959867"),
-    ("explicit.stat_2567659895", "explicit.stat_281949611"),
-    ("explicit.stat_4012281889", "explicit.stat_1173690938"),
-    ("explicit.stat_4012281889", "explicit.stat_2365917222"),
-    ("explicit.stat_4012281889", "explicit.stat_3223142064"),
-    ("explicit.stat_4012281889", "explicit.stat_1567542124"),
-    ("explicit.stat_4012281889", "explicit.stat_2647344903"),
-    ("explicit.stat_4012281889", "explicit.stat_1165583295"),
-    ("explicit.stat_4012281889", "explicit.stat_371612541"),
-    ("explicit.stat_4012281889", "explicit.stat_2720072724"),
-    ("explicit.stat_4012281889", "explicit.stat_1919069577"),
-    ("explicit.stat_4012281889", "explicit.stat_3772841281"),
-    ("explicit.stat_4012281889", "explicit.stat_4245204226"),
-    ("explicit.stat_4012281889", "explicit.stat_2163419452"),
-    ("explicit.stat_4012281889", "explicit.stat_3111519953"),
-    ("explicit.stat_4012281889", "explicit.stat_2434030180"),
-    ("explicit.stat_4012281889", "explicit.stat_1653848515"),
-    ("explicit.stat_4012281889", "explicit.stat_2731416566"),
-    ("explicit.stat_4012281889", "explicit.stat_3234824465"),
-    ("explicit.stat_4012281889", "explicit.stat_3627458291"),
-    ("explicit.stat_4012281889", "explicit.stat_2091518682"),
-    ("explicit.stat_4012281889", "explicit.stat_214835567"),
-    ("explicit.stat_4012281889", "explicit.stat_362838683"),
-    ("explicit.stat_4012281889", "explicit.stat_2457540491"),
-    ("explicit.stat_4012281889", "explicit.stat_65331133"),
-    ("explicit.stat_4012281889", "explicit.stat_3337107517"),
-    ("explicit.stat_4012281889", "explicit.stat_3332055899"),
-    ("explicit.stat_4012281889", "explicit.stat_2548097895"),
-    ("explicit.stat_4012281889", "explicit.stat_1016185292"),
-    ("explicit.stat_4012281889", "explicit.stat_3624529132"),
-    ("explicit.stat_4012281889", "explicit.stat_380220671"),
-    ("explicit.stat_4012281889", "explicit.stat_2189467271"),
-    ("explicit.stat_4012281889", "explicit.stat_3953667743"),
-    ("explicit.stat_4012281889", "explicit.stat_1723738042"),
-    ("explicit.stat_4012281889", "explicit.stat_556659145"),
-    ("explicit.stat_4012281889", "explicit.stat_2690790844"),
-    ("explicit.stat_4012281889", "explicit.stat_80470845"),
-    ("explicit.stat_4012281889", "explicit.stat_2444534954"),
-    ("explicit.stat_4012281889", "explicit.stat_1699077932"),
-    ("explicit.stat_4012281889", "explicit.stat_2383304564"),
-    ("explicit.stat_4012281889", "explicit.stat_121436064"),
-    ("explicit.stat_4012281889", "explicit.stat_2312747856"),
-    ("explicit.stat_4012281889", "explicit.stat_3656959867"),
-    ("explicit.stat_4012281889", "explicit.stat_281949611"),
-    ("explicit.stat_1173690938", "explicit.stat_2365917222"),
-    ("explicit.stat_1173690938", "explicit.stat_3223142064"),
-    ("explicit.stat_1173690938", "explicit.stat_1567542124"),
-    ("explicit.stat_1173690938", "explicit.stat_2647344903"),
-    ("explicit.stat_1173690938", "explicit.stat_1165583295"),
-    ("explicit.stat_1173690938", "explicit.stat_371612541"),
-    ("explicit.stat_1173690938", "explicit.stat_2720072724"),
-    ("explicit.stat_1173690938", "explicit.stat_1919069577"),
-    ("explicit.stat_1173690938", "explicit.stat_3772841281"),
-    ("explicit.stat_1173690938", "explicit.stat_4245204226"),
-    ("explicit.stat_1173690938", "explicit.stat_2163419452"),
-    ("explicit.stat_1173690938", "explicit.stat_3111519953"),
-    ("explicit.stat_1173690938", "explicit.stat_2434030180"),
-    ("explicit.stat_1173690938", "explicit.stat_1653848515"),
-    ("explicit.stat_1173690938", "explicit.stat_2731416566"),
-    ("explicit.stat_1173690938", "explicit.stat_3234824465"),
-    ("explicit.stat_1173690938", "explicit.stat_3627458291"),
-    ("explicit.stat_1173690938", "explicit.stat_2091518682"),
-    ("explicit.stat_1173690938", "explicit.stat_214835567"),
-    ("explicit.stat_1173690938", "explicit.stat_362838683"),
-    ("explicit.stat_1173690938", "explicit.stat_2457540491"),
-    ("explicit.stat_1173690938", "explicit.stat_65331133"),
-    ("explicit.stat_1173690938", "explicit.stat_3337107517"),
-    ("explicit.stat_1173690938", "explicit.stat_3332055899"),
-    ("explicit.stat_1173690938", "explicit.stat_2548097895"),
-    ("explicit.stat_1173690938", "explicit.stat_1016185292"),
-    ("explicit.stat_1173690938", "explicit.stat_3624529132"),
-    ("explicit.stat_1173690938", "explicit.stat_380220671"),
-    ("explicit.stat_1173690938", "explicit.stat_2189467271"),
-    ("explicit.stat_1173690938", "explicit.stat_3953667743"),
-    ("explicit.stat_1173690938", "explicit.stat_1723738042"),
-    ("explicit.stat_1173690938", "explicit.stat_556659145"),
-    ("explicit.stat_1173690938", "explicit.stat_2690790844"),
-    ("explicit.stat_1173690938", "explicit.stat_80470845"),
-    ("explicit.stat_1173690938", "explicit.stat_2444534954"),
-    ("explicit.stat_1173690938", "explicit.stat_1699077932"),
-    ("explicit.stat_1173690938", "explicit.stat_2383304564"),
-    ("explicit.stat_1173690938", "explicit.stat_121436064"),
-    ("explicit.stat_1173690938", "explicit.stat_2312747856"),
-    ("explicit.stat_1173690938", "explicit.stat_3656959867"),
-    ("explicit.stat_1173690938", "explicit.stat_281949611"),
-    ("explicit.stat_2365917222", "explicit.stat_3223142064"),
-    ("explicit.stat_2365917222", "explicit.stat_1567542124"),
-    ("explicit.stat_2365917222", "explicit.stat_2647344903"),
-    ("explicit.stat_2365917222", "explicit.stat_1165583295"),
-    ("explicit.stat_2365917222", "explicit.stat_371612541"),
-    ("explicit.stat_2365917222", "explicit.stat_2720072724"),
-    ("explicit.stat_2365917222", "explicit.stat_1919069577"),
-    ("explicit.stat_2365917222", "explicit.stat_3772841281"),
-    ("explicit.stat_2365917222", "explicit.stat_4245204226"),
-    ("explicit.stat_2365917222", "explicit.stat_2163419452"),
-    ("explicit.stat_2365917222", "explicit.stat_3111519953"),
-    ("explicit.stat_2365917222", "explicit.stat_2434030180"),
-    ("explicit.stat_2365917222", "explicit.stat_1653848515"),
-    ("explicit.stat_2365917222", "explicit.stat_2731416566"),
-    ("explicit.stat_2365917222", "explicit.stat_3234824465"),
-    ("explicit.stat_2365917222", "explicit.stat_3627458291"),
-    ("explicit.stat_2365917222", "explicit.stat_2091518682"),
-    ("explicit.stat_2365917222", "explicit.stat_214835567"),
-    ("explicit.stat_2365917222", "explicit.stat_362838683"),
-    ("explicit.stat_2365917222", "explicit.stat_2457540491"),
-    ("explicit.stat_2365917222", "explicit.stat_65331133"),
-    ("explicit.stat_2365917222", "explicit.stat_3337107517"),
-    ("explicit.stat_2365917222", "explicit.stat_3332055899"),
-    ("explicit.stat_2365917222", "explicit.stat_2548097895"),
-    ("explicit.stat_2365917222", "explicit.stat_1016185292"),
-    ("explicit.stat_2365917222", "explicit.stat_3624529132"),
-    ("explicit.stat_2365917222", "explicit.stat_380220671"),
-    ("explicit.stat_2365917222", "explicit.stat_2189467271"),
-    ("explicit.stat_2365917222", "explicit.stat_3953667743"),
-    ("explicit.stat_2365917222", "explicit.stat_1723738042"),
-    ("explicit.stat_2365917222", "explicit.stat_556659145"),
-    ("explicit.stat_2365917222", "explicit.stat_2690790844"),
-    ("explicit.stat_2365917222", "explicit.stat_80470845"),
-    ("explicit.stat_2365917222", "explicit.stat_2444534954"),
-    ("explicit.stat_2365917222", "explicit.stat_1699077932"),
-    ("explicit.stat_2365917222", "explicit.stat_2383304564"),
-    ("explicit.stat_2365917222", "explicit.stat_121436064"),
-    ("explicit.stat_2365917222", "explicit.stat_2312747856"),
-    ("explicit.stat_2365917222", "explicit.stat_3656959867"),
-    ("explicit.stat_2365917222", "explicit.stat_281949611"),
-    ("explicit.stat_3223142064", "explicit.stat_1567542124"),
-    ("explicit.stat_3223142064", "explicit.stat_2647344903"),
-    ("explicit.stat_3223142064", "explicit.stat_1165583295"),
-    ("explicit.stat_3223142064", "explicit.stat_371612541"),
-    ("explicit.stat_3223142064", "explicit.stat_2720072724"),
-    ("explicit.stat_3223142064", "explicit.stat_1919069577"),
-    ("explicit.stat_3223142064", "explicit.stat_3772841281"),
-    ("explicit.stat_3223142064", "explicit.stat_4245204226"),
-    ("explicit.stat_3223142064", "explicit.stat_2163419452"),
-    ("explicit.stat_3223142064", "explicit.stat_3111519953"),
-    ("explicit.stat_3223142064", "explicit.stat_2434030180"),
-    ("explicit.stat_3223142064", "explicit.stat_1653848515"),
-    ("explicit.stat_3223142064", "explicit.stat_2731416566"),
-    ("explicit.stat_3223142064", "explicit.stat_3234824465"),
-    ("explicit.stat_3223142064", "explicit.stat_3627458291"),
-    ("explicit.stat_3223142064", "explicit.stat_2091518682"),
-    ("explicit.stat_3223142064", "explicit.stat_214835567"),
-    ("explicit.stat_3223142064", "explicit.stat_362838683"),
-    ("explicit.stat_3223142064", "explicit.stat_2457540491"),
-    ("explicit.stat_3223142064", "explicit.stat_65331133"),
-    ("explicit.stat_3223142064", "explicit.stat_3337107517"),
-    ("explicit.stat_3223142064", "explicit.stat_3332055899"),
-    ("explicit.stat_3223142064", "explicit.stat_2548097895"),
-    ("explicit.stat_3223142064", "explicit.stat_1016185292"),
-    ("explicit.stat_3223142064", "explicit.stat_3624529132"),
-    ("explicit.stat_3223142064", "explicit.stat_380220671"),
-    ("explicit.stat_3223142064", "explicit.stat_2189467271"),
-    ("explicit.stat_3223142064", "explicit.stat_3953667743"),
-    ("explicit.stat_3223142064", "explicit.stat_1723738042"),
-    ("explicit.stat_3223142064", "explicit.stat_556659145"),
-    ("explicit.stat_3223142064", "explicit.stat_2690790844"),
-    ("explicit.stat_3223142064", "explicit.stat_80470845"),
-    ("explicit.stat_3223142064", "explicit.stat_2444534954"),
-    ("explicit.stat_3223142064", "explicit.stat_1699077932"),
-    ("explicit.stat_3223142064", "explicit.stat_2383304564"),
-    ("explicit.stat_3223142064", "explicit.stat_121436064"),
-    ("explicit.stat_3223142064", "explicit.stat_2312747856"),
-    ("explicit.stat_3223142064", "explicit.stat_3656959867"),
-    ("explicit.stat_3223142064", "explicit.stat_281949611"),
-    ("explicit.stat_1567542124", "explicit.stat_2647344903"),
-    ("explicit.stat_1567542124", "explicit.stat_1165583295"),
-    ("explicit.stat_1567542124", "explicit.stat_371612541"),
-    ("explicit.stat_1567542124", "explicit.stat_2720072724"),
-    ("explicit.stat_1567542124", "explicit.stat_1919069577"),
-    ("explicit.stat_1567542124", "explicit.stat_3772841281"),
-    ("explicit.stat_1567542124", "explicit.stat_4245204226"),
-    ("explicit.stat_1567542124", "explicit.stat_2163419452"),
-    ("explicit.stat_1567542124", "explicit.stat_3111519953"),
-    ("explicit.stat_1567542124", "explicit.stat_2434030180"),
-    ("explicit.stat_1567542124", "explicit.stat_1653848515"),
-    ("explicit.stat_1567542124", "explicit.stat_2731416566"),
-    ("explicit.stat_1567542124", "explicit.stat_3234824465"),
-    ("explicit.stat_1567542124", "explicit.stat_3627458291"),
-    ("explicit.stat_1567542124", "explicit.stat_2091518682"),
-    ("explicit.stat_1567542124", "explicit.stat_214835567"),
-    ("explicit.stat_1567542124", "explicit.stat_362838683"),
-    ("explicit.stat_1567542124", "explicit.stat_2457540491"),
-    ("explicit.stat_1567542124", "explicit.stat_65331133"),
-    ("explicit.stat_1567542124", "explicit.stat_3337107517"),
-    ("explicit.stat_1567542124", "explicit.stat_3332055899"),
-    ("explicit.stat_1567542124", "explicit.stat_2548097895"),
-    ("explicit.stat_1567542124", "explicit.stat_1016185292"),
-    ("explicit.stat_1567542124", "explicit.stat_3624529132"),
-    ("explicit.stat_1567542124", "explicit.stat_380220671"),
-    ("explicit.stat_1567542124", "explicit.stat_2189467271"),
-    ("explicit.stat_1567542124", "explicit.stat_3953667743"),
-    ("explicit.stat_1567542124", "explicit.stat_1723738042"),
-    ("explicit.stat_1567542124", "explicit.stat_556659145"),
-    ("explicit.stat_1567542124", "explicit.stat_2690790844"),
-    ("explicit.stat_1567542124", "explicit.stat_80470845"),
-    ("explicit.stat_1567542124", "explicit.stat_2444534954"),
-    ("explicit.stat_1567542124", "explicit.stat_1699077932"),
-    ("explicit.stat_1567542124", "explicit.stat_2383304564"),
-    ("explicit.stat_1567542124", "explicit.stat_121436064"),
-    ("explicit.stat_1567542124", "explicit.stat_2312747856"),
-    ("explicit.stat_1567542124", "explicit.stat_3656959867"),
-    ("explicit.stat_1567542124", "explicit.stat_281949611"),
-    ("explicit.stat_2647344903", "explicit.stat_1165583295"),
-    ("explicit.stat_2647344903", "explicit.stat_371612541"),
-    ("explicit.stat_2647344903", "explicit.stat_2720072724"),
-    ("explicit.stat_2647344903", "explicit.stat_1919069577"),
-    ("explicit.stat_2647344903", "explicit.stat_3772841281"),
-    ("explicit.stat_2647344903", "explicit.stat_4245204226"),
-    ("explicit.stat_2647344903", "explicit.stat_2163419452"),
-    ("explicit.stat_2647344903", "explicit.stat_3111519953"),
-    ("explicit.stat_2647344903", "explicit.stat_2434030180"),
-    ("explicit.stat_2647344903", "explicit.stat_1653848515"),
-    ("explicit.stat_2647344903", "explicit.stat_2731416566"),
-    ("explicit.stat_2647344903", "explicit.stat_3234824465"),
-    ("explicit.stat_2647344903", "explicit.stat_3627458291"),
-    ("explicit.stat_2647344903", "explicit.stat_2091518682"),
-    ("explicit.stat_2647344903", "explicit.stat_214835567"),
-    ("explicit.stat_2647344903", "explicit.stat_362838683"),
-    ("explicit.stat_2647344903", "explicit.stat_2457540491"),
-    ("explicit.stat_2647344903", "explicit.stat_65331133"),
-    ("explicit.stat_2647344903", "explicit.stat_3337107517"),
-    ("explicit.stat_2647344903", "explicit.stat_3332055899"),
-    ("explicit.stat_2647344903", "explicit.stat_2548097895"),
-    ("explicit.stat_2647344903", "explicit.stat_1016185292"),
-    ("explicit.stat_2647344903", "explicit.stat_3624529132"),
-    ("explicit.stat_2647344903", "explicit.stat_380220671"),
-    ("explicit.stat_2647344903", "explicit.stat_2189467271"),
-    ("explicit.stat_2647344903", "explicit.stat_3953667743"),
-    ("explicit.stat_2647344903", "explicit.stat_1723738042"),
-    ("explicit.stat_2647344903", "explicit.stat_556659145"),
-    ("explicit.stat_2647344903", "explicit.stat_2690790844"),
-    ("explicit.stat_2647344903", "explicit.stat_80470845"),
-    ("explicit.stat_2647344903", "explicit.stat_2444534954"),
-    ("explicit.stat_2647344903", "explicit.stat_1699077932"),
-    ("explicit.stat_2647344903", "explicit.stat_2383304564"),
-    ("explicit.stat_2647344903", "explicit.stat_121436064"),
-    ("explicit.stat_2647344903", "explicit.stat_2312747856"),
-    ("explicit.stat_2647344903", "explicit.stat_3656959867"),
-    ("explicit.stat_2647344903", "explicit.stat_281949611"),
-    ("explicit.stat_1165583295", "explicit.stat_371612541"),
-    ("explicit.stat_1165583295", "explicit.stat_2720072724"),
-    ("explicit.stat_1165583295", "explicit.stat_1919069577"),
-    ("explicit.stat_1165583295", "explicit.stat_3772841281"),
-    ("explicit.stat_1165583295", "explicit.stat_4245204226"),
-    ("explicit.stat_1165583295", "explicit.stat_2163419452"),
-    ("explicit.stat_1165583295", "explicit.stat_3111519953"),
-    ("explicit.stat_1165583295", "explicit.stat_2434030180"),
-    ("explicit.stat_1165583295", "explicit.stat_1653848515"),
-    ("explicit.stat_1165583295", "explicit.stat_2731416566"),
-    ("explicit.stat_1165583295", "explicit.stat_3234824465"),
-    ("explicit.stat_1165583295", "explicit.stat_3627458291"),
-    ("explicit.stat_1165583295", "explicit.stat_2091518682"),
-    ("explicit.stat_1165583295", "explicit.stat_214835567"),
-    ("explicit.stat_1165583295", "explicit.stat_362838683"),
-    ("explicit.stat_1165583295", "explicit.stat_2457540491"),
-    ("explicit.stat_1165583295", "explicit.stat_65331133"),
-    ("explicit.stat_1165583295", "explicit.stat_3337107517"),
-    ("explicit.stat_1165583295", "explicit.stat_3332055899"),
-    ("explicit.stat_1165583295", "explicit.stat_2548097895"),
-    ("explicit.stat_1165583295", "explicit.stat_1016185292"),
-    ("explicit.stat_1165583295", "explicit.stat_3624529132"),
-    ("explicit.stat_1165583295", "explicit.stat_380220671"),
-    ("explicit.stat_1165583295", "explicit.stat_2189467271"),
-    ("explicit.stat_1165583295", "explicit.stat_3953667743"),
-    ("explicit.stat_1165583295", "explicit.stat_1723738042"),
-    ("explicit.stat_1165583295", "explicit.stat_556659145"),
-    ("explicit.stat_1165583295", "explicit.stat_2690790844"),
-    ("explicit.stat_1165583295", "explicit.stat_80470845"),
-    ("explicit.stat_1165583295", "explicit.stat_2444534954"),
-    ("explicit.stat_1165583295", "explicit.stat_1699077932"),
-    ("explicit.stat_1165583295", "explicit.stat_2383304564"),
-    ("explicit.stat_1165583295", "explicit.stat_121436064"),
-    ("explicit.stat_1165583295", "explicit.stat_2312747856"),
-    ("explicit.stat_1165583295", "explicit.stat_3656959867"),
-    ("explicit.stat_1165583295", "explicit.stat_281949611"),
-    ("explicit.stat_371612541", "explicit.stat_2720072724"),
-    ("explicit.stat_371612541", "explicit.stat_1919069577"),
-    ("explicit.stat_371612541", "explicit.stat_3772841281"),
-    ("explicit.stat_371612541", "explicit.stat_4245204226"),
-    ("explicit.stat_371612541", "explicit.stat_2163419452"),
-    ("explicit.stat_371612541", "explicit.stat_3111519953"),
-    ("explicit.stat_371612541", "explicit.stat_2434030180"),
-    ("explicit.stat_371612541", "explicit.stat_1653848515"),
-    ("explicit.stat_371612541", "explicit.stat_2731416566"),
-    ("explicit.stat_371612541", "explicit.stat_3234824465"),
-    ("explicit.stat_371612541", "explicit.stat_3627458291"),
-    ("explicit.stat_371612541", "explicit.stat_2091518682"),
-    ("explicit.stat_371612541", "explicit.stat_214835567"),
-    ("explicit.stat_371612541", "explicit.stat_362838683"),
-    ("explicit.stat_371612541", "explicit.stat_2457540491"),
-    ("explicit.stat_371612541", "explicit.stat_65331133"),
-    ("explicit.stat_371612541", "explicit.stat_3337107517"),
-    ("explicit.stat_371612541", "explicit.stat_3332055899"),
-    ("explicit.stat_371612541", "explicit.stat_2548097895"),
-    ("explicit.stat_371612541", "explicit.stat_1016185292"),
-    ("explicit.stat_371612541", "explicit.stat_3624529132"),
-    ("explicit.stat_371612541", "explicit.stat_380220671"),
-    ("explicit.stat_371612541", "explicit.stat_2189467271"),
-    ("explicit.stat_371612541", "explicit.stat_3953667743"),
-    ("explicit.stat_371612541", "explicit.stat_1723738042"),
-    ("explicit.stat_371612541", "explicit.stat_556659145"),
-    ("explicit.stat_371612541", "explicit.stat_2690790844"),
-    ("explicit.stat_371612541", "explicit.stat_80470845"),
-    ("explicit.stat_371612541", "explicit.stat_2444534954"),
-    ("explicit.stat_371612541", "explicit.stat_1699077932"),
-    ("explicit.stat_371612541", "explicit.stat_2383304564"),
-    ("explicit.stat_371612541", "explicit.stat_121436064"),
-    ("explicit.stat_371612541", "explicit.stat_2312747856"),
-    ("explicit.stat_371612541", "explicit.stat_3656959867"),
-    ("explicit.stat_371612541", "explicit.stat_281949611"),
-    ("explicit.stat_2720072724", "explicit.stat_1919069577"),
-    ("explicit.stat_2720072724", "explicit.stat_3772841281"),
-    ("explicit.stat_2720072724", "explicit.stat_4245204226"),
-    ("explicit.stat_2720072724", "explicit.stat_2163419452"),
-    ("explicit.stat_2720072724", "explicit.stat_3111519953"),
-    ("explicit.stat_2720072724", "explicit.stat_2434030180"),
-    ("explicit.stat_2720072724", "explicit.stat_1653848515"),
-    ("explicit.stat_2720072724", "explicit.stat_2731416566"),
-    ("explicit.stat_2720072724", "explicit.stat_3234824465"),
-    ("explicit.stat_2720072724", "explicit.stat_3627458291"),
-    ("explicit.stat_2720072724", "explicit.stat_2091518682"),
-    ("explicit.stat_2720072724", "explicit.stat_214835567"),
-    ("explicit.stat_2720072724", "explicit.stat_362838683"),
-    ("explicit.stat_2720072724", "explicit.stat_2457540491"),
-    ("explicit.stat_2720072724", "explicit.stat_65331133"),
-    ("explicit.stat_2720072724", "explicit.stat_3337107517"),
-    ("explicit.stat_2720072724", "explicit.stat_3332055899"),
-    ("explicit.stat_2720072724", "explicit.stat_2548097895"),
-    ("explicit.stat_2720072724", "explicit.stat_1016185292"),
-    ("explicit.stat_2720072724", "explicit.stat_3624529132"),
-    ("explicit.stat_2720072724", "explicit.stat_380220671"),
-    ("explicit.stat_2720072724", "explicit.stat_2189467271"),
-    ("explicit.stat_2720072724", "explicit.stat_3953667743"),
-    ("explicit.stat_2720072724", "explicit.stat_1723738042"),
-    ("explicit.stat_2720072724", "explicit.stat_556659145"),
-    ("explicit.stat_2720072724", "explicit.stat_2690790844"),
-    ("explicit.stat_2720072724", "explicit.stat_80470845"),
-    ("explicit.stat_2720072724", "explicit.stat_2444534954"),
-    ("explicit.stat_2720072724", "explicit.stat_1699077932"),
-    ("explicit.stat_2720072724", "explicit.stat_2383304564"),
-    ("explicit.stat_2720072724", "explicit.stat_121436064"),
-    ("explicit.stat_2720072724", "explicit.stat_2312747856"),
-    ("explicit.stat_2720072724", "explicit.stat_3656959867"),
-    ("explicit.stat_2720072724", "explicit.stat_281949611"),
-    ("explicit.stat_1919069577", "explicit.stat_3772841281"),
-    ("explicit.stat_1919069577", "explicit.stat_4245204226"),
-    ("explicit.stat_1919069577", "explicit.stat_2163419452"),
-    ("explicit.stat_1919069577", "explicit.stat_3111519953"),
-    ("explicit.stat_1919069577", "explicit.stat_2434030180"),
-    ("explicit.stat_1919069577", "explicit.stat_1653848515"),
-    ("explicit.stat_1919069577", "explicit.stat_2731416566"),
-    ("explicit.stat_1919069577", "explicit.stat_3234824465"),
-    ("explicit.stat_1919069577", "explicit.stat_3627458291"),
-    ("explicit.stat_1919069577", "explicit.stat_2091518682"),
-    ("explicit.stat_1919069577", "explicit.stat_214835567"),
-    ("explicit.stat_1919069577", "explicit.stat_362838683"),
-    ("explicit.stat_1919069577", "explicit.stat_2457540491"),
-    ("explicit.stat_1919069577", "explicit.stat_65331133"),
-    ("explicit.stat_1919069577", "explicit.stat_3337107517"),
-    ("explicit.stat_1919069577", "explicit.stat_3332055899"),
-    ("explicit.stat_1919069577", "explicit.stat_2548097895"),
-    ("explicit.stat_1919069577", "explicit.stat_1016185292"),
-    ("explicit.stat_1919069577", "explicit.stat_3624529132"),
-    ("explicit.stat_1919069577", "explicit.stat_380220671"),
-    ("explicit.stat_1919069577", "explicit.stat_2189467271"),
-    ("explicit.stat_1919069577", "explicit.stat_3953667743"),
-    ("explicit.stat_1919069577", "explicit.stat_1723738042"),
-    ("explicit.stat_1919069577", "explicit.stat_556659145"),
-    ("explicit.stat_1919069577", "explicit.stat_2690790844"),
-    ("explicit.stat_1919069577", "explicit.stat_80470845"),
-    ("explicit.stat_1919069577", "explicit.stat_2444534954"),
-    ("explicit.stat_1919069577", "explicit.stat_1699077932"),
-    ("explicit.stat_1919069577", "explicit.stat_2383304564"),
-    ("explicit.stat_1919069577", "explicit.stat_121436064"),
-    ("explicit.stat_1919069577", "explicit.stat_2312747856"),
-    ("explicit.stat_1919069577", "explicit.stat_3656959867"),
-    ("explicit.stat_1919069577", "explicit.stat_281949611"),
-    ("explicit.stat_3772841281", "explicit.stat_4245204226"),
-    ("explicit.stat_3772841281", "explicit.stat_2163419452"),
-    ("explicit.stat_3772841281", "explicit.stat_3111519953"),
-    ("explicit.stat_3772841281", "explicit.stat_2434030180"),
-    ("explicit.stat_3772841281", "explicit.stat_1653848515"),
-    ("explicit.stat_3772841281", "explicit.stat_2731416566"),
-    ("explicit.stat_3772841281", "explicit.stat_3234824465"),
-    ("explicit.stat_3772841281", "explicit.stat_3627458291"),
-    ("explicit.stat_3772841281", "explicit.stat_2091518682"),
-    ("explicit.stat_3772841281", "explicit.stat_214835567"),
-    ("explicit.stat_3772841281", "explicit.stat_362838683"),
-    ("explicit.stat_3772841281", "explicit.stat_2457540491"),
-    ("explicit.stat_3772841281", "explicit.stat_65331133"),
-    ("explicit.stat_3772841281", "explicit.stat_3337107517"),
-    ("explicit.stat_3772841281", "explicit.stat_3332055899"),
-    ("explicit.stat_3772841281", "explicit.stat_2548097895"),
-    ("explicit.stat_3772841281", "explicit.stat_1016185292"),
-    ("explicit.stat_3772841281", "explicit.stat_3624529132"),
-    ("explicit.stat_3772841281", "explicit.stat_380220671"),
-    ("explicit.stat_3772841281", "explicit.stat_2189467271"),
-    ("explicit.stat_3772841281", "explicit.stat_3953667743"),
-    ("explicit.stat_3772841281", "explicit.stat_1723738042"),
-    ("explicit.stat_3772841281", "explicit.stat_556659145"),
-    ("explicit.stat_3772841281", "explicit.stat_2690790844"),
-    ("explicit.stat_3772841281", "explicit.stat_80470845"),
-    ("explicit.stat_3772841281", "explicit.stat_2444534954"),
-    ("explicit.stat_3772841281", "explicit.stat_1699077932"),
-    ("explicit.stat_3772841281", "explicit.stat_2383304564"),
-    ("explicit.stat_3772841281", "explicit.stat_121436064"),
-    ("explicit.stat_3772841281", "explicit.stat_2312747856"),
-    ("explicit.stat_3772841281", "explicit.stat_3656959867"),
-    ("explicit.stat_3772841281", "explicit.stat_281949611"),
-    ("explicit.stat_4245204226", "explicit.stat_2163419452"),
-    ("explicit.stat_4245204226", "explicit.stat_3111519953"),
-    ("explicit.stat_4245204226", "explicit.stat_2434030180"),
-    ("explicit.stat_4245204226", "explicit.stat_1653848515"),
-    ("explicit.stat_4245204226", "explicit.stat_2731416566"),
-    ("explicit.stat_4245204226", "explicit.stat_3234824465"),
-    ("explicit.stat_4245204226", "explicit.stat_3627458291"),
-    ("explicit.stat_4245204226", "explicit.stat_2091518682"),
-    ("explicit.stat_4245204226", "explicit.stat_214835567"),
-    ("explicit.stat_4245204226", "explicit.stat_362838683"),
-    ("explicit.stat_4245204226", "explicit.stat_2457540491"),
-    ("explicit.stat_4245204226", "explicit.stat_65331133"),
-    ("explicit.stat_4245204226", "explicit.stat_3337107517"),
-    ("explicit.stat_4245204226", "explicit.stat_3332055899"),
-    ("explicit.stat_4245204226", "explicit.stat_2548097895"),
-    ("explicit.stat_4245204226", "explicit.stat_1016185292"),
-    ("explicit.stat_4245204226", "explicit.stat_3624529132"),
-    ("explicit.stat_4245204226", "explicit.stat_380220671"),
-    ("explicit.stat_4245204226", "explicit.stat_2189467271"),
-    ("explicit.stat_4245204226", "explicit.stat_3953667743"),
-    ("explicit.stat_4245204226", "explicit.stat_1723738042"),
-    ("explicit.stat_4245204226", "explicit.stat_556659145"),
-    ("explicit.stat_4245204226", "explicit.stat_2690790844"),
-    ("explicit.stat_4245204226", "explicit.stat_80470845"),
-    ("explicit.stat_4245204226", "explicit.stat_2444534954"),
-    ("explicit.stat_4245204226", "explicit.stat_1699077932"),
-    ("explicit.stat_4245204226", "explicit.stat_2383304564"),
-    ("explicit.stat_4245204226", "explicit.stat_121436064"),
-    ("explicit.stat_4245204226", "explicit.stat_2312747856"),
-    ("explicit.stat_4245204226", "explicit.stat_3656959867"),
-    ("explicit.stat_4245204226", "explicit.stat_281949611"),
-    ("explicit.stat_2163419452", "explicit.stat_3111519953"),
-    ("explicit.stat_2163419452", "explicit.stat_2434030180"),
-    ("explicit.stat_2163419452", "explicit.stat_1653848515"),
-    ("explicit.stat_2163419452", "explicit.stat_2731416566"),
-    ("explicit.stat_2163419452", "explicit.stat_3234824465"),
-    ("explicit.stat_2163419452", "explicit.stat_3627458291"),
-    ("explicit.stat_2163419452", "explicit.stat_2091518682"),
-    ("explicit.stat_2163419452", "explicit.stat_214835567"),
-    ("explicit.stat_2163419452", "explicit.stat_362838683"),
-    ("explicit.stat_2163419452", "explicit.stat_2457540491"),
-    ("explicit.stat_2163419452", "explicit.stat_65331133"),
-    ("explicit.stat_2163419452", "explicit.stat_3337107517"),
-    ("explicit.stat_2163419452", "explicit.stat_3332055899"),
-    ("explicit.stat_2163419452", "explicit.stat_2548097895"),
-    ("explicit.stat_2163419452", "explicit.stat_1016185292"),
-    ("explicit.stat_2163419452", "explicit.stat_3624529132"),
-    ("explicit.stat_2163419452", "explicit.stat_380220671"),
-    ("explicit.stat_2163419452", "explicit.stat_2189467271"),
-    ("explicit.stat_2163419452", "explicit.stat_3953667743"),
-    ("explicit.stat_2163419452", "explicit.stat_1723738042"),
-    ("explicit.stat_2163419452", "explicit.stat_556659145"),
-    ("explicit.stat_2163419452", "explicit.stat_2690790844"),
-    ("explicit.stat_2163419452", "explicit.stat_80470845"),
-    ("explicit.stat_2163419452", "explicit.stat_2444534954"),
-    ("explicit.stat_2163419452", "explicit.stat_1699077932"),
-    ("explicit.stat_2163419452", "explicit.stat_2383304564"),
-    ("explicit.stat_2163419452", "explicit.stat_121436064"),
-    ("explicit.stat_2163419452", "explicit.stat_2312747856"),
-    ("explicit.stat_2163419452", "explicit.stat_3656959867"),
-    ("explicit.stat_2163419452", "explicit.stat_281949611"),
-    ("explicit.stat_3111519953", "explicit.stat_2434030180"),
-    ("explicit.stat_3111519953", "explicit.stat_1653848515"),
-    ("explicit.stat_3111519953", "explicit.stat_2731416566"),
-    ("explicit.stat_3111519953", "explicit.stat_3234824465"),
-    ("explicit.stat_3111519953", "explicit.stat_3627458291"),
-    ("explicit.stat_3111519953", "explicit.stat_2091518682"),
-    ("explicit.stat_3111519953", "explicit.stat_214835567"),
-    ("explicit.stat_3111519953", "explicit.stat_362838683"),
-    ("explicit.stat_3111519953", "explicit.stat_2457540491"),
-    ("explicit.stat_3111519953", "explicit.stat_65331133"),
-    ("explicit.stat_3111519953", "explicit.stat_3337107517"),
-    ("explicit.stat_3111519953", "explicit.stat_3332055899"),
-    ("explicit.stat_3111519953", "explicit.stat_2548097895"),
-    ("explicit.stat_3111519953", "explicit.stat_1016185292"),
-    ("explicit.stat_3111519953", "explicit.stat_3624529132"),
-    ("explicit.stat_3111519953", "explicit.stat_380220671"),
-    ("explicit.stat_3111519953", "explicit.stat_2189467271"),
-    ("explicit.stat_3111519953", "explicit.stat_3953667743"),
-    ("explicit.stat_3111519953", "explicit.stat_1723738042"),
-    ("explicit.stat_3111519953", "explicit.stat_556659145"),
-    ("explicit.stat_3111519953", "explicit.stat_2690790844"),
-    ("explicit.stat_3111519953", "explicit.stat_80470845"),
-    ("explicit.stat_3111519953", "explicit.stat_2444534954"),
-    ("explicit.stat_3111519953", "explicit.stat_1699077932"),
-    ("explicit.stat_3111519953", "explicit.stat_2383304564"),
-    ("explicit.stat_3111519953", "explicit.stat_121436064"),
-    ("explicit.stat_3111519953", "explicit.stat_2312747856"),
-    ("explicit.stat_3111519953", "explicit.stat_3656959867"),
-    ("explicit.stat_3111519953", "explicit.stat_281949611"),
-    ("explicit.stat_2434030180", "explicit.stat_1653848515"),
-    ("explicit.stat_2434030180", "explicit.stat_2731416566"),
-    ("explicit.stat_2434030180", "explicit.stat_3234824465"),
-    ("explicit.stat_2434030180", "explicit.stat_3627458291"),
-    ("explicit.stat_2434030180", "explicit.stat_2091518682"),
-    ("explicit.stat_2434030180", "explicit.stat_214835567"),
-    ("explicit.stat_2434030180", "explicit.stat_362838683"),
-    ("explicit.stat_2434030180", "explicit.stat_2457540491"),
-    ("explicit.stat_2434030180", "explicit.stat_65331133"),
-    ("explicit.stat_2434030180", "explicit.stat_3337107517"),
-    ("explicit.stat_2434030180", "explicit.stat_3332055899"),
-    ("explicit.stat_2434030180", "explicit.stat_2548097895"),
-    ("explicit.stat_2434030180", "explicit.stat_1016185292"),
-    ("explicit.stat_2434030180", "explicit.stat_3624529132"),
-    ("explicit.stat_2434030180", "explicit.stat_380220671"),
-    ("explicit.stat_2434030180", "explicit.stat_2189467271"),
-    ("explicit.stat_2434030180", "explicit.stat_3953667743"),
-    ("explicit.stat_2434030180", "explicit.stat_1723738042"),
-    ("explicit.stat_2434030180", "explicit.stat_556659145"),
-    ("explicit.stat_2434030180", "explicit.stat_2690790844"),
-    ("explicit.stat_2434030180", "explicit.stat_80470845"),
-    ("explicit.stat_2434030180", "explicit.stat_2444534954"),
-    ("explicit.stat_2434030180", "explicit.stat_1699077932"),
-    ("explicit.stat_2434030180", "explicit.stat_2383304564"),
-    ("explicit.stat_2434030180", "explicit.stat_121436064"),
-    ("explicit.stat_2434030180", "explicit.stat_2312747856"),
-    ("explicit.stat_2434030180", "explicit.stat_3656959867"),
-    ("explicit.stat_2434030180", "explicit.stat_281949611"),
-    ("explicit.stat_1653848515", "explicit.stat_2731416566"),
-    ("explicit.stat_1653848515", "explicit.stat_3234824465"),
-    ("explicit.stat_1653848515", "explicit.stat_3627458291"),
-    ("explicit.stat_1653848515", "explicit.stat_2091518682"),
-    ("explicit.stat_1653848515", "explicit.stat_214835567"),
-    ("explicit.stat_1653848515", "explicit.stat_362838683"),
-    ("explicit.stat_1653848515", "explicit.stat_2457540491"),
-    ("explicit.stat_1653848515", "explicit.stat_65331133"),
-    ("explicit.stat_1653848515", "explicit.stat_3337107517"),
-    ("explicit.stat_1653848515", "explicit.stat_3332055899"),
-    ("explicit.stat_1653848515", "explicit.stat_2548097895"),
-    ("explicit.stat_1653848515", "explicit.stat_1016185292"),
-    ("explicit.stat_1653848515", "explicit.stat_3624529132"),
-    ("explicit.stat_1653848515", "explicit.stat_380220671"),
-    ("explicit.stat_1653848515", "explicit.stat_2189467271"),
-    ("explicit.stat_1653848515", "explicit.stat_3953667743"),
-    ("explicit.stat_1653848515", "explicit.stat_1723738042"),
-    ("explicit.stat_1653848515", "explicit.stat_556659145"),
-    ("explicit.stat_1653848515", "explicit.stat_2690790844"),
-    ("explicit.stat_1653848515", "explicit.stat_80470845"),
-    ("explicit.stat_1653848515", "explicit.stat_2444534954"),
-    ("explicit.stat_1653848515", "explicit.stat_1699077932"),
-    ("explicit.stat_1653848515", "explicit.stat_2383304564"),
-    ("explicit.stat_1653848515", "explicit.stat_121436064"),
-    ("explicit.stat_1653848515", "explicit.stat_2312747856"),
-    ("explicit.stat_1653848515", "explicit.stat_3656959867"),
-    ("explicit.stat_1653848515", "explicit.stat_281949611"),
-    ("explicit.stat_2731416566", "explicit.stat_3234824465"),
-    ("explicit.stat_2731416566", "explicit.stat_3627458291"),
-    ("explicit.stat_2731416566", "explicit.stat_2091518682"),
-    ("explicit.stat_2731416566", "explicit.stat_214835567"),
-    ("explicit.stat_2731416566", "explicit.stat_362838683"),
-    ("explicit.stat_2731416566", "explicit.stat_2457540491"),
-    ("explicit.stat_2731416566", "explicit.stat_65331133"),
-    ("explicit.stat_2731416566", "explicit.stat_3337107517"),
-    ("explicit.stat_2731416566", "explicit.stat_3332055899"),
-    ("explicit.stat_2731416566", "explicit.stat_2548097895"),
-    ("explicit.stat_2731416566", "explicit.stat_1016185292"),
-    ("explicit.stat_2731416566", "explicit.stat_3624529132"),
-    ("explicit.stat_2731416566", "explicit.stat_380220671"),
-    ("explicit.stat_2731416566", "explicit.stat_2189467271"),
-    ("explicit.stat_2731416566", "explicit.stat_3953667743"),
-    ("explicit.stat_2731416566", "explicit.stat_1723738042"),
-    ("explicit.stat_2731416566", "explicit.stat_556659145"),
-    ("explicit.stat_2731416566", "explicit.stat_2690790844"),
-    ("explicit.stat_2731416566", "explicit.stat_80470845"),
-    ("explicit.stat_2731416566", "explicit.stat_2444534954"),
-    ("explicit.stat_2731416566", "explicit.stat_1699077932"),
-    ("explicit.stat_2731416566", "explicit.stat_2383304564"),
-    ("explicit.stat_2731416566", "explicit.stat_121436064"),
-    ("explicit.stat_2731416566", "explicit.stat_2312747856"),
-    ("explicit.stat_2731416566", "explicit.stat_3656959867"),
-    ("explicit.stat_2731416566", "explicit.stat_281949611"),
-    ("explicit.stat_3234824465", "explicit.stat_3627458291"),
-    ("explicit.stat_3234824465", "explicit.stat_2091518682"),
-    ("explicit.stat_3234824465", "explicit.stat_214835567"),
-    ("explicit.stat_3234824465", "explicit.stat_362838683"),
-    ("explicit.stat_3234824465", "explicit.stat_2457540491"),
-    ("explicit.stat_3234824465", "explicit.stat_65331133"),
-    ("explicit.stat_3234824465", "explicit.stat_3337107517"),
-    ("explicit.stat_3234824465", "explicit.stat_3332055899"),
-    ("explicit.stat_3234824465", "explicit.stat_2548097895"),
-    ("explicit.stat_3234824465", "explicit.stat_1016185292"),
-    ("explicit.stat_3234824465", "explicit.stat_3624529132"),
-    ("explicit.stat_3234824465", "explicit.stat_380220671"),
-    ("explicit.stat_3234824465", "explicit.stat_2189467271"),
-    ("explicit.stat_3234824465", "explicit.stat_3953667743"),
-    ("explicit.stat_3234824465", "explicit.stat_1723738042"),
-    ("explicit.stat_3234824465", "explicit.stat_556659145"),
-    ("explicit.stat_3234824465", "explicit.stat_2690790844"),
-    ("explicit.stat_3234824465", "explicit.stat_80470845"),
-    ("explicit.stat_3234824465", "explicit.stat_2444534954"),
-    ("explicit.stat_3234824465", "explicit.stat_1699077932"),
-    ("explicit.stat_3234824465", "explicit.stat_2383304564"),
-    ("explicit.stat_3234824465", "explicit.stat_121436064"),
-    ("explicit.stat_3234824465", "explicit.stat_2312747856"),
-    ("explicit.stat_3234824465", "explicit.stat_3656959867"),
-    ("explicit.stat_3234824465", "explicit.stat_281949611"),
-    ("explicit.stat_3627458291", "explicit.stat_2091518682"),
-    ("explicit.stat_3627458291", "explicit.stat_214835567"),
-    ("explicit.stat_3627458291", "explicit.stat_362838683"),
-    ("explicit.stat_3627458291", "explicit.stat_2457540491"),
-    ("explicit.stat_3627458291", "explicit.stat_65331133"),
-    ("explicit.stat_3627458291", "explicit.stat_3337107517"),
-    ("explicit.stat_3627458291", "explicit.stat_3332055899"),
-    ("explicit.stat_3627458291", "explicit.stat_2548097895"),
-    ("explicit.stat_3627458291", "explicit.stat_1016185292"),
-    ("explicit.stat_3627458291", "explicit.stat_3624529132"),
-    ("explicit.stat_3627458291", "explicit.stat_380220671"),
-    ("explicit.stat_3627458291", "explicit.stat_2189467271"),
-    ("explicit.stat_3627458291", "explicit.stat_3953667743"),
-    ("explicit.stat_3627458291", "explicit.stat_1723738042"),
-    ("explicit.stat_3627458291", "explicit.stat_556659145"),
-    ("explicit.stat_3627458291", "explicit.stat_2690790844"),
-    ("explicit.stat_3627458291", "explicit.stat_80470845"),
-    ("explicit.stat_3627458291", "explicit.stat_2444534954"),
-    ("explicit.stat_3627458291", "explicit.stat_1699077932"),
-    ("explicit.stat_3627458291", "explicit.stat_2383304564"),
-    ("explicit.stat_3627458291", "explicit.stat_121436064"),
-    ("explicit.stat_3627458291", "explicit.stat_2312747856"),
-    ("explicit.stat_3627458291", "explicit.stat_3656959867"),
-    ("explicit.stat_3627458291", "explicit.stat_281949611"),
-    ("explicit.stat_2091518682", "explicit.stat_214835567"),
-    ("explicit.stat_2091518682", "explicit.stat_362838683"),
-    ("explicit.stat_2091518682", "explicit.stat_2457540491"),
-    ("explicit.stat_2091518682", "explicit.stat_65331133"),
-    ("explicit.stat_2091518682", "explicit.stat_3337107517"),
-    ("explicit.stat_2091518682", "explicit.stat_3332055899"),
-    ("explicit.stat_2091518682", "explicit.stat_2548097895"),
-    ("explicit.stat_2091518682", "explicit.stat_1016185292"),
-    ("explicit.stat_2091518682", "explicit.stat_3624529132"),
-    ("explicit.stat_2091518682", "explicit.stat_380220671"),
-    ("explicit.stat_2091518682", "explicit.stat_2189467271"),
-    ("explicit.stat_2091518682", "explicit.stat_3953667743"),
-    ("explicit.stat_2091518682", "explicit.stat_1723738042"),
-    ("explicit.stat_2091518682", "explicit.stat_556659145"),
-    ("explicit.stat_2091518682", "explicit.stat_2690790844"),
-    ("explicit.stat_2091518682", "explicit.stat_80470845"),
-    ("explicit.stat_2091518682", "explicit.stat_2444534954"),
-    ("explicit.stat_2091518682", "explicit.stat_1699077932"),
-    ("explicit.stat_2091518682", "explicit.stat_2383304564"),
-    ("explicit.stat_2091518682", "explicit.stat_121436064"),
-    ("explicit.stat_2091518682", "explicit.stat_2312747856"),
-    ("explicit.stat_2091518682", "explicit.stat_3656959867"),
-    ("explicit.stat_2091518682", "explicit.stat_281949611"),
-    ("explicit.stat_214835567", "explicit.stat_362838683"),
-    ("explicit.stat_214835567", "explicit.stat_2457540491"),
-    ("explicit.stat_214835567", "explicit.stat_65331133"),
-    ("explicit.stat_214835567", "explicit.stat_3337107517"),
-    ("explicit.stat_214835567", "explicit.stat_3332055899"),
-    ("explicit.stat_214835567", "explicit.stat_2548097895"),
-    ("explicit.stat_214835567", "explicit.stat_1016185292"),
-    ("explicit.stat_214835567", "explicit.stat_3624529132"),
-    ("explicit.stat_214835567", "explicit.stat_380220671"),
-    ("explicit.stat_214835567", "explicit.stat_2189467271"),
-    ("explicit.stat_214835567", "explicit.stat_3953667743"),
-    ("explicit.stat_214835567", "explicit.stat_1723738042"),
-    ("explicit.stat_214835567", "explicit.stat_556659145"),
-    ("explicit.stat_214835567", "explicit.stat_2690790844"),
-    ("explicit.stat_214835567", "explicit.stat_80470845"),
-    ("explicit.stat_214835567", "explicit.stat_2444534954"),
-    ("explicit.stat_214835567", "explicit.stat_1699077932"),
-    ("explicit.stat_214835567", "explicit.stat_2383304564"),
-    ("explicit.stat_214835567", "explicit.stat_121436064"),
-    ("explicit.stat_214835567", "explicit.stat_2312747856"),
-    ("explicit.stat_214835567", "explicit.stat_3656959867"),
-    ("explicit.stat_214835567", "explicit.stat_281949611"),
-    ("explicit.stat_362838683", "explicit.stat_2457540491"),
-    ("explicit.stat_362838683", "explicit.stat_65331133"),
-    ("explicit.stat_362838683", "explicit.stat_3337107517"),
-    ("explicit.stat_362838683", "explicit.stat_3332055899"),
-    ("explicit.stat_362838683", "explicit.stat_2548097895"),
-    ("explicit.stat_362838683", "explicit.stat_1016185292"),
-    ("explicit.stat_362838683", "explicit.stat_3624529132"),
-    ("explicit.stat_362838683", "explicit.stat_380220671"),
-    ("explicit.stat_362838683", "explicit.stat_2189467271"),
-    ("explicit.stat_362838683", "explicit.stat_3953667743"),
-    ("explicit.stat_362838683", "explicit.stat_1723738042"),
-    ("explicit.stat_362838683", "explicit.stat_556659145"),
-    ("explicit.stat_362838683", "explicit.stat_2690790844"),
-    ("explicit.stat_362838683", "explicit.stat_80470845"),
-    ("explicit.stat_362838683", "explicit.stat_2444534954"),
-    ("explicit.stat_362838683", "explicit.stat_1699077932"),
-    ("explicit.stat_362838683", "explicit.stat_2383304564"),
-    ("explicit.stat_362838683", "explicit.stat_121436064"),
-    ("explicit.stat_362838683", "explicit.stat_2312747856"),
-    ("explicit.stat_362838683", "explicit.stat_3656959867"),
-    ("explicit.stat_362838683", "explicit.stat_281949611"),
-    ("explicit.stat_2457540491", "explicit.stat_65331133"),
-    ("explicit.stat_2457540491", "explicit.stat_3337107517"),
-    ("explicit.stat_2457540491", "explicit.stat_3332055899"),
-    ("explicit.stat_2457540491", "explicit.stat_2548097895"),
-    ("explicit.stat_2457540491", "explicit.stat_1016185292"),
-    ("explicit.stat_2457540491", "explicit.stat_3624529132"),
-    ("explicit.stat_2457540491", "explicit.stat_380220671"),
-    ("explicit.stat_2457540491", "explicit.stat_2189467271"),
-    ("explicit.stat_2457540491", "explicit.stat_3953667743"),
-    ("explicit.stat_2457540491", "explicit.stat_1723738042"),
-    ("explicit.stat_2457540491", "explicit.stat_556659145"),
-    ("explicit.stat_2457540491", "explicit.stat_2690790844"),
-    ("explicit.stat_2457540491", "explicit.stat_80470845"),
-    ("explicit.stat_2457540491", "explicit.stat_2444534954"),
-    ("explicit.stat_2457540491", "explicit.stat_1699077932"),
-    ("explicit.stat_2457540491", "explicit.stat_2383304564"),
-    ("explicit.stat_2457540491", "explicit.stat_121436064"),
-    ("explicit.stat_2457540491", "explicit.stat_2312747856"),
-    ("explicit.stat_2457540491", "explicit.stat_3656959867"),
-    ("explicit.stat_2457540491", "explicit.stat_281949611"),
-    ("explicit.stat_65331133", "explicit.stat_3337107517"),
-    ("explicit.stat_65331133", "explicit.stat_3332055899"),
-    ("explicit.stat_65331133", "explicit.stat_2548097895"),
-    ("explicit.stat_65331133", "explicit.stat_1016185292"),
-    ("explicit.stat_65331133", "explicit.stat_3624529132"),
-    ("explicit.stat_65331133", "explicit.stat_380220671"),
-    ("explicit.stat_65331133", "explicit.stat_2189467271"),
-    ("explicit.stat_65331133", "explicit.stat_3953667743"),
-    ("explicit.stat_65331133", "explicit.stat_1723738042"),
-    ("explicit.stat_65331133", "explicit.stat_556659145"),
-    ("explicit.stat_65331133", "explicit.stat_2690790844"),
-    ("explicit.stat_65331133", "explicit.stat_80470845"),
-    ("explicit.stat_65331133", "explicit.stat_2444534954"),
-    ("explicit.stat_65331133", "explicit.stat_1699077932"),
-    ("explicit.stat_65331133", "explicit.stat_2383304564"),
-    ("explicit.stat_65331133", "explicit.stat_121436064"),
-    ("explicit.stat_65331133", "explicit.stat_2312747856"),
-    ("explicit.stat_65331133", "explicit.stat_3656959867"),
-    ("explicit.stat_65331133", "explicit.stat_281949611"),
-    ("explicit.stat_3337107517", "explicit.stat_3332055899"),
-    ("explicit.stat_3337107517", "explicit.stat_2548097895"),
-    ("explicit.stat_3337107517", "explicit.stat_1016185292"),
-    ("explicit.stat_3337107517", "explicit.stat_3624529132"),
-    ("explicit.stat_3337107517", "explicit.stat_380220671"),
-    ("explicit.stat_3337107517", "explicit.stat_2189467271"),
-    ("explicit.stat_3337107517", "explicit.stat_3953667743"),
-    ("explicit.stat_3337107517", "explicit.stat_1723738042"),
-    ("explicit.stat_3337107517", "explicit.stat_556659145"),
-    ("explicit.stat_3337107517", "explicit.stat_2690790844"),
-    ("explicit.stat_3337107517", "explicit.stat_80470845"),
-    ("explicit.stat_3337107517", "explicit.stat_2444534954"),
-    ("explicit.stat_3337107517", "explicit.stat_1699077932"),
-    ("explicit.stat_3337107517", "explicit.stat_2383304564"),
-    ("explicit.stat_3337107517", "explicit.stat_121436064"),
-    ("explicit.stat_3337107517", "explicit.stat_2312747856"),
-    ("explicit.stat_3337107517", "explicit.stat_3656959867"),
-    ("explicit.stat_3337107517", "explicit.stat_281949611"),
-    ("explicit.stat_3332055899", "explicit.stat_2548097895"),
-    ("explicit.stat_3332055899", "explicit.stat_1016185292"),
-    ("explicit.stat_3332055899", "explicit.stat_3624529132"),
-    ("explicit.stat_3332055899", "explicit.stat_380220671"),
-    ("explicit.stat_3332055899", "explicit.stat_2189467271"),
-    ("explicit.stat_3332055899", "explicit.stat_3953667743"),
-    ("explicit.stat_3332055899", "explicit.stat_1723738042"),
-    ("explicit.stat_3332055899", "explicit.stat_556659145"),
-    ("explicit.stat_3332055899", "explicit.stat_2690790844"),
-    ("explicit.stat_3332055899", "explicit.stat_80470845"),
-    ("explicit.stat_3332055899", "explicit.stat_2444534954"),
-    ("explicit.stat_3332055899", "explicit.stat_1699077932"),
-    ("explicit.stat_3332055899", "explicit.stat_2383304564"),
-    ("explicit.stat_3332055899", "explicit.stat_121436064"),
-    ("explicit.stat_3332055899", "explicit.stat_2312747856"),
-    ("explicit.stat_3332055899", "explicit.stat_3656959867"),
-    ("explicit.stat_3332055899", "explicit.stat_281949611"),
-    ("explicit.stat_2548097895", "explicit.stat_1016185292"),
-    ("explicit.stat_2548097895", "explicit.stat_3624529132"),
-    ("explicit.stat_2548097895", "explicit.stat_380220671"),
-    ("explicit.stat_2548097895", "explicit.stat_2189467271"),
-    ("explicit.stat_2548097895", "explicit.stat_3953667743"),
-    ("explicit.stat_2548097895", "explicit.stat_1723738042"),
-    ("explicit.stat_2548097895", "explicit.stat_556659145"),
-    ("explicit.stat_2548097895", "explicit.stat_2690790844"),
-    ("explicit.stat_2548097895", "explicit.stat_80470845"),
-    ("explicit.stat_2548097895", "explicit.stat_2444534954"),
-    ("explicit.stat_2548097895", "explicit.stat_1699077932"),
-    ("explicit.stat_2548097895", "explicit.stat_2383304564"),
-    ("explicit.stat_2548097895", "explicit.stat_121436064"),
-    ("explicit.stat_2548097895", "explicit.stat_2312747856"),
-    ("explicit.stat_2548097895", "explicit.stat_3656959867"),
-    ("explicit.stat_2548097895", "explicit.stat_281949611"),
-    ("explicit.stat_1016185292", "explicit.stat_3624529132"),
-    ("explicit.stat_1016185292", "explicit.stat_380220671"),
-    ("explicit.stat_1016185292", "explicit.stat_2189467271"),
-    ("explicit.stat_1016185292", "explicit.stat_3953667743"),
-    ("explicit.stat_1016185292", "explicit.stat_1723738042"),
-    ("explicit.stat_1016185292", "explicit.stat_556659145"),
-    ("explicit.stat_1016185292", "explicit.stat_2690790844"),
-    ("explicit.stat_1016185292", "explicit.stat_80470845"),
-    ("explicit.stat_1016185292", "explicit.stat_2444534954"),
-    ("explicit.stat_1016185292", "explicit.stat_1699077932"),
-    ("explicit.stat_1016185292", "explicit.stat_2383304564"),
-    ("explicit.stat_1016185292", "explicit.stat_121436064"),
-    ("explicit.stat_1016185292", "explicit.stat_2312747856"),
-    ("explicit.stat_1016185292", "explicit.stat_3656959867"),
-    ("explicit.stat_1016185292", "explicit.stat_281949611"),
-    ("explicit.stat_3624529132", "explicit.stat_380220671"),
-    ("explicit.stat_3624529132", "explicit.stat_2189467271"),
-    ("explicit.stat_3624529132", "explicit.stat_3953667743"),
-    ("explicit.stat_3624529132", "explicit.stat_1723738042"),
-    ("explicit.stat_3624529132", "explicit.stat_556659145"),
-    ("explicit.stat_3624529132", "explicit.stat_2690790844"),
-    ("explicit.stat_3624529132", "explicit.stat_80470845"),
-    ("explicit.stat_3624529132", "explicit.stat_2444534954"),
-    ("explicit.stat_3624529132", "explicit.stat_1699077932"),
-    ("explicit.stat_3624529132", "explicit.stat_2383304564"),
-    ("explicit.stat_3624529132", "explicit.stat_121436064"),
-    ("explicit.stat_3624529132", "explicit.stat_2312747856"),
-    ("explicit.stat_3624529132", "explicit.stat_3656959867"),
-    ("explicit.stat_3624529132", "explicit.stat_281949611"),
-    ("explicit.stat_380220671", "explicit.stat_2189467271"),
-    ("explicit.stat_380220671", "explicit.stat_3953667743"),
-    ("explicit.stat_380220671", "explicit.stat_1723738042"),
-    ("explicit.stat_380220671", "explicit.stat_556659145"),
-    ("explicit.stat_380220671", "explicit.stat_2690790844"),
-    ("explicit.stat_380220671", "explicit.stat_80470845"),
-    ("explicit.stat_380220671", "explicit.stat_2444534954"),
-    ("explicit.stat_380220671", "explicit.stat_1699077932"),
-    ("explicit.stat_380220671", "explicit.stat_2383304564"),
-    ("explicit.stat_380220671", "explicit.stat_121436064"),
-    ("explicit.stat_380220671", "explicit.stat_2312747856"),
-    ("explicit.stat_380220671", "explicit.stat_3656959867"),
-    ("explicit.stat_380220671", "explicit.stat_281949611"),
-    ("explicit.stat_2189467271", "explicit.stat_3953667743"),
-    ("explicit.stat_2189467271", "explicit.stat_1723738042"),
-    ("explicit.stat_2189467271", "explicit.stat_556659145"),
-    ("explicit.stat_2189467271", "explicit.stat_2690790844"),
-    ("explicit.stat_2189467271", "explicit.stat_80470845"),
-    ("explicit.stat_2189467271", "explicit.stat_2444534954"),
-    ("explicit.stat_2189467271", "explicit.stat_1699077932"),
-    ("explicit.stat_2189467271", "explicit.stat_2383304564"),
-    ("explicit.stat_2189467271", "explicit.stat_121436064"),
-    ("explicit.stat_2189467271", "explicit.stat_2312747856"),
-    ("explicit.stat_2189467271", "explicit.stat_3656959867"),
-    ("explicit.stat_2189467271", "explicit.stat_281949611"),
-    ("explicit.stat_3953667743", "explicit.stat_1723738042"),
-    ("explicit.stat_3953667743", "explicit.stat_556659145"),
-    ("explicit.stat_3953667743", "explicit.stat_2690790844"),
-    ("explicit.stat_3953667743", "explicit.stat_80470845"),
-    ("explicit.stat_3953667743", "explicit.stat_2444534954"),
-    ("explicit.stat_3953667743", "explicit.stat_1699077932"),
-    ("explicit.stat_3953667743", "explicit.stat_2383304564"),
-    ("explicit.stat_3953667743", "explicit.stat_121436064"),
-    ("explicit.stat_3953667743", "explicit.stat_2312747856"),
-    ("explicit.stat_3953667743", "explicit.stat_3656959867"),
-    ("explicit.stat_3953667743", "explicit.stat_281949611"),
-    ("explicit.stat_1723738042", "explicit.stat_556659145"),
-    ("explicit.stat_1723738042", "explicit.stat_2690790844"),
-    ("explicit.stat_1723738042", "explicit.stat_80470845"),
-    ("explicit.stat_1723738042", "explicit.stat_2444534954"),
-    ("explicit.stat_1723738042", "explicit.stat_1699077932"),
-    ("explicit.stat_1723738042", "explicit.stat_2383304564"),
-    ("explicit.stat_1723738042", "explicit.stat_121436064"),
-    ("explicit.stat_1723738042", "explicit.stat_2312747856"),
-    ("explicit.stat_1723738042", "explicit.stat_3656959867"),
-    ("explicit.stat_1723738042", "explicit.stat_281949611"),
-    ("explicit.stat_556659145", "explicit.stat_2690790844"),
-    ("explicit.stat_556659145", "explicit.stat_80470845"),
-    ("explicit.stat_556659145", "explicit.stat_2444534954"),
-    ("explicit.stat_556659145", "explicit.stat_1699077932"),
-    ("explicit.stat_556659145", "explicit.stat_2383304564"),
-    ("explicit.stat_556659145", "explicit.stat_121436064"),
-    ("explicit.stat_556659145", "explicit.stat_2312747856"),
-    ("explicit.stat_556659145", "explicit.stat_3656959867"),
-    ("explicit.stat_556659145", "explicit.stat_281949611"),
-    ("explicit.stat_2690790844", "explicit.stat_80470845"),
-    ("explicit.stat_2690790844", "explicit.stat_2444534954"),
-    ("explicit.stat_2690790844", "explicit.stat_1699077932"),
-    ("explicit.stat_2690790844", "explicit.stat_2383304564"),
-    ("explicit.stat_2690790844", "explicit.stat_121436064"),
-    ("explicit.stat_2690790844", "explicit.stat_2312747856"),
-    ("explicit.stat_2690790844", "explicit.stat_3656959867"),
-    ("explicit.stat_2690790844", "explicit.stat_281949611"),
-    ("explicit.stat_80470845", "explicit.stat_2444534954"),
-    ("explicit.stat_80470845", "explicit.stat_1699077932"),
-    ("explicit.stat_80470845", "explicit.stat_2383304564"),
-    ("explicit.stat_80470845", "explicit.stat_121436064"),
-    ("explicit.stat_80470845", "explicit.stat_2312747856"),
-    ("explicit.stat_80470845", "explicit.stat_3656959867"),
-    ("explicit.stat_80470845", "explicit.stat_281949611"),
-    ("explicit.stat_2444534954", "explicit.stat_1699077932"),
-    ("explicit.stat_2444534954", "explicit.stat_2383304564"),
-    ("explicit.stat_2444534954", "explicit.stat_121436064"),
-    ("explicit.stat_2444534954", "explicit.stat_2312747856"),
-    ("explicit.stat_2444534954", "explicit.stat_3656959867"),
-    ("explicit.stat_2444534954", "explicit.stat_281949611"),
-    ("explicit.stat_1699077932", "explicit.stat_2383304564"),
-    ("explicit.stat_1699077932", "explicit.stat_121436064"),
-    ("explicit.stat_1699077932", "explicit.stat_2312747856"),
-    ("explicit.stat_1699077932", "explicit.stat_3656959867"),
-    ("explicit.stat_1699077932", "explicit.stat_281949611"),
-    ("explicit.stat_2383304564", "explicit.stat_121436064"),
-    ("explicit.stat_2383304564", "explicit.stat_2312747856"),
-    ("explicit.stat_2383304564", "explicit.stat_3656959867"),
-    ("explicit.stat_2383304564", "explicit.stat_281949611"),
-    ("explicit.stat_121436064", "explicit.stat_2312747856"),
-    ("explicit.stat_121436064", "explicit.stat_3656959867"),
-    ("explicit.stat_121436064", "explicit.stat_281949611"),
-    ("explicit.stat_2312747856", "explicit.stat_3656959867"),
-    ("explicit.stat_2312747856", "explicit.stat_281949611"),
-    ("explicit.stat_3656959867", "explicit.stat_281949611"),
-]
-
-# Mapping of mod IDs to readable names
-MOD_NAMES = {
-    "explicit.stat_1817023621": "+#% to Critical Strike Multiplier while affected by Precision",
-    "explicit.stat_3375743050": "#% increased Attack Speed while affected by Precision",
-    "explicit.stat_2048747572": "#% increased Attack Damage while affected by Precision",
-    "explicit.stat_418293304": "#% increased Lightning Damage while affected by Wrath",
-    "explicit.stat_2106756686": "#% of Physical Damage Converted to Lightning Damage while affected by Wrath",
-    "explicit.stat_3357049845": "#% increased Critical Strike Chance while affected by Wrath",
-    "explicit.stat_1077131949": "Damage Penetrates #% Lightning Resistance while affected by Wrath",
-    "explicit.stat_2255914633": "Gain #% of Physical Damage as Extra Lightning Damage while affected by Wrath",
-    "explicit.stat_2753985507": "+#% to Critical Strike Chance while affected by Hatred",
-    "explicit.stat_2643562209": "Adds # to # Cold Damage while affected by Hatred",
-    "explicit.stat_1413864591": "#% increased Cold Damage while affected by Hatred",
-    "explicit.stat_1222888897": "Damage Penetrates #% Cold Resistance while affected by Hatred",
-    "explicit.stat_664849247": "#% of Physical Damage Converted to Cold Damage while affected by Hatred",
-    "explicit.stat_68410701": "You take #% reduced Extra Damage from Critical Strikes while affected by Determination",
-    "explicit.stat_3742808908": "+# to Armour while affected by Determination",
-    "explicit.stat_1873457881": "#% additional Physical Damage Reduction while affected by Determination",
-    "explicit.stat_3692646597": "+#% Chance to Block Attack Damage while affected by Determination",
-    "explicit.stat_1011863394": "Impales you inflict last # additional Hits while using Pride",
-    "explicit.stat_3371719014": "#% chance to deal Double Damage while using Pride",
-    "explicit.stat_4173751044": "#% chance to Impale Enemies on Hit with Attacks while using Pride",
-    "explicit.stat_576528026": "#% increased Physical Damage while using Pride",
-    "explicit.stat_3772848194": "Your Hits Intimidate Enemies for 4 seconds while you are using Pride",
-    "explicit.stat_969576725": "+#% chance to Evade Attack Hits while affected by Grace",
-    "explicit.stat_4071658793": "+#% chance to Suppress Spell Damage while affected by Grace",
-    "explicit.stat_3329402420": "#% increased Movement Speed while affected by Grace",
-    "explicit.stat_4259701244": "Gain # Life per Enemy Hit while affected by Vitality",
-    "explicit.stat_3765507527": "Gain # Energy Shield per Enemy Hit while affected by Discipline",
-    "explicit.stat_1313498929": "+#% Chance to Block Spell Damage while affected by Discipline",
-    "explicit.stat_991194404": "Regenerate #% of Energy Shield per Second while affected by Discipline",
-    "explicit.stat_1424006185": "You gain Onslaught for # seconds on Kill while affected by Haste",
-    "explicit.stat_1346311588": "You have Phasing while affected by Haste",
-    "explicit.stat_207635700": "Debuffs on you expire #% faster while affected by Haste",
-    "explicit.stat_1853636813": "Non-Channelling Skills have +# to Total Mana Cost while affected by Clarity",
-    "explicit.stat_2831391506": "Gain #% of Maximum Mana as Extra Maximum Energy Shield while affected by Clarity",
-    "explicit.stat_1138813382": "+#% to Chaos Resistance while affected by Purity of Elements",
-    "explicit.stat_2736708072": "+#% to Damage over Time Multiplier while affected by Malevolence",
-    "explicit.stat_3308185931": "Unaffected by Burning Ground while affected by Purity of Fire",
-    "explicit.stat_4104891138": "Unaffected by Bleeding while affected by Malevolence",
-    "explicit.stat_34059570": "Unaffected by Poison while affected by Malevolence",
-    "explicit.stat_3643449791": "#% increased Recovery rate of Life and Energy Shield while affected by Malevolence",
-    "explicit.stat_3468843137": "Damaging Ailments you inflict deal Damage #% faster while affected by Malevolence",
-    "explicit.stat_3207781478": "Unaffected by Vulnerability while affected by Determination",
-    "explicit.stat_2806391472": "Unaffected by Temporal Chains while affected by Haste",
-    "explicit.stat_2567659895": "Unaffected by Shocked Ground while affected by Purity of Lightning",
-    "explicit.stat_4012281889": "Unaffected by Frostbite while affected by Purity of Ice",
-    "explicit.stat_1173690938": "Unaffected by Flammability while affected by Purity of Fire",
-    "explicit.stat_2365917222": "Unaffected by Enfeeble while affected by Grace",
-    "explicit.stat_3223142064": "Unaffected by Elemental Weakness while affected by Purity of Elements",
-    "explicit.stat_1567542124": "Unaffected by Conductivity while affected by Purity of Lightning",
-    "explicit.stat_2647344903": "Unaffected by Chilled Ground while affected by Purity of Ice",
-    "explicit.stat_1165583295": "Regenerate #% of Life per second while affected by Vitality",
-    "explicit.stat_371612541": "Immune to Ignite while affected by Purity of Fire",
-    "explicit.stat_2720072724": "Immune to Freeze while affected by Purity of Ice",
-    "explicit.stat_1919069577": "Gain Arcane Surge for 4 seconds when you create Consecrated Ground while affected by Zealotry",
-    "explicit.stat_3772841281": "Gain a Flask Charge when you deal a Critical Strike while affected by Precision",
-    "explicit.stat_4245204226": "Gain #% of Physical Damage as Extra Fire Damage while affected by Anger",
-    "explicit.stat_2163419452": "Effects of Consecrated Ground you create while affected by Zealotry Linger for # seconds",
-    "explicit.stat_3111519953": "Damage Penetrates #% Fire Resistance while affected by Anger",
-    "explicit.stat_2434030180": "Consecrated Ground you create while affected by Zealotry causes enemies to take #% increased Damage",
-    "explicit.stat_1653848515": "Cannot be Blinded while affected by Precision",
-    "explicit.stat_2731416566": "#% increased Maximum total Energy Shield Recovery per second from Leech while affected by Zealotry",
-    "explicit.stat_3234824465": "+#% to all maximum Elemental Resistances while affected by Purity of Elements",
-    "explicit.stat_3627458291": "+#% to Critical Strike Multiplier while affected by Anger",
-    "explicit.stat_2091518682": "Critical Strikes Penetrate #% of Enemy Elemental Resistances while affected by Zealotry",
-    "explicit.stat_214835567": "#% increased Critical Strike Chance against Enemies on Consecrated Ground while affected by Zealotry",
-    "explicit.stat_362838683": "#% increased Life Recovery from Flasks while affected by Vitality",
-    "explicit.stat_2457540491": "#% reduced Reflected Physical Damage taken while affected by Determination",
-    "explicit.stat_65331133": "#% reduced Reflected Elemental Damage taken while affected by Purity of Elements",
-    "explicit.stat_3337107517": "#% increased Fire Damage while affected by Anger",
-    "explicit.stat_3332055899": "#% increased Cooldown Recovery Rate of Movement Skills used while affected by Haste",
-    "explicit.stat_2548097895": "#% chance to Blind Enemies which Hit you while affected by Grace",
-    "explicit.stat_1016185292": "#% faster start of Energy Shield Recharge while affected by Discipline",
-    "explicit.stat_3624529132": "#% of Physical Damage Converted to Fire Damage while affected by Anger",
-    "explicit.stat_380220671": "#% of Damage taken while affected by Clarity Recouped as Mana",
-    "explicit.stat_2189467271": "#% of Fire and Lightning Damage taken as Cold Damage while affected by Purity of Ice",
-    "explicit.stat_3953667743": "#% of Fire and Cold Damage taken as Lightning Damage while affected by Purity of Lightning",
-    "explicit.stat_1723738042": "#% of Cold and Lightning Damage taken as Fire Damage while affected by Purity of Fire",
-    "explicit.stat_556659145": "#% increased Mana Recovery Rate while affected by Clarity",
-    "explicit.stat_2690790844": "#% increased Life Recovery Rate while affected by Vitality",
-    "explicit.stat_80470845": "#% increased Energy Shield Recovery Rate while affected by Discipline",
-    "explicit.stat_2444534954": "#% increased Cast Speed while affected by Zealotry",
-    "explicit.stat_1699077932": "#% chance to Recover 10% of Mana when you use a Skill while affected by Clarity",
-    "explicit.stat_2383304564": "#% of Damage taken from Mana before Life while affected by Clarity",
-    "explicit.stat_121436064": "#% of Lightning Damage is Leeched as Energy Shield while affected by Wrath",
-    "explicit.stat_2312747856": "#% of Fire Damage Leeched as Life while affected by Anger",
-    "explicit.stat_3656959867": "#% of Damage leeched as Life while affected by Vitality",
-    "explicit.stat_281949611": "Immune to Shock while affected by Purity of Lightning"
-}
-